@@ -86,6 +86,7 @@ def _ensure_schema_for_entity(cursor, entity):
             PRIMARY KEY({pk})
         )"""
         cursor.execute(ddl)
+        ensure_nocase_key_index(cursor, entity, pk)
         return
 
     cursor.execute(f"PRAGMA table_info({entity})")
@@ -98,6 +99,15 @@ def _ensure_schema_for_entity(cursor, entity):
         cursor.execute(
             f"ALTER TABLE {entity} ADD COLUMN {col} {typ}"
         )
+    ensure_nocase_key_index(cursor, entity, pk)
+
+
+def ensure_nocase_key_index(cursor, entity, key_field):
+    """Create the case-insensitive key index used by name lookups that ignore case."""
+    cursor.execute(
+        f"CREATE INDEX IF NOT EXISTS idx_{entity}_{key_field}_nocase "
+        f"ON {entity}({key_field} COLLATE NOCASE)"
+    )
 
 
 def _ensure_campaign_metadata_tables(cursor):
@@ -227,6 +237,14 @@ def initialize_db():
     conn.commit()
     conn.close()
 
+    # Book transcripts now live in the full-text index, not on the rows.
+    try:
+        from db.migrations.book_text_index import migrate_inline_book_text
+
+        migrate_inline_book_text()
+    except Exception as exc:
+        logging.warning("Failed to migrate book transcripts: %s", exc)
+
 def update_table_schema(conn, cursor):
     """
     For each entity:
@@ -0,0 +1,51 @@
+"""Idempotently move inline book transcripts into the book text index."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Optional
+
+from db.db import get_connection
+from modules.books.book_text_index import get_book_text_index, page_payload_texts
+
+
+def migrate_inline_book_text(database: Optional[str | Path] = None) -> int:
+    """Index ``ExtractedText``/``ExtractedPages`` transcripts and blank them.
+
+    Returns the number of book rows that were migrated.
+    """
+    connect = (lambda: sqlite3.connect(str(database))) if database else get_connection
+    with closing(connect()) as connection:
+        columns = {row[1] for row in connection.execute("PRAGMA table_info(books)")}
+        if not {"Title", "ExtractedText", "ExtractedPages"} <= columns:
+            return 0
+        rows = connection.execute(
+            """
+            SELECT Title, ExtractedText, ExtractedPages FROM books
+            WHERE COALESCE(ExtractedText, '') != ''
+               OR COALESCE(ExtractedPages, '') NOT IN ('', '[]')
+            """
+        ).fetchall()
+    index = get_book_text_index(str(database) if database else None)
+    updates = []
+    for title, transcript, raw_pages in rows:
+        try:
+            pages = json.loads(raw_pages) if raw_pages else []
+        except (TypeError, ValueError):
+            pages = []
+        page_texts = page_payload_texts(pages)
+        if not page_texts and not str(transcript or "").strip():
+            continue
+        index.index_book(str(title), page_texts or [str(transcript)])
+        excerpts = [page for page in pages if isinstance(page, dict)] if isinstance(pages, list) else []
+        updates.append(("", json.dumps(excerpts), title))
+    if updates:
+        with closing(connect()) as connection, connection:
+            connection.executemany(
+                "UPDATE books SET ExtractedText = ?, ExtractedPages = ? WHERE Title = ?",
+                updates,
+            )
+    return len(updates)
@@ -9,6 +9,7 @@ os.environ.setdefault("MPLBACKEND", "Agg")
 
 import sys
 import json
+import multiprocessing
 import sqlite3
 import subprocess
 import time
@@ -58,6 +59,7 @@ from modules.helpers.backup_helper import (
     restore_backup_archive,
 )
 from modules.helpers.swarmui_helper import get_available_models
+from modules.helpers.swarmui_portrait_queue import resume_pending_portrait_jobs
 from modules.helpers.logging_helper import (
     initialize_logging,
     install_global_exception_hooks,
@@ -73,7 +75,11 @@ from modules.helpers.system_config import register_system_change_listener
 from modules.ui.tooltip import ToolTip
 from modules.ui.icon_button import create_icon_button
 from modules.ui.portrait_importer import PortraitImporter
-from modules.ui.image_library.dialogs import ImageDirectoryImportDialog, ImageLibraryBrowserDialog
+from modules.ui.image_library.dialogs import (
+    ImageDirectoryImportDialog,
+    ImageDuplicateReviewDialog,
+    ImageLibraryBrowserDialog,
+)
 from modules.helpers.portrait_helper import parse_portrait_value, serialize_portrait_value
 from modules.ui.system_selector_dialog import CampaignSystemSelectorDialog
 from modules.ui.database_manager_dialog import DatabaseManagerDialog
@@ -99,6 +105,7 @@ from modules.events.services.calendar_state_store import CalendarStateStore
 
 from modules.generic.generic_list_view import GenericListView
 from modules.generic.generic_model_wrapper import GenericModelWrapper
+from modules.generic.campaign_search_index import get_campaign_search_index
 from modules.scenarios.gm_layout_manager import GMScreenLayoutManager
 from modules.scenarios.gm_table.layout_store import GMTableLayoutStore
 from modules.scenarios.gm_table.table_registry import (
@@ -129,7 +136,7 @@ from modules.generic.campaign_sync.settings import CampaignUpdatePreferences
 from modules.generic.campaign_sync.metadata_store import CampaignSyncMetadataStore
 from modules.generic.campaign_sync.publisher import CampaignPublisher
 from modules.generic.campaign_sync.auto_publish import (
-    AutoPublishCoordinator, DurableOutbox, PublicationScheduler,
+    AdaptivePublicationScheduler, AutoPublishCoordinator, DurableOutbox,
     PublicationWorker, TkEventBridge,
 )
 import queue
@@ -246,6 +253,7 @@ class MainWindow(ctk.CTk):
         self._image_assets_service = None
         self._image_directory_importer_window = None
         self._image_library_browser_window = None
+        self._image_duplicate_review_window = None
         self._asset_library_window = None
         self._ambiance_player: SecondScreenAmbiancePlayer | None = None
         self._ambiance_control_window = None
@@ -262,7 +270,7 @@ class MainWindow(ctk.CTk):
         self._auto_publish_coordinator = AutoPublishCoordinator(
             DurableOutbox(Path.home() / ".gmcampaigndesigner" / "campaign-publish-outbox.json"),
             PublicationWorker(lambda: CampaignPublisher(publish_client), publish_events),
-            scheduler=PublicationScheduler(
+            scheduler=AdaptivePublicationScheduler(
                 sync_preferences.publication_idle_seconds,
                 sync_preferences.publication_maximum_seconds,
             ),
@@ -301,8 +309,34 @@ class MainWindow(ctk.CTk):
         # configured interval still governs later automatic checks, while the
         # enabled/offline preferences remain enforced by the checker.
         self.after(1000, lambda: self._queue_campaign_update_check(force=True))
+        self.after(1500, self._warm_campaign_search_index)
+        self.after(2000, self._resume_portrait_jobs)
+
+    def _warm_campaign_search_index(self) -> None:
+        """Bring the global search index up to date off the Tk thread."""
+
+        def worker():
+            try:
+                get_campaign_search_index().refresh()
+            except Exception as exc:
+                log_warning(
+                    f"Could not refresh the campaign search index: {exc}",
+                    func_name="MainWindow._warm_campaign_search_index",
+                )
+
+        threading.Thread(target=worker, name="campaign-search-index", daemon=True).start()
+
+    def _resume_portrait_jobs(self) -> None:
+        """Finish SwarmUI portrait jobs interrupted by the last session."""
+        try:
+            resume_pending_portrait_jobs()
+        except Exception as exc:
+            log_warning(
+                f"Could not resume portrait jobs: {exc}",
+                func_name="MainWindow._resume_portrait_jobs",
+            )
 
-    def _on_campaign_data_saved(self, database_path=None) -> None:
+    def _on_campaign_data_saved(self, database_path=None, change=None) -> None:
         """Mark linked campaign content dirty after its database commit succeeds."""
         database = Path(database_path or ConfigHelper.get(
             "Database", "path", fallback="default_campaign.db"
@@ -316,6 +350,8 @@ class MainWindow(ctk.CTk):
             campaign_id=metadata.campaign_id, campaign_name=root.name,
             campaign_root=root, database_path=database,
             expected_parent_revision=expected_parent,
+            changed_items=getattr(change, "item_count", 1),
+            changed_bytes=getattr(change, "byte_count", 0),
         )
 
     def _on_auto_publish_event(self, event) -> None:
@@ -739,6 +775,24 @@ class MainWindow(ctk.CTk):
             messagebox.showerror("Error", f"Failed to open image library browser:\n{exc}")
             return None
 
+    def open_image_duplicate_review(self):
+        """Open the image library duplicate review dialog."""
+        try:
+            if self._image_duplicate_review_window and self._image_duplicate_review_window.winfo_exists():
+                self._image_duplicate_review_window.lift()
+                self._image_duplicate_review_window.focus_force()
+                return
+
+            window = ImageDuplicateReviewDialog(self, service=self._get_image_assets_service())
+            window.bind("<Destroy>", lambda _evt: setattr(self, "_image_duplicate_review_window", None))
+            self._image_duplicate_review_window = window
+        except Exception as exc:
+            log_exception(
+                f"Failed to open image duplicate review: {exc}",
+                func_name="main_window.MainWindow.open_image_duplicate_review",
+            )
+            messagebox.showerror("Error", f"Failed to open image duplicate review:\n{exc}")
+
     def open_new_entity_type_dialog(self):
         """Open new entity type dialog."""
         try:
@@ -5152,6 +5206,16 @@ class MainWindow(ctk.CTk):
                 )
             finally:
                 self._system_listener_unsub = None
+        try:
+            # Throughput measured this session is only written periodically.
+            from modules.ai.ollama_model_service import get_model_catalog
+
+            get_model_catalog().flush()
+        except Exception as exc:
+            log_warning(
+                f"Failed to save the model catalog: {exc}",
+                func_name="MainWindow.destroy",
+            )
         super().destroy()
 
     def get_ambiance_player(self) -> SecondScreenAmbiancePlayer:
@@ -5378,6 +5442,9 @@ class MainWindow(ctk.CTk):
             messagebox.showerror("Error", f"Failed to open Map Tool:\n{exc}")
 
 if __name__ == "__main__":
+    # Book indexing uses a process pool; in the PyInstaller build each worker
+    # re-runs this executable and must stop here instead of opening the app.
+    multiprocessing.freeze_support()
     if "--webview" in sys.argv:
         sys.argv.remove("--webview")
         from modules.ui.webview import pywebview_launcher
@@ -1,10 +1,13 @@
 """Wizard flow for AI authoring."""
 import re
 import json
+import threading
 import customtkinter as ctk
 from tkinter import messagebox
 
 from modules.ai.local_ai_client import LocalAIClient
+from modules.ai.runtime import execute_ai_chat
+from modules.ai.streaming import TkChunkPump
 from modules.generic.generic_model_wrapper import GenericModelWrapper
 from modules.helpers.logging_helper import log_module_import
 
@@ -61,6 +64,7 @@ class AuthoringWizardView(ctk.CTkFrame):
         # displaying a human-friendly text view in the UI.
         self._last_npc_data = None
         self._last_scenario_data = None
+        self._beat_stop = None
 
         # Presets
         self.tones = [
@@ -192,7 +196,14 @@ class AuthoringWizardView(ctk.CTkFrame):
         ctk.CTkLabel(left, text="Beat (short sentence/idea)").pack(anchor="w")
         self.beat_input = ctk.CTkTextbox(left, wrap="word", height=160)
         self.beat_input.pack(fill="both", expand=True)
-        ctk.CTkButton(left, text="Expand Beat", command=self.expand_beat).pack(pady=6)
+        buttons = ctk.CTkFrame(left, fg_color="transparent")
+        buttons.pack(pady=6)
+        self.beat_button = ctk.CTkButton(buttons, text="Expand Beat", command=self.expand_beat)
+        self.beat_button.pack(side="left", padx=3)
+        self.beat_stop_button = ctk.CTkButton(
+            buttons, text="Stop", width=80, state="disabled", command=self.stop_beat
+        )
+        self.beat_stop_button.pack(side="left", padx=3)
 
         ctk.CTkLabel(right, text="Expanded Scene").pack(anchor="w")
         self.beat_output = ctk.CTkTextbox(right, wrap="word")
@@ -288,14 +299,6 @@ class AuthoringWizardView(ctk.CTkFrame):
             messagebox.showerror("AI JSON Error", f"Failed to parse JSON: {e}\nRaw: {resp[:5000]}")
             return {}
 
-    def _chat_text(self, user_prompt: str) -> str:
-        """Internal helper for chat text."""
-        messages = [
-            {"role": "system", "content": self._system_hdr() + " Return plain text."},
-            {"role": "user", "content": user_prompt},
-        ]
-        return self.ai.chat(messages)
-
     # -------- Formatting helpers (text view) --------
     def _format_kv(self, key, value):
         """Format kv."""
@@ -596,6 +599,42 @@ class AuthoringWizardView(ctk.CTkFrame):
             "Expand the following GM beat into a short playable scene (6-10 lines), "
             "including sensory details and possible player choices. Keep it system-agnostic.\n\nBeat:\n" + beat
         )
-        text = self._chat_text(self._with_lore(prompt))
+        messages = [
+            {"role": "system", "content": self._system_hdr() + " Return plain text."},
+            {"role": "user", "content": self._with_lore(prompt)},
+        ]
+        # Stream the scene into the output box as the model writes it.
         self.beat_output.delete("1.0", "end")
-        self.beat_output.insert("1.0", text.strip())
+        stop = self._beat_stop = threading.Event()
+        self.beat_button.configure(state="disabled")
+        self.beat_stop_button.configure(state="normal")
+
+        def finished():
+            self.beat_button.configure(state="normal")
+            self.beat_stop_button.configure(state="disabled")
+
+        pump = TkChunkPump(
+            self, lambda chunk: self.beat_output.insert("end", chunk), on_done=finished
+        ).start()
+
+        def worker():
+            try:
+                execute_ai_chat(
+                    self.ai,
+                    messages,
+                    pipeline_name="authoring_wizard.expand_beat",
+                    context_metadata={"feature": "authoring_wizard", "action_label": "Expand beat"},
+                    on_chunk=pump.put,
+                    stop_event=stop,
+                )
+            except Exception as exc:
+                self.after(0, lambda: messagebox.showerror("AI Error", f"Failed to expand beat: {exc}"))
+            finally:
+                pump.close()
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def stop_beat(self):
+        """Cancel the beat expansion in progress."""
+        if self._beat_stop is not None:
+            self._beat_stop.set()
@@ -27,7 +27,7 @@ class AutoGenerationService:
         include_linked: bool = True,
     ) -> List[Dict[str, Any]]:
         """Handle generate and save."""
-        items = self._generator.generate(entity_slug, count, user_prompt)
+        items = self._generator.generate_batch(entity_slug, count, user_prompt)
         self._generator.save(entity_slug, items)
 
         if include_linked:
@@ -75,7 +75,8 @@ class AutoGenerationService:
                 continue
 
             wrapper = GenericModelWrapper(linked_slug, db_path=self._db_path)
-            missing = [name for name in names if not wrapper.load_item_by_key(name)]
+            existing = wrapper.existing_keys(names)
+            missing = [name for name in names if name not in existing]
             if not missing:
                 continue
 
@@ -5,6 +5,7 @@ from typing import Dict, List, Any
 
 from db.db import load_schema_from_json
 from modules.ai.local_ai_client import LocalAIClient
+from modules.ai.ollama_model_service import get_model_catalog
 from modules.ai.automation.prompt_builder import (
     build_entity_prompt,
     build_linked_entities_prompt,
@@ -12,17 +13,31 @@ from modules.ai.automation.prompt_builder import (
 )
 from modules.ai.automation.response_parser import parse_ai_json, parse_story_arc_json
 from modules.generic.generic_model_wrapper import GenericModelWrapper
+from modules.helpers.config_helper import ConfigHelper
 from modules.helpers.logging_helper import log_info, log_module_import
 from modules.helpers.template_loader import load_template
 
 log_module_import(__name__)
 
+DEFAULT_CONTEXT_WINDOW = 8192
+TOKENS_PER_FIELD = 60
+MAX_ITEMS_PER_REQUEST = 25
+MAX_REFILL_ROUNDS = 2
+# Keep one batched request within this many seconds at the model's measured speed.
+MAX_SECONDS_PER_REQUEST = 180
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token)."""
+    return len(text or "") // 4 + 1
+
 
 class EntityAutoGenerator:
-    def __init__(self, *, db_path: str | None = None):
+    def __init__(self, *, db_path: str | None = None, ai_client=None):
         """Initialize the EntityAutoGenerator instance."""
         self._db_path = db_path
-        self._ai = LocalAIClient()
+        self._ai = ai_client or LocalAIClient()
+        self._schema_ready: set[str] = set()
 
     def generate(self, entity_slug: str, count: int, user_prompt: str) -> List[Dict[str, Any]]:
         """Handle generate."""
@@ -64,12 +79,91 @@ class EntityAutoGenerator:
         items = self._normalize_payload(entity_slug, payload, len(names), expected_names=names)
         return items
 
+    def generate_batch(
+        self,
+        entity_slug: str,
+        count: int,
+        user_prompt: str,
+        *,
+        context_window: int | None = None,
+    ) -> List[Dict[str, Any]]:
+        """Generate *count* new entities in as few requests as the context allows.
+
+        Each request asks for as many items as fit in the model's context
+        window. Names that already exist in the table or earlier in the
+        batch are dropped, and a couple of extra rounds refill the shortfall.
+        """
+        if count <= 0:
+            return []
+        model_info = self._model_info()
+        window = context_window or self._context_window(model_info)
+        key_field = self._infer_key_field(entity_slug)
+        self._ensure_schema(entity_slug)
+        wrapper = GenericModelWrapper(entity_slug, db_path=self._db_path)
+        field_count = max(1, len(load_template(entity_slug).get("fields", [])))
+        item_tokens = TOKENS_PER_FIELD * field_count
+        max_per_request = MAX_ITEMS_PER_REQUEST
+        if model_info is not None and model_info.tokens_per_second:
+            affordable = int(model_info.tokens_per_second * MAX_SECONDS_PER_REQUEST) // item_tokens
+            max_per_request = max(1, min(max_per_request, affordable))
+
+        accepted: List[Dict[str, Any]] = []
+        seen: set[str] = set()
+        requests_left = None
+        while len(accepted) < count:
+            missing = count - len(accepted)
+            avoid = [item[key_field] for item in accepted]
+            base_prompt = build_entity_prompt(
+                entity_slug, missing, user_prompt, db_path=self._db_path, avoid_names=avoid
+            )
+            room = max(1, (window - estimate_tokens(base_prompt)) // item_tokens)
+            per_request = min(missing, room, max_per_request)
+            if requests_left is None:
+                # Planned requests plus a few refill rounds for dropped duplicates.
+                requests_left = -(-count // per_request) + MAX_REFILL_ROUNDS
+            if requests_left <= 0:
+                break
+            requests_left -= 1
+
+            prompt = base_prompt if per_request == missing else build_entity_prompt(
+                entity_slug, per_request, user_prompt, db_path=self._db_path, avoid_names=avoid
+            )
+            response = self._ai.chat(
+                [
+                    {"role": "system", "content": "You are a helpful RPG content generator."},
+                    {"role": "user", "content": prompt},
+                ]
+            )
+            items = self._normalize_payload(entity_slug, parse_ai_json(response), per_request)
+            fresh = []
+            for item in items:
+                # Process each item from items.
+                name = str(item.get(key_field) or "").strip()
+                if not name or name.casefold() in seen:
+                    continue
+                seen.add(name.casefold())
+                item[key_field] = name
+                fresh.append(item)
+            existing = {
+                key.casefold()
+                for key in wrapper.existing_keys([item[key_field] for item in fresh], key_field, nocase=True)
+            } if fresh else set()
+            accepted.extend(item for item in fresh if item[key_field].casefold() not in existing)
+
+        if len(accepted) < count:
+            log_info(
+                f"Generated {len(accepted)}/{count} unique {entity_slug}; the rest were duplicates.",
+                func_name="EntityAutoGenerator.generate_batch",
+            )
+        return accepted[:count]
+
     def save(self, entity_slug: str, items: List[Dict[str, Any]]) -> None:
-        """Save the operation."""
+        """Save the operation in one transaction."""
+        if not items:
+            return
         self._ensure_schema(entity_slug)
         wrapper = GenericModelWrapper(entity_slug, db_path=self._db_path)
-        for item in items:
-            wrapper.save_item(item)
+        wrapper.save_items(items, replace=False)
         log_info(
             f"Saved {len(items)} {entity_slug} item(s) via automation.",
             func_name="EntityAutoGenerator.save",
@@ -131,9 +225,11 @@ class EntityAutoGenerator:
             }
             if notes:
                 item["Notes"] = notes
-            wrapper.save_item(item)
             saved_items.append(item)
 
+        if saved_items:
+            wrapper.save_items(saved_items, replace=False)
+
         log_info(
             f"Saved {len(saved_items)} scenario(s) from story arc via automation.",
             func_name="EntityAutoGenerator.save_story_arc",
@@ -208,10 +304,31 @@ class EntityAutoGenerator:
             return "Title"
         return "Name"
 
+    def _model_info(self):
+        """Return the catalog entry for the client's model, if it has one."""
+        base_url = getattr(self._ai, "base_url", None)
+        model = getattr(self._ai, "model", None)
+        if not base_url or not model:
+            return None
+        return get_model_catalog().info(base_url, model)
+
+    def _context_window(self, model_info=None) -> int:
+        """Return ``[AI] context_window``, else the catalogued context length."""
+        configured = ConfigHelper.get("AI", "context_window", fallback="")
+        try:
+            if configured:
+                return int(configured)
+        except (TypeError, ValueError):
+            pass
+        if model_info is not None and model_info.context_length:
+            return model_info.context_length
+        return DEFAULT_CONTEXT_WINDOW
+
     def _ensure_schema(self, entity_slug: str) -> None:
-        """Ensure schema."""
-        if not self._db_path:
+        """Ensure schema, once per entity type for this generator."""
+        if not self._db_path or entity_slug in self._schema_ready:
             return
+        self._schema_ready.add(entity_slug)
         schema = load_schema_from_json(entity_slug)
         if not schema:
             return
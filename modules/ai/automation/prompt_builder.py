@@ -54,8 +54,22 @@ def _entity_content_guidance(entity_slug: str) -> str:
     return ""
 
 
-def build_entity_prompt(entity_slug: str, count: int, user_prompt: str, *, db_path: str | None = None) -> str:
-    """Build entity prompt."""
+def _avoid_names_rule(names: List[str] | None) -> str:
+    """Return the rule forbidding already used names, or an empty string."""
+    if not names:
+        return ""
+    return f"- Every item needs a new, distinct name; do not use any of: {', '.join(names)}.\n"
+
+
+def build_entity_prompt(
+    entity_slug: str,
+    count: int,
+    user_prompt: str,
+    *,
+    db_path: str | None = None,
+    avoid_names: List[str] | None = None,
+) -> str:
+    """Build entity prompt; ``avoid_names`` lists names that must not be reused."""
     template = load_template(entity_slug)
     fields = template.get("fields", [])
     field_list = _format_fields(fields)
@@ -81,7 +95,8 @@ def build_entity_prompt(entity_slug: str, count: int, user_prompt: str, *, db_pa
         "- Use lists for fields typed as list.\n"
         "- Use plain strings for text/longtext/file/audio fields.\n"
         "- Fill missing fields with empty strings or empty lists.\n"
-        "- Do not wrap the JSON in markdown fences.\n\n"
+        "- Do not wrap the JSON in markdown fences.\n"
+        f"{_avoid_names_rule(avoid_names)}\n"
         f"Example shape (not actual content):\n{schema_json}\n\n"
         f"User prompt: {user_prompt}\n"
     )
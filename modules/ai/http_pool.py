@@ -0,0 +1,225 @@
+"""Shared HTTP sessions and concurrency limits for AI backends.
+
+Every backend (the local language model, SwarmUI) gets one
+:class:`BackendPool`.  It holds a keep-alive ``requests.Session``, admits at
+most ``max_concurrent`` requests at a time with interactive work ahead of
+batch work, and retries 429/503 answers with jittered exponential backoff.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import random
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Callable, Iterator, Optional
+
+import requests
+
+from modules.helpers.config_helper import ConfigHelper
+from modules.helpers.logging_helper import log_module_import, log_warning
+
+log_module_import(__name__)
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BATCH = 10
+
+RETRY_STATUSES = frozenset({429, 503})
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_BASE = 0.5
+DEFAULT_BACKOFF_MAX = 30.0
+
+# Config section and default concurrency for each known backend.
+_BACKEND_CONFIG = {
+    "ai": ("AI", 2),
+    "swarmui": ("SwarmUI", 1),
+}
+
+
+class PriorityLimiter:
+    """Counting semaphore that wakes waiters lowest priority value first.
+
+    Waiters of equal priority are admitted in arrival order.
+    """
+
+    def __init__(self, max_concurrent: int) -> None:
+        self.max_concurrent = max(1, int(max_concurrent))
+        self._cond = threading.Condition()
+        self._waiting: list[tuple[int, int]] = []
+        self._counter = itertools.count()
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        with self._cond:
+            return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        with self._cond:
+            return len(self._waiting)
+
+    def acquire(self, priority: int = PRIORITY_INTERACTIVE) -> None:
+        with self._cond:
+            ticket = (int(priority), next(self._counter))
+            heapq.heappush(self._waiting, ticket)
+            while self._waiting[0] != ticket or self._in_flight >= self.max_concurrent:
+                self._cond.wait()
+            heapq.heappop(self._waiting)
+            self._in_flight += 1
+            # The next waiter may also fit if several slots are free.
+            self._cond.notify_all()
+
+    def release(self) -> None:
+        with self._cond:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, priority: int = PRIORITY_INTERACTIVE) -> Iterator[None]:
+        self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+
+def _retry_after_seconds(response) -> Optional[float]:
+    """Return the delay requested by a ``Retry-After`` header, if any."""
+    value = (getattr(response, "headers", None) or {}).get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class BackendPool:
+    """Pooled, rate-limited HTTP access to one backend server."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_concurrent: int = 2,
+        pool_size: int = 8,
+        retries: int = DEFAULT_RETRIES,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+        session_factory: Optional[Callable[[], object]] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.name = name
+        self.limiter = PriorityLimiter(max_concurrent)
+        self.pool_size = max(1, int(pool_size), self.limiter.max_concurrent)
+        self.retries = max(0, int(retries))
+        self.backoff_base = float(backoff_base)
+        self.backoff_max = float(backoff_max)
+        self._session_factory = session_factory
+        self._sleep = sleep
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self):
+        """Return the shared keep-alive session, creating it on first use."""
+        with self._session_lock:
+            if self._session is None:
+                self._session = self._session_factory() if self._session_factory else self._new_session()
+            return self._session
+
+    def _new_session(self):
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def slot(self, priority: int = PRIORITY_INTERACTIVE):
+        """Hold one concurrency slot, e.g. for the lifetime of a streamed response."""
+        return self.limiter.slot(priority)
+
+    def backoff_delay(self, attempt: int, response=None) -> float:
+        """Full-jitter exponential backoff, honouring ``Retry-After``."""
+        requested = _retry_after_seconds(response) if response is not None else None
+        if requested is not None:
+            return min(requested, self.backoff_max)
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    def send(self, method: str, url: str, **kwargs):
+        """Send without taking a slot, retrying 429/503 answers."""
+        attempt = 0
+        while True:
+            response = self.session.request(method, url, **kwargs)
+            if getattr(response, "status_code", 200) not in RETRY_STATUSES or attempt >= self.retries:
+                return response
+            delay = self.backoff_delay(attempt, response)
+            log_warning(
+                f"{self.name} answered {response.status_code}; retrying in {delay:.1f}s",
+                func_name="BackendPool.send",
+            )
+            response.close()
+            self._sleep(delay)
+            attempt += 1
+
+    def request(self, method: str, url: str, *, priority: int = PRIORITY_INTERACTIVE, **kwargs):
+        """Send one request inside a concurrency slot."""
+        with self.slot(priority):
+            return self.send(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": self.limiter.in_flight,
+            "queue_depth": self.limiter.queue_depth,
+            "max_concurrent": self.limiter.max_concurrent,
+        }
+
+    def close(self) -> None:
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+_POOLS: dict[str, BackendPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _configured_concurrency(name: str) -> int:
+    section, default = _BACKEND_CONFIG.get(name, ("AI", 2))
+    value = ConfigHelper.get(section, "max_concurrent_requests", fallback=str(default))
+    try:
+        return max(1, int(value or default))
+    except (TypeError, ValueError):
+        return default
+
+
+def get_backend_pool(name: str) -> BackendPool:
+    """Return the process-wide pool for backend *name* (``"ai"``, ``"swarmui"``)."""
+    with _POOLS_LOCK:
+        pool = _POOLS.get(name)
+        if pool is None:
+            pool = _POOLS[name] = BackendPool(name, max_concurrent=_configured_concurrency(name))
+        return pool
+
+
+def pool_stats() -> dict[str, dict]:
+    """Return in-flight and queued request counts per backend for diagnostics."""
+    with _POOLS_LOCK:
+        pools = dict(_POOLS)
+    return {name: pool.stats() for name, pool in pools.items()}
@@ -1,10 +1,13 @@
 """Client helpers for local AI."""
-import requests
 import json
 import platform
 import subprocess
 import tempfile
 import os
+from modules.ai.http_pool import PRIORITY_INTERACTIVE, get_backend_pool
+from modules.ai.ollama_model_service import get_model_catalog
+from modules.ai.response_cache import get_response_cache, make_cache_key
+from modules.ai.streaming import iter_stream_text
 from modules.helpers.config_helper import ConfigHelper
 from modules.helpers.logging_helper import log_module_import
 
@@ -21,12 +24,24 @@ class LocalAIClient:
       - model:   model name/id to request
       - temperature: default generation temperature (float)
       - max_tokens:  optional default max tokens (int)
-      - use_powershell: if true on Windows, call via PowerShell
-                        Invoke-WebRequest (default true on Windows)
+      - use_powershell: if true on Windows, send non-streamed requests via
+                        PowerShell Invoke-WebRequest (default true on Windows)
+      - response_cache: cache deterministic responses on disk (default true)
+      - max_concurrent_requests: generations sent to the server at once
+                                 (default 2); extra requests queue
+
+    Requests share the keep-alive pool of the "ai" backend. Batch callers pass
+    ``priority=PRIORITY_BATCH`` so interactive requests jump ahead of them.
+    Ollama's eval counters feed the model catalog's tokens-per-second figure.
     """
 
-    def __init__(self):
-        """Initialize the LocalAIClient instance."""
+    def __init__(self, *, response_cache=None, priority=PRIORITY_INTERACTIVE):
+        """Initialize the LocalAIClient instance.
+
+        ``response_cache`` overrides the shared :class:`AIResponseCache`.
+        """
+        self._response_cache = response_cache
+        self.priority = priority
         # Default to local webserver compatible with /api/generate
         self.base_url = (ConfigHelper.get("AI", "base_url", fallback="http://127.0.0.1:11434") or "").rstrip("/")
         self.api_key = ConfigHelper.get("AI", "api_key", fallback=None)
@@ -269,56 +284,181 @@ class LocalAIClient:
         except Exception as e:
             raise RuntimeError(f"Could not parse PowerShell JSON: {e}. Raw: {out[:500]}")
 
-    def chat(self, messages, model=None, temperature=None, max_tokens=None, timeout=600):
-        """
-        Send a chat completion request and return the assistant's text.
+    def _get_response_cache(self):
+        """Return the response cache, resolving the shared one lazily."""
+        if self._response_cache is None:
+            shared = get_response_cache()
+            self._response_cache = False if shared is None else shared
+        return None if self._response_cache is False else self._response_cache
 
-        messages: list[{role, content}] per OpenAI API
-        """
-        # Build a single prompt string from chat-style messages
-        def _to_prompt(msgs):
-            """Internal helper for to prompt."""
-            if isinstance(msgs, str):
-                return msgs
-            parts = []
-            for m in msgs or []:
-                role = m.get("role", "user")
-                content = m.get("content", "")
-                parts.append(f"{role.capitalize()}: {content}")
-            # End with Assistant: to hint completion
-            parts.append("Assistant:")
-            return "\n".join(parts).strip()
-
-        prompt_text = _to_prompt(messages)
+    @staticmethod
+    def _to_prompt(msgs):
+        """Build a single prompt string from chat-style messages."""
+        if isinstance(msgs, str):
+            return msgs
+        parts = []
+        for m in msgs or []:
+            role = m.get("role", "user")
+            content = m.get("content", "")
+            parts.append(f"{role.capitalize()}: {content}")
+        # End with Assistant: to hint completion
+        parts.append("Assistant:")
+        return "\n".join(parts).strip()
+
+    def _prepare(self, messages, model, temperature, max_tokens, cache, stream):
+        """Return ``(url, payload, response_cache, cache_key)`` for one request."""
+        prompt_text = self._to_prompt(messages)
 
         # Target Ollama/text-gen style endpoint as per template
         # e.g. http://127.0.0.1:11434/api/generate
         generate_path = "/api/generate"
         url = f"{self.base_url}{generate_path}"
 
+        effective_temperature = self.temperature if temperature is None else temperature
+        effective_max_tokens = self.max_tokens if max_tokens is None else max_tokens
+        # The sampling values are sent so the cache key describes what the server ran.
+        options = {"temperature": float(effective_temperature or 0)}
+        if effective_max_tokens and int(effective_max_tokens) > 0:
+            options["num_predict"] = int(effective_max_tokens)
         payload = {
             "model": model or self.model,
             "prompt": prompt_text,
-            "stream": False,
+            "stream": stream,
+            "options": options,
         }
 
+        use_cache = cache if cache is not None else options["temperature"] <= 0
+        response_cache = self._get_response_cache() if use_cache else None
+        cache_key = None
+        if response_cache is not None:
+            cache_key = make_cache_key(
+                endpoint=url,
+                model=payload["model"],
+                prompt=prompt_text,
+                temperature=options["temperature"],
+                max_tokens=options.get("num_predict", 0),
+            )
+        return url, payload, response_cache, cache_key
+
+    def forget(self, messages, model=None, temperature=None, max_tokens=None):
+        """Drop the cached response for this request, e.g. after it failed validation.
+
+        The next identical request reaches the server again instead of
+        replaying the rejected answer.
+        """
+        _url, _payload, response_cache, cache_key = self._prepare(
+            messages, model, temperature, max_tokens, True, stream=False
+        )
+        if cache_key is not None:
+            response_cache.discard(cache_key)
+
+    def chat(self, messages, model=None, temperature=None, max_tokens=None, timeout=600, cache=None):
+        """
+        Send a chat completion request and return the assistant's text.
+
+        messages: list[{role, content}] per OpenAI API
+        cache: ``None`` reuses cached responses only for temperature 0,
+               ``True`` opts in at any temperature, ``False`` bypasses.
+        """
+        url, payload, response_cache, cache_key = self._prepare(
+            messages, model, temperature, max_tokens, cache, stream=False
+        )
+        if cache_key is not None:
+            cached = response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        data = self._post(url, payload, timeout)
+        self._record_throughput(payload["model"], data)
+        text = self._extract_text(data)
+        if cache_key is not None and text:
+            response_cache.put(cache_key, text)
+        return text
+
+    def chat_stream(
+        self,
+        messages,
+        model=None,
+        temperature=None,
+        max_tokens=None,
+        timeout=600,
+        cache=None,
+        stop_event=None,
+    ):
+        """
+        Yield the assistant's text in chunks as the server produces them.
+
+        Understands Ollama NDJSON and OpenAI-style SSE bodies. Setting
+        ``stop_event`` ends the stream and closes the connection; a cached
+        response arrives as a single chunk. Streams always go through the
+        shared pool, even when ``use_powershell`` is set. ``timeout`` bounds
+        the wait for each chunk rather than the whole completion.
+        """
+        url, payload, response_cache, cache_key = self._prepare(
+            messages, model, temperature, max_tokens, cache, stream=True
+        )
+        if cache_key is not None:
+            cached = response_cache.get(cache_key)
+            if cached is not None:
+                yield cached
+                return
+
+        parts = []
+        pool = get_backend_pool("ai")
+        # Hold the slot until the stream ends so the server's load stays bounded.
+        with pool.slot(self.priority):
+            resp = pool.send("POST", url, json=payload, headers=self._headers(), timeout=timeout, stream=True)
+            try:
+                resp.raise_for_status()
+                for chunk in iter_stream_text(resp.iter_lines(), stop_event):
+                    parts.append(chunk)
+                    yield chunk
+            finally:
+                resp.close()
+        if cache_key is not None and parts and not (stop_event is not None and stop_event.is_set()):
+            response_cache.put(cache_key, "".join(parts).strip())
+
+    def _record_throughput(self, model, data):
+        """Feed Ollama's eval counters into the model catalog's speed estimate."""
+        if not isinstance(data, dict):
+            return
+        try:
+            tokens = int(data.get("eval_count") or 0)
+            seconds = float(data.get("eval_duration") or 0) / 1e9
+            if tokens > 0 and seconds > 0:
+                get_model_catalog().record_throughput(self.base_url, model, tokens, seconds)
+        except (TypeError, ValueError):
+            pass
+
+    def _headers(self):
+        """Return the request headers, including the bearer token if configured."""
         headers = {"Content-Type": "application/json"}
         if self.api_key:
             headers["Authorization"] = f"Bearer {self.api_key}"
-        
+        return headers
+
+    def _post(self, url, payload, timeout):
+        """Send one generate request and return the decoded JSON body."""
+        headers = self._headers()
         data = None
-        # Optionally use PowerShell to make the request (matches user template)
-        if self.use_powershell and platform.system() == "Windows":
-            try:
-                data = self._powershell_generate(url, payload, headers)
-            except Exception:
-                # Fallback to requests if PowerShell path fails
-                data = None
-        if data is None:
-            resp = requests.post(url, json=payload, headers=headers, timeout=timeout)
-            resp.raise_for_status()
-            data = self._parse_json_safe(resp.text)
+        pool = get_backend_pool("ai")
+        with pool.slot(self.priority):
+            # Optionally use PowerShell to make the request (matches user template)
+            if self.use_powershell and platform.system() == "Windows":
+                try:
+                    data = self._powershell_generate(url, payload, headers)
+                except Exception:
+                    # Fallback to requests if PowerShell path fails
+                    data = None
+            if data is None:
+                resp = pool.send("POST", url, json=payload, headers=headers, timeout=timeout)
+                resp.raise_for_status()
+                data = self._parse_json_safe(resp.text)
+        return data
 
+    @staticmethod
+    def _extract_text(data):
+        """Return the assistant text from a generate/chat completion body."""
         # Prefer Ollama/text-gen style response key
         if isinstance(data, dict):
             # Handle the branch where isinstance(data, dict).
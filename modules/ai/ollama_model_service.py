@@ -1,26 +1,226 @@
-"""Helpers for discovering locally available Ollama models."""
+"""Helpers for discovering locally available Ollama models.
+
+Discovered models are kept in a persistent :class:`ModelCatalog` with a TTL.
+:meth:`OllamaModelService.list_models` answers from the catalog and refreshes
+stale entries on a background thread, so opening a model picker never waits on
+a stopped server. The catalog also records per-model metadata (context
+length, last measured tokens per second) that the rest of the AI pipeline
+uses to size requests.
+"""
 
 from __future__ import annotations
 
+import json
+import os
 import subprocess
-from typing import Any
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
 
 import requests
 
+from modules.helpers.config_helper import ConfigHelper
+from modules.helpers.logging_helper import log_module_import, log_warning
+
+log_module_import(__name__)
+
+DEFAULT_BASE_URL = "http://127.0.0.1:11434"
+DEFAULT_CATALOG_PATH = Path.home() / ".gmcampaigndesigner" / "ollama_model_catalog.json"
+DEFAULT_TTL_SECONDS = 3600.0
+_THROUGHPUT_SMOOTHING = 0.5
+_THROUGHPUT_FLUSH_SECONDS = 300.0
+# Context Ollama allocates when neither the Modelfile nor the request sets num_ctx.
+OLLAMA_DEFAULT_NUM_CTX = 2048
+
+
+@dataclass
+class ModelInfo:
+    """What is known about one model served by one Ollama instance."""
+
+    name: str
+    context_length: Optional[int] = None
+    tokens_per_second: Optional[float] = None
+    size: Optional[int] = None
+
+
+class ModelCatalog:
+    """JSON-backed model list per server, with refresh timestamps.
+
+    Throughput updates stay in memory and reach the file with the next
+    refresh, or at most every few minutes.
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_CATALOG_PATH, *, ttl_seconds: float = DEFAULT_TTL_SECONDS) -> None:
+        self.path = Path(path)
+        self.ttl_seconds = float(ttl_seconds)
+        self._lock = threading.Lock()
+        self._servers: dict[str, dict[str, Any]] = self._read()
+        self._dirty = False
+        self._written_at = time.monotonic()
+
+    def models(self, base_url: str) -> list[ModelInfo]:
+        """Return the cached models of *base_url* in discovery order."""
+        with self._lock:
+            entries = self._servers.get(_server_key(base_url), {}).get("models", {})
+            return [ModelInfo(**entry) for entry in entries.values()]
+
+    def info(self, base_url: str, model: str) -> Optional[ModelInfo]:
+        with self._lock:
+            entry = self._servers.get(_server_key(base_url), {}).get("models", {}).get(model)
+            return ModelInfo(**entry) if entry else None
+
+    def is_stale(self, base_url: str, now: Optional[float] = None) -> bool:
+        with self._lock:
+            refreshed_at = self._servers.get(_server_key(base_url), {}).get("refreshed_at", 0.0)
+        return (now if now is not None else time.time()) - refreshed_at > self.ttl_seconds
+
+    def replace(self, base_url: str, models: list[ModelInfo]) -> None:
+        """Store a fresh model list, keeping measured throughput for known models."""
+        with self._lock:
+            server = self._servers.setdefault(_server_key(base_url), {})
+            previous = server.get("models", {})
+            entries = {}
+            for model in models:
+                if model.tokens_per_second is None:
+                    model.tokens_per_second = previous.get(model.name, {}).get("tokens_per_second")
+                entries[model.name] = asdict(model)
+            server["models"] = entries
+            server["refreshed_at"] = time.time()
+            self._write()
+
+    def record_throughput(self, base_url: str, model: str, tokens: int, seconds: float) -> None:
+        """Blend one generation's tokens-per-second into the model's estimate."""
+        if not model or tokens <= 0 or seconds <= 0:
+            return
+        rate = tokens / seconds
+        with self._lock:
+            entries = self._servers.setdefault(_server_key(base_url), {}).setdefault("models", {})
+            entry = entries.setdefault(model, asdict(ModelInfo(model)))
+            previous = entry.get("tokens_per_second")
+            entry["tokens_per_second"] = round(
+                rate if not previous else previous + _THROUGHPUT_SMOOTHING * (rate - previous), 2
+            )
+            self._dirty = True
+            if time.monotonic() - self._written_at >= _THROUGHPUT_FLUSH_SECONDS:
+                self._write()
+
+    def flush(self) -> None:
+        """Write throughput updates that are still only in memory."""
+        with self._lock:
+            if self._dirty:
+                self._write()
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _write(self) -> None:
+        """Replace the catalog file atomically; called with the lock held."""
+        self._dirty = False
+        self._written_at = time.monotonic()
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            temp_path.write_text(json.dumps(self._servers, indent=2), encoding="utf-8")
+            os.replace(temp_path, self.path)
+        except OSError as exc:
+            log_warning(f"Could not save the model catalog: {exc}", func_name="ModelCatalog._write")
+
+
+def _server_key(base_url: str) -> str:
+    return (base_url or DEFAULT_BASE_URL).rstrip("/")
+
+
+_SHARED: dict[str, ModelCatalog] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def get_model_catalog() -> ModelCatalog:
+    """Return the shared catalog configured under ``[AI]``."""
+    path = ConfigHelper.get("AI", "model_catalog_path", fallback="") or str(DEFAULT_CATALOG_PATH)
+    with _SHARED_LOCK:
+        catalog = _SHARED.get(path)
+        if catalog is None:
+            try:
+                ttl_minutes = float(ConfigHelper.get("AI", "model_catalog_ttl_minutes", fallback="60") or 60)
+            except (TypeError, ValueError):
+                ttl_minutes = 60.0
+            catalog = _SHARED[path] = ModelCatalog(path, ttl_seconds=ttl_minutes * 60)
+        return catalog
+
 
 class OllamaModelService:
     """Discover model names from Ollama without requiring generation calls."""
 
-    def __init__(self, base_url: str = "http://127.0.0.1:11434") -> None:
-        """Initialize the OllamaModelService instance."""
-        self.base_url = (base_url or "http://127.0.0.1:11434").rstrip("/")
+    _refreshing: set[str] = set()
+    _refreshing_lock = threading.Lock()
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        *,
+        catalog: Optional[ModelCatalog] = None,
+        http_client=None,
+        timeout: float = 5.0,
+    ) -> None:
+        """Initialize the OllamaModelService instance.
 
-    def list_models(self) -> list[str]:
-        """Return available Ollama model names, preferring ``ollama list`` output."""
-        models = self._list_models_from_cli()
-        if models:
-            return models
-        return self._list_models_from_api()
+        ``http_client`` is anything with ``requests``-style ``get``/``post``.
+        """
+        self.base_url = (base_url or DEFAULT_BASE_URL).rstrip("/")
+        self.catalog = catalog if catalog is not None else get_model_catalog()
+        self._http_client = http_client
+        self.timeout = timeout
+
+    def list_models(self, *, on_refresh: Optional[Callable[[list[str]], None]] = None) -> list[str]:
+        """Return available Ollama model names from the catalog.
+
+        Only an empty catalog waits for discovery. A stale one is returned
+        as is while a background refresh runs; ``on_refresh`` receives the new
+        names from that worker thread.
+        """
+        cached = [model.name for model in self.catalog.models(self.base_url)]
+        if not cached:
+            return self.refresh()
+        if self.catalog.is_stale(self.base_url):
+            self.refresh_async(on_refresh)
+        return cached
+
+    def refresh(self) -> list[str]:
+        """Rediscover models now and update the catalog; keeps old entries on failure."""
+        names = self._list_models_from_cli() or self._list_models_from_api()
+        if not names:
+            return [model.name for model in self.catalog.models(self.base_url)]
+        self.catalog.replace(self.base_url, [self._describe(name) for name in names])
+        return names
+
+    def refresh_async(self, on_refresh: Optional[Callable[[list[str]], None]] = None) -> Optional[threading.Thread]:
+        """Refresh on a daemon thread unless one is already running for this server."""
+        with self._refreshing_lock:
+            if self.base_url in self._refreshing:
+                return None
+            self._refreshing.add(self.base_url)
+
+        def worker() -> None:
+            try:
+                names = self.refresh()
+            except Exception as exc:
+                log_warning(f"Model refresh failed: {exc}", func_name="OllamaModelService.refresh_async")
+                return
+            finally:
+                with self._refreshing_lock:
+                    self._refreshing.discard(self.base_url)
+            if on_refresh is not None:
+                on_refresh(names)
+
+        thread = threading.Thread(target=worker, name="ollama-model-refresh", daemon=True)
+        thread.start()
+        return thread
 
     @staticmethod
     def _list_models_from_cli() -> list[str]:
@@ -55,10 +255,13 @@ class OllamaModelService:
 
         return []
 
+    def _http(self):
+        return self._http_client if self._http_client is not None else requests
+
     def _list_models_from_api(self) -> list[str]:
         """Return model names from Ollama's HTTP tags endpoint."""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self._http().get(f"{self.base_url}/api/tags", timeout=self.timeout)
             response.raise_for_status()
             payload: Any = response.json()
         except Exception:
@@ -72,3 +275,35 @@ class OllamaModelService:
             if name and name not in names:
                 names.append(name)
         return names
+
+    def _describe(self, name: str) -> ModelInfo:
+        """Return *name* with the context length reported by ``/api/show``, when reachable."""
+        try:
+            response = self._http().post(f"{self.base_url}/api/show", json={"model": name}, timeout=self.timeout)
+            response.raise_for_status()
+            payload: Any = response.json()
+        except Exception:
+            return ModelInfo(name)
+        return ModelInfo(name, context_length=_context_length(payload))
+
+
+def _context_length(payload: Any) -> Optional[int]:
+    """Return the context Ollama actually serves the model with.
+
+    That is the Modelfile's ``num_ctx``, else Ollama's default, capped by the
+    architecture's maximum. Requests do not send ``options.num_ctx``.
+    """
+    if not isinstance(payload, dict):
+        return None
+    num_ctx = OLLAMA_DEFAULT_NUM_CTX
+    for line in str(payload.get("parameters") or "").splitlines():
+        parts = line.split()
+        if len(parts) == 2 and parts[0] == "num_ctx" and parts[1].isdigit():
+            num_ctx = int(parts[1])
+            break
+    model_info = payload.get("model_info")
+    if isinstance(model_info, dict):
+        for key, value in model_info.items():
+            if key.endswith(".context_length") and isinstance(value, int) and value > 0:
+                return min(num_ctx, value)
+    return num_ctx
@@ -0,0 +1,189 @@
+"""Persistent, content-addressed cache of local AI responses.
+
+Entries are keyed by a SHA-256 of the endpoint, model, normalized prompt and
+sampling parameters, and live in one SQLite file bounded by entry age and
+total size.  :class:`LocalAIClient` only consults it for deterministic
+requests (temperature 0) unless the caller opts in.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from modules.helpers.config_helper import ConfigHelper
+from modules.helpers.logging_helper import log_module_import, log_warning
+
+log_module_import(__name__)
+
+DEFAULT_CACHE_PATH = Path.home() / ".gmcampaigndesigner" / "ai_response_cache.sqlite3"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_AGE_SECONDS = 30 * 24 * 3600
+_PRUNE_EVERY_WRITES = 50
+_TRAILING_SPACE = re.compile(r"[ \t]+(?=\n|$)")
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Normalize line endings and trailing blanks so cosmetic edits still hit."""
+    text = str(prompt or "").replace("\r\n", "\n").replace("\r", "\n")
+    return _TRAILING_SPACE.sub("", text).strip()
+
+
+def make_cache_key(
+    *,
+    endpoint: str,
+    model: str,
+    prompt: str,
+    temperature: Optional[float],
+    max_tokens: Optional[int],
+) -> str:
+    """Return the content address of one request."""
+    material = json.dumps(
+        {
+            "endpoint": endpoint,
+            "model": model,
+            "prompt": normalize_prompt(prompt),
+            "temperature": None if temperature is None else round(float(temperature), 4),
+            "max_tokens": int(max_tokens or 0),
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class AIResponseCache:
+    """SQLite-backed response store with age and size limits."""
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_CACHE_PATH,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+    ) -> None:
+        self.path = Path(path)
+        self.max_bytes = max(0, int(max_bytes))
+        self.max_age_seconds = float(max_age_seconds)
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    used_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS responses_used_at ON responses(used_at)")
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for *key*, or ``None`` if missing or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            response, created_at = row
+            with self._conn:
+                if now - created_at > self.max_age_seconds:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    return None
+                self._conn.execute("UPDATE responses SET used_at = ? WHERE key = ?", (now, key))
+        return response
+
+    def put(self, key: str, response: str) -> None:
+        text = str(response)
+        size = len(text.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses(key, response, size, created_at, used_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, text, size, now, now),
+                )
+            self._writes += 1
+            if self._writes % _PRUNE_EVERY_WRITES == 1:
+                self._prune(now)
+
+    def discard(self, key: str) -> None:
+        """Drop the response stored under *key*, if any."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0])
+
+    def _prune(self, now: float) -> None:
+        """Drop expired entries, then least recently used ones over the size cap."""
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM responses WHERE created_at < ?", (now - self.max_age_seconds,)
+            )
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            excess = total - self.max_bytes
+            doomed = []
+            for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY used_at ASC"):
+                doomed.append((key,))
+                excess -= size
+                if excess <= 0:
+                    break
+            self._conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_SHARED: dict[str, AIResponseCache] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def get_response_cache() -> Optional[AIResponseCache]:
+    """Return the shared cache configured under ``[AI]``, or ``None`` if disabled."""
+    if not ConfigHelper.getboolean("AI", "response_cache", fallback=True):
+        return None
+    path = ConfigHelper.get("AI", "response_cache_path", fallback="") or str(DEFAULT_CACHE_PATH)
+    with _SHARED_LOCK:
+        cache = _SHARED.get(path)
+        if cache is None:
+            try:
+                max_mb = float(ConfigHelper.get("AI", "response_cache_max_mb", fallback="64") or 64)
+                max_days = float(ConfigHelper.get("AI", "response_cache_max_age_days", fallback="30") or 30)
+                cache = _SHARED[path] = AIResponseCache(
+                    path,
+                    max_bytes=int(max_mb * 1024 * 1024),
+                    max_age_seconds=max_days * 24 * 3600,
+                )
+            except (OSError, ValueError, sqlite3.Error) as exc:
+                log_warning(
+                    f"AI response cache unavailable: {exc}",
+                    func_name="modules.ai.response_cache.get_response_cache",
+                )
+                return None
+        return cache
@@ -60,6 +60,12 @@ class AIPipelineRunner:
         )
         return response_text, metadata
 
+    def forget(self, messages, **chat_kwargs) -> None:
+        """Drop the client's cached answer to *messages* after it failed validation."""
+        forget = getattr(self.ai_client, "forget", None)
+        if forget is not None:
+            forget(messages, **chat_kwargs)
+
     def emit_phase(self, phase: str, message: str = "", **metadata) -> None:
         """Handle emit phase."""
         publish_local_ai_event(
@@ -77,9 +83,17 @@ class AIPipelineRunner:
         phase: str = "llm_call",
         phase_message: str = "Calling AI model",
         context_metadata: dict | None = None,
+        on_chunk=None,
+        stop_event=None,
         **chat_kwargs,
     ):
-        """Run chat."""
+        """Run chat.
+
+        With ``on_chunk`` the completion is streamed when the client supports
+        it: each text chunk is passed to the callback (from the calling
+        thread) and the assembled text is returned. ``stop_event`` cancels
+        the stream.
+        """
         context_metadata = context_metadata or {}
         action_label = str(context_metadata.get("action_label") or "").strip()
         feature = context_metadata.get("feature") or self.pipeline_name
@@ -111,7 +125,7 @@ class AIPipelineRunner:
         started = perf_counter()
         try:
             # Keep chat resilient if this step fails.
-            response_text = self.ai_client.chat(messages, **chat_kwargs)
+            response_text = self._chat(messages, on_chunk, stop_event, chat_kwargs)
         except Exception as exc:
             publish_local_ai_event(
                 event_type=EVENT_AI_PIPELINE_FAILED,
@@ -139,6 +153,20 @@ class AIPipelineRunner:
         )
         return response_text
 
+    def _chat(self, messages, on_chunk, stop_event, chat_kwargs):
+        """Call the client, streaming into ``on_chunk`` when requested."""
+        stream = getattr(self.ai_client, "chat_stream", None) if on_chunk is not None else None
+        if stream is None:
+            response_text = self.ai_client.chat(messages, **chat_kwargs)
+            if on_chunk is not None and response_text:
+                on_chunk(response_text)
+            return response_text
+        parts: list[str] = []
+        for chunk in stream(messages, stop_event=stop_event, **chat_kwargs):
+            parts.append(chunk)
+            on_chunk(chunk)
+        return "".join(parts).strip()
+
 
 
 def execute_ai_chat(
@@ -150,6 +178,8 @@ def execute_ai_chat(
     phase: str = "llm_call",
     phase_message: str = "Calling AI model",
     context_metadata: dict | None = None,
+    on_chunk=None,
+    stop_event=None,
     **chat_kwargs,
 ):
     """Handle execute AI chat."""
@@ -159,5 +189,7 @@ def execute_ai_chat(
         phase=phase,
         phase_message=phase_message,
         context_metadata=context_metadata,
+        on_chunk=on_chunk,
+        stop_event=stop_event,
         **chat_kwargs,
     )
@@ -1,5 +1,5 @@
 """Story Forge orchestration package for scenario drafting."""
 
-from .orchestrator import StoryForgeOrchestrator
+from .orchestrator import StoryForgeOrchestrator, StoryForgeSession
 
-__all__ = ["StoryForgeOrchestrator"]
+__all__ = ["StoryForgeOrchestrator", "StoryForgeSession"]
@@ -1,7 +1,15 @@
 ﻿"""Catalog helpers for Story Forge entity definitions and lookups."""
 from __future__ import annotations
 
+import itertools
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+
+from modules.ai.story_forge.scene_entity_assignment import entity_keywords
 from modules.generic.generic_model_wrapper import GenericModelWrapper
+from modules.helpers.logging_helper import log_warning
 
 
 ENTITY_TYPE_TO_FIELD = {
@@ -19,34 +27,164 @@ ENTITY_TYPE_TO_FIELD = {
 }
 
 
-def load_db_entity_catalog(entity_types: tuple[str, ...] | None = None, limit: int = 100) -> dict[str, list[str]]:
-    """Load existing entity names from DB wrappers to ground Story Forge output."""
+_NAME_COLUMNS = ("Name", "Title", "name")
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """One entity name and its matching keywords."""
+
+    name: str
+    keywords: tuple[str, ...]
+
+
+class EntityCatalog:
+    """Entity names per type for one database, cached until the next save.
+
+    Only the name column is read, and each type keeps an inverted index from
+    keyword to entries so names related to a text are found without
+    scanning the whole table.
+    """
+
+    def __init__(self, db_path: str | None = None) -> None:
+        self._db_path = db_path
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[CatalogEntry, ...]] = {}
+        self._keyword_index: dict[str, dict[str, tuple[CatalogEntry, ...]]] = {}
+
+    def entries(self, entity_type: str) -> tuple[CatalogEntry, ...]:
+        """Return the named entities of *entity_type* in table order."""
+        with self._lock:
+            cached = self._entries.get(entity_type)
+        if cached is not None:
+            return cached
+        entries = tuple(
+            CatalogEntry(name, entity_keywords(name)) for name in self._load_names(entity_type)
+        )
+        with self._lock:
+            self._entries[entity_type] = entries
+            self._keyword_index.pop(entity_type, None)
+        return entries
+
+    def names(self, entity_type: str, limit: int | None = None) -> list[str]:
+        """Return distinct names, taken from the first *limit* named rows."""
+        entries = self.entries(entity_type)
+        if limit is not None:
+            entries = entries[:limit]
+        return list(dict.fromkeys(entry.name for entry in entries))
+
+    def related_names(self, entity_type: str, text: str) -> list[str]:
+        """Return names sharing keywords with *text*, most shared keywords first."""
+        index = self._index_for(entity_type)
+        overlap: dict[CatalogEntry, int] = {}
+        for word in entity_keywords(text):
+            for entry in index.get(word, ()):
+                overlap[entry] = overlap.get(entry, 0) + 1
+        # Stable sort keeps table order among equally related names.
+        ranked = sorted(overlap, key=lambda entry: -overlap[entry])
+        return list(dict.fromkeys(entry.name for entry in ranked))
+
+    def invalidate(self, entity_type: str | None = None) -> None:
+        with self._lock:
+            if entity_type is None:
+                self._entries.clear()
+                self._keyword_index.clear()
+            else:
+                self._entries.pop(entity_type, None)
+                self._keyword_index.pop(entity_type, None)
+
+    def on_saved(self, db_path: str | None, event) -> None:
+        """Save listener: drop the cached names of the saved entity type."""
+        if _normalize_path(db_path) == _normalize_path(self._db_path):
+            self.invalidate(getattr(event, "entity_type", None))
+
+    def _index_for(self, entity_type: str) -> dict[str, tuple[CatalogEntry, ...]]:
+        entries = self.entries(entity_type)
+        with self._lock:
+            index = self._keyword_index.get(entity_type)
+        if index is not None:
+            return index
+        building: dict[str, list[CatalogEntry]] = {}
+        for entry in entries:
+            for keyword in entry.keywords:
+                building.setdefault(keyword, []).append(entry)
+        index = {keyword: tuple(bucket) for keyword, bucket in building.items()}
+        with self._lock:
+            if self._entries.get(entity_type) is entries:
+                self._keyword_index[entity_type] = index
+        return index
+
+    def _load_names(self, entity_type: str) -> list[str]:
+        """Read the name column of *entity_type* without deserializing rows."""
+        try:
+            wrapper = GenericModelWrapper(entity_type, db_path=self._db_path)
+            conn = wrapper._get_connection()
+            try:
+                columns = {row[1] for row in conn.execute(f'PRAGMA table_info("{entity_type}")')}
+                present = [column for column in _NAME_COLUMNS if column in columns]
+                if not present:
+                    return []
+                expression = "COALESCE(" + ", ".join(f'NULLIF(TRIM("{c}"), \'\')' for c in present) + ", '')"
+                rows = conn.execute(f'SELECT {expression} FROM "{entity_type}" ORDER BY rowid').fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error as exc:
+            log_warning(
+                f"Could not load {entity_type} names for the entity catalog: {exc}",
+                func_name="modules.ai.story_forge.entity_catalog.EntityCatalog._load_names",
+            )
+            return []
+        return [str(row[0]).strip() for row in rows if row[0] and str(row[0]).strip()]
+
+
+def _normalize_path(db_path: str | None) -> str | None:
+    return os.path.normcase(os.path.abspath(str(db_path))) if db_path else None
+
+
+_CATALOGS: dict[str | None, EntityCatalog] = {}
+_CATALOGS_LOCK = threading.Lock()
+
+
+def get_entity_catalog(db_path: str | None = None) -> EntityCatalog:
+    """Return the shared catalog for *db_path*, subscribed to entity saves."""
+    normalized = _normalize_path(db_path)
+    with _CATALOGS_LOCK:
+        catalog = _CATALOGS.get(normalized)
+        if catalog is None:
+            catalog = _CATALOGS[normalized] = EntityCatalog(db_path)
+            GenericModelWrapper.add_save_listener(catalog.on_saved)
+        return catalog
+
+
+def load_db_entity_catalog(
+    entity_types: tuple[str, ...] | None = None,
+    limit: int = 100,
+    *,
+    relevant_to: str = "",
+    db_path: str | None = None,
+) -> dict[str, list[str]]:
+    """Load existing entity names from DB wrappers to ground Story Forge output.
+
+    Names sharing keywords with *relevant_to* (e.g. the brief) are listed
+    first so they survive the *limit*.
+    """
 
     requested = entity_types or tuple(ENTITY_TYPE_TO_FIELD.keys())
-    catalog: dict[str, list[str]] = {}
+    catalog = get_entity_catalog(db_path)
+    result: dict[str, list[str]] = {}
     for entity_type in requested:
         # Process each entity_type from requested.
         field_name = ENTITY_TYPE_TO_FIELD.get(entity_type)
         if not field_name:
             continue
-        try:
-            wrapper = GenericModelWrapper(entity_type)
-            items = wrapper.load_items() or []
-        except Exception:
-            items = []
-        names: list[str] = []
-        for item in items:
-            # Process each item from items.
-            if not isinstance(item, dict):
-                continue
-            name = str(item.get("Name") or item.get("Title") or item.get("name") or "").strip()
-            if not name:
-                continue
-            names.append(name)
-            if len(names) >= limit:
-                break
-        catalog[field_name] = list(dict.fromkeys(names))
-    return catalog
+        if relevant_to:
+            related = catalog.related_names(entity_type, relevant_to)[:limit]
+            seen = set(related)
+            rest = (name for name in catalog.names(entity_type) if name not in seen)
+            result[field_name] = related + list(itertools.islice(rest, limit - len(related)))
+        else:
+            result[field_name] = catalog.names(entity_type, limit)
+    return result
 
 
 def load_campaign_arc_context(campaign_context: dict | None = None, arc_context: dict | None = None) -> dict[str, str]:
@@ -1,6 +1,8 @@
 """Orchestration helpers for story forge."""
 from __future__ import annotations
 
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from uuid import uuid4
 
 from modules.ai.local_ai_client import LocalAIClient
@@ -35,56 +37,80 @@ class StoryForgeOrchestrator:
         """Initialize the StoryForgeOrchestrator instance."""
         self.ai_client = ai_client or LocalAIClient()
         self._runner = AIPipelineRunner(self.ai_client, pipeline_name="story_forge")
-        self._last_step_metadata: dict = {"feature": "story_forge"}
 
     def run(self, request: StoryForgeRequest, request_id: str | None = None) -> StoryForgeResponse:
-        """Run the operation."""
+        """Run the operation with the first rewrite option selected."""
+        return self.propose(request, request_id=request_id, speculate=0).select(0)
+
+    def propose(
+        self,
+        request: StoryForgeRequest,
+        request_id: str | None = None,
+        *,
+        speculate: int = 1,
+    ) -> "StoryForgeSession":
+        """Generate rewrite options and start drafting the likeliest ones.
+
+        The first ``speculate`` options are drafted in the background while
+        the user chooses; :meth:`StoryForgeSession.select` reuses a matching
+        draft and cancels the others.
+        """
         ai_request_id = request_id or uuid4().hex
         self._emit_started(ai_request_id)
         try:
-            # Keep run resilient if this step fails.
+            # Keep propose resilient if this step fails.
             self._emit_phase(ai_request_id, "context_preparation", "Preparing Story Forge context")
-            rewrite_raw = self._chat(build_rewrite_options_prompt(request))
+            rewrite_raw, metadata = self._chat(build_rewrite_options_prompt(request))
             rewrite_payload = parse_json_strict_with_fallback(rewrite_raw, fallback={"options": []})
             options = normalize_rewrite_options(rewrite_payload, brief=request.brief)
-            selected_option = options[0]
-
-            self._emit_phase(ai_request_id, "generation", "Generating entities and scenario draft")
-            entities_raw = self._chat(build_entity_options_prompt(request, selected_option))
-            entities_payload = parse_json_strict_with_fallback(entities_raw, fallback={"entities": {}})
-            entities = normalize_entities(entities_payload)
-
-            draft_raw = self._chat(build_full_draft_prompt(request, selected_option, entities))
-            draft_payload = parse_json_strict_with_fallback(draft_raw, fallback={})
-
-            self._emit_phase(ai_request_id, "normalization", "Normalizing Story Forge output")
-            normalized_draft = normalize_full_draft(draft_payload, selected_option, entities)
-            scenes_with_assignments, assignment_diagnostics = assign_unused_entities_to_scenes(
-                normalized_draft["scenes"], normalized_draft["entities"], include_diagnostics=True
-            )
-
-            response = StoryForgeResponse(
-                title=normalized_draft["title"],
-                summary=normalized_draft["summary"],
-                secrets=normalized_draft["secrets"],
-                scenes=scenes_with_assignments,
-                entities=normalized_draft["entities"],
-                raw_steps={
-                    "rewrite": rewrite_payload,
-                    "entities": entities_payload,
-                    "draft": draft_payload,
-                    "entity_scene_assignments": assignment_diagnostics,
-                },
-            )
         except Exception as exc:
             self._emit_failed(ai_request_id, exc)
             raise
 
-        self._emit_completed(ai_request_id)
-        return response
+        session = StoryForgeSession(self, request, ai_request_id, rewrite_payload, options, metadata)
+        for index in range(min(max(0, int(speculate)), len(options))):
+            session._speculate(index)
+        return session
+
+    def _generate(self, request: StoryForgeRequest, option: dict, cancelled: threading.Event | None = None):
+        """Draft entities and the full scenario for one rewrite option.
 
-    def _chat(self, prompt: str) -> str:
-        """Internal helper for chat."""
+        Returns the parsed steps plus the metadata of the last model call, so
+        concurrent drafts never report each other's calls.
+        """
+        entities_raw, _metadata = self._chat(build_entity_options_prompt(request, option))
+        entities_payload = parse_json_strict_with_fallback(entities_raw, fallback={"entities": {}})
+        entities = normalize_entities(entities_payload)
+        if cancelled is not None and cancelled.is_set():
+            raise _SpeculationCancelled()
+        draft_raw, metadata = self._chat(build_full_draft_prompt(request, option, entities))
+        draft_payload = parse_json_strict_with_fallback(draft_raw, fallback={})
+        return entities_payload, entities, draft_payload, metadata
+
+    def _finish(self, request_id, rewrite_payload, option, generated) -> StoryForgeResponse:
+        """Normalize a generated draft into the response."""
+        entities_payload, entities, draft_payload, metadata = generated
+        self._emit_phase(request_id, "normalization", "Normalizing Story Forge output", metadata)
+        normalized_draft = normalize_full_draft(draft_payload, option, entities)
+        scenes_with_assignments, assignment_diagnostics = assign_unused_entities_to_scenes(
+            normalized_draft["scenes"], normalized_draft["entities"], include_diagnostics=True
+        )
+        return StoryForgeResponse(
+            title=normalized_draft["title"],
+            summary=normalized_draft["summary"],
+            secrets=normalized_draft["secrets"],
+            scenes=scenes_with_assignments,
+            entities=normalized_draft["entities"],
+            raw_steps={
+                "rewrite": rewrite_payload,
+                "entities": entities_payload,
+                "draft": draft_payload,
+                "entity_scene_assignments": assignment_diagnostics,
+            },
+        )
+
+    def _chat(self, prompt: str) -> tuple[str, dict]:
+        """Call the model once; return the answer and its step metadata."""
         response, metadata = self._runner.chat_once(
             [
                 {"role": "system", "content": SYSTEM_PROMPT},
@@ -92,8 +118,7 @@ class StoryForgeOrchestrator:
             ]
         )
         metadata["feature"] = "story_forge"
-        self._last_step_metadata = metadata
-        return response
+        return response, metadata
 
     @staticmethod
     def _emit_started(request_id: str) -> None:
@@ -106,18 +131,20 @@ class StoryForgeOrchestrator:
             feature="story_forge",
         )
 
-    def _emit_phase(self, request_id: str, phase: str, message: str) -> None:
+    @staticmethod
+    def _emit_phase(request_id: str, phase: str, message: str, metadata: dict | None = None) -> None:
         """Internal helper for emit phase."""
         publish_local_ai_event(
             event_type=EVENT_AI_PIPELINE_PHASE,
             request_id=request_id,
             phase=phase,
             message=message,
-            metadata=self._last_step_metadata,
+            metadata=metadata,
             feature="story_forge",
         )
 
-    def _emit_completed(self, request_id: str) -> None:
+    @staticmethod
+    def _emit_completed(request_id: str, metadata: dict | None = None) -> None:
         """Internal helper for emit completed."""
         publish_local_ai_event(
             event_type=EVENT_AI_PIPELINE_COMPLETED,
@@ -125,11 +152,12 @@ class StoryForgeOrchestrator:
             phase="completed",
             message="Story Forge completed",
             is_terminal=True,
-            metadata=self._last_step_metadata,
+            metadata=metadata,
             feature="story_forge",
         )
 
-    def _emit_failed(self, request_id: str, exc: Exception) -> None:
+    @staticmethod
+    def _emit_failed(request_id: str, exc: Exception, metadata: dict | None = None) -> None:
         """Internal helper for emit failed."""
         publish_local_ai_event(
             event_type=EVENT_AI_PIPELINE_FAILED,
@@ -137,6 +165,100 @@ class StoryForgeOrchestrator:
             phase="error",
             message=str(exc),
             is_terminal=True,
-            metadata=self._last_step_metadata,
+            metadata=metadata,
             feature="story_forge",
         )
+
+
+class _SpeculationCancelled(Exception):
+    """Raised inside a speculative draft whose option was not selected."""
+
+
+class StoryForgeSession:
+    """Rewrite options of one Story Forge run awaiting the user's choice."""
+
+    def __init__(self, orchestrator, request, request_id, rewrite_payload, options, metadata=None):
+        """Initialize the StoryForgeSession instance."""
+        self._orchestrator = orchestrator
+        # Metadata of the rewrite call, reported until a draft replaces it.
+        self._metadata = metadata
+        self._request = request
+        self.request_id = request_id
+        self.rewrite_payload = rewrite_payload
+        self.options = options
+        self._executor: ThreadPoolExecutor | None = None
+        self._speculative: dict[int, tuple[Future, threading.Event]] = {}
+        self._closed = False
+
+    @property
+    def speculative_indexes(self) -> list[int]:
+        return sorted(self._speculative)
+
+    def _speculate(self, index: int) -> None:
+        """Start drafting option *index* in the background."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(thread_name_prefix="story-forge")
+        cancelled = threading.Event()
+        option = self.options[index]
+        self._orchestrator._emit_phase(
+            self.request_id,
+            "speculative_generation",
+            f"Drafting '{option['title']}' while an option is chosen",
+            self._metadata,
+        )
+        future = self._executor.submit(self._orchestrator._generate, self._request, option, cancelled)
+        self._speculative[index] = (future, cancelled)
+
+    def select(self, index: int) -> StoryForgeResponse:
+        """Finish the draft for option *index*, reusing speculative work."""
+        if self._closed:
+            raise RuntimeError("Story Forge session is already closed")
+        orchestrator = self._orchestrator
+        option = self.options[index]
+        try:
+            # Keep select resilient if this step fails.
+            speculative = self._speculative.pop(index, None)
+            self._discard_speculation()
+            orchestrator._emit_phase(
+                self.request_id, "generation", "Generating entities and scenario draft", self._metadata
+            )
+            if speculative is not None:
+                generated = speculative[0].result()
+            else:
+                generated = orchestrator._generate(self._request, option)
+            self._metadata = generated[-1]
+            response = orchestrator._finish(self.request_id, self.rewrite_payload, option, generated)
+        except Exception as exc:
+            orchestrator._emit_failed(self.request_id, exc, self._metadata)
+            raise
+        finally:
+            self._close()
+
+        orchestrator._emit_completed(self.request_id, self._metadata)
+        return response
+
+    def cancel(self) -> None:
+        """Abandon the session and any speculative drafts."""
+        if self._closed:
+            return
+        self._discard_speculation()
+        self._close()
+        self._orchestrator._emit_failed(self.request_id, RuntimeError("Story Forge cancelled"), self._metadata)
+
+    def _discard_speculation(self) -> None:
+        """Cancel drafts of options that were not selected."""
+        for index, (future, cancelled) in self._speculative.items():
+            cancelled.set()
+            future.cancel()
+            self._orchestrator._emit_phase(
+                self.request_id,
+                "speculative_generation",
+                f"Discarding speculative draft for '{self.options[index]['title']}'",
+                self._metadata,
+            )
+        self._speculative.clear()
+
+    def _close(self) -> None:
+        self._closed = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
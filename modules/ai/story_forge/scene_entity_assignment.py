@@ -18,6 +18,7 @@ def assign_unused_entities_to_scenes(
     - entities already present in any scene are left untouched,
     - each unused entity is assigned to a single scene,
     - scene choice is based on keyword matching in title/summary with stable tie-breaking,
+      looked up through a :class:`SceneKeywordIndex` built once per call,
     - fallback uses first setup/investigation scene, otherwise first scene.
     """
 
@@ -25,6 +26,8 @@ def assign_unused_entities_to_scenes(
     usage_map = _build_usage_map(normalized_scenes)
 
     fallback_scene_index = _select_fallback_scene_index(normalized_scenes)
+    # Assignments only touch entity lists, so the scene text index stays valid.
+    scene_index = SceneKeywordIndex(normalized_scenes)
     assignments: list[dict[str, Any]] = []
 
     for entity_type in _SCENE_ENTITY_KEYS:
@@ -42,7 +45,7 @@ def assign_unused_entities_to_scenes(
             if name.casefold() in usage_map.get(entity_type, set()):
                 continue
 
-            target_scene_index, score = _find_best_scene_index(normalized_scenes, name, fallback_scene_index)
+            target_scene_index, score = _find_best_scene_index(scene_index, name, fallback_scene_index)
             target_scene = normalized_scenes[target_scene_index]
 
             raw_scene_entities = target_scene.get(entity_type)
@@ -95,15 +98,62 @@ def _build_usage_map(scenes: list[dict[str, Any]]) -> dict[str, set[str]]:
     return usage_map
 
 
-def _find_best_scene_index(scenes: list[dict[str, Any]], entity_name: str, fallback_scene_index: int) -> tuple[int, int]:
-    """Find best scene index."""
-    best_index = fallback_scene_index
-    best_score = -1
+def entity_keywords(entity_name: str) -> tuple[str, ...]:
+    """Return the distinct lowercase keywords (3+ characters) of an entity name."""
+    tokens = [token for token in _TOKEN_RE.findall(str(entity_name).casefold()) if len(token) >= 3]
+    return tuple(dict.fromkeys(tokens))
+
+
+class SceneKeywordIndex:
+    """Inverted index from keyword to the scenes whose text contains it.
+
+    Keywords match anywhere inside a scene word, so every substring of three
+    or more characters of each scene word is indexed.  Scoring an entity
+    then only touches the scenes that share one of its keywords.
+    """
 
-    for index, scene in enumerate(scenes):
-        # Process each (index, scene) from enumerate(scenes).
-        score = _score_scene(scene, entity_name)
-        if score > best_score:
+    def __init__(self, scenes: list[dict[str, Any]]) -> None:
+        self.texts: list[str] = []
+        self.postings: dict[str, list[int]] = {}
+        for index, scene in enumerate(scenes):
+            # Process each (index, scene) from enumerate(scenes).
+            text = " ".join(
+                str(scene.get(field) or "").casefold() for field in ("Title", "Summary", "Text")
+            ) if isinstance(scene, dict) else ""
+            self.texts.append(text)
+            fragments: set[str] = set()
+            for token in set(_TOKEN_RE.findall(text)):
+                length = len(token)
+                for start in range(length - 2):
+                    for end in range(start + 3, length + 1):
+                        fragments.add(token[start:end])
+            for fragment in fragments:
+                self.postings.setdefault(fragment, []).append(index)
+
+    def scores(self, entity_name: str) -> dict[int, int]:
+        """Return the positive keyword scores of *entity_name* per scene index."""
+        entity_cf = entity_name.casefold()
+        keywords = entity_keywords(entity_name)
+        scores: dict[int, int] = {}
+        for keyword in keywords:
+            for index in self.postings.get(keyword, ()):
+                scores[index] = scores.get(index, 0) + 10
+        # A full-name hit implies every keyword hit, except for names without keywords.
+        candidates = scores if keywords else range(len(self.texts))
+        for index in list(candidates):
+            if entity_cf in self.texts[index] and self.texts[index].strip():
+                scores[index] = scores.get(index, 0) + 100
+        return scores
+
+
+def _find_best_scene_index(
+    scene_index: SceneKeywordIndex, entity_name: str, fallback_scene_index: int
+) -> tuple[int, int]:
+    """Find best scene index; ties go to the earliest scene."""
+    best_index = fallback_scene_index
+    best_score = 0
+    for index, score in scene_index.scores(entity_name).items():
+        if score > best_score or (score == best_score and index < best_index):
             best_score = score
             best_index = index
 
@@ -112,32 +162,6 @@ def _find_best_scene_index(scenes: list[dict[str, Any]], entity_name: str, fallb
     return best_index, best_score
 
 
-def _score_scene(scene: dict[str, Any], entity_name: str) -> int:
-    """Internal helper for score scene."""
-    scene_text = " ".join(
-        [
-            str(scene.get("Title") or "").casefold(),
-            str(scene.get("Summary") or "").casefold(),
-            str(scene.get("Text") or "").casefold(),
-        ]
-    )
-    entity_cf = entity_name.casefold()
-    if not scene_text.strip():
-        return 0
-
-    score = 0
-    if entity_cf in scene_text:
-        score += 100
-
-    keywords = [token for token in _TOKEN_RE.findall(entity_cf) if len(token) >= 3]
-    unique_keywords = _dedupe_preserve_order(keywords)
-    for keyword in unique_keywords:
-        if keyword in scene_text:
-            score += 10
-
-    return score
-
-
 def _select_fallback_scene_index(scenes: list[dict[str, Any]]) -> int:
     """Select fallback scene index."""
     for preferred in ("setup", "investigation"):
@@ -0,0 +1,138 @@
+"""Incremental delivery of local AI completions.
+
+:func:`iter_stream_text` turns the lines of a streamed response, either
+Ollama-style NDJSON or OpenAI-style server-sent events, into text chunks.
+:class:`TkChunkPump` hands chunks produced on a worker thread to a Tk
+callback by draining a queue with ``after()``.
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+import threading
+from typing import Callable, Iterable, Iterator, Optional
+
+from modules.helpers.logging_helper import log_module_import
+
+log_module_import(__name__)
+
+_SSE_DONE = "[DONE]"
+
+
+def _chunk_text(event) -> Optional[str]:
+    """Return the text carried by one decoded stream event, if any."""
+    if not isinstance(event, dict):
+        return None
+    if isinstance(event.get("response"), str):
+        return event["response"]
+    message = event.get("message")
+    if isinstance(message, dict) and isinstance(message.get("content"), str):
+        return message["content"]
+    choices = event.get("choices")
+    if isinstance(choices, list) and choices and isinstance(choices[0], dict):
+        choice = choices[0]
+        delta = choice.get("delta")
+        if isinstance(delta, dict) and isinstance(delta.get("content"), str):
+            return delta["content"]
+        if isinstance(choice.get("text"), str):
+            return choice["text"]
+    return None
+
+
+def iter_stream_text(
+    lines: Iterable,
+    stop_event: Optional[threading.Event] = None,
+) -> Iterator[str]:
+    """Yield non-empty text chunks from NDJSON or SSE *lines*, in order.
+
+    Stops at the end-of-stream marker (``"done": true`` or ``data: [DONE]``)
+    or as soon as *stop_event* is set.
+    """
+    for raw in lines:
+        if stop_event is not None and stop_event.is_set():
+            return
+        line = raw.decode("utf-8", "replace") if isinstance(raw, (bytes, bytearray)) else str(raw or "")
+        line = line.strip()
+        if not line or line.startswith(":"):
+            continue
+        if line.startswith("data:"):
+            line = line[5:].strip()
+            if line == _SSE_DONE:
+                return
+        elif line.startswith(("event:", "id:", "retry:")):
+            continue
+        try:
+            event = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(event, dict) and event.get("error"):
+            raise RuntimeError(f"AI stream error: {event['error']}")
+        text = _chunk_text(event)
+        if text:
+            yield text
+        if isinstance(event, dict) and event.get("done") is True:
+            return
+
+
+class TkChunkPump:
+    """Forward chunks from worker threads to *on_chunk* on the Tk thread.
+
+    :meth:`put` is safe to call from any thread; :meth:`close` schedules
+    *on_done* once every queued chunk has been delivered.
+    """
+
+    _CLOSED = object()
+
+    def __init__(
+        self,
+        widget,
+        on_chunk: Callable[[str], None],
+        *,
+        on_done: Optional[Callable[[], None]] = None,
+        interval_ms: int = 40,
+    ) -> None:
+        self._widget = widget
+        self._on_chunk = on_chunk
+        self._on_done = on_done
+        self._interval_ms = max(1, int(interval_ms))
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._finished = False
+
+    def put(self, chunk: str) -> None:
+        self._queue.put(chunk)
+
+    def close(self) -> None:
+        self._queue.put(self._CLOSED)
+
+    def start(self) -> "TkChunkPump":
+        self._widget.after(self._interval_ms, self._drain)
+        return self
+
+    def _drain(self) -> None:
+        """Deliver queued chunks in one batch, then reschedule."""
+        if self._finished:
+            return
+        pending = []
+        closed = False
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is self._CLOSED:
+                closed = True
+                break
+            pending.append(item)
+        if pending:
+            self._on_chunk("".join(pending))
+        if closed:
+            self._finished = True
+            if self._on_done is not None:
+                self._on_done()
+            return
+        try:
+            self._widget.after(self._interval_ms, self._drain)
+        except Exception:
+            # The widget was destroyed; nothing is left to update.
+            self._finished = True
@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 import re
-import shutil
 from pathlib import Path
 from typing import Iterable, List, Sequence, Tuple
 
 from pypdf import PdfReader
 
+from modules.generic.shared_asset_store import copy_into_campaign
 from modules.helpers.config_helper import ConfigHelper
 from modules.helpers.logging_helper import log_info, log_module_import, log_warning
 
@@ -154,7 +154,9 @@ def _copy_pdf_to_assets(source: Path, campaign_dir: str) -> Tuple[Path, str]:
         counter += 1
 
     if dest_path.resolve() != source_resolved:
-        shutil.copy2(source_resolved, dest_path)
+        copy_into_campaign(
+            source_resolved, dest_path, campaign_dir=Path(campaign_dir)
+        )
 
     rel_path = dest_path.resolve().relative_to(Path(campaign_dir).resolve()).as_posix()
     log_info(
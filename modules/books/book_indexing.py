@@ -0,0 +1,220 @@
+"""Parallel, resumable extraction of book text into the book text index.
+
+Books are split into page ranges that worker processes extract with PyMuPDF
+(falling back to pypdf), running OCR only on pages without a text layer.
+Each finished range is written to :class:`BookTextIndex` immediately, so
+pages become searchable while the rest of the book is still being processed,
+and pages already recorded there are skipped when indexing resumes.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional
+
+from modules.books.book_text_index import BookTextIndex
+from modules.helpers.logging_helper import log_module_import, log_warning
+
+log_module_import(__name__)
+
+try:  # PyMuPDF is much faster than pypdf for plain text extraction
+    import fitz  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    fitz = None
+
+try:  # Optional OCR dependency
+    import pytesseract  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    pytesseract = None
+
+DEFAULT_PAGES_PER_TASK = 16
+OCR_ZOOM = 300 / 72
+
+ProgressCallback = Callable[["BookIndexProgress"], None]
+CancelCallback = Callable[[], bool]
+
+
+@dataclass(frozen=True)
+class BookIndexProgress:
+    book: str
+    pages_done: int
+    page_count: int
+
+
+@dataclass(frozen=True)
+class BookIndexResult:
+    book: str
+    page_count: int
+    pages_indexed: int
+    cancelled: bool = False
+
+    @property
+    def complete(self) -> bool:
+        return not self.cancelled
+
+
+def count_pages(pdf_path: str) -> int:
+    """Return the number of pages in *pdf_path*."""
+    if fitz is not None:
+        with fitz.open(pdf_path) as document:
+            return int(document.page_count)
+    from pypdf import PdfReader
+
+    return len(PdfReader(pdf_path).pages)
+
+
+def _ocr_fitz_page(page) -> str:
+    """Internal helper for OCR of one PyMuPDF page."""
+    if pytesseract is None:
+        return ""
+    from PIL import Image
+
+    pix = page.get_pixmap(matrix=fitz.Matrix(OCR_ZOOM, OCR_ZOOM), alpha=False)
+    image = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+    return str(pytesseract.image_to_string(image) or "")
+
+
+def extract_page_range(pdf_path: str, first_page: int, last_page: int) -> list[tuple[int, str]]:
+    """Return ``(page, text)`` for pages ``first_page..last_page`` (1-based).
+
+    Runs inside worker processes, so it only takes picklable arguments.
+    """
+    results: list[tuple[int, str]] = []
+    if fitz is not None:
+        with fitz.open(pdf_path) as document:
+            for number in range(first_page, last_page + 1):
+                page = document.load_page(number - 1)
+                text = (page.get_text("text") or "").strip()
+                if not text:
+                    try:
+                        text = _ocr_fitz_page(page).strip()
+                    except Exception as exc:  # pragma: no cover - OCR failure
+                        log_warning(
+                            f"OCR failed on page {number} of {pdf_path}: {exc}",
+                            func_name="modules.books.book_indexing.extract_page_range",
+                        )
+                results.append((number, text))
+        return results
+
+    from pathlib import Path
+
+    from pypdf import PdfReader
+
+    from modules.books.book_importer import _run_ocr_on_page
+
+    reader = PdfReader(pdf_path)
+    for number in range(first_page, last_page + 1):
+        try:
+            text = (reader.pages[number - 1].extract_text() or "").strip()
+        except Exception as exc:  # pragma: no cover - defensive catch
+            log_warning(
+                f"Failed to extract text from page {number} of {pdf_path}: {exc}",
+                func_name="modules.books.book_indexing.extract_page_range",
+            )
+            text = ""
+        if not text:
+            text = _run_ocr_on_page(Path(pdf_path), number)
+        results.append((number, text))
+    return results
+
+
+def _page_ranges(pages: Iterable[int], size: int) -> list[tuple[int, int]]:
+    """Group sorted page numbers into contiguous ranges of at most *size*."""
+    ranges: list[tuple[int, int]] = []
+    for page in sorted(pages):
+        if ranges and page == ranges[-1][1] + 1 and page - ranges[-1][0] < size:
+            ranges[-1] = (ranges[-1][0], page)
+        else:
+            ranges.append((page, page))
+    return ranges
+
+
+class BookIndexingEngine:
+    """Fan book pages out to a process pool and stream results to the index."""
+
+    def __init__(
+        self,
+        text_index: BookTextIndex,
+        *,
+        max_workers: Optional[int] = None,
+        pages_per_task: int = DEFAULT_PAGES_PER_TASK,
+        executor_factory: Optional[Callable[[int], Executor]] = None,
+        extract_range: Callable[[str, int, int], list[tuple[int, str]]] = extract_page_range,
+        page_counter: Callable[[str], int] = count_pages,
+    ) -> None:
+        self.text_index = text_index
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 2) - 1)
+        self.pages_per_task = max(1, int(pages_per_task))
+        self._executor_factory = executor_factory or (
+            lambda workers: ProcessPoolExecutor(max_workers=workers)
+        )
+        self._extract_range = extract_range
+        self._page_counter = page_counter
+        self._executor: Optional[Executor] = None
+
+    def __enter__(self) -> "BookIndexingEngine":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = self._executor_factory(self.max_workers)
+        return self._executor
+
+    def index_book(
+        self,
+        book: str,
+        pdf_path: str,
+        *,
+        resume: bool = True,
+        progress: Optional[ProgressCallback] = None,
+        cancelled: Optional[CancelCallback] = None,
+    ) -> BookIndexResult:
+        """Index every page of *pdf_path* under *book*, skipping finished pages."""
+        page_count = int(self._page_counter(str(pdf_path)))
+        done = self.text_index.indexed_pages(book) if resume else set()
+        if not resume or any(page > page_count for page in done):
+            # A replaced attachment invalidates earlier partial results.
+            self.text_index.remove_book(book)
+            done = set()
+        pending = [page for page in range(1, page_count + 1) if page not in done]
+        completed = page_count - len(pending)
+        if progress:
+            progress(BookIndexProgress(book, completed, page_count))
+        if not pending:
+            return BookIndexResult(book, page_count, 0)
+
+        executor = self._get_executor()
+        futures = {
+            executor.submit(self._extract_range, str(pdf_path), first, last)
+            for first, last in _page_ranges(pending, self.pages_per_task)
+        }
+        indexed = 0
+        try:
+            while futures:
+                if cancelled and cancelled():
+                    for future in futures:
+                        future.cancel()
+                    return BookIndexResult(book, page_count, indexed, cancelled=True)
+                finished, futures = wait(futures, timeout=0.25, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    pages = dict(future.result())
+                    self.text_index.index_pages(book, pages)
+                    indexed += len(pages)
+                    completed += len(pages)
+                    if progress:
+                        progress(BookIndexProgress(book, completed, page_count))
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+        return BookIndexResult(book, page_count, indexed)
@@ -0,0 +1,338 @@
+"""Full-text index of extracted book pages stored in the campaign database.
+
+Book rows only keep metadata; page text lives in an FTS5 table of
+``(book, page, paragraph, body)`` rows so list views never load the corpus and
+searches are ranked with bm25 and return highlighted snippets.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sqlite3
+import threading
+from contextlib import closing
+from dataclasses import dataclass
+from typing import Iterable, Mapping, Optional, Sequence
+
+from db.db import get_connection
+from modules.helpers.logging_helper import log_module_import, log_warning
+
+log_module_import(__name__)
+
+FTS_TABLE = "book_text_fts"
+FALLBACK_TABLE = "book_text"
+PAGES_TABLE = "book_text_pages"
+SNIPPET_TOKENS = 24
+HIGHLIGHT_OPEN = "\u0002"
+HIGHLIGHT_CLOSE = "\u0003"
+
+_PARAGRAPH_SPLIT = re.compile(r"\n\s*\n")
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclass(frozen=True)
+class BookTextHit:
+    """One ranked paragraph match."""
+
+    book: str
+    page: int
+    paragraph: int
+    snippet: str
+    score: float
+
+
+def split_paragraphs(page_text: str) -> list[str]:
+    """Split one page into non-empty paragraphs."""
+    text = str(page_text or "").replace("\r\n", "\n").replace("\r", "\n").strip()
+    if not text:
+        return []
+    return [part.strip() for part in _PARAGRAPH_SPLIT.split(text) if part.strip()]
+
+
+def build_match_expression(query: str) -> Optional[str]:
+    """Translate free text into an FTS5 query matching every word as a prefix."""
+    tokens = _TOKEN_PATTERN.findall(str(query or ""))
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def page_payload_texts(pages: object) -> list[str]:
+    """Return the page transcripts held in a legacy ``ExtractedPages`` value."""
+    if not isinstance(pages, list):
+        return []
+    if not any(isinstance(page, str) for page in pages):
+        return []
+    return [page if isinstance(page, str) else "" for page in pages]
+
+
+def strip_book_text(record: Mapping) -> dict:
+    """Return a copy of a book row without inline transcripts.
+
+    Excerpt descriptors (dict entries of ``ExtractedPages``) stay on the row.
+    """
+    stripped = dict(record)
+    stripped["ExtractedText"] = ""
+    pages = record.get("ExtractedPages")
+    stripped["ExtractedPages"] = (
+        [page for page in pages if isinstance(page, dict)] if isinstance(pages, list) else []
+    )
+    return stripped
+
+
+class BookTextIndex:
+    """Maintain and query the per-campaign book text index."""
+
+    def __init__(self, db_path: Optional[str] = None) -> None:
+        self._db_path = db_path
+        self._fts_enabled: Optional[bool] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._db_path) if self._db_path else get_connection()
+        self._ensure_schema(conn)
+        return conn
+
+    def _ensure_schema(self, conn: sqlite3.Connection) -> None:
+        # Pages that finished extraction, including ones without text, so an
+        # interrupted indexing run can resume where it stopped.
+        conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {PAGES_TABLE} (
+                book TEXT NOT NULL,
+                page INTEGER NOT NULL,
+                PRIMARY KEY (book, page)
+            )
+            """
+        )
+        if self._fts_enabled is None:
+            try:
+                conn.execute(
+                    f"""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+                        book UNINDEXED,
+                        page UNINDEXED,
+                        paragraph UNINDEXED,
+                        body,
+                        tokenize = 'unicode61 remove_diacritics 2'
+                    )
+                    """
+                )
+                self._fts_enabled = True
+            except sqlite3.OperationalError as exc:
+                log_warning(
+                    f"SQLite FTS5 unavailable, falling back to LIKE search: {exc}",
+                    func_name="modules.books.book_text_index.BookTextIndex._ensure_schema",
+                )
+                self._fts_enabled = False
+        if not self._fts_enabled:
+            conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {FALLBACK_TABLE} (
+                    book TEXT NOT NULL,
+                    page INTEGER NOT NULL,
+                    paragraph INTEGER NOT NULL,
+                    body TEXT NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {FALLBACK_TABLE}_book ON {FALLBACK_TABLE}(book, page)"
+            )
+
+    @property
+    def _table(self) -> str:
+        return FTS_TABLE if self._fts_enabled else FALLBACK_TABLE
+
+    def index_book(self, book: str, pages: Sequence[str], *, first_page: int = 1) -> int:
+        """Replace the indexed text of *book* with *pages*; return paragraph count."""
+        with closing(self._connect()) as conn, conn:
+            self._delete_book(conn, book)
+            return self._insert_pages(conn, book, pages, first_page)
+
+    def index_pages(self, book: str, pages: Mapping[int, str]) -> int:
+        """Replace only the given page numbers of *book*."""
+        with closing(self._connect()) as conn, conn:
+            count = 0
+            for page_number, text in sorted(pages.items()):
+                conn.execute(
+                    f"DELETE FROM {self._table} WHERE book = ? AND page = ?",
+                    (book, int(page_number)),
+                )
+                count += self._insert_pages(conn, book, [text], int(page_number))
+            return count
+
+    def _insert_pages(
+        self, conn: sqlite3.Connection, book: str, pages: Sequence[str], first_page: int
+    ) -> int:
+        rows = [
+            (book, page_number, paragraph_number, paragraph)
+            for page_number, text in enumerate(pages, start=first_page)
+            for paragraph_number, paragraph in enumerate(split_paragraphs(text), start=1)
+        ]
+        conn.executemany(
+            f"INSERT INTO {self._table} (book, page, paragraph, body) VALUES (?, ?, ?, ?)",
+            rows,
+        )
+        conn.executemany(
+            f"INSERT OR IGNORE INTO {PAGES_TABLE} (book, page) VALUES (?, ?)",
+            [(book, page_number) for page_number in range(first_page, first_page + len(pages))],
+        )
+        return len(rows)
+
+    def _delete_book(self, conn: sqlite3.Connection, book: str) -> None:
+        conn.execute(f"DELETE FROM {self._table} WHERE book = ?", (book,))
+        conn.execute(f"DELETE FROM {PAGES_TABLE} WHERE book = ?", (book,))
+
+    def remove_book(self, book: str) -> None:
+        with closing(self._connect()) as conn, conn:
+            self._delete_book(conn, book)
+
+    def rename_book(self, old: str, new: str) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute(f"UPDATE {self._table} SET book = ? WHERE book = ?", (new, old))
+            conn.execute(f"UPDATE {PAGES_TABLE} SET book = ? WHERE book = ?", (new, old))
+
+    def indexed_books(self) -> set[str]:
+        with closing(self._connect()) as conn:
+            rows = conn.execute(f"SELECT DISTINCT book FROM {self._table}").fetchall()
+        return {str(row[0]) for row in rows}
+
+    def indexed_pages(self, book: str) -> set[int]:
+        """Return the pages of *book* whose extraction has completed."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"SELECT page FROM {PAGES_TABLE} WHERE book = ?", (book,)
+            ).fetchall()
+        return {int(row[0]) for row in rows}
+
+    def page_texts(self, book: str) -> list[str]:
+        """Reassemble the indexed pages of *book* (1-based pages, list index 0)."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"SELECT page, body FROM {self._table} WHERE book = ? ORDER BY page, paragraph",
+                (book,),
+            ).fetchall()
+        if not rows:
+            return []
+        pages: dict[int, list[str]] = {}
+        for page, body in rows:
+            pages.setdefault(int(page), []).append(str(body))
+        return ["\n\n".join(pages.get(number, [])) for number in range(1, max(pages) + 1)]
+
+    def search(
+        self,
+        query: str,
+        *,
+        books: Optional[Iterable[str]] = None,
+        limit: int = 50,
+        highlight: tuple[str, str] = (HIGHLIGHT_OPEN, HIGHLIGHT_CLOSE),
+    ) -> list[BookTextHit]:
+        """Return paragraphs matching every word of *query*, best first."""
+        expression = build_match_expression(query)
+        if expression is None:
+            return []
+        wanted = sorted({str(book) for book in books}) if books is not None else None
+        if wanted == []:
+            return []
+        with closing(self._connect()) as conn:
+            if self._fts_enabled:
+                sql = (
+                    f"SELECT book, page, paragraph, "
+                    f"snippet({FTS_TABLE}, 3, ?, ?, '…', {SNIPPET_TOKENS}), bm25({FTS_TABLE}) "
+                    f"FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH ?"
+                )
+                params: list = [highlight[0], highlight[1], expression]
+                if wanted is not None:
+                    sql += f" AND book IN ({', '.join('?' for _ in wanted)})"
+                    params.extend(wanted)
+                sql += f" ORDER BY bm25({FTS_TABLE}), book, page, paragraph LIMIT ?"
+                params.append(int(limit))
+                try:
+                    rows = conn.execute(sql, params).fetchall()
+                except sqlite3.OperationalError as exc:
+                    log_warning(
+                        f"Book text search failed for {query!r}: {exc}",
+                        func_name="modules.books.book_text_index.BookTextIndex.search",
+                    )
+                    return []
+                return [
+                    BookTextHit(str(book), int(page), int(paragraph), str(snippet), float(score))
+                    for book, page, paragraph, snippet, score in rows
+                ]
+            return self._fallback_search(conn, query, wanted, limit, highlight)
+
+    def _fallback_search(self, conn, query, wanted, limit, highlight) -> list[BookTextHit]:
+        tokens = _TOKEN_PATTERN.findall(str(query or ""))
+        sql = f"SELECT book, page, paragraph, body FROM {FALLBACK_TABLE} WHERE "
+        sql += " AND ".join("body LIKE ?" for _ in tokens)
+        params: list = [f"%{token}%" for token in tokens]
+        if wanted is not None:
+            sql += f" AND book IN ({', '.join('?' for _ in wanted)})"
+            params.extend(wanted)
+        sql += " ORDER BY book, page, paragraph LIMIT ?"
+        params.append(int(limit))
+        hits = []
+        for book, page, paragraph, body in conn.execute(sql, params).fetchall():
+            snippet = str(body)
+            for token in tokens:
+                snippet = re.sub(
+                    re.escape(token),
+                    lambda match: f"{highlight[0]}{match.group(0)}{highlight[1]}",
+                    snippet,
+                    flags=re.IGNORECASE,
+                )
+            hits.append(BookTextHit(str(book), int(page), int(paragraph), snippet, 0.0))
+        return hits
+
+    def matching_books(self, query: str, *, limit: int = 1000) -> set[str]:
+        return {hit.book for hit in self.search(query, limit=limit)}
+
+    def on_saved(self, db_path: Optional[str], event) -> None:
+        """Save listener: move indexed text to a book's new title once the rename is committed."""
+        if _normalize_path(db_path) != _normalize_path(self._db_path):
+            return
+        if getattr(event, "entity_type", None) != "books":
+            return
+        for old, new in getattr(event, "renamed", ()):
+            try:
+                self.rename_book(str(old), str(new))
+            except sqlite3.Error as exc:
+                log_warning(
+                    f"Failed to rename indexed text for book '{old}': {exc}",
+                    func_name="modules.books.book_text_index.BookTextIndex.on_saved",
+                )
+
+    def migrate_records(self, records: Iterable[Mapping], key_field: str = "Title") -> list[dict]:
+        """Move inline transcripts into the index; return the rows to re-save."""
+        migrated = []
+        for record in records:
+            book = str(record.get(key_field) or "").strip()
+            pages = page_payload_texts(record.get("ExtractedPages"))
+            transcript = record.get("ExtractedText")
+            if not book or (not pages and not (isinstance(transcript, str) and transcript.strip())):
+                continue
+            self.index_book(book, pages or [transcript])
+            migrated.append(strip_book_text(record))
+        return migrated
+
+
+def _normalize_path(db_path: Optional[str]) -> Optional[str]:
+    return os.path.normcase(os.path.abspath(str(db_path))) if db_path else None
+
+
+_INDEXES: dict[Optional[str], BookTextIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_book_text_index(db_path: Optional[str] = None) -> BookTextIndex:
+    """Return the shared index for *db_path*, subscribed to book renames."""
+    from modules.generic.generic_model_wrapper import GenericModelWrapper
+
+    normalized = _normalize_path(db_path)
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(normalized)
+        if index is None:
+            index = _INDEXES[normalized] = BookTextIndex(db_path)
+            GenericModelWrapper.add_save_listener(index.on_saved)
+        return index
@@ -10,11 +10,14 @@ import customtkinter as ctk
 import fitz
 from PIL import ImageTk
 from modules.books.pdf_viewer_panel import PDFViewerFrame
+from modules.books.book_text_index import get_book_text_index
+from modules.books.page_render_cache import PageRenderer, document_page_renderer, zoom_bucket
+from modules.books.pdf_text_cache import load_text_cache_async
 
 from modules.books.pdf_processing import (
     extract_images_with_names,
     open_document,
-    render_pdf_page_to_image,
+    resolve_pdf_path,
 )
 from modules.helpers.config_helper import ConfigHelper
 from modules.helpers.logging_helper import (
@@ -38,6 +41,7 @@ class BookViewer(ctk.CTkToplevel):
         self.attachment = self.book_record.get("Attachment", "")
         self._document = None
         self._page_image = None
+        self._page_renderer = None
         self._search_cache: list[int] = []
         self._search_query = ""
         self._search_query_display = ""
@@ -45,6 +49,8 @@ class BookViewer(ctk.CTkToplevel):
         self._signets: list[dict[str, int | str]] = []
         self._suppress_signet_events = False
         self._highlight_boxes: list[tuple[float, float, float, float]] = []
+        self._text_cache = None
+        self._search_hit_rects: dict[int, tuple] = {}
 
         self.title(self.book_record.get("Title") or "Book Viewer")
         self.geometry("1920x1080+0+0")
@@ -69,6 +75,8 @@ class BookViewer(ctk.CTkToplevel):
         if not self.page_count:
             self.page_count = self.book_record.get("PageCount") or 0
 
+        self._page_renderer = self._create_page_renderer()
+        self._load_text_cache()
         self._page_texts = self._collect_page_texts()
         self._signets = self._collect_signets()
 
@@ -316,6 +324,10 @@ class BookViewer(ctk.CTkToplevel):
         if covers_full_book(record_texts):
             return normalize_to_page_count(record_texts)
 
+        indexed_texts = self._load_indexed_page_texts()
+        if any(text.strip() for text in indexed_texts):
+            return normalize_to_page_count(indexed_texts)
+
         extracted = self._extract_page_texts_from_pdf()
         has_pdf_content = any(text.strip() for text in extracted)
         if has_pdf_content:
@@ -343,6 +355,20 @@ class BookViewer(ctk.CTkToplevel):
 
         return extracted
 
+    def _load_indexed_page_texts(self) -> list[str]:
+        """Return page texts stored in the campaign's book text index."""
+        title = str(self.book_record.get("Title") or "").strip()
+        if not title:
+            return []
+        try:
+            return get_book_text_index().page_texts(title)
+        except Exception as exc:
+            log_warning(
+                f"Failed to load indexed text for '{title}': {exc}",
+                func_name="BookViewer._load_indexed_page_texts",
+            )
+            return []
+
     def _split_transcript_into_pages(self, transcript) -> list[str]:
         """Internal helper for split transcript into pages."""
         if not isinstance(transcript, str):
@@ -436,27 +462,66 @@ class BookViewer(ctk.CTkToplevel):
             )
         return signets
 
+    def _create_page_renderer(self):
+        """Create the background renderer for this book's pages."""
+        try:
+            pdf_key = str(resolve_pdf_path(self.attachment, self.campaign_dir))
+        except Exception:
+            pdf_key = str(self.attachment)
+        render_page, close = document_page_renderer(self.attachment, campaign_dir=self.campaign_dir)
+        return PageRenderer(pdf_key, render_page, page_count=self.page_count, on_close=close)
+
+    def _load_text_cache(self):
+        """Load the positional search cache for this book in the background."""
+        source = getattr(self._document, "name", "")
+        if not source:
+            return
+
+        def ready(cache):
+            try:
+                self.after(0, lambda: setattr(self, "_text_cache", cache))
+            except (RuntimeError, tk.TclError):
+                pass
+
+        load_text_cache_async(source, ready, open_document=open_document, campaign_dir=self.campaign_dir)
+
     def _render_current_page(self):
         """Render current page."""
-        if not self._document:
+        if not self._document or self._page_renderer is None:
             return
+        # Show whatever is cached right away (scaled if the zoom differs) and
+        # let the worker deliver the exact raster.
+        image, exact = self._page_renderer.lookup(self.current_page, self.zoom)
+        if image is not None:
+            self._display_page_image(image)
+        if exact:
+            self._page_renderer.prefetch(self.current_page, self.zoom)
+            return
+        self._page_renderer.request(self.current_page, self.zoom, self._on_page_rendered)
+
+    def _on_page_rendered(self, page, zoom, image, exact, error):
+        """Handle a raster delivered by the page renderer thread."""
         try:
-            # Keep current page resilient if this step fails.
-            image = render_pdf_page_to_image(
-                self.attachment,
-                self.current_page,
-                zoom=self.zoom,
-                campaign_dir=self.campaign_dir,
-                document=self._document,
-            )
-        except Exception as exc:
+            self.after(0, lambda: self._apply_rendered_page(page, zoom, image, exact, error))
+        except (RuntimeError, tk.TclError):
+            pass
+
+    def _apply_rendered_page(self, page, zoom, image, exact, error):
+        """Display a rendered page if it is still the one being viewed."""
+        if page != self.current_page or zoom != zoom_bucket(self.zoom):
+            return
+        if error is not None:
             log_warning(
-                f"Unable to render page {self.current_page}: {exc}",
+                f"Unable to render page {page}: {error}",
                 func_name="BookViewer._render_current_page",
             )
-            messagebox.showerror("Book Viewer", f"Failed to render page {self.current_page}:\n{exc}")
+            messagebox.showerror("Book Viewer", f"Failed to render page {page}:\n{error}")
             return
+        if image is not None:
+            self._display_page_image(image)
 
+    def _display_page_image(self, image):
+        """Show a rendered page on the canvas."""
         self._page_image = ImageTk.PhotoImage(image)
         self.canvas.delete("page")
         self.canvas.create_image(0, 0, image=self._page_image, anchor="nw", tags="page")
@@ -595,7 +660,13 @@ class BookViewer(ctk.CTkToplevel):
             return
 
         matches: list[int] = []
-        for idx, text in enumerate(self._page_texts):
+        self._search_hit_rects = {}
+        if self._text_cache is not None:
+            # Page hits and word rectangles from the cached text layer.
+            hits = self._text_cache.search(stripped)
+            matches = [hit.page for hit in hits]
+            self._search_hit_rects = {hit.page: hit.rects for hit in hits}
+        for idx, text in enumerate(self._page_texts if not matches else []):
             # Process each (idx, text) from enumerate(_page_texts).
             try:
                 content = text.lower()
@@ -744,6 +815,9 @@ class BookViewer(ctk.CTkToplevel):
 
     def _on_close(self):
         """Handle close."""
+        if self._page_renderer is not None:
+            self._page_renderer.close()
+            self._page_renderer = None
         if self._document is not None:
             try:
                 # Keep on close resilient if this step fails.
@@ -774,6 +848,16 @@ class BookViewer(ctk.CTkToplevel):
         if self._search_cache and self.current_page not in self._search_cache:
             return
 
+        zoom = self.zoom
+        cached_rects = self._search_hit_rects.get(self.current_page)
+        if cached_rects is None and self._text_cache is not None:
+            cached_rects = self._text_cache.page_rects(self.current_page, self._search_query_display) or None
+        if cached_rects:
+            self._highlight_boxes = [
+                (x0 * zoom, y0 * zoom, x1 * zoom, y1 * zoom) for x0, y0, x1, y1 in cached_rects
+            ]
+            return
+
         try:
             page = self._document.load_page(self.current_page - 1)
         except Exception as exc:  # pragma: no cover - defensive catch
@@ -0,0 +1,274 @@
+"""Rendered PDF page cache with background prefetching.
+
+Rasterized pages are kept in a process-wide LRU keyed by
+``(pdf, page, zoom bucket)`` under a memory budget. :class:`PageRenderer`
+renders on a single worker thread per document: the requested page first
+(preceded by a cheap low-zoom preview when nothing usable is cached), then
+its neighbours so that flipping pages hits the cache.
+"""
+
+from __future__ import annotations
+
+import itertools
+import queue
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from modules.helpers.logging_helper import log_module_import, log_warning
+
+log_module_import(__name__)
+
+DEFAULT_BUDGET_BYTES = 256 * 1024 * 1024
+ZOOM_STEP = 0.05
+PREVIEW_ZOOM = 0.35
+PREFETCH_RADIUS = 2
+
+_PRIORITY_PREVIEW = 0
+_PRIORITY_CURRENT = 1
+_PRIORITY_PREFETCH = 2
+
+RenderPage = Callable[[int, float], object]
+RenderCallback = Callable[[int, float, object, bool, Optional[BaseException]], None]
+
+
+def zoom_bucket(zoom: float) -> float:
+    """Snap *zoom* to the cache granularity."""
+    return round(round(float(zoom) / ZOOM_STEP) * ZOOM_STEP, 2)
+
+
+def _image_bytes(image) -> int:
+    bands = len(image.getbands()) if hasattr(image, "getbands") else 3
+    return int(image.width) * int(image.height) * bands
+
+
+def scale_to_zoom(image, from_zoom: float, to_zoom: float):
+    """Resize a raster rendered at *from_zoom* to the size of *to_zoom*."""
+    if abs(from_zoom - to_zoom) < 1e-6:
+        return image
+    ratio = to_zoom / from_zoom
+    size = (max(1, round(image.width * ratio)), max(1, round(image.height * ratio)))
+    return image.resize(size)
+
+
+class PageRenderCache:
+    """Thread-safe LRU of rendered pages bounded by total raster bytes."""
+
+    def __init__(self, max_bytes: int = DEFAULT_BUDGET_BYTES) -> None:
+        self.max_bytes = int(max_bytes)
+        self._entries: OrderedDict[tuple[str, int, float], tuple[object, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, pdf: str, page: int, zoom: float):
+        key = (pdf, int(page), zoom_bucket(zoom))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, pdf: str, page: int, zoom: float, image) -> None:
+        key = (pdf, int(page), zoom_bucket(zoom))
+        size = _image_bytes(image)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (image, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _key, (_image, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+
+    def nearest(self, pdf: str, page: int, zoom: float) -> Optional[tuple[float, object]]:
+        """Return ``(zoom, image)`` of the cached raster closest to *zoom*.
+
+        Larger rasters win ties because downscaling looks better.
+        """
+        target = zoom_bucket(zoom)
+        best = None
+        with self._lock:
+            for (entry_pdf, entry_page, entry_zoom), (image, _size) in self._entries.items():
+                if entry_pdf != pdf or entry_page != int(page):
+                    continue
+                rank = (abs(entry_zoom - target), -entry_zoom)
+                if best is None or rank < best[0]:
+                    best = (rank, entry_zoom, image)
+        return None if best is None else (best[1], best[2])
+
+    def discard(self, pdf: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == pdf]:
+                self._bytes -= self._entries.pop(key)[1]
+
+
+class PageRenderer:
+    """Render pages of one PDF on a worker thread, backed by a shared cache."""
+
+    def __init__(
+        self,
+        pdf_key: str,
+        render_page: RenderPage,
+        *,
+        cache: Optional[PageRenderCache] = None,
+        page_count: int = 0,
+        prefetch_radius: int = PREFETCH_RADIUS,
+        preview_zoom: float = PREVIEW_ZOOM,
+        on_close: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self.pdf_key = str(pdf_key)
+        self.page_count = int(page_count or 0)
+        self.prefetch_radius = max(0, int(prefetch_radius))
+        self.preview_zoom = zoom_bucket(preview_zoom)
+        self.cache = cache if cache is not None else get_page_render_cache()
+        self._render_page = render_page
+        self._on_close = on_close
+        self._jobs: queue.PriorityQueue = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._generation = 0
+        self._focus_page = 0
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="pdf-page-renderer", daemon=True)
+        self._thread.start()
+
+    def lookup(self, page: int, zoom: float) -> tuple[object, bool]:
+        """Return ``(image, exact)`` from the cache without rendering.
+
+        When the exact zoom is missing the nearest cached raster is scaled to
+        the requested size; ``(None, False)`` means nothing is cached.
+        """
+        image = self.cache.get(self.pdf_key, page, zoom)
+        if image is not None:
+            return image, True
+        nearest = self.cache.nearest(self.pdf_key, page, zoom)
+        if nearest is None:
+            return None, False
+        return scale_to_zoom(nearest[1], nearest[0], zoom_bucket(zoom)), False
+
+    def request(self, page: int, zoom: float, callback: RenderCallback) -> None:
+        """Render *page* at *zoom* and prefetch its neighbours.
+
+        *callback* runs on the worker thread as
+        ``callback(page, zoom, image, exact, error)``; a preview (``exact``
+        false) may arrive before the final raster. Requests superseded by a
+        newer call are dropped.
+        """
+        self._generation += 1
+        self._focus_page = int(page)
+        generation = self._generation
+        zoom = zoom_bucket(zoom)
+        if self.cache.nearest(self.pdf_key, page, zoom) is None and self.preview_zoom < zoom:
+            self._submit(_PRIORITY_PREVIEW, generation, page, self.preview_zoom, zoom, callback)
+        self._submit(_PRIORITY_CURRENT, generation, page, zoom, zoom, callback)
+        self.prefetch(page, zoom)
+
+    def prefetch(self, page: int, zoom: float) -> None:
+        """Queue neighbouring pages, nearest first, and make *page* the focus."""
+        self._focus_page = int(page)
+        zoom = zoom_bucket(zoom)
+        for distance in range(1, self.prefetch_radius + 1):
+            for neighbour in (page + distance, page - distance):
+                if neighbour < 1 or (self.page_count and neighbour > self.page_count):
+                    continue
+                if self.cache.get(self.pdf_key, neighbour, zoom) is None:
+                    self._submit(_PRIORITY_PREFETCH, 0, neighbour, zoom, zoom, None)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._jobs.put((-1, next(self._sequence), None))
+
+    def _submit(self, priority, generation, page, render_zoom, target_zoom, callback) -> None:
+        if self._closed:
+            return
+        job = (generation, int(page), render_zoom, target_zoom, callback)
+        self._jobs.put((priority, next(self._sequence), job))
+
+    def _run(self) -> None:
+        try:
+            while True:
+                priority, _sequence, job = self._jobs.get()
+                if job is None:
+                    return
+                generation, page, render_zoom, target_zoom, callback = job
+                if priority == _PRIORITY_PREFETCH:
+                    # Prefetches survive navigation while still near the focus.
+                    if abs(page - self._focus_page) > self.prefetch_radius:
+                        continue
+                elif generation != self._generation:
+                    continue
+                self._process(page, render_zoom, target_zoom, callback)
+        finally:
+            if self._on_close is not None:
+                try:
+                    self._on_close()
+                except Exception:
+                    pass
+
+    def _process(self, page, render_zoom, target_zoom, callback) -> None:
+        image = self.cache.get(self.pdf_key, page, render_zoom)
+        error = None
+        if image is None:
+            try:
+                image = self._render_page(page, render_zoom)
+                self.cache.put(self.pdf_key, page, render_zoom, image)
+            except Exception as exc:
+                error = exc
+                if callback is None:
+                    log_warning(
+                        f"Failed to prefetch page {page} of {self.pdf_key}: {exc}",
+                        func_name="modules.books.page_render_cache.PageRenderer._process",
+                    )
+        if callback is None:
+            return
+        exact = render_zoom == target_zoom
+        if image is not None and not exact:
+            image = scale_to_zoom(image, render_zoom, target_zoom)
+        callback(page, target_zoom, image, exact, error)
+
+
+def document_page_renderer(
+    attachment_path: str, *, campaign_dir: Optional[str] = None
+) -> tuple[RenderPage, Callable[[], None]]:
+    """Return ``(render_page, close)`` backed by a document private to the worker.
+
+    PyMuPDF documents are not thread-safe, so the renderer opens its own copy
+    instead of sharing the viewer's.
+    """
+    from modules.books.pdf_processing import open_document, render_pdf_page_to_image
+
+    state: dict[str, object] = {}
+
+    def render_page(page: int, zoom: float):
+        document = state.get("document")
+        if document is None:
+            document = state["document"] = open_document(attachment_path, campaign_dir=campaign_dir)
+        return render_pdf_page_to_image(
+            attachment_path, page, zoom=zoom, campaign_dir=campaign_dir, document=document
+        )
+
+    def close() -> None:
+        document = state.pop("document", None)
+        if document is not None:
+            document.close()
+
+    return render_page, close
+
+
+_DEFAULT_CACHE = PageRenderCache()
+
+
+def get_page_render_cache() -> PageRenderCache:
+    return _DEFAULT_CACHE
@@ -31,8 +31,8 @@ def _resolve_campaign_dir(campaign_dir: str | None) -> Path:
     return base
 
 
-def _resolve_pdf_path(attachment_path: str, campaign_dir: str | None) -> Path:
-    """Resolve PDF path."""
+def resolve_pdf_path(attachment_path: str, campaign_dir: str | None) -> Path:
+    """Return the absolute path of a campaign-relative PDF attachment."""
     campaign_root = _resolve_campaign_dir(campaign_dir)
     pdf_path = Path(attachment_path or "")
     if not pdf_path.is_absolute():
@@ -46,7 +46,7 @@ def _resolve_pdf_path(attachment_path: str, campaign_dir: str | None) -> Path:
 def open_document(attachment_path: str, *, campaign_dir: str | None = None) -> fitz.Document:
     """Open a PDF attachment and return a PyMuPDF document instance."""
 
-    pdf_path = _resolve_pdf_path(attachment_path, campaign_dir)
+    pdf_path = resolve_pdf_path(attachment_path, campaign_dir)
     log_debug(f"Opening PDF document: {pdf_path}", func_name="pdf_processing.open_document")
     return fitz.open(pdf_path)
 
@@ -91,7 +91,7 @@ def render_pdf_page_to_image(
 def get_pdf_page_count(attachment_path: str, *, campaign_dir: str | None = None) -> int:
     """Return the total number of pages for the PDF attachment."""
 
-    pdf_path = _resolve_pdf_path(attachment_path, campaign_dir)
+    pdf_path = resolve_pdf_path(attachment_path, campaign_dir)
     reader = PdfReader(str(pdf_path))
     page_count = len(reader.pages)
     log_debug(
@@ -115,7 +115,7 @@ def export_pdf_page_range(
     if end_page < start_page:
         raise ValueError("end_page must be greater than or equal to start_page.")
 
-    pdf_path = _resolve_pdf_path(attachment_path, campaign_dir)
+    pdf_path = resolve_pdf_path(attachment_path, campaign_dir)
     reader = PdfReader(str(pdf_path))
     total_pages = len(reader.pages)
     if start_page > total_pages or end_page > total_pages:
@@ -369,7 +369,7 @@ def extract_images_with_names(
     metadata for each exported image.
     """
 
-    pdf_path = _resolve_pdf_path(attachment_path, campaign_dir)
+    pdf_path = resolve_pdf_path(attachment_path, campaign_dir)
     campaign_root = _resolve_campaign_dir(campaign_dir)
     image_dir = campaign_root / "assets" / "books" / "images"
     image_dir.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,221 @@
+"""Positional text cache for in-document PDF search.
+
+Each PDF's words and their rectangles are extracted once with PyMuPDF,
+stored under the campaign's cache folder keyed by the file hash
+(:meth:`PDFHashTracker.compute_hash`) and reused by every viewer, so a
+search is a scan over in-memory strings and highlight boxes come straight
+from the cached word rectangles.
+"""
+
+from __future__ import annotations
+
+import bisect
+import gzip
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional, Sequence
+
+from modules.helpers.config_helper import ConfigHelper
+from modules.helpers.importing.pdf_hash_tracker import PDFHashTracker
+from modules.helpers.logging_helper import log_module_import, log_warning
+
+log_module_import(__name__)
+
+CACHE_DIRNAME = os.path.join(".cache", "pdf_text")
+CACHE_VERSION = 1
+
+Rect = tuple[float, float, float, float]
+Word = tuple[float, float, float, float, str]
+
+
+@dataclass(frozen=True)
+class PDFSearchHit:
+    """Occurrences of a query on one page (1-based) with word rectangles."""
+
+    page: int
+    rects: tuple[Rect, ...]
+
+
+class _PageText:
+    """Casefolded page text with a char offset -> word lookup."""
+
+    __slots__ = ("words", "text", "starts")
+
+    def __init__(self, words: Sequence[Word]) -> None:
+        self.words = list(words)
+        self.starts: list[int] = []
+        parts: list[str] = []
+        offset = 0
+        for word in self.words:
+            self.starts.append(offset)
+            folded = str(word[4]).casefold()
+            parts.append(folded)
+            offset += len(folded) + 1
+        self.text = " ".join(parts)
+
+    def find(self, needle: str) -> tuple[Rect, ...]:
+        rects: list[Rect] = []
+        start = self.text.find(needle)
+        while start != -1:
+            first = bisect.bisect_right(self.starts, start) - 1
+            last = bisect.bisect_right(self.starts, start + len(needle) - 1) - 1
+            rects.extend(tuple(word[:4]) for word in self.words[first : last + 1])
+            start = self.text.find(needle, start + len(needle))
+        return tuple(rects)
+
+
+def normalize_query(query: str) -> str:
+    """Casefold *query* and collapse whitespace to match cached page text."""
+    return " ".join(str(query or "").split()).casefold()
+
+
+class PDFTextCache:
+    """Words and rectangles of every page of one PDF."""
+
+    def __init__(self, pages: Sequence[Sequence[Word]]) -> None:
+        self._pages = [_PageText(words) for words in pages]
+
+    @property
+    def page_count(self) -> int:
+        return len(self._pages)
+
+    @classmethod
+    def from_document(cls, document) -> "PDFTextCache":
+        pages = []
+        for index in range(document.page_count):
+            words = document.load_page(index).get_text("words") or []
+            pages.append([(float(w[0]), float(w[1]), float(w[2]), float(w[3]), str(w[4])) for w in words])
+        return cls(pages)
+
+    def search(self, query: str) -> list[PDFSearchHit]:
+        """Return every page containing *query* with the matching word rects."""
+        needle = normalize_query(query)
+        if not needle:
+            return []
+        hits = []
+        for number, page in enumerate(self._pages, start=1):
+            if needle in page.text:
+                hits.append(PDFSearchHit(number, page.find(needle)))
+        return hits
+
+    def matching_pages(self, query: str) -> list[int]:
+        needle = normalize_query(query)
+        if not needle:
+            return []
+        return [number for number, page in enumerate(self._pages, start=1) if needle in page.text]
+
+    def page_contains(self, page: int, query: str) -> bool:
+        needle = normalize_query(query)
+        return bool(needle) and 1 <= page <= len(self._pages) and needle in self._pages[page - 1].text
+
+    def page_rects(self, page: int, query: str) -> tuple[Rect, ...]:
+        needle = normalize_query(query)
+        if not needle or not 1 <= page <= len(self._pages):
+            return ()
+        return self._pages[page - 1].find(needle)
+
+    def to_payload(self) -> dict:
+        return {
+            "version": CACHE_VERSION,
+            "pages": [[list(word) for word in page.words] for page in self._pages],
+        }
+
+    @classmethod
+    def from_payload(cls, payload: dict) -> Optional["PDFTextCache"]:
+        if not isinstance(payload, dict) or payload.get("version") != CACHE_VERSION:
+            return None
+        return cls([[tuple(word) for word in page] for page in payload.get("pages") or []])
+
+
+_MEMORY: dict[str, PDFTextCache] = {}
+_HASHES: dict[tuple[str, int, int], str] = {}
+_LOCK = threading.Lock()
+
+
+def _pdf_hash(pdf_path: Path) -> str:
+    stat = pdf_path.stat()
+    key = (str(pdf_path), stat.st_size, stat.st_mtime_ns)
+    with _LOCK:
+        cached = _HASHES.get(key)
+    if cached is None:
+        cached = PDFHashTracker.compute_hash(str(pdf_path))
+        with _LOCK:
+            _HASHES[key] = cached
+    return cached
+
+
+def cache_directory(campaign_dir: Optional[str] = None) -> Path:
+    return Path(campaign_dir or ConfigHelper.get_campaign_dir()) / CACHE_DIRNAME
+
+
+def load_text_cache(
+    pdf_path: str | Path,
+    *,
+    open_document: Callable[[str], object],
+    campaign_dir: Optional[str] = None,
+) -> PDFTextCache:
+    """Return the text cache of *pdf_path*, building and persisting it once."""
+    pdf_path = Path(pdf_path)
+    digest = _pdf_hash(pdf_path)
+    with _LOCK:
+        cached = _MEMORY.get(digest)
+    if cached is not None:
+        return cached
+    cache_file = cache_directory(campaign_dir) / f"{digest}.json.gz"
+    if cache_file.exists():
+        try:
+            with gzip.open(cache_file, "rt", encoding="utf-8") as handle:
+                cached = PDFTextCache.from_payload(json.load(handle))
+        except Exception as exc:
+            log_warning(
+                f"Ignoring unreadable PDF text cache {cache_file}: {exc}",
+                func_name="modules.books.pdf_text_cache.load_text_cache",
+            )
+    if cached is None:
+        document = open_document(str(pdf_path))
+        try:
+            cached = PDFTextCache.from_document(document)
+        finally:
+            document.close()
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = cache_file.with_suffix(".tmp")
+            with gzip.open(temp_file, "wt", encoding="utf-8") as handle:
+                json.dump(cached.to_payload(), handle, separators=(",", ":"))
+            os.replace(temp_file, cache_file)
+        except OSError as exc:
+            log_warning(
+                f"Unable to persist PDF text cache {cache_file}: {exc}",
+                func_name="modules.books.pdf_text_cache.load_text_cache",
+            )
+    with _LOCK:
+        _MEMORY[digest] = cached
+    return cached
+
+
+def load_text_cache_async(
+    pdf_path: str | Path,
+    on_ready: Callable[[Optional[PDFTextCache]], None],
+    *,
+    open_document: Callable[[str], object],
+    campaign_dir: Optional[str] = None,
+) -> threading.Thread:
+    """Build or load the cache on a daemon thread and pass it to *on_ready*."""
+
+    def worker():
+        try:
+            cache = load_text_cache(pdf_path, open_document=open_document, campaign_dir=campaign_dir)
+        except Exception as exc:
+            log_warning(
+                f"Unable to build PDF text cache for {pdf_path}: {exc}",
+                func_name="modules.books.pdf_text_cache.load_text_cache_async",
+            )
+            cache = None
+        on_ready(cache)
+
+    thread = threading.Thread(target=worker, name="pdf-text-cache", daemon=True)
+    thread.start()
+    return thread
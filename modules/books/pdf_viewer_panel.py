@@ -1,11 +1,12 @@
 """Reusable frame-based PDF viewer for embedded panels and book windows."""
 from __future__ import annotations
-import threading
 import tkinter as tk
 from typing import Any
 import customtkinter as ctk
 from PIL import ImageTk
-from modules.books.pdf_processing import get_pdf_page_count, open_document, render_pdf_page_to_image
+from modules.books.page_render_cache import PageRenderer, document_page_renderer
+from modules.books.pdf_processing import get_pdf_page_count, open_document
+from modules.books.pdf_text_cache import load_text_cache_async
 from modules.helpers.config_helper import ConfigHelper
 from modules.helpers.logging_helper import log_warning
 
@@ -31,6 +32,8 @@ class PDFViewerFrame(ctk.CTkFrame):
         self._render_token = 0
         self._page_image = None
         self._document = None
+        self._page_renderer = None
+        self._text_cache = None
         self.page_count = 0
         self._build_ui()
         self.open_pdf(self.pdf_path, initial_page=self.current_page, zoom=self.zoom)
@@ -79,8 +82,34 @@ class PDFViewerFrame(ctk.CTkFrame):
         except Exception as exc:
             log_warning(f"Unable to open PDF '{self.pdf_path}': {exc}", func_name="PDFViewerFrame.open_pdf")
             self._document = None; self.page_count = 0
+        self._close_page_renderer()
+        if self._document is not None:
+            render_page, close = document_page_renderer(self.pdf_path, campaign_dir=self.campaign_dir)
+            self._page_renderer = PageRenderer(getattr(self._document, "name", "") or self.pdf_path, render_page, page_count=self.page_count, on_close=close)
+        self._load_text_cache()
         self.go_to_page(initial_page, render=True)
 
+    def _load_text_cache(self) -> None:
+        self._text_cache = None
+        document = self._document
+        source = getattr(document, "name", "") if document is not None else ""
+        if not source: return
+        def ready(cache):
+            try: self.after(0, lambda: self._set_text_cache(document, cache))
+            except (RuntimeError, tk.TclError): pass
+        load_text_cache_async(source, ready, open_document=open_document, campaign_dir=self.campaign_dir)
+
+    def _set_text_cache(self, document, cache) -> None:
+        if document is self._document: self._text_cache = cache
+
+    def _close_page_renderer(self) -> None:
+        if self._page_renderer is not None:
+            self._page_renderer.close(); self._page_renderer = None
+
+    def destroy(self) -> None:
+        self._close_page_renderer()
+        super().destroy()
+
 
     def _reset_search_results(self) -> None:
         self._search_matches = []
@@ -92,6 +121,9 @@ class PDFViewerFrame(ctk.CTkFrame):
     def _page_contains_query(self, page_index: int, query: str) -> bool:
         if not self._document or not query:
             return False
+        text_cache = getattr(self, "_text_cache", None)
+        if text_cache is not None:
+            return text_cache.page_contains(page_index + 1, query)
         try:
             page = self._document.load_page(page_index)
             text = page.get_text("text") if hasattr(page, "get_text") else page.get_text()
@@ -102,6 +134,10 @@ class PDFViewerFrame(ctk.CTkFrame):
     def _build_search_matches(self, query: str) -> list[int]:
         if not query or not self._document or not self.page_count:
             return []
+        text_cache = getattr(self, "_text_cache", None)
+        if text_cache is not None:
+            # Built once per PDF in the background; scanning it is cheap.
+            return text_cache.matching_pages(query)
         return [
             page_number
             for page_number in range(1, self.page_count + 1)
@@ -162,15 +198,18 @@ class PDFViewerFrame(ctk.CTkFrame):
         self.zoom = 1.25; self._refresh_labels(); self._schedule_render(); self._changed()
     def _schedule_render(self) -> None:
         self._render_token += 1; token = self._render_token
-        self.loading_label.place(relx=0.5, rely=0.5, anchor="center")
-        path, page, zoom, doc = self.pdf_path, self.current_page, self.zoom, self._document
-        def worker():
-            image = None; error = None
-            try:
-                if path: image = render_pdf_page_to_image(path, page, zoom=zoom, campaign_dir=self.campaign_dir, document=doc)
-            except Exception as exc: error = exc
-            self.after(0, lambda: self._apply_render(token, image, error))
-        threading.Thread(target=worker, daemon=True).start()
+        renderer = self._page_renderer
+        if renderer is None: return
+        # Cached (or scaled nearest-zoom) rasters show at once; the worker
+        # sharpens them and prefetches neighbouring pages.
+        image, exact = renderer.lookup(self.current_page, self.zoom)
+        if image is not None: self._apply_render(token, image, None)
+        if exact: renderer.prefetch(self.current_page, self.zoom); return
+        if image is None: self.loading_label.place(relx=0.5, rely=0.5, anchor="center")
+        def deliver(_page, _zoom, image, _exact, error):
+            try: self.after(0, lambda: self._apply_render(token, image, error))
+            except (RuntimeError, tk.TclError): pass
+        renderer.request(self.current_page, self.zoom, deliver)
     def _apply_render(self, token: int, image, error) -> None:
         if token != self._render_token: return
         self.loading_label.place_forget()
@@ -61,6 +61,8 @@ class ArcGenerationService:
                 return normalized
             except Exception as exc:
                 last_error = exc
+                # A re-run must not replay the rejected answer from the response cache.
+                runner.forget(messages)
                 if attempt == 1:
                     raise
                 messages = [
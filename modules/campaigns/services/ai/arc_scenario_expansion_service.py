@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from modules.campaigns.services.ai.arc_scenario_entities import build_existing_entity_lookup
@@ -23,9 +24,10 @@ class ArcScenarioExpansionValidationError(ValueError):
 class ArcScenarioExpansionService:
     """Generate exactly two new scenario payloads for each existing campaign arc."""
 
-    def __init__(self, ai_client):
+    def __init__(self, ai_client, *, max_concurrency: int = 3):
         """Initialize the ArcScenarioExpansionService instance."""
         self.ai_client = ai_client
+        self.max_concurrency = max(1, int(max_concurrency))
 
     def generate_scenarios(
         self,
@@ -34,61 +36,101 @@ class ArcScenarioExpansionService:
         *,
         existing_scenarios: list[dict[str, Any]] | None = None,
     ) -> dict[str, Any]:
-        """Handle generate scenarios."""
+        """Generate two scenarios per arc, one request per arc on a bounded pool.
+
+        Arcs whose response fails validation are retried on their own; arcs
+        that already validated are kept.
+        """
         normalized_arcs = self._normalize_input_arcs(arcs)
         existing_entities = build_existing_entity_lookup(foundation)
-        prompt = build_arc_scenario_expansion_prompt(
-            foundation=foundation,
-            arcs=normalized_arcs,
-            existing_scenarios=existing_scenarios,
-        )
-        messages = [
-            {
-                "role": "system",
-                "content": "Write tabletop RPG scenarios and return strict JSON only.",
-            },
-            {"role": "user", "content": prompt},
+        conversations = [
+            [
+                {
+                    "role": "system",
+                    "content": "Write tabletop RPG scenarios and return strict JSON only.",
+                },
+                {
+                    "role": "user",
+                    "content": build_arc_scenario_expansion_prompt(
+                        foundation=foundation,
+                        arcs=[arc],
+                        existing_scenarios=existing_scenarios,
+                    ),
+                },
+            ]
+            for arc in normalized_arcs
         ]
 
-        runner = AIPipelineRunner(self.ai_client, pipeline_name="campaign.scenario_expansion")
-        last_error: Exception | None = None
-        for attempt in range(2):
-            # Process each attempt from range(2).
-            raw_response = runner.run_chat(
-                messages,
-                phase="scenario_expansion",
-                phase_message=f"Generating arc scenarios (attempt {attempt + 1}/2)",
-                context_metadata={
-                    "feature": "campaign_builder",
-                    "action_label": "Generate scenarios per arc",
-                },
-            )
-            try:
-                # Keep generate scenarios resilient if this step fails.
-                parsed = parse_json_relaxed(raw_response)
-                return self._normalize_generated_payload(
-                    parsed,
-                    normalized_arcs,
-                    existing_entities=existing_entities,
-                )
-            except Exception as exc:
-                last_error = exc
+        groups: dict[int, dict[str, Any]] = {}
+        used_titles: set[str] = set()
+        pending = list(range(len(normalized_arcs)))
+        workers = min(self.max_concurrency, len(pending))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="arc-scenarios") as executor:
+            for attempt in range(2):
+                # Process each attempt from range(2); only failed arcs are re-requested.
+                futures = {
+                    index: executor.submit(
+                        self._request_arc, normalized_arcs[index], conversations[index], attempt
+                    )
+                    for index in pending
+                }
+                failed: list[int] = []
+                errors: dict[int, Exception] = {}
+                # Validate in arc order so duplicate-title checks are deterministic.
+                for index in pending:
+                    raw_response = futures[index].result()
+                    arc_titles = set(used_titles)
+                    try:
+                        # Keep generate scenarios resilient if this step fails.
+                        parsed = parse_json_relaxed(raw_response)
+                        normalized = self._normalize_generated_payload(
+                            parsed,
+                            [normalized_arcs[index]],
+                            existing_entities=existing_entities,
+                            used_titles=arc_titles,
+                        )
+                    except Exception as exc:
+                        failed.append(index)
+                        errors[index] = exc
+                        # A re-run must not replay the rejected answer from the response cache.
+                        AIPipelineRunner(self.ai_client, pipeline_name="campaign.scenario_expansion").forget(
+                            conversations[index]
+                        )
+                        conversations[index] = [
+                            *conversations[index],
+                            {"role": "assistant", "content": str(raw_response)},
+                            {
+                                "role": "user",
+                                "content": (
+                                    "Your previous JSON did not satisfy the scenario-generation constraints. "
+                                    f"Fix it and return strict JSON only. Error: {exc}. "
+                                    "Ensure the arc appears exactly once and contains exactly 2 scenario payloads."
+                                ),
+                            },
+                        ]
+                        continue
+                    used_titles = arc_titles
+                    groups[index] = normalized["arcs"][0]
+                if not failed:
+                    break
                 if attempt == 1:
-                    raise
-                messages = [
-                    *messages,
-                    {"role": "assistant", "content": str(raw_response)},
-                    {
-                        "role": "user",
-                        "content": (
-                            "Your previous JSON did not satisfy the scenario-generation constraints. "
-                            f"Fix it and return strict JSON only. Error: {exc}. "
-                            "Ensure every arc appears exactly once and contains exactly 2 scenario payloads."
-                        ),
-                    },
-                ]
-
-        raise RuntimeError(f"Scenario expansion failed: {last_error}")
+                    raise errors[failed[0]]
+                pending = failed
+
+        return {"arcs": [groups[index] for index in range(len(normalized_arcs))]}
+
+    def _request_arc(self, arc: dict[str, Any], messages: list[dict[str, str]], attempt: int) -> Any:
+        """Request the scenarios of one arc."""
+        runner = AIPipelineRunner(self.ai_client, pipeline_name="campaign.scenario_expansion")
+        return runner.run_chat(
+            messages,
+            phase="scenario_expansion",
+            phase_message=f"Generating scenarios for arc '{arc['name']}' (attempt {attempt + 1}/2)",
+            context_metadata={
+                "feature": "campaign_builder",
+                "action_label": "Generate scenarios per arc",
+            },
+        )
 
     def _normalize_input_arcs(self, arcs: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Normalize input arcs."""
@@ -128,6 +170,7 @@ class ArcScenarioExpansionService:
         arcs: list[dict[str, Any]],
         *,
         existing_entities: dict[str, set[str]] | None = None,
+        used_titles: set[str] | None = None,
     ) -> dict[str, Any]:
         """Normalize generated payload."""
         payload = self._coerce_json_object(payload)
@@ -142,7 +185,7 @@ class ArcScenarioExpansionService:
         expected_lookup = {name.casefold(): name for name in expected_arc_names}
         arc_context_lookup = {arc["name"].casefold(): arc for arc in arcs}
         seen_arc_names: set[str] = set()
-        used_titles: set[str] = set()
+        used_titles = set() if used_titles is None else used_titles
         normalized_groups: list[dict[str, Any]] = []
 
         for raw_group in raw_arc_groups:
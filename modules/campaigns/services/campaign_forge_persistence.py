@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from modules.campaigns.services.ai.arc_scenario_entities import ENTITY_WRAPPER_SPECS
-from modules.generic.generic_model_wrapper import GenericModelWrapper
+from modules.generic.generic_model_wrapper import GenericModelWrapper, WrapperTransaction
 
 SAVE_MODE_REPLACE_GENERATED_ONLY = "replace_generated_only"
 SAVE_MODE_MERGE_KEEP_EXISTING = "merge_keep_existing"
@@ -57,7 +57,7 @@ class CampaignForgePersistence:
     ) -> dict[str, Any]:
         """Build dry run report."""
         save_mode = self._validate_save_mode(save_mode)
-        existing_titles = self._load_existing_titles()
+        existing_titles = self._load_existing_titles(generated_payload)
         operations = self._plan_operations(generated_payload, existing_titles, save_mode)
         arc_link_updates = self._plan_arc_link_updates(arcs, operations, save_mode)
 
@@ -97,6 +97,15 @@ class CampaignForgePersistence:
         self.unsaved_generated_payload = None
         self.last_error_summary = None
 
+        if self._supports_single_transaction():
+            return self._save_in_one_transaction(
+                generated_payload,
+                arcs,
+                dry_run_report,
+                campaign_metadata=campaign_metadata,
+                campaign_original_key=campaign_original_key,
+            )
+
         operations = self._operations_from_report(generated_payload, dry_run_report)
         failures: list[dict[str, str]] = []
         saved_groups: list[dict[str, Any]] = []
@@ -107,7 +116,7 @@ class CampaignForgePersistence:
                 if not self.campaign_wrapper:
                     raise CampaignForgePersistenceError("campaign_wrapper is required to persist campaign metadata")
                 self.campaign_wrapper.save_item(
-                    campaign_metadata,
+                    self._with_arc_links(campaign_metadata, dry_run_report.get("arc_linkage") or {}),
                     key_field="Name",
                     original_key_value=campaign_original_key,
                 )
@@ -159,6 +168,119 @@ class CampaignForgePersistence:
         self.last_error_summary = self._build_error_summary(failures)
         raise CampaignForgePersistenceError(self.last_error_summary)
 
+    def _supports_single_transaction(self) -> bool:
+        """Return whether every wrapper involved writes to the same SQLite database."""
+        wrappers = [self.scenario_wrapper, *self.entity_wrappers.values()]
+        if self.campaign_wrapper is not None:
+            wrappers.append(self.campaign_wrapper)
+        if not all(isinstance(wrapper, GenericModelWrapper) for wrapper in wrappers):
+            return False
+        return len({wrapper._db_path for wrapper in wrappers}) == 1
+
+    def _save_in_one_transaction(
+        self,
+        generated_payload: dict[str, Any],
+        arcs: list[dict[str, Any]],
+        dry_run_report: dict[str, Any],
+        *,
+        campaign_metadata: dict[str, Any] | None,
+        campaign_original_key: str | None,
+    ) -> dict[str, Any]:
+        """Write metadata, created entities and scenarios together, or nothing at all."""
+        operations = [op for op in self._operations_from_report(generated_payload, dry_run_report) if op.action != "skipped"]
+        arc_linkage = dry_run_report.get("arc_linkage") or {}
+        step = {"phase": "created_entities", "arc_name": "", "title": ""}
+        grouped_saved: dict[str, list[dict[str, Any]]] = {}
+        try:
+            # Lookups run before the write lock is taken.
+            entity_batches = self._plan_created_entities(operations)
+            scenario_payloads = []
+            for op in operations:
+                # Process each op from operations.
+                scenario_payload = dict(op.payload)
+                scenario_payload.pop("EntityCreations", None)
+                scenario_payload["Title"] = op.final_title
+                scenario_payloads.append(scenario_payload)
+                grouped_saved.setdefault(op.arc_name, []).append(scenario_payload)
+
+            with WrapperTransaction(self.scenario_wrapper._db_path) as transaction:
+                if campaign_metadata:
+                    step = {"phase": "campaign_metadata", "arc_name": "", "title": str(campaign_metadata.get("Name") or "")}
+                    if not self.campaign_wrapper:
+                        raise CampaignForgePersistenceError("campaign_wrapper is required to persist campaign metadata")
+                    self.campaign_wrapper.save_item(
+                        self._with_arc_links(campaign_metadata, arc_linkage),
+                        key_field="Name",
+                        original_key_value=campaign_original_key,
+                        transaction=transaction,
+                    )
+                for entity_type, (wrapper, records) in entity_batches.items():
+                    step = {"phase": "created_entities", "arc_name": "", "title": entity_type}
+                    wrapper.save_items(records, replace=False, transaction=transaction)
+                if scenario_payloads:
+                    step = {"phase": "scenario", "arc_name": "", "title": f"{len(scenario_payloads)} scenario(s)"}
+                    self.scenario_wrapper.save_items(scenario_payloads, replace=False, transaction=transaction)
+        except Exception as exc:
+            self.unsaved_generated_payload = generated_payload
+            self.last_error_summary = self._build_error_summary([{**step, "error": str(exc)}])
+            raise CampaignForgePersistenceError(self.last_error_summary) from exc
+
+        self._apply_arc_link_updates(arcs, arc_linkage)
+        return {
+            "saved_groups": [{"arc_name": name, "scenarios": scenarios} for name, scenarios in grouped_saved.items()],
+            "dry_run_report": dry_run_report,
+            "failures": [],
+        }
+
+    def _plan_created_entities(self, operations: list[_ScenarioOperation]) -> dict[str, tuple[Any, list[dict[str, Any]]]]:
+        """Return the new entity records per type, skipping names already stored."""
+        batches: dict[str, tuple[Any, list[dict[str, Any]]]] = {}
+        for entity_type, spec in ENTITY_WRAPPER_SPECS.items():
+            # Process each (entity_type, spec) from ENTITY_WRAPPER_SPECS.items().
+            key_field = spec["key_field"]
+            candidates: dict[str, dict[str, Any]] = {}
+            for op in operations:
+                entity_creations = op.payload.get("EntityCreations")
+                records = entity_creations.get(entity_type) if isinstance(entity_creations, dict) else None
+                for record in records if isinstance(records, list) else []:
+                    name = str(record.get(key_field) or "").strip() if isinstance(record, dict) else ""
+                    if name and name.casefold() not in candidates:
+                        candidates[name.casefold()] = dict(record)
+            if not candidates:
+                continue
+            wrapper = self._resolve_entity_wrapper(entity_type)
+            names = [str(record.get(key_field)).strip() for record in candidates.values()]
+            existing = {str(name).casefold() for name in wrapper.existing_keys(names, key_field, nocase=True)}
+            records = [record for key, record in candidates.items() if key not in existing]
+            if records:
+                batches[entity_type] = (wrapper, records)
+        return batches
+
+    @staticmethod
+    def _with_arc_links(campaign_metadata: dict[str, Any], arc_linkage_report: dict[str, Any]) -> dict[str, Any]:
+        """Return the metadata with planned arc scenario links applied to ``Arcs``."""
+        arcs = campaign_metadata.get("Arcs")
+        updates_by_arc = {
+            str(row.get("arc_name") or "").casefold(): list(row.get("after") or [])
+            for row in arc_linkage_report.get("items") or []
+        }
+        if not isinstance(arcs, list) or not updates_by_arc:
+            return campaign_metadata
+        linked_arcs = []
+        for arc in arcs:
+            # Process each arc from arcs.
+            key = str(arc.get("name") or "").strip().casefold() if isinstance(arc, dict) else ""
+            linked_arcs.append({**arc, "scenarios": updates_by_arc[key]} if key in updates_by_arc else arc)
+        metadata = {**campaign_metadata, "Arcs": linked_arcs}
+        if "LinkedScenarios" in metadata:
+            linked: list[str] = []
+            for arc in linked_arcs:
+                for title in arc.get("scenarios", []) if isinstance(arc, dict) else []:
+                    if title and title not in linked:
+                        linked.append(title)
+            metadata["LinkedScenarios"] = linked
+        return metadata
+
     def save(
         self,
         generated_payload: dict[str, Any],
@@ -315,8 +437,25 @@ class CampaignForgePersistence:
             if key in updates_by_arc:
                 arc["scenarios"] = updates_by_arc[key]
 
-    def _load_existing_titles(self) -> set[str]:
-        """Load existing titles."""
+    def _load_existing_titles(self, generated_payload: dict[str, Any] | None = None) -> set[str]:
+        """Load existing titles that could collide with the generated ones.
+
+        Wrappers with an indexed prefix lookup only fetch titles starting with
+        a generated title (enough for the "Title (n)" renames); others fall
+        back to loading every scenario.
+        """
+        lookup = getattr(self.scenario_wrapper, "keys_with_prefixes", None)
+        if generated_payload is not None and callable(lookup):
+            source_titles = [
+                str(scenario.get("Title") or "Untitled Scenario").strip() or "Untitled Scenario"
+                for group in generated_payload.get("arcs") or []
+                for scenario in group.get("scenarios") or []
+                if isinstance(scenario, dict)
+            ]
+            try:
+                return {str(title).strip().casefold() for title in lookup(source_titles, "Title") if str(title).strip()}
+            except Exception:
+                pass
         try:
             items = self.scenario_wrapper.load_items() if self.scenario_wrapper else []
         except Exception:
@@ -16,12 +16,13 @@ from modules.helpers.logging_helper import (
     log_warning,
 )
 from modules.helpers.pdf_review_dialog import PDFReviewDialog
+from modules.helpers.importing.pdf_hash_tracker import PDFHashTracker
+from modules.importers.pdf_batch_importer import BatchPDFImporter, EntityImportSpec
 from modules.importers.pdf_entity_importer import parse_json_relaxed, to_longtext
 from modules.npcs.npc_importer import (
-    build_npc_prompt,
+    NPC_IMPORT_SPEC,
     import_npc_records,
     import_npcs_from_json,
-    normalize_npc_payload,
 )
 
 log_module_import(__name__)
@@ -39,6 +40,59 @@ def _normalize_creature_payload(payload):
     raise ValueError("Payload must be a list of creatures or contain a 'creatures' array")
 
 
+def build_creature_record(raw: dict) -> dict:
+    """Map one AI/JSON creature entry onto the creatures table columns."""
+    return {
+        "Name": raw.get("Name", "Unnamed"),
+        "Type": raw.get("Type", ""),
+        "Description": to_longtext(raw.get("Description", "")),
+        "Weakness": to_longtext(raw.get("Weakness", "")),
+        "Powers": to_longtext(raw.get("Powers", "")),
+        "Stats": to_longtext(raw.get("Stats", "")),
+        "Background": to_longtext(raw.get("Background", "")),
+        "Genre": raw.get("Genre", ""),
+        "Portrait": raw.get("Portrait", ""),
+    }
+
+
+def build_creature_prompt(raw_text: str, source_label: str) -> str:
+    """Build creature prompt."""
+    schema = {
+        "creatures": [
+            {
+                "Name": "text",
+                "Type": "text(optional)",
+                "Description": "longtext(optional)",
+                "Weakness": "longtext(optional)",
+                "Powers": "longtext(optional)",
+                "Stats": "stat block text",
+                "Background": "longtext(optional)",
+                "Genre": "text(optional)",
+                "Portrait": "url or file(optional)",
+            }
+        ]
+    }
+    return (
+        "You are an assistant that extracts creature stat blocks from tabletop RPG PDFs.\n"
+        "Return STRICT JSON only using the schema below.\n"
+        "Important: For every creature, copy the statistics directly from the PDF into the 'Stats' field.\n"
+        "Do not invent numbers or abilities—leave the field empty if the PDF omits them.\n"
+        "Preserve line breaks so the stat block stays readable.\n\n"
+        "Schema:\n" + json.dumps(schema, ensure_ascii=False, indent=2) + "\n\n"
+        f"Source: {source_label or 'Unknown'}\n"
+        "PDF text (may be truncated):\n" + raw_text[:5000000]
+    )
+
+
+CREATURE_IMPORT_SPEC = EntityImportSpec(
+    entity_type="creatures",
+    system_prompt="Extract structured creature information as strict JSON.",
+    build_prompt=build_creature_prompt,
+    normalize=_normalize_creature_payload,
+    to_record=build_creature_record,
+)
+
+
 @log_function
 def import_creature_records(payload) -> int:
     """Persist a list (or wrapped dict) of creature entries into the database."""
@@ -46,29 +100,11 @@ def import_creature_records(payload) -> int:
     if not creatures:
         raise ValueError("No creatures found in payload")
 
-    wrapper = GenericModelWrapper("creatures")
-    existing = wrapper.load_items()
-    new_items = []
-    for raw in creatures:
-        # Process each raw from creatures.
-        if not isinstance(raw, dict):
-            continue
-        item = {
-            "Name": raw.get("Name", "Unnamed"),
-            "Type": raw.get("Type", ""),
-            "Description": to_longtext(raw.get("Description", "")),
-            "Weakness": to_longtext(raw.get("Weakness", "")),
-            "Powers": to_longtext(raw.get("Powers", "")),
-            "Stats": to_longtext(raw.get("Stats", "")),
-            "Background": to_longtext(raw.get("Background", "")),
-            "Genre": raw.get("Genre", ""),
-            "Portrait": raw.get("Portrait", ""),
-        }
-        new_items.append(item)
+    new_items = [build_creature_record(raw) for raw in creatures if isinstance(raw, dict)]
     if not new_items:
         raise ValueError("No valid creature entries were provided")
 
-    wrapper.save_items(existing + new_items)
+    GenericModelWrapper("creatures").save_items(new_items, replace=False)
     return len(new_items)
 
 
@@ -199,6 +235,26 @@ class CreatureImportWindow(ctk.CTkToplevel):
         if not path:
             return
 
+        pdf_hash = None
+        try:
+            pdf_hash = PDFHashTracker.compute_hash(path)
+            previous_record = PDFHashTracker.get_record(pdf_hash)
+            if previous_record and not messagebox.askyesno(
+                "PDF Already Imported",
+                "This PDF appears to have been imported before.\n\n"
+                f"Source: {previous_record.get('path', path)}\n"
+                f"When: {previous_record.get('timestamp', 'an earlier session')}\n\n"
+                "Import it again?",
+            ):
+                return
+            if previous_record:
+                PDFHashTracker.clear_chunks(pdf_hash)
+        except Exception as exc:
+            log_warning(
+                f"Unable to check PDF hash: {exc}",
+                func_name="CreatureImportWindow.import_pdf_via_ai",
+            )
+
         def worker():
             """Handle worker."""
             try:
@@ -208,10 +264,10 @@ class CreatureImportWindow(ctk.CTkToplevel):
                 if not pages or not any(page.strip() for page in pages):
                     self._warn("Empty PDF", "Could not extract meaningful text from the PDF.")
                     return
-                selected_text = self._review_extracted_pages(pages, os.path.basename(path))
-                if not selected_text:
+                selected_pages = self._review_extracted_pages(pages, os.path.basename(path))
+                if not selected_pages:
                     return
-                self._ai_extract_and_import(selected_text, source_label=os.path.basename(path))
+                self._ai_import_pages(selected_pages, path, pdf_hash)
             except Exception as exc:
                 self._error("AI Import Error", str(exc))
             finally:
@@ -273,9 +329,9 @@ class CreatureImportWindow(ctk.CTkToplevel):
             )
             raise
 
-    def _review_extracted_pages(self, pages: list[str], source_name: str) -> str | None:
-        """Internal helper for review extracted pages."""
-        selection: dict[str, str | None] = {"text": None}
+    def _review_extracted_pages(self, pages: list[str], source_name: str) -> list[str] | None:
+        """Return the pages the user kept, or ``None`` if cancelled."""
+        selection: dict[str, list[str] | None] = {"pages": None}
         event = threading.Event()
 
         def _open_dialog():
@@ -283,100 +339,74 @@ class CreatureImportWindow(ctk.CTkToplevel):
             dialog = PDFReviewDialog(self, pages, title=f"Review {source_name}")
             self.wait_window(dialog)
             chosen = dialog.selected_pages
-            selection["text"] = "\n".join(chosen) if chosen else None
+            selection["pages"] = list(chosen) if chosen else None
             event.set()
 
         self.after(0, _open_dialog)
         event.wait()
-        return selection["text"]
+        return selection["pages"]
+
+    def _import_spec(self) -> EntityImportSpec:
+        """Return the import spec of the selected mode."""
+        return NPC_IMPORT_SPEC if self._get_mode_config()["slug"] == "npcs" else CREATURE_IMPORT_SPEC
 
     def _ai_extract_and_import(self, raw_text: str, source_label: str = ""):
         """Internal helper for AI extract and import."""
         config = self._get_mode_config()
+        spec = self._import_spec()
         log_info(
             f"Running {config['label'].lower()} AI import for {source_label or 'input'}",
             func_name="CreatureImportWindow._ai_extract_and_import",
         )
         self._set_status("Contacting AI...")
         client = LocalAIClient()
-
-        if config["slug"] == "npcs":
-            # Handle the branch where config['slug'] == 'npcs'.
-            prompt = build_npc_prompt(raw_text, source_label)
-            response = client.chat([
-                {"role": "system", "content": "Extract structured NPC information as strict JSON."},
-                {"role": "user", "content": prompt},
-            ])
-            parsed = parse_json_relaxed(response)
-            npcs = normalize_npc_payload(parsed)
-            count = import_npc_records(npcs)
-
-            pretty = json.dumps({"npcs": npcs}, ensure_ascii=False, indent=2)
-            self._set_text(pretty)
-            self._info(
-                "Import Complete",
-                f"Imported {count} NPC(s) from {source_label or 'AI input'}.",
-            )
-            return
-
-        wrapper = GenericModelWrapper("creatures")
-        existing = wrapper.load_items()
-        stats_examples = []
-        for entry in existing:
-            # Process each entry from existing.
-            stats_val = entry.get("Stats")
-            if isinstance(stats_val, dict):
-                stats_val = stats_val.get("text", "")
-            if isinstance(stats_val, str) and stats_val.strip():
-                stats_examples.append({
-                    "Name": entry.get("Name", ""),
-                    "Stats": stats_val.strip(),
-                })
-            if len(stats_examples) >= 3:
-                break
-
-        schema = {
-            "creatures": [
-                {
-                    "Name": "text",
-                    "Type": "text(optional)",
-                    "Description": "longtext(optional)",
-                    "Weakness": "longtext(optional)",
-                    "Powers": "longtext(optional)",
-                    "Stats": "stat block text",
-                    "Background": "longtext(optional)",
-                    "Genre": "text(optional)",
-                    "Portrait": "url or file(optional)",
-                }
-            ]
-        }
-
-        prompt = (
-            "You are an assistant that extracts creature stat blocks from tabletop RPG PDFs.\n"
-            "Return STRICT JSON only using the schema below.\n"
-            "Important: For every creature, copy the statistics directly from the PDF into the 'Stats' field.\n"
-            "Do not invent numbers or abilities—leave the field empty if the PDF omits them.\n"
-            "Preserve line breaks so the stat block stays readable.\n\n"
-            "Schema:\n" + json.dumps(schema, ensure_ascii=False, indent=2) + "\n\n"
-            f"Source: {source_label or 'Unknown'}\n"
-            "PDF text (may be truncated):\n" + raw_text[:5000000]
-        )
-
         response = client.chat([
-            {"role": "system", "content": "Extract structured creature information as strict JSON."},
-            {"role": "user", "content": prompt},
+            {"role": "system", "content": spec.system_prompt},
+            {"role": "user", "content": spec.build_prompt(raw_text, source_label)},
         ])
 
         parsed = parse_json_relaxed(response)
-        creatures = _normalize_creature_payload(parsed)
-        count = import_creature_records(creatures)
+        entries = spec.normalize(parsed)
+        if config["slug"] == "npcs":
+            count = import_npc_records(entries)
+        else:
+            count = import_creature_records(entries)
 
-        pretty = json.dumps({"creatures": creatures}, ensure_ascii=False, indent=2)
+        pretty = json.dumps({config["slug"]: entries}, ensure_ascii=False, indent=2)
         self._set_text(pretty)
         self._info(
             "Import Complete",
-            f"Imported {count} creature(s) from {source_label or 'AI input'}.",
+            f"Imported {count} {config['label'].lower()}(s) from {source_label or 'AI input'}.",
+        )
+
+    def _ai_import_pages(self, pages: list[str], pdf_path: str, pdf_hash: str | None):
+        """Import PDF pages chunk by chunk, resuming an interrupted import."""
+        config = self._get_mode_config()
+        source_label = os.path.basename(pdf_path)
+        self._set_status("Contacting AI...")
+
+        def report(done: int, total: int) -> None:
+            self._set_status(f"Imported {done}/{total} page chunks...")
+
+        result = BatchPDFImporter(self._import_spec()).run(
+            pages,
+            source_label=source_label,
+            source_path=pdf_path,
+            pdf_hash=pdf_hash,
+            progress=report,
         )
+        pretty = json.dumps({config["slug"]: result.items}, ensure_ascii=False, indent=2)
+        self._set_text(pretty)
+        message = f"Imported {result.imported} {config['label'].lower()}(s) from {source_label}."
+        if result.chunks_skipped:
+            message += f"\n{result.chunks_skipped} chunk(s) were already imported earlier."
+        if result.failures:
+            message += (
+                f"\n{len(result.failures)} chunk(s) failed; import the PDF again to retry them."
+            )
+            self._warn("Import Incomplete", message)
+        else:
+            self._info("Import Complete", message)
 
     def _set_text(self, value: str):
         """Set text."""
@@ -0,0 +1,565 @@
+"""Campaign-wide full-text index over every entity table.
+
+Each entity row becomes one FTS5 document of ``(name, body)`` where the body
+is the row's text with rich-text payloads flattened to plain text.  The
+tokenizer folds accents, so ``Eowyn`` finds ``Éowyn``.  Documents are keyed
+through ``campaign_search_docs`` so single rows can be replaced by rowid when
+a save listener reports them, and a per-table signature lets a freshly
+opened campaign reuse the index instead of rebuilding it.  Triggers on the
+entity tables count writes in ``campaign_search_changes``, so the signature
+also moves when another connection updates a row in place.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sqlite3
+import threading
+import unicodedata
+from contextlib import closing
+from dataclasses import dataclass
+from typing import Any, Iterable, Mapping, Optional, Sequence
+
+from db.db import get_connection
+from modules.books.book_text_index import HIGHLIGHT_CLOSE, HIGHLIGHT_OPEN, build_match_expression
+from modules.generic.json_value_deserializer import deserialize_possible_json
+from modules.helpers.logging_helper import log_module_import, log_warning
+
+log_module_import(__name__)
+
+DOCS_TABLE = "campaign_search_docs"
+FTS_TABLE = "campaign_search_fts"
+FALLBACK_TABLE = "campaign_search_text"
+STATE_TABLE = "campaign_search_state"
+CHANGES_TABLE = "campaign_search_changes"
+SNIPPET_TOKENS = 16
+NAME_WEIGHT = 10.0
+MAX_BODY_CHARS = 200_000
+# Saves touching more rows than this mark the table stale instead of being
+# re-indexed inside the listener.
+INLINE_REINDEX_LIMIT = 200
+
+# Image assets have their own index; book transcripts live in the book index.
+EXCLUDED_ENTITY_TYPES = frozenset({"image_assets"})
+SKIPPED_FIELDS = frozenset(
+    {"Portrait", "Image", "Token", "Audio", "Video", "ExtractedText", "ExtractedPages"}
+)
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclass(frozen=True)
+class CampaignSearchHit:
+    """One ranked entity match.
+
+    Highlight offsets are ``(start, end)`` character ranges into ``name`` and
+    ``snippet`` respectively.
+    """
+
+    entity_type: str
+    key: str
+    name: str
+    name_highlights: tuple[tuple[int, int], ...]
+    snippet: str
+    snippet_highlights: tuple[tuple[int, int], ...]
+    score: float
+
+
+@dataclass(frozen=True)
+class CampaignSearchPage:
+    """One page of results plus the total number of matches."""
+
+    hits: tuple[CampaignSearchHit, ...]
+    total: int
+    offset: int
+    limit: int
+
+    @property
+    def has_more(self) -> bool:
+        return self.offset + len(self.hits) < self.total
+
+
+def fold_text(text: str) -> str:
+    """Lower-case *text* and strip diacritics, for the LIKE fallback."""
+    decomposed = unicodedata.normalize("NFKD", str(text or ""))
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+
+def split_highlights(marked: str) -> tuple[str, tuple[tuple[int, int], ...]]:
+    """Remove highlight markers from *marked* and return their offsets."""
+    plain: list[str] = []
+    ranges: list[tuple[int, int]] = []
+    length = 0
+    start = None
+    for char in str(marked or ""):
+        if char == HIGHLIGHT_OPEN:
+            start = length
+        elif char == HIGHLIGHT_CLOSE:
+            if start is not None and length > start:
+                ranges.append((start, length))
+            start = None
+        else:
+            plain.append(char)
+            length += 1
+    return "".join(plain), tuple(ranges)
+
+
+def entity_text(record: Mapping[str, Any], key_field: str) -> str:
+    """Flatten a row's searchable fields into plain text."""
+    parts: list[str] = []
+
+    def visit(value: Any) -> None:
+        value = deserialize_possible_json(value) if isinstance(value, str) else value
+        if value is None or isinstance(value, bool):
+            return
+        if isinstance(value, str):
+            if value.strip():
+                parts.append(value.strip())
+        elif isinstance(value, Mapping):
+            # Rich text is stored as {"text": ..., "formatting": ...}.
+            if "text" in value:
+                visit(value.get("text"))
+                return
+            for inner in value.values():
+                visit(inner)
+        elif isinstance(value, (list, tuple, set)):
+            for inner in value:
+                visit(inner)
+        elif isinstance(value, (int, float)):
+            parts.append(str(value))
+
+    for field, value in record.items():
+        if field == key_field or field in SKIPPED_FIELDS:
+            continue
+        visit(value)
+    return "\n".join(parts)[:MAX_BODY_CHARS]
+
+
+class CampaignSearchIndex:
+    """Maintain and query the campaign-wide entity index."""
+
+    def __init__(self, db_path: Optional[str] = None) -> None:
+        self._db_path = db_path
+        self._fts_enabled: Optional[bool] = None
+        self._lock = threading.RLock()
+        self._watched: set[str] = set()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._db_path) if self._db_path else get_connection()
+        conn.execute("PRAGMA busy_timeout = 5000")
+        self._ensure_schema(conn)
+        return conn
+
+    def _ensure_schema(self, conn: sqlite3.Connection) -> None:
+        conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {DOCS_TABLE} (
+                id INTEGER PRIMARY KEY,
+                entity_type TEXT NOT NULL,
+                entity_key TEXT NOT NULL,
+                UNIQUE (entity_type, entity_key)
+            )
+            """
+        )
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {STATE_TABLE} (entity_type TEXT PRIMARY KEY, signature TEXT)"
+        )
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {CHANGES_TABLE} "
+            "(entity_type TEXT PRIMARY KEY, version INTEGER NOT NULL DEFAULT 0)"
+        )
+        if self._fts_enabled is None:
+            try:
+                conn.execute(
+                    f"""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+                        name,
+                        body,
+                        tokenize = 'unicode61 remove_diacritics 2'
+                    )
+                    """
+                )
+                self._fts_enabled = True
+            except sqlite3.OperationalError as exc:
+                log_warning(
+                    f"SQLite FTS5 unavailable, falling back to LIKE search: {exc}",
+                    func_name="modules.generic.campaign_search_index.CampaignSearchIndex._ensure_schema",
+                )
+                self._fts_enabled = False
+        if not self._fts_enabled:
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {FALLBACK_TABLE} "
+                "(rowid INTEGER PRIMARY KEY, name TEXT NOT NULL, body TEXT NOT NULL)"
+            )
+
+    @property
+    def _text_table(self) -> str:
+        return FTS_TABLE if self._fts_enabled else FALLBACK_TABLE
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _key_field(conn: sqlite3.Connection, entity_type: str) -> Optional[str]:
+        columns = conn.execute(f"PRAGMA table_info({entity_type})").fetchall()
+        for column in columns:
+            if column[5]:
+                return str(column[1])
+        names = {str(column[1]) for column in columns}
+        for candidate in ("Title", "Name"):
+            if candidate in names:
+                return candidate
+        return None
+
+    @staticmethod
+    def _signature(conn: sqlite3.Connection, entity_type: str) -> str:
+        count, last_rowid = conn.execute(f"SELECT COUNT(*), MAX(rowid) FROM {entity_type}").fetchone()
+        version = conn.execute(
+            f"SELECT version FROM {CHANGES_TABLE} WHERE entity_type = ?", (entity_type,)
+        ).fetchone()
+        return f"{count}:{last_rowid or 0}:{version[0] if version else 0}"
+
+    def _watch_changes(self, conn: sqlite3.Connection, entity_type: str) -> None:
+        """Install the write-counting triggers of *entity_type* once per index."""
+        if entity_type in self._watched:
+            return
+        with conn:
+            conn.execute(
+                f"INSERT OR IGNORE INTO {CHANGES_TABLE} (entity_type, version) VALUES (?, 0)",
+                (entity_type,),
+            )
+            for event in ("INSERT", "UPDATE", "DELETE"):
+                conn.execute(
+                    f"CREATE TRIGGER IF NOT EXISTS {CHANGES_TABLE}_{entity_type}_{event.lower()} "
+                    f"AFTER {event} ON {entity_type} BEGIN "
+                    f"UPDATE {CHANGES_TABLE} SET version = version + 1 WHERE entity_type = '{entity_type}'; "
+                    "END"
+                )
+        self._watched.add(entity_type)
+
+    def _stored_signature(self, conn: sqlite3.Connection, entity_type: str) -> Optional[str]:
+        row = conn.execute(
+            f"SELECT signature FROM {STATE_TABLE} WHERE entity_type = ?", (entity_type,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _entity_tables(self, conn: sqlite3.Connection, entity_types: Optional[Iterable[str]]) -> list[str]:
+        if entity_types is None:
+            from modules.helpers.template_loader import list_known_entities
+
+            entity_types = list_known_entities()
+        existing = {
+            str(row[0])
+            for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        return [
+            entity_type
+            for entity_type in dict.fromkeys(entity_types)
+            if entity_type in existing and entity_type not in EXCLUDED_ENTITY_TYPES
+        ]
+
+    def refresh(self, entity_types: Optional[Iterable[str]] = None, *, force: bool = False) -> int:
+        """Re-index tables whose signature changed; return the rows indexed.
+
+        Only a ``COUNT``/``MAX(rowid)`` probe and a change-counter lookup run
+        for tables that are current, so this is cheap enough to call before
+        every search.
+        """
+        indexed = 0
+        with self._lock, closing(self._connect()) as conn:
+            for entity_type in self._entity_tables(conn, entity_types):
+                self._watch_changes(conn, entity_type)
+                signature = self._signature(conn, entity_type)
+                if not force and self._stored_signature(conn, entity_type) == signature:
+                    continue
+                with conn:
+                    indexed += self._index_table(conn, entity_type, signature)
+        return indexed
+
+    def _index_table(self, conn: sqlite3.Connection, entity_type: str, signature: str) -> int:
+        key_field = self._key_field(conn, entity_type)
+        self._delete_documents(conn, entity_type, None)
+        count = 0
+        if key_field:
+            conn.row_factory = sqlite3.Row
+            try:
+                rows = conn.execute(f"SELECT * FROM {entity_type}").fetchall()
+            finally:
+                conn.row_factory = None
+            count = self._insert_documents(conn, entity_type, key_field, rows)
+        conn.execute(
+            f"INSERT OR REPLACE INTO {STATE_TABLE} (entity_type, signature) VALUES (?, ?)",
+            (entity_type, signature),
+        )
+        return count
+
+    def index_entities(self, entity_type: str, keys: Iterable[Any]) -> int:
+        """Replace the documents of *keys* and drop rows deleted since."""
+        keys = [str(key) for key in keys if key not in (None, "")]
+        with self._lock, closing(self._connect()) as conn:
+            if not self._entity_tables(conn, [entity_type]):
+                return 0
+            key_field = self._key_field(conn, entity_type)
+            if not key_field:
+                return 0
+            with conn:
+                self._delete_documents(conn, entity_type, keys)
+                self._delete_missing(conn, entity_type, key_field)
+                conn.row_factory = sqlite3.Row
+                try:
+                    rows = [
+                        row
+                        for start in range(0, len(keys), 500)
+                        for row in conn.execute(
+                            f"SELECT * FROM {entity_type} WHERE {key_field} IN "
+                            f"({', '.join('?' for _ in keys[start:start + 500])})",
+                            keys[start:start + 500],
+                        ).fetchall()
+                    ]
+                finally:
+                    conn.row_factory = None
+                count = self._insert_documents(conn, entity_type, key_field, rows)
+                # A table that was never fully indexed stays stale for refresh().
+                conn.execute(
+                    f"UPDATE {STATE_TABLE} SET signature = ? WHERE entity_type = ?",
+                    (self._signature(conn, entity_type), entity_type),
+                )
+            return count
+
+    def invalidate(self, entity_type: str) -> None:
+        """Force the next :meth:`refresh` to rebuild *entity_type*."""
+        with self._lock, closing(self._connect()) as conn, conn:
+            conn.execute(f"DELETE FROM {STATE_TABLE} WHERE entity_type = ?", (entity_type,))
+
+    def _insert_documents(
+        self, conn: sqlite3.Connection, entity_type: str, key_field: str, rows: Sequence[sqlite3.Row]
+    ) -> int:
+        count = 0
+        for row in rows:
+            record = dict(row)
+            key = str(record.get(key_field) or "").strip()
+            if not key:
+                continue
+            body = entity_text(record, key_field)
+            cursor = conn.execute(
+                f"INSERT INTO {DOCS_TABLE} (entity_type, entity_key) VALUES (?, ?)",
+                (entity_type, key),
+            )
+            if self._fts_enabled:
+                values = (cursor.lastrowid, key, body)
+            else:
+                values = (cursor.lastrowid, fold_text(key), fold_text(body))
+            conn.execute(f"INSERT INTO {self._text_table} (rowid, name, body) VALUES (?, ?, ?)", values)
+            count += 1
+        return count
+
+    def _delete_documents(
+        self, conn: sqlite3.Connection, entity_type: str, keys: Optional[Sequence[str]]
+    ) -> None:
+        """Delete documents of *entity_type*, limited to *keys* when given."""
+        if keys is None:
+            ids = conn.execute(
+                f"SELECT id FROM {DOCS_TABLE} WHERE entity_type = ?", (entity_type,)
+            ).fetchall()
+        else:
+            ids = [
+                row
+                for start in range(0, len(keys), 500)
+                for row in conn.execute(
+                    f"SELECT id FROM {DOCS_TABLE} WHERE entity_type = ? AND entity_key IN "
+                    f"({', '.join('?' for _ in keys[start:start + 500])})",
+                    [entity_type, *keys[start:start + 500]],
+                ).fetchall()
+            ]
+        conn.executemany(f"DELETE FROM {self._text_table} WHERE rowid = ?", ids)
+        conn.executemany(f"DELETE FROM {DOCS_TABLE} WHERE id = ?", ids)
+
+    def _delete_missing(self, conn: sqlite3.Connection, entity_type: str, key_field: str) -> None:
+        ids = conn.execute(
+            f"SELECT id FROM {DOCS_TABLE} WHERE entity_type = ? AND entity_key NOT IN "
+            f"(SELECT CAST({key_field} AS TEXT) FROM {entity_type} WHERE {key_field} IS NOT NULL)",
+            (entity_type,),
+        ).fetchall()
+        conn.executemany(f"DELETE FROM {self._text_table} WHERE rowid = ?", ids)
+        conn.executemany(f"DELETE FROM {DOCS_TABLE} WHERE id = ?", ids)
+
+    def on_saved(self, db_path: Optional[str], event: Any) -> None:
+        """Save listener: keep the index in step with committed saves."""
+        if _normalize_path(db_path) != _normalize_path(self._db_path):
+            return
+        entity_type = getattr(event, "entity_type", None)
+        if not entity_type or entity_type in EXCLUDED_ENTITY_TYPES:
+            return
+        keys = tuple(getattr(event, "keys", ()) or ())
+        try:
+            if not keys or len(keys) > INLINE_REINDEX_LIMIT:
+                self.invalidate(entity_type)
+            else:
+                self.index_entities(entity_type, keys)
+        except sqlite3.Error as exc:
+            log_warning(
+                f"Could not update the search index for {entity_type}: {exc}",
+                func_name="modules.generic.campaign_search_index.CampaignSearchIndex.on_saved",
+            )
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def search(
+        self,
+        query: str,
+        *,
+        entity_types: Optional[Iterable[str]] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> CampaignSearchPage:
+        """Return one page of entities matching every word of *query*, best first.
+
+        An empty query lists the entities alphabetically. FTS matches word
+        prefixes only, so its ranked hits are followed by the entities that
+        only match as substrings ("oblin" still finds "Goblin").
+        """
+        wanted = sorted({str(entity_type) for entity_type in entity_types}) if entity_types is not None else None
+        limit, offset = max(0, int(limit)), max(0, int(offset))
+        if wanted == []:
+            return CampaignSearchPage((), 0, offset, limit)
+        self.refresh(wanted)
+        type_filter, type_params = "", []
+        if wanted is not None:
+            type_filter = f" AND d.entity_type IN ({', '.join('?' for _ in wanted)})"
+            type_params = wanted
+        with self._lock, closing(self._connect()) as conn:
+            expression = build_match_expression(query)
+            if expression is None:
+                return self._list_all(conn, type_filter, type_params, limit, offset)
+            if not self._fts_enabled:
+                return self._fallback_search(conn, query, type_filter, type_params, limit, offset)
+            conn.create_function("fold_text", 1, fold_text, deterministic=True)
+            joined = f"FROM {FTS_TABLE} f JOIN {DOCS_TABLE} d ON d.id = f.rowid WHERE {FTS_TABLE} MATCH ?"
+            try:
+                total = conn.execute(
+                    f"SELECT COUNT(*) {joined}{type_filter}", [expression, *type_params]
+                ).fetchone()[0]
+                rows = [] if offset >= total else conn.execute(
+                    f"SELECT d.entity_type, d.entity_key, "
+                    f"highlight({FTS_TABLE}, 0, ?, ?), "
+                    f"snippet({FTS_TABLE}, 1, ?, ?, '…', {SNIPPET_TOKENS}), "
+                    f"bm25({FTS_TABLE}, {NAME_WEIGHT}, 1.0) AS score "
+                    f"{joined}{type_filter} ORDER BY score, d.entity_key LIMIT ? OFFSET ?",
+                    [
+                        HIGHLIGHT_OPEN, HIGHLIGHT_CLOSE, HIGHLIGHT_OPEN, HIGHLIGHT_CLOSE,
+                        expression, *type_params, limit, offset,
+                    ],
+                ).fetchall()
+                extra = self._fallback_search(
+                    conn,
+                    query,
+                    type_filter,
+                    type_params,
+                    limit - len(rows),
+                    max(0, offset - total),
+                    table=FTS_TABLE,
+                    exclude=expression,
+                )
+            except sqlite3.OperationalError as exc:
+                log_warning(
+                    f"Campaign search failed for {query!r}: {exc}",
+                    func_name="modules.generic.campaign_search_index.CampaignSearchIndex.search",
+                )
+                return CampaignSearchPage((), 0, offset, limit)
+        hits = []
+        for entity_type, key, marked_name, marked_snippet, score in rows:
+            name, name_ranges = split_highlights(marked_name)
+            snippet, snippet_ranges = split_highlights(marked_snippet)
+            hits.append(
+                CampaignSearchHit(
+                    str(entity_type), str(key), name, name_ranges, snippet, snippet_ranges, float(score)
+                )
+            )
+        hits.extend(extra.hits)
+        return CampaignSearchPage(tuple(hits), int(total) + extra.total, offset, limit)
+
+    def _list_all(self, conn, type_filter, type_params, limit, offset) -> CampaignSearchPage:
+        where = f"WHERE 1 = 1{type_filter}"
+        total = conn.execute(f"SELECT COUNT(*) FROM {DOCS_TABLE} d {where}", type_params).fetchone()[0]
+        rows = conn.execute(
+            f"SELECT d.entity_type, d.entity_key FROM {DOCS_TABLE} d {where} "
+            "ORDER BY d.entity_type, d.entity_key COLLATE NOCASE LIMIT ? OFFSET ?",
+            [*type_params, limit, offset],
+        ).fetchall()
+        hits = tuple(
+            CampaignSearchHit(str(entity_type), str(key), str(key), (), "", (), 0.0)
+            for entity_type, key in rows
+        )
+        return CampaignSearchPage(hits, int(total), offset, limit)
+
+    def _fallback_search(
+        self, conn, query, type_filter, type_params, limit, offset, *, table=FALLBACK_TABLE, exclude=None
+    ) -> CampaignSearchPage:
+        """Substring search; the FTS table's text is folded on the fly.
+
+        *exclude* is an FTS match expression whose hits are left out, so the
+        substring pass can follow a ranked FTS page without repeating it.
+        """
+        tokens = [fold_text(token) for token in _TOKEN_PATTERN.findall(str(query or ""))]
+        name, body = ("t.name", "t.body") if table == FALLBACK_TABLE else ("fold_text(t.name)", "fold_text(t.body)")
+        condition = " AND ".join(f"({name} LIKE ? OR {body} LIKE ?)" for _ in tokens)
+        params = [pattern for token in tokens for pattern in (f"%{token}%", f"%{token}%")]
+        if exclude is not None:
+            condition += f" AND t.rowid NOT IN (SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH ?)"
+            params.append(exclude)
+        joined = f"FROM {table} t JOIN {DOCS_TABLE} d ON d.id = t.rowid WHERE {condition}{type_filter}"
+        total = conn.execute(f"SELECT COUNT(*) {joined}", [*params, *type_params]).fetchone()[0]
+        if not limit:
+            return CampaignSearchPage((), int(total), offset, limit)
+        rows = conn.execute(
+            f"SELECT d.entity_type, d.entity_key, t.body {joined} "
+            "ORDER BY d.entity_key COLLATE NOCASE LIMIT ? OFFSET ?",
+            [*params, *type_params, limit, offset],
+        ).fetchall()
+        hits = []
+        for entity_type, key, body in rows:
+            name = str(key)
+            hits.append(
+                CampaignSearchHit(
+                    str(entity_type),
+                    name,
+                    name,
+                    _token_ranges(fold_text(name), tokens),
+                    str(body)[:240],
+                    _token_ranges(fold_text(str(body)[:240]), tokens),
+                    0.0,
+                )
+            )
+        return CampaignSearchPage(tuple(hits), int(total), offset, limit)
+
+
+def _token_ranges(folded: str, tokens: Sequence[str]) -> tuple[tuple[int, int], ...]:
+    ranges = []
+    for token in tokens:
+        start = folded.find(token)
+        if token and start >= 0:
+            ranges.append((start, start + len(token)))
+    return tuple(sorted(ranges))
+
+
+def _normalize_path(db_path: Optional[str]) -> Optional[str]:
+    return os.path.normcase(os.path.abspath(str(db_path))) if db_path else None
+
+
+_INDEXES: dict[Optional[str], CampaignSearchIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_campaign_search_index(db_path: Optional[str] = None) -> CampaignSearchIndex:
+    """Return the shared index for *db_path*, subscribed to entity saves."""
+    from modules.generic.generic_model_wrapper import GenericModelWrapper
+
+    normalized = _normalize_path(db_path)
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(normalized)
+        if index is None:
+            index = _INDEXES[normalized] = CampaignSearchIndex(db_path)
+            GenericModelWrapper.add_save_listener(index.on_saved)
+        return index
@@ -1,15 +1,16 @@
 """Durable, non-modal campaign publication service."""
 
 from .coordinator import AutoPublishCoordinator
-from .models import OutboxEntry, PublicationJob, SyncState, WorkerEvent
+from .models import OutboxEntry, PublicationJob, PublicationMetrics, SyncState, WorkerEvent
 from .outbox import DurableOutbox
 from .retry import FailureCategory, RetryPolicy
-from .scheduler import PublicationScheduler
+from .scheduler import AdaptivePublicationScheduler, ChangeVolume, PublicationScheduler
 from .tk_bridge import TkEventBridge
 from .worker import PublicationWorker
 
 __all__ = [
-    "AutoPublishCoordinator", "DurableOutbox", "FailureCategory", "OutboxEntry",
-    "PublicationJob", "PublicationScheduler", "PublicationWorker", "RetryPolicy",
-    "SyncState", "TkEventBridge", "WorkerEvent",
+    "AdaptivePublicationScheduler", "AutoPublishCoordinator", "ChangeVolume", "DurableOutbox",
+    "FailureCategory", "OutboxEntry", "PublicationJob", "PublicationMetrics",
+    "PublicationScheduler", "PublicationWorker", "RetryPolicy", "SyncState", "TkEventBridge",
+    "WorkerEvent",
 ]
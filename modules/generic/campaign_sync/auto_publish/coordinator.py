@@ -6,16 +6,17 @@ import queue
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from pathlib import Path
 from typing import Callable, Optional
 from uuid import uuid4
 
 from modules.generic.campaign_sync.change_detector import CampaignChangeDetector, CampaignChangeState
 
-from .models import EventKind, OutboxEntry, PublicationJob, SyncState, WorkerEvent
+from .models import EventKind, OutboxEntry, PublicationJob, PublicationMetrics, SyncState, WorkerEvent
 from .outbox import DurableOutbox
 from .retry import FailureCategory, RetryPolicy
-from .scheduler import PublicationScheduler
+from .scheduler import AdaptivePublicationScheduler, ChangeVolume, PublicationScheduler
 
 
 class AutoPublishCoordinator:
@@ -29,7 +30,7 @@ class AutoPublishCoordinator:
     ) -> None:
         self.outbox, self.worker = outbox, worker
         self.detector = detector or CampaignChangeDetector()
-        self.scheduler = scheduler or PublicationScheduler()
+        self.scheduler = scheduler or AdaptivePublicationScheduler()
         self.retry_policy = retry_policy or RetryPolicy()
         self.clock, self.automatic, self.offline = clock, automatic, offline
         self.events: queue.Queue[WorkerEvent] = worker.events
@@ -38,24 +39,49 @@ class AutoPublishCoordinator:
         self._lock = threading.RLock()
         self._inflight: set[str] = set()
         self._dirty_during_flight: set[str] = set()
+        self._volumes: dict[str, ChangeVolume] = {}
+        self._metrics = PublicationMetrics()
         self._stopped = False
 
     def mark_dirty(self, *, campaign_id: str, campaign_name: str, campaign_root: Path,
                    database_path: Path, expected_parent_revision: int,
                    force_full_checkpoint: bool = False,
-                   when: Optional[float] = None) -> None:
-        """Record a *successfully saved* campaign mutation."""
+                   when: Optional[float] = None, changed_items: int = 1,
+                   changed_bytes: int = 0) -> None:
+        """Record a *successfully saved* campaign mutation.
+
+        Repeated saves for an already queued campaign only move its debounce
+        timestamp in memory and add to the accumulated change volume; the
+        outbox file is rewritten once per burst rather than once per save.
+        """
         now = self.clock() if when is None else when
         with self._lock:
+            self._volumes[campaign_id] = self._volumes.get(campaign_id, ChangeVolume()).add(
+                changed_items, changed_bytes
+            )
+            self._metrics = replace(
+                self._metrics,
+                saves_recorded=self._metrics.saves_recorded + 1,
+                changed_items=self._metrics.changed_items + max(0, int(changed_items)),
+                changed_bytes=self._metrics.changed_bytes + max(0, int(changed_bytes)),
+            )
+            if campaign_id in self._inflight:
+                self._dirty_during_flight.add(campaign_id)
             previous = self.outbox.get(campaign_id)
+            touch = getattr(self.outbox, "touch", None)
+            if (
+                previous is not None and callable(touch) and not force_full_checkpoint
+                and previous.expected_parent_revision == expected_parent_revision
+                and previous.database_path == Path(database_path).resolve()
+            ):
+                touch(campaign_id, now)
+                return
             first = previous.first_dirty_at if previous else now
             self.outbox.upsert(OutboxEntry(
                 campaign_id, campaign_name, Path(campaign_root).resolve(), Path(database_path).resolve(),
                 expected_parent_revision, first, now,
                 force_full_checkpoint=force_full_checkpoint,
             ))
-            if campaign_id in self._inflight:
-                self._dirty_during_flight.add(campaign_id)
 
     def publish_now(self, campaign_id: str) -> bool:
         return self._dispatch(campaign_id, force=True)
@@ -75,7 +101,10 @@ class AutoPublishCoordinator:
                 continue
             if entry.next_attempt_at > now:
                 continue
-            if self.automatic and self.scheduler.is_due(entry.first_dirty_at, entry.last_dirty_at, now):
+            volume = self._volumes.get(entry.campaign_id)
+            if self.automatic and self.scheduler.is_due(
+                entry.first_dirty_at, entry.last_dirty_at, now, volume
+            ):
                 self._dispatch(entry.campaign_id)
 
     def set_offline(self, value: bool) -> None:
@@ -84,7 +113,7 @@ class AutoPublishCoordinator:
     def configure(self, *, automatic: bool, offline: bool,
                   idle_delay: float, maximum_interval: float) -> None:
         """Apply publication preferences without requiring an application restart."""
-        scheduler = PublicationScheduler(idle_delay, maximum_interval)
+        scheduler = AdaptivePublicationScheduler(idle_delay, maximum_interval)
         with self._lock:
             self.automatic = bool(automatic)
             self.offline = bool(offline)
@@ -111,6 +140,10 @@ class AutoPublishCoordinator:
                 return False
             # Fingerprinting is expensive and therefore submitted as part of dispatch work.
             self._inflight.add(campaign_id)
+            self._volumes.pop(campaign_id, None)
+            self._metrics = replace(
+                self._metrics, publishes_started=self._metrics.publishes_started + 1
+            )
             self._executor.submit(self._prepare_and_run, entry, force)
             return True
 
@@ -163,6 +196,7 @@ class AutoPublishCoordinator:
             follow_up = event.campaign_id in self._dirty_during_flight
             self._dirty_during_flight.discard(event.campaign_id)
             if event.kind is EventKind.SUCCESS:
+                self._record_success(entry, event)
                 if follow_up:
                     self.outbox.replace(entry.updated(first_dirty_at=entry.last_dirty_at,
                                                       retry_count=0, next_attempt_at=0,
@@ -179,7 +213,28 @@ class AutoPublishCoordinator:
                                                   failure_category=category.value,
                                                   failure_message=event.message))
 
+    def metrics(self) -> PublicationMetrics:
+        with self._lock:
+            return self._metrics
+
+    def _record_success(self, entry: OutboxEntry, event: WorkerEvent) -> None:
+        bundle_bytes = int(getattr(event.result, "archive_size", 0) or 0)
+        if not bundle_bytes:
+            return  # nothing was uploaded (clean campaign)
+        self._metrics = replace(
+            self._metrics,
+            publishes_succeeded=self._metrics.publishes_succeeded + 1,
+            total_bundle_bytes=self._metrics.total_bundle_bytes + bundle_bytes,
+            total_time_to_publish=(
+                self._metrics.total_time_to_publish
+                + max(0.0, self.clock() - entry.first_dirty_at)
+            ),
+        )
+
     def shutdown(self, wait: bool = False) -> None:
         self._stopped = True
+        flush = getattr(self.outbox, "flush", None)
+        if callable(flush):
+            flush()
         if self._owns_executor:
             self._executor.shutdown(wait=wait, cancel_futures=True)
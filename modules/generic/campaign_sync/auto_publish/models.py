@@ -101,3 +101,29 @@ class WorkerEvent:
     result: Any = None
     failure_category: Optional[str] = None
     terminal: bool = False
+
+
+@dataclass(frozen=True)
+class PublicationMetrics:
+    """Counters for tuning the publication scheduler."""
+
+    saves_recorded: int = 0
+    changed_items: int = 0
+    changed_bytes: int = 0
+    publishes_started: int = 0
+    publishes_succeeded: int = 0
+    total_bundle_bytes: int = 0
+    total_time_to_publish: float = 0.0
+
+    @property
+    def publishes_avoided(self) -> int:
+        """Saves absorbed into an already scheduled publication."""
+        return max(0, self.saves_recorded - self.publishes_started)
+
+    @property
+    def average_bundle_size(self) -> float:
+        return self.total_bundle_bytes / self.publishes_succeeded if self.publishes_succeeded else 0.0
+
+    @property
+    def average_time_to_publish(self) -> float:
+        return self.total_time_to_publish / self.publishes_succeeded if self.publishes_succeeded else 0.0
@@ -16,6 +16,7 @@ class DurableOutbox:
         self.path = Path(path).expanduser()
         self._lock = threading.RLock()
         self._entries: dict[str, OutboxEntry] = {}
+        self._dirty = False
         self._load()
 
     def _load(self) -> None:
@@ -44,6 +45,7 @@ class DurableOutbox:
             handle.flush()
             os.fsync(handle.fileno())
         os.replace(temporary, self.path)
+        self._dirty = False
 
     def upsert(self, entry: OutboxEntry) -> OutboxEntry:
         with self._lock:
@@ -64,6 +66,27 @@ class DurableOutbox:
             self._persist()
             return entry
 
+    def touch(self, campaign_id: str, last_dirty_at: float) -> Optional[OutboxEntry]:
+        """Move the debounce timestamp without rewriting the file.
+
+        Only ``last_dirty_at`` changes, so losing it in a crash merely lets the
+        publication start a little earlier; the next durable write or
+        :meth:`flush` persists it.
+        """
+        with self._lock:
+            entry = self._entries.get(campaign_id)
+            if entry is None:
+                return None
+            entry = entry.updated(last_dirty_at=max(entry.last_dirty_at, last_dirty_at))
+            self._entries[campaign_id] = entry
+            self._dirty = True
+            return entry
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._dirty:
+                self._persist()
+
     def replace(self, entry: OutboxEntry) -> None:
         with self._lock:
             self._entries[entry.campaign_id] = entry
@@ -3,6 +3,21 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class ChangeVolume:
+    """Saves, rows and approximate bytes accumulated since the first dirty mark."""
+
+    saves: int = 0
+    items: int = 0
+    bytes: int = 0
+
+    def add(self, items: int = 1, byte_count: int = 0) -> "ChangeVolume":
+        return ChangeVolume(
+            self.saves + 1, self.items + max(0, int(items)), self.bytes + max(0, int(byte_count))
+        )
 
 
 @dataclass(frozen=True)
@@ -14,8 +29,55 @@ class PublicationScheduler:
         if self.idle_delay < 0 or self.maximum_interval <= 0:
             raise ValueError("publication intervals must be positive")
 
-    def due_at(self, first_dirty_at: float, last_dirty_at: float) -> float:
+    def due_at(self, first_dirty_at: float, last_dirty_at: float,
+               volume: Optional[ChangeVolume] = None) -> float:
         return min(last_dirty_at + self.idle_delay, first_dirty_at + self.maximum_interval)
 
-    def is_due(self, first_dirty_at: float, last_dirty_at: float, now: float) -> bool:
-        return now >= self.due_at(first_dirty_at, last_dirty_at)
+    def is_due(self, first_dirty_at: float, last_dirty_at: float, now: float,
+               volume: Optional[ChangeVolume] = None) -> bool:
+        return now >= self.due_at(first_dirty_at, last_dirty_at, volume)
+
+
+@dataclass(frozen=True)
+class AdaptivePublicationScheduler(PublicationScheduler):
+    """Stretch the quiet period while changes arrive in bursts.
+
+    A GM saving a few times a minute publishes ``idle_delay`` after the last
+    save. During heavy prep sessions the quiet window grows with the change
+    rate (up to ``maximum_stretch`` times), so a burst coalesces into one
+    publication; ``maximum_interval`` still caps latency from the first save.
+    The rate is the heaviest of saves, rows and bytes per minute, each
+    measured against its own burst threshold, so a few bulk saves stretch
+    the window like many small ones.
+    """
+
+    burst_saves_per_minute: float = 20.0
+    burst_items_per_minute: float = 200.0
+    burst_bytes_per_minute: float = 2_000_000.0
+    maximum_stretch: float = 4.0
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        if (
+            min(self.burst_saves_per_minute, self.burst_items_per_minute, self.burst_bytes_per_minute) <= 0
+            or self.maximum_stretch < 1
+        ):
+            raise ValueError("burst settings must be positive")
+
+    def quiet_period(self, first_dirty_at: float, last_dirty_at: float,
+                     volume: Optional[ChangeVolume]) -> float:
+        if volume is None or volume.saves <= 1:
+            return self.idle_delay
+        elapsed_minutes = max(last_dirty_at - first_dirty_at, 1.0) / 60.0
+        load = max(
+            volume.saves / self.burst_saves_per_minute,
+            volume.items / self.burst_items_per_minute,
+            volume.bytes / self.burst_bytes_per_minute,
+        ) / elapsed_minutes
+        stretch = min(self.maximum_stretch, 1.0 + load)
+        return self.idle_delay * stretch
+
+    def due_at(self, first_dirty_at: float, last_dirty_at: float,
+               volume: Optional[ChangeVolume] = None) -> float:
+        quiet = self.quiet_period(first_dirty_at, last_dirty_at, volume)
+        return min(last_dirty_at + quiet, first_dirty_at + self.maximum_interval)
@@ -7,9 +7,7 @@ Sync bookkeeping and SQLite's transient sidecar files are deliberately excluded.
 from __future__ import annotations
 
 import hashlib
-import os
 import shutil
-import sqlite3
 import tempfile
 from dataclasses import dataclass
 from enum import Enum
@@ -17,6 +15,7 @@ from pathlib import Path
 from typing import Iterable, Optional
 
 from modules.generic.cross_campaign_bundle_extras import collect_full_campaign_extra_files
+from modules.helpers.database_snapshot import database_snapshot
 
 from .hashing import sha256_file
 from .metadata_store import InstallationStateStore
@@ -73,20 +72,8 @@ def sqlite_snapshot_sha256(database_path: Path) -> str:
     source_path = Path(database_path).resolve()
     if not source_path.is_file():
         raise FileNotFoundError(source_path)
-    descriptor, snapshot_name = tempfile.mkstemp(prefix="gmcd_fingerprint_", suffix=".db")
-    os.close(descriptor)
-    snapshot = Path(snapshot_name)
-    try:
-        source = sqlite3.connect(f"file:{source_path.as_posix()}?mode=ro", uri=True)
-        destination = sqlite3.connect(str(snapshot))
-        try:
-            source.backup(destination)
-        finally:
-            destination.close()
-            source.close()
-        return sha256_file(snapshot)
-    finally:
-        snapshot.unlink(missing_ok=True)
+    with database_snapshot(source_path) as snapshot:
+        return snapshot.sha256
 
 
 def create_campaign_backup_archive(
@@ -130,13 +117,8 @@ def create_campaign_backup_archive(
         shutil.copytree(root, staged, ignore=ignore)
         staged_database = staged / database_relative
         staged_database.parent.mkdir(parents=True, exist_ok=True)
-        source = sqlite3.connect(f"file:{database.as_posix()}?mode=ro", uri=True)
-        snapshot = sqlite3.connect(staged_database)
-        try:
-            source.backup(snapshot)
-        finally:
-            snapshot.close()
-            source.close()
+        with database_snapshot(database) as snapshot:
+            snapshot.copy_to(staged_database)
 
         archive_base = destination.with_suffix("") if destination.suffix.lower() == ".zip" else destination
         archive = Path(shutil.make_archive(str(archive_base), "zip", root_dir=staged))
@@ -200,6 +182,21 @@ def calculate_campaign_fingerprint(
         (_normalized_relative_path(relative), sha256_file(path))
         for relative, path in _content_files(root)
     )
+    return _combine_fingerprint(entries)
+
+
+def fingerprint_from_inventory(inventory: Iterable) -> str:
+    """Return the canonical fingerprint of an already verified inventory.
+
+    Equivalent to :func:`calculate_campaign_fingerprint` for the tree the
+    inventory was built from, without hashing every file a second time.
+    """
+    return _combine_fingerprint(
+        (_normalized_relative_path(entry.path), entry.sha256) for entry in inventory
+    )
+
+
+def _combine_fingerprint(entries: Iterable[tuple[str, str]]) -> str:
     digest = hashlib.sha256()
     for relative, file_digest in sorted(entries, key=lambda pair: pair[0]):
         digest.update(relative.encode("utf-8"))
@@ -259,5 +256,6 @@ class CampaignChangeDetector:
 __all__ = [
     "CampaignChangeDetector", "CampaignChangeResult", "CampaignChangeState",
     "calculate_campaign_fingerprint", "create_campaign_backup_archive",
+    "fingerprint_from_inventory",
     "sqlite_snapshot_sha256",
 ]
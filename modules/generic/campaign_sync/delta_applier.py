@@ -3,7 +3,11 @@ from __future__ import annotations
 
 import os
 import shutil
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterable
+
+from modules.generic.shared_asset_store import try_reflink
 
 from .delta_manifest import DeltaManifest, normalize_sync_path
 from .hashing import sha256_file
@@ -20,14 +24,59 @@ def _safe_staging_path(staging: Path, relative: str) -> Path:
     return candidate
 
 
-def clone_campaign(source: Path, destination: Path) -> None:
-    def copy(source_name: str, destination_name: str) -> str:
-        try:
-            os.link(source_name, destination_name)
-            return destination_name
-        except OSError:
-            return shutil.copy2(source_name, destination_name)
-    shutil.copytree(source, destination, copy_function=copy)
+@dataclass
+class CloneReport:
+    linked: int = 0
+    reflinked: int = 0
+    copied: int = 0
+    skipped: int = 0
+
+
+def _clone_file(source: Path, destination: Path) -> str:
+    """Share *source*'s bytes with *destination* as cheaply as the volume allows."""
+    try:
+        os.link(source, destination)
+        return "linked"
+    except OSError:
+        pass
+    if try_reflink(source, destination):
+        return "reflinked"
+    shutil.copy2(source, destination)
+    return "copied"
+
+
+def delta_clone_skips(delta: DeltaManifest, database_file_name: str) -> frozenset[str]:
+    """Paths a staged clone does not need: apply_delta rewrites or deletes them."""
+    skipped = {entry.path for entry in delta.files} | set(delta.tombstones)
+    name = normalize_sync_path(database_file_name)
+    skipped.update(name + suffix for suffix in ("", "-journal", "-shm", "-wal"))
+    return frozenset(skipped)
+
+
+def clone_campaign(source: Path, destination: Path, *, skip: Iterable[str] = ()) -> CloneReport:
+    """Stage a copy of *source* whose files share storage with the original.
+
+    Files are hard-linked, reflinked, or copied in that order of preference.
+    Staging writers must replace files rather than edit them in place, which
+    apply_delta and the updater's local-settings step already do.  Paths in
+    *skip* (relative POSIX paths) are not materialized at all.
+    """
+    source, destination = Path(source), Path(destination)
+    skipped = frozenset(skip)
+    report = CloneReport()
+    destination.mkdir(parents=True)
+    for directory, _names, files in os.walk(source, followlinks=True):
+        current = Path(directory)
+        relative_dir = current.relative_to(source)
+        (destination / relative_dir).mkdir(parents=True, exist_ok=True)
+        for name in files:
+            relative = (relative_dir / name).as_posix()
+            if relative in skipped:
+                report.skipped += 1
+                continue
+            method = _clone_file(current / name, destination / relative_dir / name)
+            setattr(report, method, getattr(report, method) + 1)
+    return report
 
 
 def apply_delta(extracted: Path, staging: Path, delta: DeltaManifest, database_meta: dict) -> Path:
@@ -10,21 +10,53 @@ from .delta_manifest import DeltaManifest, InventoryEntry
 from .hashing import sha256_file
 
 
-def build_inventory(root: Path, database_path: Path, *, database_snapshot_path: Path | None = None) -> tuple[InventoryEntry, ...]:
+def file_signature(path: Path) -> tuple[int, int, int]:
+    """Cheap identity of a file's content: size, modification time and inode."""
+    info = Path(path).stat()
+    return info.st_size, info.st_mtime_ns, info.st_ino
+
+
+def _cached_sha256(path: Path, relative: str, previous: dict, stat_cache: dict | None) -> tuple[str, int]:
+    if stat_cache is None:
+        return sha256_file(path), path.stat().st_size
+    signature = file_signature(path)
+    cached = previous.get(relative)
+    if isinstance(cached, (list, tuple)) and len(cached) == 4 and tuple(cached[:3]) == signature:
+        digest = str(cached[3])
+    else:
+        digest = sha256_file(path)
+    stat_cache[relative] = [*signature, digest]
+    return digest, signature[0]
+
+
+def build_inventory(root: Path, database_path: Path, *, database_snapshot_path: Path | None = None,
+                    stat_cache: dict | None = None, database_sha256: str | None = None) -> tuple[InventoryEntry, ...]:
+    """Hash the synchronized content of *root* into sorted inventory entries.
+
+    ``stat_cache`` maps relative paths to ``[size, mtime_ns, inode, sha256]``.
+    Files whose signature still matches reuse the cached digest, and the
+    mapping is refreshed in place so callers can persist it.  The database is
+    always hashed unless the caller already holds its snapshot digest.
+    """
     root, database_path = Path(root).resolve(), Path(database_path).resolve()
+    previous = dict(stat_cache or {})
+    if stat_cache is not None:
+        stat_cache.clear()
     try:
         database_relative = database_path.relative_to(root).as_posix()
     except ValueError as exc:
         raise ValueError("campaign database must be inside the campaign root") from exc
     db_source = Path(database_snapshot_path) if database_snapshot_path else database_path
-    entries = [InventoryEntry(database_relative, sha256_file(db_source), db_source.stat().st_size, "database")]
+    entries = [InventoryEntry(database_relative, database_sha256 or sha256_file(db_source),
+                              db_source.stat().st_size, "database")]
     for relative, path in _content_files(root):
         try:
             path.resolve().relative_to(root)
         except ValueError as exc:
             raise ValueError(f"synchronized file escapes campaign root: {relative}") from exc
         kind = "asset" if relative.startswith(("assets/", "world_maps/")) else "extra_file"
-        entries.append(InventoryEntry(relative, sha256_file(path), path.stat().st_size, kind))
+        digest, size = _cached_sha256(path, relative, previous, stat_cache)
+        entries.append(InventoryEntry(relative, digest, size, kind))
     return tuple(sorted(entries, key=lambda item: item.path))
 
 
@@ -7,11 +7,11 @@ This module is the only route that may advance synchronized campaign state.
 from __future__ import annotations
 
 import shutil
-import sqlite3
 import tempfile
 import time
 import json
 import zipfile
+from contextlib import ExitStack
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
@@ -24,12 +24,17 @@ from modules.generic.cross_campaign_asset_service import (
     CampaignDatabase,
     export_bundle,
 )
+from modules.helpers.database_snapshot import get_snapshot_service
 
-from .change_detector import CampaignChangeDetector, calculate_campaign_fingerprint
+from .change_detector import (
+    CampaignChangeDetector,
+    calculate_campaign_fingerprint,
+    fingerprint_from_inventory,
+)
 from .hashing import sha256_file
 from .metadata_store import CampaignSyncMetadataStore, InstallationStateStore
 from .models import CampaignSyncMetadata
-from .delta_builder import build_inventory, write_delta_bundle
+from .delta_builder import build_inventory, compare_inventories, write_delta_bundle
 
 
 class CampaignPublishError(RuntimeError):
@@ -87,6 +92,8 @@ class CampaignPublishResult:
     snapshot_sha256: str
     release: object
     conflict_message: Optional[str] = None
+    archive_size: int = 0
+    snapshot_mode: str = ""
 
     @property
     def conflicted(self) -> bool:
@@ -110,6 +117,7 @@ class CampaignPublisher:
         retry_delay: float = 0.05,
         sleeper: Callable[[float], None] = time.sleep,
         checkpoint_interval: int = 10,
+        full_checkpoint_ratio: float = 0.6,
     ) -> None:
         self.gallery_client = gallery_client
         self.installation_store = installation_store or InstallationStateStore()
@@ -117,6 +125,7 @@ class CampaignPublisher:
         self.retry_delay = max(0.0, float(retry_delay))
         self.sleeper = sleeper
         self.checkpoint_interval = max(2, int(checkpoint_interval))
+        self.full_checkpoint_ratio = max(0.0, float(full_checkpoint_ratio))
 
     def enable(self, campaign_root: Path, *, database_path: Optional[Path] = None) -> CampaignSyncMetadata:
         """Give a legacy campaign a durable UUID and initial revision.
@@ -234,17 +243,19 @@ class CampaignPublisher:
 
         revision = remote_revision + 1
         temp_dir = Path(tempfile.mkdtemp(prefix="campaign_sync_publish_"))
+        leases = ExitStack()
         try:
             # Use one SQLite backup for record extraction, the archived database,
             # and the content digest.  Reading the live database independently
             # for each of those steps could describe different transactions.
-            database_snapshot = temp_dir / database.name
-            self._create_database_snapshot(database, database_snapshot)
-            content_digest = calculate_campaign_fingerprint(
-                root,
-                database_path=database,
-                database_snapshot_path=database_snapshot,
+            # export_bundle leases the same snapshot instead of copying it.
+            snapshot = leases.enter_context(get_snapshot_service().acquire(database))
+            database_snapshot = snapshot.path
+            current_inventory = build_inventory(
+                root, database, database_snapshot_path=database_snapshot,
+                database_sha256=snapshot.sha256,
             )
+            content_digest = fingerprint_from_inventory(current_inventory)
             published_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
             state = self.installation_store.campaign_state(str(root))
             from .delta_manifest import InventoryEntry
@@ -252,12 +263,12 @@ class CampaignPublisher:
                 baseline_inventory = tuple(InventoryEntry.from_dict(x) for x in state.get("baseline_inventory", ()))
             except (KeyError, TypeError, ValueError):
                 baseline_inventory = ()
-            current_inventory = build_inventory(root, database, database_snapshot_path=database_snapshot)
             is_checkpoint = (
                 force_full_checkpoint
                 or revision == 1
                 or revision % self.checkpoint_interval == 0
                 or not baseline_inventory
+                or self._delta_outweighs_checkpoint(baseline_inventory, current_inventory)
             )
             snapshot_mode = "full_campaign" if is_checkpoint else "campaign_delta"
             base_fingerprint = state.get("baseline_fingerprint") if snapshot_mode == "campaign_delta" else None
@@ -320,11 +331,13 @@ class CampaignPublisher:
                     "The remote campaign changed while preparing the snapshot; "
                     "retry after updating."
                 )
+            archive_size = archive.stat().st_size
             release = self.gallery_client.publish_bundle(
                 archive, manifest, title=title or root.name,
                 description=description, progress_callback=progress_callback,
             )
         finally:
+            leases.close()
             shutil.rmtree(temp_dir, ignore_errors=True)
 
         matches = self._matching_revisions(local.campaign_id, revision)
@@ -346,20 +359,23 @@ class CampaignPublisher:
             baseline_inventory=[entry.__dict__ for entry in current_inventory],
         )
         return CampaignPublishResult(
-            PublishOutcome.PUBLISHED, revision, local.campaign_id, digest, release
+            PublishOutcome.PUBLISHED, revision, local.campaign_id, digest, release,
+            archive_size=archive_size, snapshot_mode=snapshot_mode,
         )
 
-    @staticmethod
-    def _create_database_snapshot(source_path: Path, destination_path: Path) -> None:
-        source = sqlite3.connect(
-            f"file:{source_path.resolve().as_posix()}?mode=ro", uri=True
-        )
-        destination = sqlite3.connect(str(destination_path))
-        try:
-            source.backup(destination)
-        finally:
-            destination.close()
-            source.close()
+    def _delta_outweighs_checkpoint(self, baseline_inventory, current_inventory) -> bool:
+        """Return True when a delta would re-send most of the campaign files.
+
+        Both bundle kinds carry the database snapshot, so only the file
+        payloads are compared: once the changed files reach
+        ``full_checkpoint_ratio`` of everything a checkpoint would send, the
+        checkpoint costs little more and resets the delta chain.
+        """
+        changed, _tombstones = compare_inventories(baseline_inventory, current_inventory)
+        full_files = sum(x.size for x in current_inventory if x.file_type != "database")
+        if full_files <= 0:
+            return False
+        return sum(x.size for x in changed) >= full_files * self.full_checkpoint_ratio
 
     @staticmethod
     def _replace_archive_manifest(archive: Path, manifest: dict) -> None:
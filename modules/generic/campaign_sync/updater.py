@@ -25,12 +25,16 @@ from modules.generic.cross_campaign_asset_service import (
 )
 from modules.helpers import backup_helper
 
-from .change_detector import CampaignChangeDetector, calculate_campaign_fingerprint
+from .change_detector import (
+    CampaignChangeDetector,
+    calculate_campaign_fingerprint,
+    fingerprint_from_inventory,
+)
 from .hashing import sha256_file
 from .metadata_store import CampaignSyncMetadataStore, InstallationStateStore
 from .models import CampaignSyncMetadata
-from .delta_applier import apply_delta, clone_campaign
-from .delta_builder import build_inventory
+from .delta_applier import apply_delta, clone_campaign, delta_clone_skips
+from .delta_builder import build_inventory, file_signature
 from .delta_manifest import DeltaManifest, InventoryEntry
 
 ProgressCallback = Callable[[str, float], None]
@@ -184,6 +188,22 @@ def _preserve_local_settings(
             shutil.copy2(source, destination)
 
 
+def _trusted_stat_cache(state: dict, staging: Path, delta: Optional[DeltaManifest]) -> dict:
+    """Seed inventory verification with digests that need no re-hashing.
+
+    Unchanged files are hard links to (or copies of) the active campaign, so
+    the signatures recorded at the previous verified install still describe
+    them.  Files written by the delta were hashed by apply_delta just now.
+    """
+    cached = state.get("inventory_stats")
+    stat_cache = dict(cached) if isinstance(cached, dict) else {}
+    for entry in delta.files if delta is not None else ():
+        target = staging / entry.path
+        if target.is_file():
+            stat_cache[entry.path] = [*file_signature(target), entry.sha256]
+    return stat_cache
+
+
 class CampaignUpdater:
     """Download, validate, and atomically replace one active campaign."""
 
@@ -337,11 +357,19 @@ class CampaignUpdater:
             if delta is None:
                 target_db = _copy_payload(extracted, staging, manifest)
             else:
-                clone_campaign(active, staging)
                 try:
+                    # Only the database and the files the delta rewrites are
+                    # written; everything else shares storage with active.
+                    clone_campaign(
+                        active, staging,
+                        skip=delta_clone_skips(delta, str(manifest["database"].get("file_name") or "")),
+                    )
                     target_db = apply_delta(extracted, staging, delta, manifest["database"])
                 except ValueError as exc:
                     raise CampaignUpdateError(str(exc)) from exc
+            stat_cache = _trusted_stat_cache(
+                self.installation_store.campaign_state(str(active)), staging, delta
+            )
             _validate_sqlite(target_db)
             _preserve_local_settings(active, staging, self.local_settings)
             try:
@@ -352,13 +380,18 @@ class CampaignUpdater:
             except (KeyError, TypeError, ValueError) as exc:
                 raise CampaignUpdateError(f"Invalid content inventory: {exc}") from exc
             if inventory_data:
-                actual_inventory = build_inventory(staging, target_db, database_snapshot_path=target_db)
+                actual_inventory = build_inventory(
+                    staging, target_db, database_snapshot_path=target_db, stat_cache=stat_cache
+                )
                 if actual_inventory != inventory_data:
                     raise CampaignUpdateError("Reconstructed campaign inventory does not match the publisher")
+                # The verified inventory already holds every content digest.
+                staged_fingerprint = fingerprint_from_inventory(actual_inventory)
+            else:
+                staged_fingerprint = calculate_campaign_fingerprint(
+                    staging, database_path=target_db, database_snapshot_path=target_db
+                )
             expected_content = str((manifest.get("sync") or {}).get("snapshot_sha256") or "")
-            staged_fingerprint = calculate_campaign_fingerprint(
-                staging, database_path=target_db, database_snapshot_path=target_db
-            )
             # Legacy full bundles did not carry an inventory and used this
             # field only for transport metadata. New versioned snapshots do,
             # and can therefore enforce publisher/reconstruction identity.
@@ -387,6 +420,7 @@ class CampaignUpdater:
                     self.installation_store.update_campaign_state(
                         str(active), installed_revision=sync.revision,
                         baseline_inventory=[entry.__dict__ for entry in inventory_data],
+                        inventory_stats=stat_cache if inventory_data else {},
                     )
                 except Exception as exc:
                     failed = parent / f".{active.name}.failed-{stamp}"
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import copy
+import hashlib
+import io
 import json
+import os
 import shutil
 import sqlite3
 import tempfile
@@ -30,10 +33,13 @@ from modules.generic.cross_campaign_gm_tables import (
     merge_gm_virtual_tables,
 )
 from modules.generic.generic_model_wrapper import GenericModelWrapper
+from modules.generic.shared_asset_store import adopt_into_store, copy_into_campaign
 from modules.generic.campaign_sync.change_detector import CampaignChangeDetector
+from modules.generic.campaign_sync.hashing import sha256_file
 from modules.generic.campaign_sync.metadata_store import CampaignSyncMetadataStore
 from modules.generic.campaign_sync.models import CampaignSyncMetadata
 from modules.helpers.config_helper import ConfigHelper
+from modules.helpers.database_snapshot import DatabaseSnapshot, database_snapshot
 from modules.helpers.portrait_helper import (
     parse_portrait_value,
     serialize_portrait_value,
@@ -101,6 +107,7 @@ class BundleAnalysis:
     systems: Optional[List[dict]] = None
     ambiance_wallpapers: Optional[List[dict]] = None
     gm_virtual_tables: Optional[dict] = None
+    bundle_path: Optional[Path] = None
 
 
 def _resolve_active_campaign() -> CampaignDatabase:
@@ -199,6 +206,58 @@ def save_entities(
     wrapper.save_items(items, replace=replace)
 
 
+_RECORD_KEY_FIELDS = ("Name", "Title", "id", "ID")
+_KEY_LOOKUP_CHUNK = 500
+
+
+def load_existing_record_keys(
+    entity_type: str, db_path: Path, candidate_keys: Iterable[str]
+) -> set:
+    """Return the subset of ``candidate_keys`` already present in ``db_path``.
+
+    Only the key columns are read, and each lookup is a ``WHERE ... IN`` query
+    against the table's key columns (the primary key for template-backed
+    tables), so duplicate detection never loads whole entity tables.
+    """
+    wanted = {str(key) for key in candidate_keys if str(key)}
+    if not wanted or not Path(db_path).exists():
+        return set()
+    conn = sqlite3.connect(str(db_path))
+    try:
+        try:
+            columns = {
+                row[1] for row in conn.execute(f"PRAGMA table_info({entity_type})")
+            }
+        except sqlite3.OperationalError as exc:
+            if _is_missing_table_error(exc):
+                return set()
+            raise
+        key_columns = [field for field in _RECORD_KEY_FIELDS if field in columns]
+        if not key_columns:
+            return set()
+        select_cols = ", ".join(key_columns)
+        ordered = sorted(wanted)
+        found: set = set()
+        for column in key_columns:
+            # Process each column from key_columns.
+            for start in range(0, len(ordered), _KEY_LOOKUP_CHUNK):
+                chunk = ordered[start : start + _KEY_LOOKUP_CHUNK]
+                placeholders = ", ".join("?" for _ in chunk)
+                rows = conn.execute(
+                    f"SELECT {select_cols} FROM {entity_type} "
+                    f"WHERE {column} IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for row in rows:
+                    # Keys follow _determine_record_key precedence.
+                    key = _determine_record_key(dict(zip(key_columns, row)))
+                    if key in wanted:
+                        found.add(key)
+        return found
+    finally:
+        conn.close()
+
+
 def _load_full_campaign_records(
     source_campaign: CampaignDatabase, selected_for_bundle: dict
 ) -> None:
@@ -711,19 +770,57 @@ def export_bundle(
     progress_callback=None,
 ) -> dict:
     """Export bundle."""
+    options = dict(
+        include_database=include_database,
+        include_systems=include_systems,
+        include_random_tables=include_random_tables,
+        gm_virtual_tables=gm_virtual_tables,
+        change_summary=change_summary,
+        sync_metadata=sync_metadata,
+        progress_callback=progress_callback,
+    )
+    if not include_database:
+        return _export_bundle(destination, source_campaign, selected_records, **options)
+    if not source_campaign.db_path.exists():
+        raise FileNotFoundError(source_campaign.db_path)
+    # Records, systems and the archived database all come from one shared
+    # snapshot, so they describe the same transaction.
+    with database_snapshot(source_campaign.db_path) as snapshot:
+        return _export_bundle(
+            destination, source_campaign, selected_records, snapshot=snapshot, **options
+        )
+
+
+def _export_bundle(
+    destination: Path,
+    source_campaign: CampaignDatabase,
+    selected_records: Dict[str, List[dict]],
+    *,
+    include_database: bool,
+    include_systems: bool,
+    include_random_tables: bool,
+    gm_virtual_tables: Optional[List[dict]],
+    change_summary: Optional[str],
+    sync_metadata: Optional[CampaignSyncMetadata],
+    progress_callback,
+    snapshot: Optional[DatabaseSnapshot] = None,
+) -> dict:
+    """Internal helper for export bundle."""
     destination = destination.resolve()
     destination.parent.mkdir(parents=True, exist_ok=True)
 
     _call_progress(progress_callback, "Collecting records...", 0.05)
 
-    if include_database and not source_campaign.db_path.exists():
-        raise FileNotFoundError(source_campaign.db_path)
-
+    records_source = (
+        CampaignDatabase(source_campaign.name, source_campaign.root, snapshot.path)
+        if snapshot is not None
+        else source_campaign
+    )
     selected_for_bundle = {
         entity: list(records) for entity, records in selected_records.items()
     }
     if include_database:
-        _load_full_campaign_records(source_campaign, selected_for_bundle)
+        _load_full_campaign_records(records_source, selected_for_bundle)
 
     data_dir = Path(tempfile.mkdtemp(prefix="asset_export_"))
     temp_root = Path(data_dir)
@@ -823,7 +920,7 @@ def export_bundle(
 
         if include_systems:
             # Continue with this path when include systems is set.
-            systems = _load_campaign_systems(source_campaign.db_path)
+            systems = _load_campaign_systems(records_source.db_path)
             systems_path = temp_root / "data" / "campaign_systems.json"
             with systems_path.open("w", encoding="utf-8") as fh:
                 json.dump(systems, fh, indent=2, ensure_ascii=False)
@@ -848,23 +945,12 @@ def export_bundle(
         if wallpaper_manifest:
             manifest[AMBIANCE_WALLPAPERS_MANIFEST_KEY] = wallpaper_manifest
 
-        if include_database:
+        if include_database and snapshot is not None:
             try:
                 # Keep bundle resilient if this step fails.
-                if not source_campaign.db_path.exists():
-                    raise FileNotFoundError(source_campaign.db_path)
-                db_dir = temp_root / "database"
-                db_dir.mkdir(parents=True, exist_ok=True)
-                db_destination = db_dir / source_campaign.db_path.name
-                source = sqlite3.connect(
-                    f"file:{source_campaign.db_path.resolve().as_posix()}?mode=ro", uri=True
+                db_destination = snapshot.copy_to(
+                    temp_root / "database" / source_campaign.db_path.name
                 )
-                snapshot = sqlite3.connect(str(db_destination))
-                try:
-                    source.backup(snapshot)
-                finally:
-                    snapshot.close()
-                    source.close()
                 stat = db_destination.stat()
                 manifest["database"] = {
                     "file_name": source_campaign.db_path.name,
@@ -902,8 +988,8 @@ def export_bundle(
     return manifest
 
 
-def _safe_extract_zip(zf: zipfile.ZipFile, target_dir: Path) -> None:
-    """Extract *zf* while rejecting members that would escape *target_dir*."""
+def _validate_zip_members(zf: zipfile.ZipFile, target_dir: Path) -> None:
+    """Reject members of *zf* that would escape *target_dir* when extracted."""
     root = target_dir.resolve()
     for member in zf.infolist():
         name = str(member.filename or "")
@@ -922,7 +1008,49 @@ def _safe_extract_zip(zf: zipfile.ZipFile, target_dir: Path) -> None:
             destination.relative_to(root)
         except ValueError as exc:
             raise ValueError(f"Unsafe bundle member path: {member.filename}") from exc
-    zf.extractall(root)
+
+
+def _safe_extract_zip(zf: zipfile.ZipFile, target_dir: Path) -> None:
+    """Extract *zf* while rejecting members that would escape *target_dir*."""
+    _validate_zip_members(zf, target_dir)
+    zf.extractall(target_dir.resolve())
+
+
+_STREAMED_MEMBER_PREFIXES = ("assets/", "extras/", "database/")
+
+
+def _extract_sidecar_members(
+    zf: zipfile.ZipFile, target_dir: Path, streamed_data_paths: Iterable[str]
+) -> None:
+    """Extract only the members that are not streamed during import.
+
+    Entity data, assets, extra files and the database snapshot are read
+    straight from the archive; everything else (wallpaper media, GM table
+    layouts, ...) is small and consumed by helpers that expect a directory.
+    """
+    skipped = {str(path) for path in streamed_data_paths if path}
+    root = target_dir.resolve()
+    for member in zf.infolist():
+        name = member.filename
+        if name in skipped or name.startswith(_STREAMED_MEMBER_PREFIXES):
+            continue
+        zf.extract(member, root)
+
+
+def _read_bundle_json(zf: zipfile.ZipFile, member_name: str):
+    """Decode a JSON member directly from the archive stream."""
+    with zf.open(member_name, "r") as handle:
+        return json.load(io.TextIOWrapper(handle, encoding="utf-8"))
+
+
+def _zip_member(zf: zipfile.ZipFile, member_name: str) -> Optional[zipfile.ZipInfo]:
+    """Return the archive entry for *member_name*, or ``None`` when absent."""
+    if not member_name:
+        return None
+    try:
+        return zf.getinfo(str(member_name).replace("\\", "/"))
+    except KeyError:
+        return None
 
 
 def _call_progress(callback, message: str, fraction: float) -> None:
@@ -936,7 +1064,14 @@ def _call_progress(callback, message: str, fraction: float) -> None:
 
 
 def analyze_bundle(bundle_path: Path, target_db: Path) -> BundleAnalysis:
-    """Handle analyze bundle."""
+    """Read bundle metadata and entity data without unpacking the archive.
+
+    Entity JSON members are decoded straight from the zip stream, duplicates
+    are resolved with indexed key lookups against ``target_db`` and only the
+    small side-car members (wallpaper index/media, GM table layouts) are
+    extracted to ``temp_dir``. Assets stay in the archive until
+    :func:`apply_import` streams them to their final location.
+    """
     bundle_path = bundle_path.resolve()
     if not bundle_path.exists():
         raise FileNotFoundError(bundle_path)
@@ -945,79 +1080,52 @@ def analyze_bundle(bundle_path: Path, target_db: Path) -> BundleAnalysis:
     try:
         # Keep analyze bundle resilient if this step fails.
         with zipfile.ZipFile(bundle_path, "r") as zf:
-            _safe_extract_zip(zf, temp_dir)
-
-        manifest_path = temp_dir / "manifest.json"
-        if not manifest_path.exists():
-            raise ValueError("Bundle manifest missing")
-        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
-        version = manifest.get("version")
-        if version != BUNDLE_VERSION:
-            raise ValueError(f"Unsupported bundle version: {version}")
-
-        data_by_type: Dict[str, List[dict]] = {}
-        for entity_type, meta in manifest.get("entities", {}).items():
-            # Process each (entity_type, meta) from manifest.get('entities', {}).items().
-            data_file = meta.get("data_path")
-            if not data_file:
-                continue
-            file_path = temp_dir / data_file
-            if not file_path.exists():
-                log_warning(
-                    f"Missing data file in bundle: {data_file}",
-                    func_name="modules.generic.cross_campaign_asset_service.analyze_bundle",
-                )
-                continue
-            try:
-                # Keep analyze bundle resilient if this step fails.
-                records = json.loads(file_path.read_text(encoding="utf-8"))
-                if isinstance(records, list):
-                    data_by_type[entity_type] = records
-            except json.JSONDecodeError as exc:
-                log_exception(
-                    f"Failed to parse {data_file}: {exc}",
-                    func_name="modules.generic.cross_campaign_asset_service.analyze_bundle",
-                )
-
-        duplicates: Dict[str, List[str]] = {}
-        for entity_type, records in data_by_type.items():
-            # Process each (entity_type, records) from data_by_type.items().
-            try:
-                existing = load_entities(entity_type, target_db)
-            except Exception as exc:
-                log_warning(
-                    f"Unable to load existing {entity_type}: {exc}",
-                    func_name="modules.generic.cross_campaign_asset_service.analyze_bundle",
-                )
-                existing = []
-            existing_lookup = {_determine_record_key(item): item for item in existing}
-            dupes: List[str] = []
-            for record in records:
-                # Process each record from records.
-                key = _determine_record_key(record)
-                if key in existing_lookup:
-                    dupes.append(key)
-            if dupes:
-                duplicates[entity_type] = dupes
-
-        database_entry = manifest.get("database")
-        if not isinstance(database_entry, dict):
-            database_entry = None
+            _validate_zip_members(zf, temp_dir)
+
+            if _zip_member(zf, "manifest.json") is None:
+                raise ValueError("Bundle manifest missing")
+            manifest = _read_bundle_json(zf, "manifest.json")
+            version = manifest.get("version")
+            if version != BUNDLE_VERSION:
+                raise ValueError(f"Unsupported bundle version: {version}")
+
+            streamed_paths: List[str] = []
+            data_by_type: Dict[str, List[dict]] = {}
+            for entity_type, meta in manifest.get("entities", {}).items():
+                # Process each (entity_type, meta) from manifest.get('entities', {}).items().
+                data_file = meta.get("data_path")
+                if not data_file:
+                    continue
+                streamed_paths.append(data_file)
+                if _zip_member(zf, data_file) is None:
+                    log_warning(
+                        f"Missing data file in bundle: {data_file}",
+                        func_name="modules.generic.cross_campaign_asset_service.analyze_bundle",
+                    )
+                    continue
+                try:
+                    # Keep analyze bundle resilient if this step fails.
+                    records = _read_bundle_json(zf, data_file)
+                    if isinstance(records, list):
+                        data_by_type[entity_type] = records
+                except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+                    log_exception(
+                        f"Failed to parse {data_file}: {exc}",
+                        func_name="modules.generic.cross_campaign_asset_service.analyze_bundle",
+                    )
 
-        world_maps_manifest = manifest.get("world_maps")
-        world_maps: Dict[str, dict] = {}
-        if isinstance(world_maps_manifest, dict):
-            # Handle the branch where isinstance(world_maps_manifest, dict).
-            data_file = world_maps_manifest.get("data_path") or world_maps_manifest.get(
-                "path"
-            )
-            if data_file:
-                # Continue with this path when data file is set.
-                file_path = temp_dir / data_file
-                if file_path.exists():
+            world_maps_manifest = manifest.get("world_maps")
+            world_maps: Dict[str, dict] = {}
+            if isinstance(world_maps_manifest, dict):
+                # Handle the branch where isinstance(world_maps_manifest, dict).
+                data_file = world_maps_manifest.get(
+                    "data_path"
+                ) or world_maps_manifest.get("path")
+                if data_file and _zip_member(zf, data_file) is not None:
+                    streamed_paths.append(data_file)
                     try:
                         # Keep analyze bundle resilient if this step fails.
-                        payload = json.loads(file_path.read_text(encoding="utf-8"))
+                        payload = _read_bundle_json(zf, data_file)
                         maps = (
                             payload.get("maps")
                             if isinstance(payload, dict)
@@ -1025,34 +1133,45 @@ def analyze_bundle(bundle_path: Path, target_db: Path) -> BundleAnalysis:
                         )
                         if isinstance(maps, dict):
                             world_maps = maps
-                    except json.JSONDecodeError as exc:
+                    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
                         log_exception(
                             f"Failed to parse world map data {data_file}: {exc}",
                             func_name="modules.generic.cross_campaign_asset_service.analyze_bundle",
                         )
 
-        systems_manifest = manifest.get("systems")
-        systems: Optional[List[dict]] = None
-        if isinstance(systems_manifest, dict):
-            # Handle the branch where isinstance(systems_manifest, dict).
-            data_file = systems_manifest.get("data_path") or systems_manifest.get(
-                "path"
-            )
-            if data_file:
-                # Continue with this path when data file is set.
-                file_path = temp_dir / data_file
-                if file_path.exists():
+            systems_manifest = manifest.get("systems")
+            systems: Optional[List[dict]] = None
+            if isinstance(systems_manifest, dict):
+                # Handle the branch where isinstance(systems_manifest, dict).
+                data_file = systems_manifest.get("data_path") or systems_manifest.get(
+                    "path"
+                )
+                if data_file and _zip_member(zf, data_file) is not None:
+                    streamed_paths.append(data_file)
                     try:
                         # Keep analyze bundle resilient if this step fails.
-                        payload = json.loads(file_path.read_text(encoding="utf-8"))
+                        payload = _read_bundle_json(zf, data_file)
                         if isinstance(payload, list):
                             systems = payload
-                    except json.JSONDecodeError as exc:
+                    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
                         log_exception(
                             f"Failed to parse campaign systems data {data_file}: {exc}",
                             func_name="modules.generic.cross_campaign_asset_service.analyze_bundle",
                         )
 
+            _extract_sidecar_members(zf, temp_dir, streamed_paths)
+
+        duplicates = detect_duplicates(
+            data_by_type,
+            CampaignDatabase(
+                name=target_db.stem, root=target_db.parent, db_path=target_db
+            ),
+        )
+
+        database_entry = manifest.get("database")
+        if not isinstance(database_entry, dict):
+            database_entry = None
+
         ambiance_wallpapers = load_wallpaper_manifest(temp_dir, manifest)
         gm_virtual_tables = load_bundled_gm_virtual_tables(temp_dir, manifest)
 
@@ -1067,16 +1186,17 @@ def analyze_bundle(bundle_path: Path, target_db: Path) -> BundleAnalysis:
             systems=systems,
             ambiance_wallpapers=ambiance_wallpapers or None,
             gm_virtual_tables=gm_virtual_tables,
+            bundle_path=bundle_path,
         )
     except Exception:
         shutil.rmtree(temp_dir, ignore_errors=True)
         raise
 
 
-def _determine_target_path(
+def _target_location(
     asset_type: str, original_path: str, campaign_dir: Path
-) -> Tuple[Path, str]:
-    """Internal helper for determine target path."""
+) -> Tuple[Path, Path, str]:
+    """Return the target directory, its campaign-relative form and file name."""
     original = (original_path or "").replace("\\", "/")
     name = Path(original).name or "asset"
 
@@ -1121,6 +1241,16 @@ def _determine_target_path(
             base = campaign_dir / "assets" / "tokens"
             relative_base = Path("assets/tokens")
 
+    return base, relative_base, name
+
+
+def _determine_target_path(
+    asset_type: str, original_path: str, campaign_dir: Path
+) -> Tuple[Path, str]:
+    """Internal helper for determine target path."""
+    base, relative_base, name = _target_location(
+        asset_type, original_path, campaign_dir
+    )
     base.mkdir(parents=True, exist_ok=True)
 
     candidate = base / name
@@ -1144,21 +1274,18 @@ def detect_duplicates(
         # Process each (entity_type, records) from selected_records.items().
         if not records:
             continue
+        keys = [_determine_record_key(record) for record in records]
         try:
-            existing = load_entities(entity_type, target_campaign.db_path)
+            existing_keys = load_existing_record_keys(
+                entity_type, target_campaign.db_path, keys
+            )
         except Exception as exc:
             log_warning(
                 f"Unable to load existing {entity_type}: {exc}",
                 func_name="modules.generic.cross_campaign_asset_service.detect_duplicates",
             )
-            existing = []
-        existing_lookup = {_determine_record_key(item): item for item in existing}
-        dupes: List[str] = []
-        for record in records:
-            # Process each record from records.
-            key = _determine_record_key(record)
-            if key in existing_lookup:
-                dupes.append(key)
+            existing_keys = set()
+        dupes = [key for key in keys if key in existing_keys]
         if dupes:
             duplicates[entity_type] = dupes
     return duplicates
@@ -1218,6 +1345,7 @@ def apply_import_for_entity_types(
         systems=None,
         ambiance_wallpapers=analysis.ambiance_wallpapers,
         gm_virtual_tables=None,
+        bundle_path=analysis.bundle_path,
     )
     return apply_import(
         filtered_analysis,
@@ -1227,6 +1355,141 @@ def apply_import_for_entity_types(
     )
 
 
+class _TargetAssetIndex:
+    """Lazy size/hash index of files already present in target asset folders.
+
+    Directories are scanned once and grouped by file size; content hashes are
+    only computed for size collisions, so importing into a large campaign
+    does not hash its whole asset tree.
+    """
+
+    def __init__(self) -> None:
+        self._by_directory: Dict[Path, Dict[int, List[Path]]] = {}
+        self._hashes: Dict[Path, str] = {}
+
+    def _files_by_size(self, directory: Path) -> Dict[int, List[Path]]:
+        cached = self._by_directory.get(directory)
+        if cached is None:
+            cached = {}
+            if directory.is_dir():
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        # Process each entry from the scanned directory.
+                        try:
+                            if not entry.is_file():
+                                continue
+                            size = entry.stat().st_size
+                        except OSError:
+                            continue
+                        cached.setdefault(size, []).append(Path(entry.path))
+            self._by_directory[directory] = cached
+        return cached
+
+    def _hash(self, path: Path) -> Optional[str]:
+        digest = self._hashes.get(path)
+        if digest is None:
+            try:
+                digest = sha256_file(path)
+            except OSError:
+                return None
+            self._hashes[path] = digest
+        return digest
+
+    def has_size(self, directory: Path, size: int) -> bool:
+        return bool(self._files_by_size(directory).get(size))
+
+    def find(self, directory: Path, size: int, digest: str) -> Optional[Path]:
+        for candidate in self._files_by_size(directory).get(size, []):
+            if self._hash(candidate) == digest:
+                return candidate
+        return None
+
+    def add(self, path: Path, size: int, digest: str) -> None:
+        self._files_by_size(path.parent).setdefault(size, []).append(path)
+        self._hashes[path] = digest
+
+
+def _hash_zip_member(zf: zipfile.ZipFile, info: zipfile.ZipInfo) -> str:
+    """Return the SHA-256 of an archive member without extracting it."""
+    digest = hashlib.sha256()
+    with zf.open(info, "r") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _stream_zip_member(
+    zf: zipfile.ZipFile, info: zipfile.ZipInfo, destination: Path
+) -> str:
+    """Copy an archive member to *destination*, hashing it on the way.
+
+    The member is written to a temporary sibling and moved into place, so an
+    existing file that shares its data with the asset store is replaced
+    rather than rewritten.
+    """
+    digest = hashlib.sha256()
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    temporary = destination.with_name(f".{destination.name}.{os.getpid()}.tmp")
+    try:
+        with zf.open(info, "r") as source, temporary.open("wb") as target:
+            for chunk in iter(lambda: source.read(1024 * 1024), b""):
+                digest.update(chunk)
+                target.write(chunk)
+        os.replace(temporary, destination)
+    finally:
+        temporary.unlink(missing_ok=True)
+    return digest.hexdigest()
+
+
+def _import_bundle_asset(
+    zf: zipfile.ZipFile,
+    asset: dict,
+    target_root: Path,
+    index: _TargetAssetIndex,
+) -> Optional[Tuple[str, bool]]:
+    """Stream one bundle asset into the target campaign.
+
+    Returns the campaign-relative path the records should point to and
+    whether an identical existing file was reused, or ``None`` when the
+    asset is missing from the archive.
+    """
+    info = _zip_member(zf, str(asset.get("bundle_path") or ""))
+    if info is None:
+        return None
+    asset_type = asset.get("asset_type", "")
+    original_path = asset.get("original_path", "")
+    base, relative_base, _name = _target_location(
+        asset_type, original_path, target_root
+    )
+    if index.has_size(base, info.file_size):
+        digest = _hash_zip_member(zf, info)
+        existing = index.find(base, info.file_size, digest)
+        if existing is not None:
+            return (relative_base / existing.name).as_posix(), True
+    target_path, relative = _determine_target_path(
+        asset_type, original_path, target_root
+    )
+    digest = _stream_zip_member(zf, info, target_path)
+    index.add(target_path, info.file_size, digest)
+    adopt_into_store([target_path], campaign_dir=target_root)
+    return relative, False
+
+
+def _copy_extracted_asset(
+    assets_dir: Path, asset: dict, target_root: Path
+) -> Optional[Tuple[str, bool]]:
+    """Copy an asset from an already extracted bundle directory."""
+    bundle_path = asset.get("bundle_path")
+    source = assets_dir / bundle_path if bundle_path else None
+    if not source or not source.exists():
+        return None
+    target_path, relative = _determine_target_path(
+        asset.get("asset_type", ""), asset.get("original_path", ""), target_root
+    )
+    shutil.copy2(source, target_path)
+    return relative, False
+
+
 def apply_import(
     analysis: BundleAnalysis,
     target_campaign: CampaignDatabase,
@@ -1250,72 +1513,88 @@ def apply_import(
         "ambiance_wallpapers_skipped": 0,
     }
 
+    bundle_zip: Optional[zipfile.ZipFile] = None
     try:
         # Keep import resilient if this step fails.
+        if analysis.bundle_path is not None:
+            bundle_zip = zipfile.ZipFile(analysis.bundle_path, "r")
+        asset_index = _TargetAssetIndex()
+        reused_assets = 0
         total_assets = len(analysis.assets) or 1
         for index, asset in enumerate(analysis.assets, start=1):
             # Process each (index, asset) from enumerate(analysis.assets, start=1).
             bundle_path = asset.get("bundle_path")
-            source = assets_dir / bundle_path if bundle_path else None
-            if not source or not source.exists():
-                log_warning(
-                    f"Bundle asset missing: {bundle_path}",
-                    func_name="modules.generic.cross_campaign_asset_service.apply_import",
-                )
+            original = asset.get("original_path", "")
+            if original in replacements:
                 continue
-            target_path, relative = _determine_target_path(
-                asset.get("asset_type", ""),
-                asset.get("original_path", ""),
-                target_campaign.root,
-            )
             try:
-                shutil.copy2(source, target_path)
-                replacements[asset.get("original_path", "")] = relative
+                if bundle_zip is not None:
+                    result = _import_bundle_asset(
+                        bundle_zip, asset, target_campaign.root, asset_index
+                    )
+                else:
+                    result = _copy_extracted_asset(
+                        assets_dir, asset, target_campaign.root
+                    )
             except Exception as exc:
                 log_warning(
-                    f"Failed to copy asset {source}: {exc}",
+                    f"Failed to copy asset {bundle_path}: {exc}",
                     func_name="modules.generic.cross_campaign_asset_service.apply_import",
                 )
+                result = None
+            else:
+                if result is None:
+                    log_warning(
+                        f"Bundle asset missing: {bundle_path}",
+                        func_name="modules.generic.cross_campaign_asset_service.apply_import",
+                    )
+            if result is not None:
+                relative, reused = result
+                replacements[original] = relative
+                reused_assets += int(reused)
             _call_progress(
                 progress_callback,
                 f"Copying assets ({index}/{total_assets})",
                 index / total_assets,
             )
+        if reused_assets:
+            summary["assets_reused"] = reused_assets
 
         for entity_type, records in analysis.data_by_type.items():
             # Process each (entity_type, records) from analysis.data_by_type.items().
             if not records:
                 continue
-            existing = load_entities(entity_type, target_campaign.db_path)
-            existing_map = {_determine_record_key(item): item for item in existing}
+            existing_keys = load_existing_record_keys(
+                entity_type,
+                target_campaign.db_path,
+                (_determine_record_key(record) for record in records),
+            )
 
-            merged: Dict[str, dict] = {key: item for key, item in existing_map.items()}
+            pending: Dict[str, dict] = {}
             for record in records:
                 # Process each record from records.
                 key = _determine_record_key(record)
-                updated_record = _rewrite_record_paths(
+                if key in existing_keys and not overwrite:
+                    summary["skipped"] += 1
+                    continue
+                pending[key] = _rewrite_record_paths(
                     entity_type,
                     record,
                     replacements,
                     target_campaign_root=target_campaign.root,
                 )
-                if key in existing_map:
-                    # Handle the branch where key is in existing map.
-                    if not overwrite:
-                        summary["skipped"] += 1
-                        continue
-                    merged[key] = updated_record
+                if key in existing_keys:
                     summary["updated"] += 1
                 else:
-                    merged[key] = updated_record
                     summary["imported"] += 1
 
-            save_entities(
-                entity_type,
-                target_campaign.db_path,
-                list(merged.values()),
-                replace=False,
-            )
+            if pending:
+                save_entities(
+                    entity_type,
+                    target_campaign.db_path,
+                    list(pending.values()),
+                    replace=False,
+                )
 
         imported_extra_files = 0
         skipped_extra_files = 0
@@ -1327,8 +1606,13 @@ def apply_import(
             if not relative_path or not bundle_rel:
                 continue
 
-            source_extra = (assets_dir / bundle_rel).resolve()
-            if not source_extra.exists():
+            if bundle_zip is not None:
+                source_extra = _zip_member(bundle_zip, bundle_rel)
+            else:
+                source_extra = (assets_dir / bundle_rel).resolve()
+                if not source_extra.exists():
+                    source_extra = None
+            if source_extra is None:
                 log_warning(
                     f"Bundle extra file missing: {bundle_rel}",
                     func_name="modules.generic.cross_campaign_asset_service.apply_import",
@@ -1349,11 +1633,14 @@ def apply_import(
 
             destination.parent.mkdir(parents=True, exist_ok=True)
             try:
-                shutil.copy2(source_extra, destination)
+                if bundle_zip is not None:
+                    _stream_zip_member(bundle_zip, source_extra, destination)
+                else:
+                    shutil.copy2(source_extra, destination)
                 imported_extra_files += 1
             except Exception as exc:
                 log_warning(
-                    f"Failed to copy extra file {source_extra}: {exc}",
+                    f"Failed to copy extra file {bundle_rel}: {exc}",
                     func_name="modules.generic.cross_campaign_asset_service.apply_import",
                 )
 
@@ -1446,6 +1733,8 @@ def apply_import(
         )
         summary.update(gm_table_summary)
     finally:
+        if bundle_zip is not None:
+            bundle_zip.close()
         shutil.rmtree(analysis.temp_dir, ignore_errors=True)
 
     _call_progress(progress_callback, "Import complete", 1.0)
@@ -1537,9 +1826,8 @@ def install_full_campaign_bundle(
             if not str(destination).startswith(str(target_root)):
                 destination = target_root / source_asset.name
 
-            destination.parent.mkdir(parents=True, exist_ok=True)
             try:
-                shutil.copy2(source_asset, destination)
+                copy_into_campaign(source_asset, destination, campaign_dir=target_root)
             except Exception as exc:
                 log_warning(
                     f"Failed to copy asset {source_asset}: {exc}",
@@ -1650,8 +1938,11 @@ def apply_direct_copy(
             asset.asset_type, asset.original_path, target_campaign.root
         )
         try:
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(asset.absolute_path, target_path)
+            copy_into_campaign(
+                asset.absolute_path,
+                target_path,
+                campaign_dir=target_campaign.root,
+            )
             replacements[original] = relative
         except Exception as exc:
             log_warning(
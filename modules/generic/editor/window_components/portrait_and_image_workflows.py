@@ -11,6 +11,7 @@ from modules.helpers.swarmui_portrait_service import (
     PortraitGenerationSource,
     SwarmUIPortraitSettings,
     cleanup_swarmui,
+    discard_portrait_candidates,
     generate_portrait_candidates,
     launch_swarmui,
     save_generated_portrait_candidate,
@@ -489,6 +490,7 @@ class GenericEditorWindowPortraitAndImageWorkflows:
 
         chosen_index = self._show_image_selection_window([candidate.thumbnail for candidate in candidates])
         if chosen_index is None or chosen_index < 0 or chosen_index >= len(candidates):
+            discard_portrait_candidates(candidates)
             return
 
         try:
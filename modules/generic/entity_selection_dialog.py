@@ -2,13 +2,14 @@
 
 import customtkinter as ctk
 import os
+import tkinter as tk
 from tkinter import messagebox
 from customtkinter import CTkLabel, CTkImage
 from modules.helpers.text_helpers import format_longtext
 from modules.helpers.config_helper import ConfigHelper
 from modules.helpers.portrait_helper import primary_portrait, resolve_portrait_path
 from modules.helpers.logging_helper import log_module_import
-from modules.ui.entity_media.thumbnail import load_media_thumbnail
+from modules.ui.image_library.thumbnail_service import TkThumbnailDelivery, get_media_thumbnail_service
 
 log_module_import(__name__)
 
@@ -43,6 +44,9 @@ class EntitySelectionDialog(ctk.CTkToplevel):
         self.filtered_items = self.items.copy()
 
         self.image_cache = {}
+        self._thumbnail_service = get_media_thumbnail_service()
+        self._thumbnail_delivery = TkThumbnailDelivery(self, self._thumbnail_service)
+        self._render_generation = 0
 
         os.makedirs(PORTRAIT_FOLDER, exist_ok=True)
 
@@ -82,6 +86,8 @@ class EntitySelectionDialog(ctk.CTkToplevel):
 
     def refresh_list(self):
         """Refresh list."""
+        self._render_generation += 1
+        self._thumbnail_service.cancel_owner(self)
         for child in self.table_frame.winfo_children():
             if int(child.grid_info()["row"]) > 0:
                 child.destroy()
@@ -98,14 +104,12 @@ class EntitySelectionDialog(ctk.CTkToplevel):
             portrait_value = item.get("Portrait", "")
             portrait_path = primary_portrait(portrait_value)
             resolved_portrait = resolve_portrait_path(portrait_value, ConfigHelper.get_campaign_dir())
-            if resolved_portrait and os.path.exists(resolved_portrait):
-                # Handle the branch where resolved portrait is set and os.path.exists(resolved_portrait).
-                if resolved_portrait not in self.image_cache:
-                    img = load_media_thumbnail(resolved_portrait, MAX_PORTRAIT_SIZE)
-                    ctk_img = CTkImage(light_image=img, dark_image=img, size=MAX_PORTRAIT_SIZE)
-                    self.image_cache[resolved_portrait] = ctk_img
-
+            if resolved_portrait and resolved_portrait in self.image_cache:
                 portrait_label = CTkLabel(self.table_frame, text="", image=self.image_cache[resolved_portrait])
+            elif resolved_portrait and os.path.exists(resolved_portrait):
+                # Decode off the Tk thread; rows nearer the top load first.
+                portrait_label = CTkLabel(self.table_frame, text="…", width=MAX_PORTRAIT_SIZE[0])
+                self._request_portrait(portrait_label, resolved_portrait, priority=row_index)
             else:
                 portrait_label = ctk.CTkLabel(self.table_frame, text="[No Media]")
 
@@ -126,6 +130,40 @@ class EntitySelectionDialog(ctk.CTkToplevel):
             label.bind("<Button-1>", lambda e, i=item: self.select_entity(i))
             col_index += 1
 
+    def _request_portrait(self, label, resolved_portrait, *, priority):
+        """Load a portrait thumbnail on the shared thumbnail workers."""
+        generation = self._render_generation
+        self._thumbnail_delivery.request(
+            resolved_portrait,
+            MAX_PORTRAIT_SIZE,
+            lambda img, _error: self._apply_portrait(label, generation, resolved_portrait, img),
+            priority=priority,
+            owner=self,
+        )
+
+    def _apply_portrait(self, label, generation, resolved_portrait, img):
+        """Show a loaded portrait if its row is still displayed."""
+        if generation != self._render_generation:
+            return
+        try:
+            if not label.winfo_exists():
+                return
+            if img is None:
+                label.configure(text="[No Media]")
+                return
+            ctk_img = self.image_cache.get(resolved_portrait)
+            if ctk_img is None:
+                ctk_img = CTkImage(light_image=img, dark_image=img, size=MAX_PORTRAIT_SIZE)
+                self.image_cache[resolved_portrait] = ctk_img
+            label.configure(text="", image=ctk_img)
+        except tk.TclError:
+            pass
+
+    def destroy(self):
+        """Drop queued portrait loads before closing."""
+        self._thumbnail_service.cancel_owner(self)
+        super().destroy()
+
     def filter_items(self):
         """Handle filter items."""
         query = self.search_var.get().strip().lower()
@@ -104,6 +104,7 @@ def _dynamic_entity_labels() -> dict:
 
 AI_CATEGORIZE_BATCH_SIZE = 20
 PORTRAIT_MENU_THUMB_SIZE = (48, 48)
+GRID_THUMB_SIZE = (160, 160)
 
 
 try:
@@ -192,6 +193,28 @@ def _lazy_book_importers():
     return extract_text_from_book, prepare_books_from_directory, prepare_books_from_files
 
 
+def _lazy_book_text_index():
+    """Internal helper for lazy book text index."""
+    from modules.books.book_indexing import BookIndexingEngine
+    from modules.books.book_text_index import get_book_text_index, strip_book_text
+
+    return BookIndexingEngine, get_book_text_index, strip_book_text
+
+
+def _lazy_media_thumbnail_service():
+    """Internal helper for lazy media thumbnail service."""
+    from modules.ui.image_library.thumbnail_service import get_media_thumbnail_service
+
+    return get_media_thumbnail_service()
+
+
+def _lazy_tk_thumbnail_delivery():
+    """Internal helper for lazy Tk thumbnail delivery."""
+    from modules.ui.image_library.thumbnail_service import TkThumbnailDelivery
+
+    return TkThumbnailDelivery
+
+
 def _lazy_text_import_dialog():
     """Internal helper for lazy text import dialog."""
     from modules.ui.imports import TextImportDialog
@@ -410,6 +433,8 @@ class GenericListView(ctk.CTkFrame):
         self._freeze_selection_changes = False
         self._tree_loading = False
         self._payload_executor = ThreadPoolExecutor(max_workers=1)
+        self._book_indexing_cancel = threading.Event()
+        self._book_indexing_resumed = False
         self._payload_batch_size = 500
         self._load_queue = None
         self._load_thread = None
@@ -478,6 +503,9 @@ class GenericListView(ctk.CTkFrame):
             self.columns = [c for c in self.columns if c in lightweight_columns]
             if "Excerpts" not in self.columns:
                 self.columns.append("Excerpts")
+            # Subscribe the text index so renames made in this view move its pages.
+            _, get_book_text_index, _ = _lazy_book_text_index()
+            get_book_text_index(getattr(self.model_wrapper, "_db_path", None))
 
         self._tree_columns = (
             [self._link_column] + list(self.columns)
@@ -591,6 +619,7 @@ class GenericListView(ctk.CTkFrame):
         self.grid_container.pack(fill="both", expand=True, padx=5, pady=5)
         self.grid_images = []
         self.grid_image_cache = {}
+        self._grid_generation = 0
         self._grid_render_job = None
         self._grid_loading_frame = None
         self._grid_loading_bar = None
@@ -996,6 +1025,7 @@ class GenericListView(ctk.CTkFrame):
         if done:
             self._initial_dataset_ready = True
             self._on_tree_load_complete()
+            self._resume_pending_book_indexing()
         else:
             self.after(15, lambda: self._drain_load_queue(session_id, query))
 
@@ -1470,9 +1500,12 @@ class GenericListView(ctk.CTkFrame):
             border_color="#1E1E1E",
         )
         card.grid(row=row, column=col, padx=10, pady=10, sticky="nsew")
-        image = self._load_grid_image(item)
+        image, pending_path = self._load_grid_image(item)
         image_label = ctk.CTkLabel(card, text="", image=image)
         image_label.grid(row=0, column=0, padx=10, pady=(10, 5))
+        if pending_path:
+            # Earlier cards (the first batch is what is on screen) load first.
+            self._request_grid_image(image_label, pending_path, priority=row)
         name = self.clean_value(item.get(self.unique_field, "")) or "Unnamed"
         name_label = ctk.CTkLabel(card, text=name, justify="center", wraplength=160)
         name_label.grid(row=1, column=0, padx=10, pady=(0, 10))
@@ -1566,6 +1599,8 @@ class GenericListView(ctk.CTkFrame):
         if not hasattr(self, "grid_container"):
             return
         self._cancel_grid_render()
+        self._grid_generation += 1
+        _lazy_media_thumbnail_service().cancel_owner(self)
         for child in self.grid_container.winfo_children():
             child.destroy()
         self.grid_images.clear()
@@ -1653,30 +1688,58 @@ class GenericListView(ctk.CTkFrame):
         return resolve_portrait_candidate(primary_path, ConfigHelper.get_campaign_dir())
 
     def _load_grid_image(self, item):
-        """Load grid image."""
+        """Return ``(image, pending_path)``; a pending path still has to load."""
         media_value = ""
         if self.media_field:
             media_value = item.get(self.media_field, "")
         resolved = self._resolve_media_path(media_value)
-        cache_key = resolved or "__placeholder__"
-        cached = self.grid_image_cache.get(cache_key)
+        cached = self.grid_image_cache.get(resolved or "__placeholder__")
         if cached:
             self.grid_images.append(cached)
-            return cached
-        image_obj = None
+            return cached, None
         if resolved:
-            try:
-                # Keep grid image resilient if this step fails.
-                image_obj = load_media_thumbnail(resolved, (160, 160))
-            except Exception:
-                image_obj = None
-        if image_obj is None:
-            image_obj = Image.new("RGBA", (160, 160), color="#3A3A3A")
-        ctk_image = ctk.CTkImage(light_image=image_obj, size=(160, 160))
+            image_obj = _lazy_media_thumbnail_service().peek(resolved, GRID_THUMB_SIZE)
+            if image_obj is not None:
+                return self._remember_grid_image(resolved, image_obj), None
+        placeholder = self.grid_image_cache.get("__placeholder__")
+        if placeholder is None:
+            image_obj = Image.new("RGBA", GRID_THUMB_SIZE, color="#3A3A3A")
+            placeholder = self._remember_grid_image("__placeholder__", image_obj)
+        return placeholder, resolved
+
+    def _remember_grid_image(self, cache_key, image_obj):
+        """Wrap a grid thumbnail and keep a reference to it."""
+        ctk_image = ctk.CTkImage(light_image=image_obj, size=GRID_THUMB_SIZE)
         self.grid_image_cache[cache_key] = ctk_image
         self.grid_images.append(ctk_image)
         return ctk_image
 
+    def _request_grid_image(self, label, resolved, *, priority):
+        """Decode a grid thumbnail off the Tk thread."""
+        generation = self._grid_generation
+        service = _lazy_media_thumbnail_service()
+        delivery = getattr(self, "_grid_thumbnail_delivery", None)
+        if delivery is None or delivery.service is not service:
+            delivery = self._grid_thumbnail_delivery = _lazy_tk_thumbnail_delivery()(self, service)
+        delivery.request(
+            resolved,
+            GRID_THUMB_SIZE,
+            lambda image_obj, _error: self._apply_grid_image(label, generation, resolved, image_obj),
+            priority=priority,
+            owner=self,
+        )
+
+    def _apply_grid_image(self, label, generation, resolved, image_obj):
+        """Swap a loaded thumbnail into its grid card if it is still shown."""
+        if generation != self._grid_generation or image_obj is None:
+            return
+        try:
+            if not label.winfo_exists():
+                return
+            label.configure(image=self._remember_grid_image(resolved, image_obj))
+        except tk.TclError:
+            pass
+
     def _edit_item(self, item):
         """Internal helper for edit item."""
         key_field = self.unique_field or self.model_wrapper._infer_key_field()
@@ -3394,6 +3457,10 @@ class GenericListView(ctk.CTkFrame):
             it for it in self.items
             if self._get_base_id(it) not in targets
         ]
+        removed_titles = [
+            it.get(self.unique_field) for it in self.items
+            if self._get_base_id(it) in targets
+        ]
         removed_any = len(remaining) != len(self.items)
         if removed_any:
             self.items = remaining
@@ -3401,6 +3468,8 @@ class GenericListView(ctk.CTkFrame):
         if removed_any:
             # Continue with this path when removed any is set.
             self.model_wrapper.save_items(self.items)
+            if self.model_wrapper.entity_type == "books":
+                self._remove_book_text(removed_titles)
             self._save_list_order()
             self.filter_items(self.search_var.get())
         else:
@@ -3410,6 +3479,19 @@ class GenericListView(ctk.CTkFrame):
                 self.shelf_view.refresh_selection()
             self._update_bulk_controls()
 
+    def _remove_book_text(self, titles):
+        """Drop deleted books from the full-text index."""
+        _, get_book_text_index, _ = _lazy_book_text_index()
+        text_index = get_book_text_index(getattr(self.model_wrapper, "_db_path", None))
+        for title in titles:
+            try:
+                text_index.remove_book(str(title))
+            except Exception as exc:
+                log_warning(
+                    f"Failed to remove indexed text for book '{title}': {exc}",
+                    func_name="GenericListView._remove_book_text",
+                )
+
     def turn_npc_to_pc(self, iid):
         """Handle turn NPC to PC."""
         if self.model_wrapper.entity_type != "npcs":
@@ -3950,51 +4032,92 @@ class GenericListView(ctk.CTkFrame):
                     )
                     return
 
-            final_updates = []
             success = 0
             failures = []
-            extract_text_from_book, _, _ = _lazy_book_importers()
-            for record in target_records:
-                # Process each record from target_records.
-                attachment = record.get("Attachment", "")
-                try:
-                    # Keep worker resilient if this step fails.
-                    page_count, extracted_text, extracted_pages = extract_text_from_book(
-                        attachment, campaign_dir=campaign_dir
-                    )
-                    update = dict(record)
-                    update["PageCount"] = page_count
-                    update["ExtractedText"] = extracted_text
-                    update["ExtractedPages"] = extracted_pages
-                    update["IndexStatus"] = "indexed"
-                    final_updates.append(update)
-                    success += 1
-                except Exception as exc:
-                    log_warning(
-                        f"Failed to index book '{record.get('Title', 'Unknown')}': {exc}",
-                        func_name="GenericListView._queue_book_indexing",
-                    )
-                    update = dict(record)
-                    update.setdefault("ExtractedText", "")
-                    update.setdefault("ExtractedPages", [])
-                    update["IndexStatus"] = f"error: {exc}"
-                    final_updates.append(update)
-                    failures.append((record.get("Title"), str(exc)))
-
-            if final_updates:
-                try:
-                    self.model_wrapper.save_items(final_updates, replace=False)
-                except Exception as exc:
-                    log_warning(
-                        f"Failed to persist indexed books: {exc}",
-                        func_name="GenericListView._queue_book_indexing",
-                    )
-                    return
+            cancelled = False
+            BookIndexingEngine, get_book_text_index, strip_book_text = _lazy_book_text_index()
+            text_index = get_book_text_index(getattr(self.model_wrapper, "_db_path", None))
+            cancel_event = self._book_indexing_cancel
+            # Pages of each book are extracted in parallel and stream into the
+            # full-text index; the row keeps only metadata and excerpts.
+            with BookIndexingEngine(text_index) as engine:
+                for record in target_records:
+                    # Process each record from target_records.
+                    title = record.get("Title")
+                    attachment = record.get("Attachment", "")
+                    try:
+                        # Keep worker resilient if this step fails.
+                        pdf_path = str(attachment or "")
+                        if not os.path.isabs(pdf_path):
+                            pdf_path = os.path.join(campaign_dir, pdf_path)
+                        if not os.path.isfile(pdf_path):
+                            raise FileNotFoundError(f"Attachment not found: {pdf_path}")
+                        result = engine.index_book(
+                            title,
+                            pdf_path,
+                            progress=self._log_book_indexing_progress,
+                            cancelled=cancel_event.is_set,
+                        )
+                        if result.cancelled:
+                            # Leave the row marked "indexing" so it resumes.
+                            cancelled = True
+                            break
+                        update = strip_book_text(record)
+                        update["PageCount"] = result.page_count
+                        update["IndexStatus"] = "indexed"
+                        success += 1
+                    except Exception as exc:
+                        log_warning(
+                            f"Failed to index book '{record.get('Title', 'Unknown')}': {exc}",
+                            func_name="GenericListView._queue_book_indexing",
+                        )
+                        update = dict(record)
+                        update.setdefault("ExtractedText", "")
+                        update.setdefault("ExtractedPages", [])
+                        update["IndexStatus"] = f"error: {exc}"
+                        failures.append((record.get("Title"), str(exc)))
+                    try:
+                        self.model_wrapper.save_items([update], replace=False)
+                    except Exception as exc:
+                        log_warning(
+                            f"Failed to persist indexed books: {exc}",
+                            func_name="GenericListView._queue_book_indexing",
+                        )
+                        return
 
+            if cancelled:
+                return
             self.after(0, lambda: self._on_book_indexing_complete(success, failures))
 
         threading.Thread(target=worker, daemon=True).start()
 
+    def _log_book_indexing_progress(self, progress):
+        """Log streamed book indexing progress."""
+        log_debug(
+            f"Indexed {progress.pages_done}/{progress.page_count} page(s) of '{progress.book}'",
+            func_name="GenericListView._queue_book_indexing",
+        )
+
+    def _resume_pending_book_indexing(self):
+        """Re-queue books whose indexing was interrupted by a restart."""
+        if self._book_indexing_resumed or self.model_wrapper.entity_type != "books":
+            return
+        self._book_indexing_resumed = True
+        pending = [
+            item.get("Title") for item in self.items
+            if str(item.get("IndexStatus") or "").strip().lower() in {"queued", "indexing"}
+        ]
+        if pending:
+            self._queue_book_indexing(pending)
+
+    def destroy(self):
+        """Stop background book indexing and thumbnail loading before teardown."""
+        cancel_event = getattr(self, "_book_indexing_cancel", None)
+        if cancel_event is not None:
+            cancel_event.set()
+        _lazy_media_thumbnail_service().cancel_owner(self)
+        super().destroy()
+
     def _on_book_indexing_complete(self, success_count, failures):
         """Handle book indexing complete."""
         current_query = self.search_var.get() if hasattr(self, "search_var") else ""
@@ -3,12 +3,82 @@
 import sqlite3
 import json
 import threading
+from dataclasses import dataclass
 from db.db import get_connection, load_schema_from_json
 from modules.generic.json_value_deserializer import deserialize_possible_json
 from modules.helpers.logging_helper import log_module_import
 
 log_module_import(__name__)
 
+
+@dataclass(frozen=True)
+class SaveEvent:
+    """Summary of one committed save, handed to save listeners."""
+
+    entity_type: str
+    keys: tuple = ()
+    item_count: int = 0
+    byte_count: int = 0
+    renamed: tuple = ()
+
+
+def _payload_size(values):
+    """Approximate the stored size of one row's bound values."""
+    size = 0
+    for value in values:
+        if isinstance(value, (str, bytes)):
+            size += len(value)
+        elif value is not None:
+            size += 8
+    return size
+
+
+class WrapperTransaction:
+    """Group saves from several wrappers on one database into a single transaction.
+
+    Pass it as ``transaction=`` to :meth:`GenericModelWrapper.save_items` or
+    :meth:`GenericModelWrapper.save_item`. Everything commits when the block
+    exits cleanly and rolls back if it raises; save listeners only hear about
+    the rows after the commit.
+    """
+
+    def __init__(self, db_path=None):
+        """Initialize the WrapperTransaction instance."""
+        self._db_path = db_path
+        self._conn = None
+        self._events = []
+
+    def __enter__(self):
+        self._conn = sqlite3.connect(self._db_path) if self._db_path else get_connection()
+        self._conn.execute("PRAGMA busy_timeout = 5000")
+        self._conn.execute("BEGIN IMMEDIATE")
+        self._events = []
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self._conn.commit()
+            else:
+                self._conn.rollback()
+        finally:
+            self._conn.close()
+            self._conn = None
+        if exc_type is None:
+            for wrapper, event in self._events:
+                wrapper._notify_saved(event)
+        return False
+
+    def cursor(self):
+        if self._conn is None:
+            raise RuntimeError("WrapperTransaction is not active")
+        return self._conn.cursor()
+
+    def defer(self, wrapper, event):
+        """Queue ``event`` for ``wrapper``'s listeners until the commit."""
+        self._events.append((wrapper, event))
+
+
 class GenericModelWrapper:
     _save_listeners = set()
     _save_listener_lock = threading.RLock()
@@ -23,12 +93,19 @@ class GenericModelWrapper:
         with cls._save_listener_lock:
             cls._save_listeners.discard(callback)
 
-    def _notify_saved(self):
-        """Notify only after SQLite commit has completed successfully."""
+    def _notify_saved(self, event=None):
+        """Notify only after SQLite commit has completed successfully.
+
+        Listeners are called as ``callback(db_path, event)`` where ``event`` is
+        a :class:`SaveEvent` describing the entity type, keys and approximate
+        byte volume of the committed rows.
+        """
+        if event is None:
+            event = SaveEvent(self.entity_type)
         with self._save_listener_lock:
             listeners = tuple(self._save_listeners)
         for callback in listeners:
-            callback(self._db_path)
+            callback(self._db_path, event)
 
     def __init__(self, entity_type, db_path=None):
         """Initialize the GenericModelWrapper instance."""
@@ -89,6 +166,49 @@ class GenericModelWrapper:
         finally:
             conn.close()
 
+    def existing_keys(self, key_values, key_field=None, *, nocase=False):
+        """Return which of *key_values* already exist, using the key's index.
+
+        With ``nocase`` the match ignores ASCII case and the stored spellings
+        are returned.
+        """
+        key_field = self._infer_key_field(key_field)
+        values = list(dict.fromkeys(key_values))
+        collate = " COLLATE NOCASE" if nocase else ""
+        found = set()
+        conn = self._get_connection()
+        try:
+            for start in range(0, len(values), 500):
+                chunk = values[start:start + 500]
+                placeholders = ", ".join("?" for _ in chunk)
+                cursor = conn.execute(
+                    f"SELECT {key_field} FROM {self.table} WHERE {key_field}{collate} IN ({placeholders})",
+                    chunk,
+                )
+                found.update(row[0] for row in cursor)
+        finally:
+            conn.close()
+        return found
+
+    def keys_with_prefixes(self, prefixes, key_field=None):
+        """Return stored keys starting with any of *prefixes*, ignoring ASCII case."""
+        key_field = self._infer_key_field(key_field)
+        prefixes = [prefix for prefix in dict.fromkeys(prefixes) if prefix]
+        found = set()
+        conn = self._get_connection()
+        try:
+            for prefix in prefixes:
+                # LIKE is case-insensitive and uses the NOCASE index for a literal prefix.
+                pattern = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+                cursor = conn.execute(
+                    f"SELECT {key_field} FROM {self.table} WHERE {key_field} LIKE ? ESCAPE '\\'",
+                    (pattern,),
+                )
+                found.update(row[0] for row in cursor)
+        finally:
+            conn.close()
+        return found
+
 
     def _ensure_schema(self, cursor, items):
         """Ensure that any new fields present in ``items`` exist in the table."""
@@ -136,80 +256,57 @@ class GenericModelWrapper:
 
         return existing_columns
 
-    def save_items(self, items, *, replace=True):
-        """Save items."""
+    def save_items(self, items, *, replace=True, transaction=None):
+        """Save items; with ``transaction`` they join that shared transaction."""
+        if transaction is not None:
+            transaction.defer(self, self._write_items(transaction.cursor(), items, replace))
+            return
         conn = self._get_connection()
         conn.execute("PRAGMA busy_timeout = 5000")
         cursor = conn.cursor()
 
         try:
             # Keep items resilient if this step fails.
-            existing_columns = self._ensure_schema(cursor, items)
-
-            # Determine the unique field to use based on entity semantics first.
-            unique_field = self._infer_key_field()
-            if items and unique_field not in items[0]:
-                # Handle the branch where items is set and unique field is not in items[0].
-                sample_item = items[0]
-                if "Name" in sample_item:
-                    unique_field = "Name"
-                elif "Title" in sample_item:
-                    unique_field = "Title"
-                elif sample_item:
-                    unique_field = list(sample_item.keys())[0]
-
-            # Insert or update (INSERT OR REPLACE)
-            for item in items:
-                # Process each item from items.
-                keys = [key for key in item.keys() if key in existing_columns]
-                values = []
-                for key in keys:
-                    # Process each key from keys.
-                    val = item[key]
-                    if isinstance(val, (list, dict)):
-                        val = json.dumps(val)
-                    values.append(val)
-                placeholders = ", ".join("?" for _ in keys)
-                cols = ", ".join(keys)
-                sql = f"INSERT OR REPLACE INTO {self.table} ({cols}) VALUES ({placeholders})"
-                if keys:
-                    cursor.execute(sql, values)
-
-            # Handle the deletion case:
-            # Build the list of unique identifiers present in the items
-            unique_ids = [item[unique_field] for item in items if unique_field in item]
-
-            if replace:
-                if unique_ids:
-                    placeholders = ", ".join("?" for _ in unique_ids)
-                    delete_sql = f"DELETE FROM {self.table} WHERE {unique_field} NOT IN ({placeholders})"
-                    cursor.execute(delete_sql, unique_ids)
-                else:
-                    # If there are no items, delete all records from the table
-                    delete_sql = f"DELETE FROM {self.table}"
-                    cursor.execute(delete_sql)
-
+            event = self._write_items(cursor, items, replace)
             conn.commit()
-            self._notify_saved()
+            self._notify_saved(event)
         finally:
             conn.close()
 
-    def save_item(self, item, *, key_field=None, original_key_value=None):
-        """Save item."""
-        if not isinstance(item, dict):
-            raise TypeError("item must be a dictionary")
-
-        conn = self._get_connection()
-        conn.execute("PRAGMA busy_timeout = 5000")
-        cursor = conn.cursor()
-
-        try:
-            # Keep item resilient if this step fails.
-            existing_columns = self._ensure_schema(cursor, [item])
-            key_field = self._infer_key_field(key_field)
-            key_value = item.get(key_field)
+    def _write_items(self, cursor, items, replace):
+        """Write ``items`` on ``cursor`` without committing; return the save event."""
+        existing_columns = self._ensure_schema(cursor, items)
+
+        # Determine the unique field to use based on entity semantics first.
+        unique_field = self._infer_key_field()
+        if items and unique_field not in items[0]:
+            # Handle the branch where items is set and unique field is not in items[0].
+            sample_item = items[0]
+            if "Name" in sample_item:
+                unique_field = "Name"
+            elif "Title" in sample_item:
+                unique_field = "Title"
+            elif sample_item:
+                unique_field = list(sample_item.keys())[0]
+
+        # Insert or update (INSERT OR REPLACE); consecutive rows with the
+        # same columns share one executemany call.
+        byte_count = 0
+        batch_keys = None
+        batch_rows = []
+
+        def flush():
+            if batch_keys and batch_rows:
+                placeholders = ", ".join("?" for _ in batch_keys)
+                cols = ", ".join(batch_keys)
+                sql = f"INSERT OR REPLACE INTO {self.table} ({cols}) VALUES ({placeholders})"
+                cursor.executemany(sql, batch_rows)
 
-            keys = [key for key in item.keys() if key in existing_columns]
+        for item in items:
+            # Process each item from items.
+            keys = tuple(key for key in item.keys() if key in existing_columns)
+            if not keys:
+                continue
             values = []
             for key in keys:
                 # Process each key from keys.
@@ -217,31 +314,98 @@ class GenericModelWrapper:
                 if isinstance(val, (list, dict)):
                     val = json.dumps(val)
                 values.append(val)
+            if keys != batch_keys:
+                flush()
+                batch_keys, batch_rows = keys, []
+            batch_rows.append(values)
+            byte_count += _payload_size(values)
+        flush()
+
+        # Handle the deletion case:
+        # Build the list of unique identifiers present in the items
+        unique_ids = [item[unique_field] for item in items if unique_field in item]
+
+        if replace:
+            if unique_ids:
+                placeholders = ", ".join("?" for _ in unique_ids)
+                delete_sql = f"DELETE FROM {self.table} WHERE {unique_field} NOT IN ({placeholders})"
+                cursor.execute(delete_sql, unique_ids)
+            else:
+                # If there are no items, delete all records from the table
+                delete_sql = f"DELETE FROM {self.table}"
+                cursor.execute(delete_sql)
+
+        return SaveEvent(self.entity_type, tuple(unique_ids), len(items), byte_count)
+
+    def save_item(self, item, *, key_field=None, original_key_value=None, transaction=None):
+        """Save item; with ``transaction`` it joins that shared transaction."""
+        if not isinstance(item, dict):
+            raise TypeError("item must be a dictionary")
+        if transaction is not None:
+            event = self._write_item(transaction.cursor(), item, key_field, original_key_value)
+            if event is not None:
+                transaction.defer(self, event)
+            return
 
-            if not keys:
-                return
+        conn = self._get_connection()
+        conn.execute("PRAGMA busy_timeout = 5000")
+        cursor = conn.cursor()
 
-            if (
-                original_key_value not in (None, "")
-                and key_value not in (None, "")
-                and original_key_value != key_value
-            ):
-                # Handle this branch separately before continuing.
-                set_clause = ", ".join(f"{key} = ?" for key in keys)
-                update_sql = (
-                    f"UPDATE {self.table} SET {set_clause} WHERE {key_field} = ?"
-                )
-                cursor.execute(update_sql, values + [original_key_value])
-                if cursor.rowcount:
-                    conn.commit()
-                    self._notify_saved()
-                    return
-
-            placeholders = ", ".join("?" for _ in keys)
-            cols = ", ".join(keys)
-            sql = f"INSERT OR REPLACE INTO {self.table} ({cols}) VALUES ({placeholders})"
-            cursor.execute(sql, values)
+        try:
+            # Keep item resilient if this step fails.
+            event = self._write_item(cursor, item, key_field, original_key_value)
+            if event is None:
+                return
             conn.commit()
-            self._notify_saved()
+            self._notify_saved(event)
         finally:
             conn.close()
+
+    def _write_item(self, cursor, item, key_field, original_key_value):
+        """Write one item on ``cursor`` without committing; return the save event."""
+        existing_columns = self._ensure_schema(cursor, [item])
+        key_field = self._infer_key_field(key_field)
+        key_value = item.get(key_field)
+
+        keys = [key for key in item.keys() if key in existing_columns]
+        values = []
+        for key in keys:
+            # Process each key from keys.
+            val = item[key]
+            if isinstance(val, (list, dict)):
+                val = json.dumps(val)
+            values.append(val)
+
+        if not keys:
+            return None
+
+        if (
+            original_key_value not in (None, "")
+            and key_value not in (None, "")
+            and original_key_value != key_value
+        ):
+            # Handle this branch separately before continuing.
+            set_clause = ", ".join(f"{key} = ?" for key in keys)
+            update_sql = (
+                f"UPDATE {self.table} SET {set_clause} WHERE {key_field} = ?"
+            )
+            cursor.execute(update_sql, values + [original_key_value])
+            if cursor.rowcount:
+                return SaveEvent(
+                    self.entity_type,
+                    (original_key_value, key_value),
+                    1,
+                    _payload_size(values),
+                    renamed=((original_key_value, key_value),),
+                )
+
+        placeholders = ", ".join("?" for _ in keys)
+        cols = ", ".join(keys)
+        sql = f"INSERT OR REPLACE INTO {self.table} ({cols}) VALUES ({placeholders})"
+        cursor.execute(sql, values)
+        return SaveEvent(
+            self.entity_type,
+            (key_value,) if key_value not in (None, "") else (),
+            1,
+            _payload_size(values),
+        )
@@ -20,6 +20,7 @@ from modules.generic.portrait_manager.components.generated_portrait_selection_di
 from modules.generic.portrait_manager.entity_portrait_actions import ScenarioPortraitEntity, campaign_relative_path, copy_portrait_to_campaign, missing_portrait_indices, portrait_status, set_entity_portraits
 from modules.generic.portrait_manager.swarmui_portrait_generator import (
     SwarmUIPortraitSettings,
+    discard_portrait_candidates,
     generate_scenario_portrait_candidates,
     launch_swarmui,
     save_generated_portrait_candidate,
@@ -365,6 +366,7 @@ class ScenarioPortraitManagerDialog(ctk.CTkToplevel):
         )
         self.wait_window(selection_dialog)
         if not selection_dialog.result:
+            discard_portrait_candidates(candidates)
             return False
 
         try:
@@ -15,6 +15,7 @@ from modules.helpers.swarmui_portrait_service import (
     SwarmUIPortraitSettings,
     build_portrait_prompt,
     cleanup_swarmui,
+    discard_portrait_candidates,
     generate_portrait_candidates,
     launch_swarmui,
     save_generated_portrait_candidate as save_portrait_candidate,
@@ -66,6 +67,7 @@ __all__ = [
     "SwarmUIPortraitSettings",
     "build_portrait_prompt",
     "cleanup_swarmui",
+    "discard_portrait_candidates",
     "generate_scenario_portrait_candidates",
     "launch_swarmui",
     "portrait_source_from_entity",
@@ -0,0 +1,316 @@
+"""Opt-in content-addressed asset store shared by sibling campaigns.
+
+Campaign folders keep their usual campaign-relative asset paths; when the
+store is enabled those paths are materialized as copy-on-write reflinks of a
+single object per SHA-256 digest instead of independent byte copies. Hardlinks
+are never used: a writer opening a campaign file with ``"wb"`` would rewrite
+the shared object and every other campaign with it. Where the filesystem
+cannot clone files (NTFS, ext4) assets are copied straight to the campaign
+and the store keeps nothing, so enabling it never writes a file twice.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from modules.helpers.config_helper import ConfigHelper
+from modules.helpers.logging_helper import log_module_import, log_warning
+
+log_module_import(__name__)
+
+SECTION = "SharedAssets"
+DEFAULT_STORE_DIRNAME = ".shared_assets"
+LINK_MODES = ("auto", "reflink", "copy")
+_FICLONE = 0x40049409
+_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class SharedAssetReport:
+    """Space accounting for every campaign file materialized from the store."""
+
+    objects: int
+    links: int
+    stored_bytes: int
+    referenced_bytes: int
+    copied_bytes: int
+
+    @property
+    def saved_bytes(self) -> int:
+        return max(0, self.referenced_bytes - self.stored_bytes - self.copied_bytes)
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as handle:
+        for chunk in iter(lambda: handle.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def try_reflink(source: Path, destination: Path) -> bool:
+    """Clone *source* into *destination* with copy-on-write when supported."""
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    try:
+        with source.open("rb") as src, destination.open("wb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    except OSError:
+        destination.unlink(missing_ok=True)
+        return False
+    shutil.copystat(source, destination)
+    return True
+
+
+class SharedAssetStore:
+    """Deduplicate campaign assets into ``objects/<aa>/<sha256>`` files."""
+
+    def __init__(self, root: Path, *, link_mode: str = "auto") -> None:
+        self.root = Path(root).expanduser()
+        self.objects_dir = self.root / "objects"
+        self.index_path = self.root / "index.db"
+        self.link_mode = link_mode if link_mode in LINK_MODES else "auto"
+        self._lock = threading.RLock()
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS objects (
+                    sha256 TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS links (
+                    path TEXT PRIMARY KEY,
+                    sha256 TEXT NOT NULL,
+                    method TEXT NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS links_sha256 ON links(sha256)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(str(self.index_path), timeout=5)
+        try:
+            conn.execute("PRAGMA busy_timeout = 5000")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest
+
+    def _ingest(self, source: Path, digest: str, size: int) -> Optional[Path]:
+        """Clone *source* into the store under *digest* unless it is already there.
+
+        Returns ``None`` when the filesystem cannot clone *source*.
+        """
+        target = self.object_path(digest)
+        if not target.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            temporary = target.with_name(f"{digest}.{os.getpid()}.tmp")
+            temporary.unlink(missing_ok=True)
+            if not try_reflink(source, temporary):
+                return None
+            os.replace(temporary, target)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO objects (sha256, size, created_at) VALUES (?, ?, ?)",
+                (digest, size, time.time()),
+            )
+        return target
+
+    def _record_link(self, destination: Path, digest: str, method: str) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO links (path, sha256, method) VALUES (?, ?, ?)",
+                (str(destination.resolve()), digest, method),
+            )
+
+    def materialize(
+        self,
+        source: Path,
+        destination: Path,
+        *,
+        digest: Optional[str] = None,
+    ) -> str:
+        """Place *source*'s content at *destination* and return the method used.
+
+        Without clone support *source* is copied straight to *destination*
+        and nothing is stored.
+        """
+        source = Path(source)
+        destination = Path(destination)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        temporary = destination.with_name(f".{destination.name}.{os.getpid()}.tmp")
+        temporary.unlink(missing_ok=True)
+        with self._lock:
+            stored = None
+            if self.link_mode != "copy":
+                digest = digest or _hash_file(source)
+                stored = self._ingest(source, digest, source.stat().st_size)
+            if stored is not None and try_reflink(stored, temporary):
+                os.replace(temporary, destination)
+                self._record_link(destination, digest, "reflink")
+                return "reflink"
+        shutil.copy2(source, temporary)
+        os.replace(temporary, destination)
+        return "copy"
+
+    def adopt(self, path: Path, *, digest: Optional[str] = None) -> str:
+        """Swap an existing campaign file for a reflink of its stored object.
+
+        Returns ``"skipped"`` and leaves the file alone when the filesystem
+        cannot clone it, since a copy would only add a second full-size file.
+        """
+        path = Path(path)
+        if self.link_mode == "copy":
+            return "skipped"
+        digest = digest or _hash_file(path)
+        with self._lock:
+            stored = self._ingest(path, digest, path.stat().st_size)
+            if stored is None:
+                return "skipped"
+            temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            temporary.unlink(missing_ok=True)
+            if not try_reflink(stored, temporary):
+                return "skipped"
+            os.replace(temporary, path)
+            self._record_link(path, digest, "reflink")
+        return "reflink"
+
+    def adopt_tree(self, directory: Path) -> int:
+        """Deduplicate every regular file below *directory*; return the count."""
+        adopted = 0
+        for path in sorted(Path(directory).rglob("*")):
+            # Process each path from the campaign asset tree.
+            if not path.is_file() or path.is_symlink():
+                continue
+            try:
+                if self.adopt(path) == "skipped":
+                    continue
+            except OSError as exc:
+                log_warning(
+                    f"Unable to deduplicate {path}: {exc}",
+                    func_name="modules.generic.shared_asset_store.SharedAssetStore.adopt_tree",
+                )
+                continue
+            adopted += 1
+        return adopted
+
+    def report(self) -> SharedAssetReport:
+        """Summarize stored versus referenced bytes, pruning vanished links."""
+        with self._lock, self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT links.path, links.method, objects.size
+                FROM links JOIN objects ON objects.sha256 = links.sha256
+                """
+            ).fetchall()
+            missing = [(path,) for path, _method, _size in rows if not Path(path).exists()]
+            if missing:
+                conn.executemany("DELETE FROM links WHERE path = ?", missing)
+            gone = {path for (path,) in missing}
+            live = [row for row in rows if row[0] not in gone]
+            objects, stored_bytes = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM objects"
+            ).fetchone()
+        return SharedAssetReport(
+            objects=int(objects),
+            links=len(live),
+            stored_bytes=int(stored_bytes),
+            referenced_bytes=sum(int(size) for _path, _method, size in live),
+            copied_bytes=sum(
+                int(size) for _path, method, size in live if method == "copy"
+            ),
+        )
+
+
+_STORE_CACHE: dict[tuple[str, str], SharedAssetStore] = {}
+_STORE_CACHE_LOCK = threading.Lock()
+
+
+def get_shared_asset_store(
+    campaign_dir: Optional[Path] = None,
+) -> Optional[SharedAssetStore]:
+    """Return the configured store, or ``None`` when deduplication is off."""
+    if not ConfigHelper.getboolean(SECTION, "enabled", fallback=False):
+        return None
+    configured = str(ConfigHelper.get(SECTION, "root", fallback="") or "").strip()
+    if configured:
+        root = Path(configured).expanduser()
+    else:
+        base = Path(campaign_dir or ConfigHelper.get_campaign_dir()).resolve()
+        root = base.parent / DEFAULT_STORE_DIRNAME
+    link_mode = str(ConfigHelper.get(SECTION, "link_mode", fallback="auto") or "auto")
+    key = (str(root.resolve()), link_mode.strip().lower())
+    with _STORE_CACHE_LOCK:
+        store = _STORE_CACHE.get(key)
+        if store is None:
+            store = SharedAssetStore(root, link_mode=key[1])
+            _STORE_CACHE[key] = store
+        return store
+
+
+def copy_into_campaign(
+    source: Path,
+    destination: Path,
+    *,
+    campaign_dir: Optional[Path] = None,
+    digest: Optional[str] = None,
+) -> Path:
+    """Copy an asset into a campaign, deduplicating through the store if enabled."""
+    destination = Path(destination)
+    store = get_shared_asset_store(campaign_dir)
+    if store is not None:
+        try:
+            store.materialize(Path(source), destination, digest=digest)
+            return destination
+        except OSError as exc:
+            log_warning(
+                f"Shared asset store unavailable, copying {source}: {exc}",
+                func_name="modules.generic.shared_asset_store.copy_into_campaign",
+            )
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copy2(source, destination)
+    return destination
+
+
+def adopt_into_store(
+    paths: Iterable[Path], *, campaign_dir: Optional[Path] = None
+) -> int:
+    """Deduplicate files that were already written into a campaign."""
+    store = get_shared_asset_store(campaign_dir)
+    if store is None:
+        return 0
+    adopted = 0
+    for path in paths:
+        # Process each path from paths.
+        try:
+            if store.adopt(Path(path)) == "skipped":
+                continue
+        except OSError as exc:
+            log_warning(
+                f"Unable to deduplicate {path}: {exc}",
+                func_name="modules.generic.shared_asset_store.adopt_into_store",
+            )
+            continue
+        adopted += 1
+    return adopted
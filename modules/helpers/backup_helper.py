@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import Callable, Iterable, Optional
 
 from modules.helpers.config_helper import ConfigHelper
+from modules.helpers.database_snapshot import database_snapshot
 from modules.helpers.logging_helper import (
     log_debug,
     log_exception,
@@ -186,7 +187,11 @@ def create_backup_archive(
     success = False
     try:
         # Keep backup archive resilient if this step fails.
-        with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        # Archive a consistent online snapshot instead of the live database
+        # file, which SQLite may be writing to while it is being zipped.
+        with database_snapshot(db_path) as snapshot, zipfile.ZipFile(
+            tmp_path, "w", compression=zipfile.ZIP_DEFLATED
+        ) as zf:
             # Keep this resource scoped to backup archive.
             total_items = len(sources) + 1  # Manifest counts as last step.
             for index, (src, arcname) in enumerate(sources, start=1):
@@ -195,6 +200,9 @@ def create_backup_archive(
                     f"Adding {arcname}",
                     index / total_items,
                 )
+                if src == db_path:
+                    src = snapshot.path
+                    manifest["files"][index - 1]["size"] = snapshot.size
                 zf.write(src, arcname)
             zf.writestr(BACKUP_MANIFEST_NAME, json.dumps(manifest, indent=2))
             _call_progress(progress_callback, "Finalizing archive...", 1.0)
@@ -0,0 +1,206 @@
+"""Shared, reference-counted online snapshots of the campaign database.
+
+Backups, synchronization and bundle exports all need a transactionally
+consistent copy of the live SQLite file. One operation takes a single online
+backup and hands it down: acquiring the snapshot's own path returns that
+lease. Independent requests for the live database only share a snapshot
+while the database is unchanged (same ``PRAGMA data_version`` and file
+mtimes); otherwise they get a fresh copy. The temporary copy is deleted when
+the last lease is released.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import shutil
+import sqlite3
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+from modules.helpers.logging_helper import log_module_import, log_warning
+
+log_module_import(__name__)
+
+BACKUP_PAGES_PER_STEP = 256
+BACKUP_STEP_SLEEP = 0.005
+_CHUNK_SIZE = 1024 * 1024
+
+
+class DatabaseSnapshot:
+    """A read-only copy of a SQLite database taken with the online backup API."""
+
+    def __init__(self, source: Path, path: Path) -> None:
+        self.source = source
+        self.path = path
+        self._sha256: Optional[str] = None
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return self.path.stat().st_size
+
+    @property
+    def sha256(self) -> str:
+        """Digest of the snapshot file, computed once and shared by all leases."""
+        with self._lock:
+            if self._sha256 is None:
+                digest = hashlib.sha256()
+                with self.path.open("rb") as handle:
+                    for chunk in iter(lambda: handle.read(_CHUNK_SIZE), b""):
+                        digest.update(chunk)
+                self._sha256 = digest.hexdigest()
+            return self._sha256
+
+    def copy_to(self, destination: Path) -> Path:
+        """Copy the snapshot to *destination*, e.g. into a staged bundle."""
+        destination = Path(destination)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(self.path, destination)
+        return destination
+
+
+class _Entry:
+    def __init__(self) -> None:
+        self.snapshot: Optional[DatabaseSnapshot] = None
+        self.refs = 0
+        self.lock = threading.Lock()
+        self.temp_dir: Optional[Path] = None
+        self.watcher: Optional[sqlite3.Connection] = None
+        self.stamp: Optional[tuple] = None
+
+
+def _file_stamp(source: Path) -> tuple:
+    """Return the mtimes of *source* and its WAL, which move on every commit."""
+    stamp = []
+    for path in (source, source.with_name(source.name + "-wal")):
+        try:
+            stamp.append(path.stat().st_mtime_ns)
+        except OSError:
+            stamp.append(None)
+    return tuple(stamp)
+
+
+class DatabaseSnapshotService:
+    """Hand out leases on one snapshot per live database at a time."""
+
+    def __init__(
+        self,
+        *,
+        pages: int = BACKUP_PAGES_PER_STEP,
+        sleep: float = BACKUP_STEP_SLEEP,
+    ) -> None:
+        self.pages = pages
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self._entries: dict[Path, _Entry] = {}
+        self._by_snapshot: dict[Path, _Entry] = {}
+
+    def active_count(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @contextmanager
+    def acquire(self, database_path: Path) -> Iterator[DatabaseSnapshot]:
+        """Yield a snapshot of *database_path*.
+
+        Passing the path of a snapshot that is already leased returns that
+        snapshot, which is how one operation shares its backup with the
+        helpers it calls. A live database path reuses an active snapshot only
+        if nothing has been committed since it was taken.
+        """
+        requested = Path(database_path).resolve()
+        with self._lock:
+            entry = self._by_snapshot.get(requested)
+            key = entry.snapshot.source if entry is not None else requested
+            if entry is None:
+                entry = self._entries.get(key)
+                if entry is None or not self._is_current(key, entry):
+                    entry = self._entries[key] = _Entry()
+            entry.refs += 1
+        try:
+            with entry.lock:
+                if entry.snapshot is None:
+                    self._create(key, entry)
+            yield entry.snapshot
+        finally:
+            self._release(key, entry)
+
+    @staticmethod
+    def _is_current(source: Path, entry: _Entry) -> bool:
+        """Whether *entry* still matches the live database; called with the lock held."""
+        if entry.watcher is None:
+            # Still being created, so it is at least as recent as this request.
+            return entry.snapshot is None
+        try:
+            data_version = entry.watcher.execute("PRAGMA data_version").fetchone()[0]
+        except sqlite3.Error:
+            return False
+        return entry.stamp == (data_version, _file_stamp(source))
+
+    def _create(self, source: Path, entry: _Entry) -> None:
+        if not source.is_file():
+            raise FileNotFoundError(source)
+        temp_dir = Path(tempfile.mkdtemp(prefix="gmcd_db_snapshot_"))
+        destination_path = temp_dir / source.name
+        # The watcher stays open for the lease so later requests can ask
+        # whether another connection has committed since the backup began.
+        watcher = sqlite3.connect(
+            f"file:{source.as_posix()}?mode=ro", uri=True, check_same_thread=False
+        )
+        try:
+            stamp = (watcher.execute("PRAGMA data_version").fetchone()[0], _file_stamp(source))
+            reader = sqlite3.connect(f"file:{source.as_posix()}?mode=ro", uri=True)
+            writer = sqlite3.connect(str(destination_path))
+            try:
+                # Copy a few pages per step so writers on the live database
+                # are only blocked briefly between steps.
+                reader.backup(writer, pages=self.pages, sleep=self.sleep)
+            finally:
+                writer.close()
+                reader.close()
+        except Exception:
+            watcher.close()
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            raise
+        entry.temp_dir = temp_dir
+        entry.snapshot = DatabaseSnapshot(source, destination_path)
+        with self._lock:
+            entry.watcher = watcher
+            entry.stamp = stamp
+            self._by_snapshot[destination_path.resolve()] = entry
+
+    def _release(self, key: Path, entry: _Entry) -> None:
+        with self._lock:
+            entry.refs -= 1
+            if entry.refs > 0:
+                return
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+            if entry.snapshot is not None:
+                self._by_snapshot.pop(entry.snapshot.path.resolve(), None)
+            if entry.watcher is not None:
+                entry.watcher.close()
+                entry.watcher = None
+        if entry.temp_dir is not None:
+            try:
+                shutil.rmtree(entry.temp_dir)
+            except OSError as exc:
+                log_warning(
+                    f"Unable to remove database snapshot {entry.temp_dir}: {exc}",
+                    func_name="modules.helpers.database_snapshot.DatabaseSnapshotService._release",
+                )
+
+
+_DEFAULT_SERVICE = DatabaseSnapshotService()
+
+
+def get_snapshot_service() -> DatabaseSnapshotService:
+    return _DEFAULT_SERVICE
+
+
+def database_snapshot(database_path: Path):
+    """Lease a snapshot of *database_path* from the default service."""
+    return _DEFAULT_SERVICE.acquire(database_path)
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import hashlib
 import json
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional, Set
 
 from modules.helpers.config_helper import ConfigHelper
 from modules.helpers.logging_helper import log_exception, log_module_import
@@ -18,6 +19,7 @@ class PDFHashTracker:
     """Track imported PDF hashes to avoid repeated imports."""
 
     HISTORY_FILENAME = "imported_pdfs.json"
+    _lock = threading.RLock()
 
     @classmethod
     def _history_path(cls) -> Path:
@@ -36,8 +38,8 @@ class PDFHashTracker:
         return sha256.hexdigest()
 
     @classmethod
-    def _load_history(cls) -> Dict[str, Dict[str, str]]:
-        """Load history."""
+    def _load_document(cls) -> dict:
+        """Load the whole history file."""
         path = cls._history_path()
         if not path.exists():
             return {}
@@ -45,7 +47,7 @@ class PDFHashTracker:
             # Keep history resilient if this step fails.
             with open(path, "r", encoding="utf-8") as handle:
                 data = json.load(handle)
-            return data.get("hashes", {}) if isinstance(data, dict) else {}
+            return data if isinstance(data, dict) else {}
         except Exception as exc:
             log_exception(
                 f"Unable to read PDF import history: {exc}",
@@ -54,20 +56,34 @@ class PDFHashTracker:
             return {}
 
     @classmethod
-    def _save_history(cls, hashes: Dict[str, Dict[str, str]]):
-        """Save history."""
+    def _save_document(cls, data: dict):
+        """Save the whole history file."""
         path = cls._history_path()
         try:
             # Keep history resilient if this step fails.
             path.parent.mkdir(parents=True, exist_ok=True)
             with open(path, "w", encoding="utf-8") as handle:
-                json.dump({"hashes": hashes}, handle, indent=2)
+                json.dump(data, handle, indent=2)
         except Exception as exc:
             log_exception(
                 f"Unable to store PDF import history: {exc}",
                 func_name="PDFHashTracker._save_history",
             )
 
+    @classmethod
+    def _load_history(cls) -> Dict[str, Dict[str, str]]:
+        """Load history."""
+        hashes = cls._load_document().get("hashes", {})
+        return hashes if isinstance(hashes, dict) else {}
+
+    @classmethod
+    def _save_history(cls, hashes: Dict[str, Dict[str, str]]):
+        """Save history."""
+        with cls._lock:
+            data = cls._load_document()
+            data["hashes"] = hashes
+            cls._save_document(data)
+
     @classmethod
     def get_record(cls, pdf_hash: str) -> Optional[Dict[str, str]]:
         """Return record."""
@@ -82,9 +98,62 @@ class PDFHashTracker:
     @classmethod
     def record_import(cls, pdf_hash: str, source_path: str):
         """Handle record import."""
-        hashes = cls._load_history()
-        hashes[pdf_hash] = {
-            "path": str(source_path),
-            "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
-        }
-        cls._save_history(hashes)
+        with cls._lock:
+            hashes = cls._load_history()
+            hashes[pdf_hash] = {
+                "path": str(source_path),
+                "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            }
+            cls._save_history(hashes)
+
+    # Chunked imports -----------------------------------------------------
+    # Partially imported documents are tracked under "partial" so they are
+    # not reported as already imported until every chunk has been saved.
+
+    @classmethod
+    def completed_chunks(cls, pdf_hash: str, import_key: str, total_chunks: int) -> Set[int]:
+        """Return the chunk indexes already saved for an interrupted import.
+
+        Progress recorded for a different chunk layout is ignored.
+        """
+        partial = cls._load_document().get("partial", {})
+        entry = partial.get(pdf_hash, {}).get(import_key) if isinstance(partial, dict) else None
+        if not isinstance(entry, dict) or entry.get("total") != int(total_chunks):
+            return set()
+        return {int(index) for index in entry.get("done", []) if 0 <= int(index) < total_chunks}
+
+    @classmethod
+    def record_chunk(cls, pdf_hash: str, import_key: str, chunk_index: int, total_chunks: int):
+        """Record that one chunk of an import has been persisted."""
+        cls.record_chunks(pdf_hash, import_key, [chunk_index], total_chunks)
+
+    @classmethod
+    def record_chunks(cls, pdf_hash: str, import_key: str, chunk_indexes: Iterable[int], total_chunks: int):
+        """Record several persisted chunks with one history write."""
+        with cls._lock:
+            data = cls._load_document()
+            partial = data.setdefault("partial", {})
+            entry = partial.setdefault(pdf_hash, {}).get(import_key)
+            if not isinstance(entry, dict) or entry.get("total") != int(total_chunks):
+                entry = {"total": int(total_chunks), "done": []}
+            done = set(entry.get("done", [])) | {int(index) for index in chunk_indexes}
+            entry["done"] = sorted(done)
+            entry["updated"] = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+            partial[pdf_hash][import_key] = entry
+            cls._save_document(data)
+
+    @classmethod
+    def clear_chunks(cls, pdf_hash: str, import_key: Optional[str] = None):
+        """Forget chunk progress for *pdf_hash* (one import, or all of them)."""
+        with cls._lock:
+            data = cls._load_document()
+            partial = data.get("partial", {})
+            if not isinstance(partial, dict) or pdf_hash not in partial:
+                return
+            if import_key is None:
+                partial.pop(pdf_hash, None)
+            else:
+                partial[pdf_hash].pop(import_key, None)
+                if not partial[pdf_hash]:
+                    partial.pop(pdf_hash, None)
+            cls._save_document(data)
@@ -0,0 +1,407 @@
+"""Persistent, resumable SwarmUI portrait job queue.
+
+Jobs live in one SQLite file and move through ``queued`` -> ``submitted``
+-> ``downloaded`` -> ``ready``.  Each transition is committed before the
+next stage starts, so a crash or restart resumes from the last completed
+stage instead of regenerating everything still in flight: submitted jobs
+keep their SwarmUI image paths, downloaded jobs keep their spooled files.
+
+Submissions and downloads run on separate bounded thread pools; results
+are thumbnailed with :func:`make_thumbnail` on a third pool.
+
+Candidates stay in the spool folder until the user picks one: saving the
+selection copies it into the campaign and :meth:`PortraitJobQueue.discard`
+deletes the job with all its candidates.  Finished jobs nobody picked from,
+such as those completed by :func:`resume_pending_portrait_jobs` after a
+restart, are kept for ``DEFAULT_RETENTION_DAYS`` and then pruned.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+from modules.helpers.config_helper import ConfigHelper
+from modules.helpers.logging_helper import log_module_import, log_warning
+from modules.helpers.swarmui_portrait_service import (
+    SWARM_API_URL,
+    HttpClient,
+    PortraitGenerationSource,
+    SwarmUIPortraitError,
+    SwarmUIPortraitSettings,
+    _http,
+    build_portrait_prompt,
+    create_swarm_session,
+    make_thumbnail,
+    request_text_to_image,
+)
+
+log_module_import(__name__)
+
+QUEUED = "queued"
+SUBMITTED = "submitted"
+DOWNLOADED = "downloaded"
+READY = "ready"
+FAILED = "failed"
+ACTIVE_STATES = (QUEUED, SUBMITTED, DOWNLOADED)
+
+DEFAULT_MAX_SUBMISSIONS = 1
+DEFAULT_MAX_DOWNLOADS = 4
+DEFAULT_THUMBNAIL_WORKERS = 2
+DEFAULT_RETENTION_DAYS = 7
+
+
+@dataclass
+class PortraitJob:
+    """One queued portrait generation and how far it has progressed."""
+
+    id: int
+    entity_name: str
+    prompt: str
+    settings: SwarmUIPortraitSettings
+    state: str = QUEUED
+    image_paths: list[str] = field(default_factory=list)
+    files: list[str] = field(default_factory=list)
+    error: str = ""
+    thumbnails: list[Any] = field(default_factory=list, compare=False, repr=False)
+
+
+def default_queue_dir() -> Path:
+    """Return the campaign folder holding the queue database and spooled images."""
+    return Path(ConfigHelper.get_campaign_dir()) / "assets" / "generated" / ".portrait_queue"
+
+
+class PortraitJobQueue:
+    """SQLite-backed portrait queue with bounded parallel submission and downloads."""
+
+    def __init__(
+        self,
+        queue_dir: str | Path | None = None,
+        *,
+        http_client: HttpClient | None = None,
+        max_submissions: int = DEFAULT_MAX_SUBMISSIONS,
+        max_downloads: int = DEFAULT_MAX_DOWNLOADS,
+        thumbnail_workers: int = DEFAULT_THUMBNAIL_WORKERS,
+    ) -> None:
+        self.queue_dir = Path(queue_dir) if queue_dir is not None else default_queue_dir()
+        self.queue_dir.mkdir(parents=True, exist_ok=True)
+        self.max_submissions = max(1, int(max_submissions))
+        self.max_downloads = max(1, int(max_downloads))
+        self.thumbnail_workers = max(1, int(thumbnail_workers))
+        self._http_client = http_client
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._claimed: set[int] = set()
+        self._session_lock = threading.Lock()
+        self._session_id: Optional[str] = None
+        self._conn = sqlite3.connect(str(self.queue_dir / "jobs.sqlite3"), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS portrait_jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    entity_name TEXT NOT NULL,
+                    prompt TEXT NOT NULL,
+                    settings TEXT NOT NULL,
+                    state TEXT NOT NULL,
+                    image_paths TEXT NOT NULL DEFAULT '[]',
+                    files TEXT NOT NULL DEFAULT '[]',
+                    error TEXT NOT NULL DEFAULT '',
+                    updated_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS portrait_jobs_state ON portrait_jobs(state)")
+
+    def enqueue(
+        self,
+        source: PortraitGenerationSource,
+        settings: SwarmUIPortraitSettings,
+        *,
+        template: dict[str, Any] | None = None,
+        prompt_fields: list[str] | None = None,
+    ) -> PortraitJob:
+        """Queue a portrait for *source*; nothing is sent until :meth:`run`."""
+        prompt = build_portrait_prompt(source, template, prompt_fields=prompt_fields)
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO portrait_jobs(entity_name, prompt, settings, state, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (source.name, prompt, json.dumps(asdict(settings)), QUEUED, time.time()),
+            )
+        return PortraitJob(int(cursor.lastrowid), source.name, prompt, settings)
+
+    def jobs(self, states: Iterable[str] | None = None) -> list[PortraitJob]:
+        """Return jobs in insertion order, optionally filtered by state."""
+        query = "SELECT id, entity_name, prompt, settings, state, image_paths, files, error FROM portrait_jobs"
+        params: tuple = ()
+        if states is not None:
+            params = tuple(states)
+            query += f" WHERE state IN ({', '.join('?' for _ in params)})"
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY id", params).fetchall()
+        return [self._job_from_row(row) for row in rows]
+
+    def pending_jobs(self) -> list[PortraitJob]:
+        """Return jobs that are neither ready nor failed yet."""
+        return self.jobs(ACTIVE_STATES)
+
+    def generate(
+        self,
+        source: PortraitGenerationSource,
+        settings: SwarmUIPortraitSettings,
+        *,
+        template: dict[str, Any] | None = None,
+        prompt_fields: list[str] | None = None,
+    ) -> PortraitJob:
+        """Queue one portrait, drive it to ``ready`` or ``failed`` and return it."""
+        job = self.enqueue(source, settings, template=template, prompt_fields=prompt_fields)
+        for done in self.run(job_ids=[job.id]):
+            return done
+        # Another run (e.g. the startup resume) claimed the job first.
+        return self.wait_for(job.id)
+
+    def wait_for(self, job_id: int, timeout: float | None = None) -> PortraitJob:
+        """Block until *job_id* leaves the active states and return it."""
+        query = (
+            "SELECT id, entity_name, prompt, settings, state, image_paths, files, error "
+            "FROM portrait_jobs WHERE id = ?"
+        )
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._changed:
+            while True:
+                row = self._conn.execute(query, (job_id,)).fetchone()
+                if row is None:
+                    raise KeyError(job_id)
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if row[4] not in ACTIVE_STATES or (remaining is not None and remaining <= 0):
+                    return self._job_from_row(row)
+                self._changed.wait(remaining)
+
+    def run(
+        self,
+        *,
+        job_ids: Iterable[int] | None = None,
+        on_job_done: Callable[[PortraitJob], None] | None = None,
+        stop_event: threading.Event | None = None,
+    ) -> list[PortraitJob]:
+        """Drive pending jobs to ``ready`` (or ``failed``) and return them.
+
+        Jobs left over from an earlier run resume from their saved state;
+        *job_ids* limits the run to those jobs. A job already driven by another
+        concurrent run is skipped. When *stop_event* is set no new stage
+        starts; running stages finish and everything else stays queued for
+        the next run.
+        """
+        finished: list[PortraitJob] = []
+        with ThreadPoolExecutor(self.max_submissions, thread_name_prefix="swarmui-submit") as submit_pool, \
+                ThreadPoolExecutor(self.max_downloads, thread_name_prefix="swarmui-download") as download_pool, \
+                ThreadPoolExecutor(self.thumbnail_workers, thread_name_prefix="swarmui-thumbnail") as thumbnail_pool:
+            stages = {
+                QUEUED: (submit_pool, self._submit),
+                SUBMITTED: (download_pool, self._download),
+                DOWNLOADED: (thumbnail_pool, self._finish),
+            }
+            in_flight = {}
+
+            def schedule(job: PortraitJob) -> None:
+                stopping = stop_event is not None and stop_event.is_set()
+                if job.state not in stages or stopping:
+                    with self._lock:
+                        self._claimed.discard(job.id)
+                if job.state not in stages:
+                    finished.append(job)
+                    if on_job_done is not None:
+                        on_job_done(job)
+                    return
+                if stopping:
+                    return
+                pool, stage = stages[job.state]
+                in_flight[pool.submit(stage, job)] = job
+
+            for job in self._claim(job_ids):
+                schedule(job)
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = in_flight.pop(future)
+                    try:
+                        future.result()
+                    except Exception as exc:
+                        self._fail(job, exc)
+                    schedule(job)
+        return finished
+
+    def retry_failed(self) -> int:
+        """Put failed jobs back in the queue, resuming from what they already have."""
+        failed = self.jobs([FAILED])
+        for job in failed:
+            job.state = DOWNLOADED if job.files else SUBMITTED if job.image_paths else QUEUED
+            job.error = ""
+            self._save(job)
+        return len(failed)
+
+    def discard(self, job_id: int) -> None:
+        """Delete a job and its spooled candidates once they are no longer needed."""
+        with self._changed, self._conn:
+            self._conn.execute("DELETE FROM portrait_jobs WHERE id = ?", (job_id,))
+            self._changed.notify_all()
+        for path in self.queue_dir.glob(f"job{int(job_id)}_*"):
+            try:
+                path.unlink()
+            except OSError as exc:
+                log_warning(f"Could not delete spooled portrait {path}: {exc}", func_name="PortraitJobQueue.discard")
+
+    def prune(self, max_age_days: float = DEFAULT_RETENTION_DAYS) -> int:
+        """Discard ready and failed jobs untouched for *max_age_days*; return how many."""
+        cutoff = time.time() - max(0.0, float(max_age_days)) * 86400
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id FROM portrait_jobs WHERE state IN (?, ?) AND updated_at < ?",
+                (READY, FAILED, cutoff),
+            ).fetchall()
+        for (job_id,) in rows:
+            self.discard(int(job_id))
+        return len(rows)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _claim(self, job_ids: Iterable[int] | None) -> list[PortraitJob]:
+        """Reserve the pending jobs this run will drive."""
+        wanted = None if job_ids is None else set(job_ids)
+        pending = self.pending_jobs()
+        with self._lock:
+            claimed = [
+                job for job in pending
+                if job.id not in self._claimed and (wanted is None or job.id in wanted)
+            ]
+            self._claimed.update(job.id for job in claimed)
+        return claimed
+
+    def _submit(self, job: PortraitJob) -> None:
+        job.image_paths = request_text_to_image(
+            self._session(), job.prompt, job.settings, http_client=self._http_client
+        )
+        job.state = SUBMITTED
+        self._save(job)
+
+    def _download(self, job: PortraitJob) -> None:
+        """Fetch every image not already spooled; partial downloads survive a restart."""
+        http_client = _http(self._http_client)
+        files = []
+        for index, rel_path in enumerate(job.image_paths):
+            target = self.queue_dir / f"job{job.id}_{index}{Path(rel_path).suffix or '.png'}"
+            if not target.exists():
+                try:
+                    response = http_client.get(f"{SWARM_API_URL}/{rel_path}")
+                    response.raise_for_status()
+                except Exception as exc:
+                    log_warning(
+                        f"Skipping portrait image {rel_path}: {exc}",
+                        func_name="PortraitJobQueue._download",
+                    )
+                    continue
+                partial = target.with_suffix(target.suffix + ".part")
+                partial.write_bytes(response.content)
+                partial.replace(target)
+            files.append(str(target))
+        if not files:
+            raise SwarmUIPortraitError("Failed to download generated images.")
+        job.files = files
+        job.state = DOWNLOADED
+        self._save(job)
+
+    def _finish(self, job: PortraitJob) -> None:
+        """Thumbnail the spooled candidates; they stay in the spool until discarded."""
+        job.thumbnails = [make_thumbnail(Path(path).read_bytes()) for path in job.files]
+        job.state = READY
+        self._save(job)
+
+    def _fail(self, job: PortraitJob, exc: Exception) -> None:
+        log_warning(f"Portrait job {job.id} for {job.entity_name} failed: {exc}", func_name="PortraitJobQueue.run")
+        job.state = FAILED
+        job.error = str(exc)
+        self._save(job)
+
+    def _session(self) -> str:
+        """Return the SwarmUI session shared by this queue's submissions."""
+        with self._session_lock:
+            if self._session_id is None:
+                self._session_id = create_swarm_session(http_client=self._http_client)
+            return self._session_id
+
+    def _save(self, job: PortraitJob) -> None:
+        with self._changed, self._conn:
+            self._changed.notify_all()
+            self._conn.execute(
+                "UPDATE portrait_jobs SET state = ?, image_paths = ?, files = ?, error = ?, "
+                "updated_at = ? WHERE id = ?",
+                (
+                    job.state,
+                    json.dumps(job.image_paths),
+                    json.dumps(job.files),
+                    job.error,
+                    time.time(),
+                    job.id,
+                ),
+            )
+
+    @staticmethod
+    def _job_from_row(row) -> PortraitJob:
+        job_id, entity_name, prompt, settings, state, image_paths, files, error = row
+        return PortraitJob(
+            id=int(job_id),
+            entity_name=entity_name,
+            prompt=prompt,
+            settings=SwarmUIPortraitSettings(**json.loads(settings)),
+            state=state,
+            image_paths=json.loads(image_paths),
+            files=json.loads(files),
+            error=error,
+        )
+
+
+_SHARED: dict[Path, PortraitJobQueue] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def get_portrait_job_queue() -> PortraitJobQueue:
+    """Return the shared portrait queue of the current campaign."""
+    queue_dir = default_queue_dir()
+    with _SHARED_LOCK:
+        queue = _SHARED.get(queue_dir)
+        if queue is None:
+            queue = _SHARED[queue_dir] = PortraitJobQueue(queue_dir)
+        return queue
+
+
+def resume_pending_portrait_jobs(queue: PortraitJobQueue | None = None) -> Optional[threading.Thread]:
+    """Finish jobs interrupted by an earlier session on a daemon thread.
+
+    Finished jobs past the retention period are pruned first.  Without
+    *queue*, a campaign that never queued a portrait is left alone.
+    """
+    if queue is None:
+        if not (default_queue_dir() / "jobs.sqlite3").exists():
+            return None
+        queue = get_portrait_job_queue()
+    queue.prune()
+    if not queue.pending_jobs():
+        return None
+
+    def worker() -> None:
+        try:
+            queue.run()
+        except Exception as exc:
+            log_warning(f"Could not resume portrait jobs: {exc}", func_name="resume_pending_portrait_jobs")
+
+    thread = threading.Thread(target=worker, name="swarmui-portrait-resume", daemon=True)
+    thread.start()
+    return thread
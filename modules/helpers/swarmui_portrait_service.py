@@ -1,7 +1,8 @@
 """UI-independent SwarmUI portrait generation service."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import partial
 from io import BytesIO
 import os
 from pathlib import Path
@@ -9,11 +10,11 @@ import shutil
 import subprocess
 import tempfile
 import time
-from typing import Any, Protocol
+from typing import Any, Callable, Optional, Protocol
 
 from PIL import Image
-import requests
 
+from modules.ai.http_pool import get_backend_pool
 from modules.helpers import text_helpers
 from modules.helpers.config_helper import ConfigHelper
 from modules.helpers.filename_helper import safe_filename_component
@@ -59,10 +60,15 @@ class PortraitGenerationSource:
 
 @dataclass(frozen=True)
 class GeneratedPortraitCandidate:
-    """A downloaded SwarmUI portrait candidate before user selection."""
+    """A downloaded SwarmUI portrait candidate before user selection.
+
+    ``release`` deletes the queue job the candidate came from, together with
+    the candidates that were not chosen.
+    """
 
     image_bytes: bytes
     thumbnail: Image.Image
+    release: Optional[Callable[[], None]] = field(default=None, compare=False, repr=False)
 
 
 @dataclass(frozen=True)
@@ -77,6 +83,11 @@ class SwarmUIPortraitError(RuntimeError):
     """Raised when SwarmUI portrait generation or persistence fails."""
 
 
+def _http(http_client: HttpClient | None) -> HttpClient:
+    """Default to the shared, rate-limited SwarmUI connection pool."""
+    return http_client if http_client is not None else get_backend_pool("swarmui")
+
+
 def launch_swarmui(*, startup_delay: float = 120.0) -> None:
     """Launch SwarmUI when it is not already running."""
     global _SWARMUI_PROCESS
@@ -124,20 +135,38 @@ def generate_portrait_candidates(
     *,
     template: dict[str, Any] | None = None,
     prompt_fields: list[str] | None = None,
-    http_client: HttpClient = requests,
+    queue=None,
 ) -> list[GeneratedPortraitCandidate]:
-    """Generate and download SwarmUI portrait candidates without UI side effects."""
-    session_id = create_swarm_session(http_client=http_client)
-    prompt = build_portrait_prompt(source, template, prompt_fields=prompt_fields)
-    image_paths = request_text_to_image(session_id, prompt, settings, http_client=http_client)
-    image_bytes = download_generated_images(image_paths, http_client=http_client)
-    if not image_bytes:
-        raise SwarmUIPortraitError("Failed to download generated images.")
-    return [GeneratedPortraitCandidate(content, make_thumbnail(content)) for content in image_bytes]
-
-
-def create_swarm_session(*, http_client: HttpClient = requests) -> str:
+    """Generate portrait candidates through the persistent portrait job queue.
+
+    The job survives a restart and its candidates stay in the queue spool
+    until one is saved or :func:`discard_portrait_candidates` is called.
+    *queue* defaults to the campaign's shared queue.
+    """
+    from modules.helpers.swarmui_portrait_queue import FAILED, get_portrait_job_queue
+
+    queue = queue if queue is not None else get_portrait_job_queue()
+    job = queue.generate(source, settings, template=template, prompt_fields=prompt_fields)
+    if job.state == FAILED:
+        raise SwarmUIPortraitError(job.error or "Portrait generation failed.")
+    release = partial(queue.discard, job.id)
+    candidates = []
+    for index, path in enumerate(job.files):
+        content = Path(path).read_bytes()
+        thumbnail = job.thumbnails[index] if index < len(job.thumbnails) else make_thumbnail(content)
+        candidates.append(GeneratedPortraitCandidate(content, thumbnail, release))
+    return candidates
+
+
+def discard_portrait_candidates(candidates: list[GeneratedPortraitCandidate]) -> None:
+    """Delete the spooled candidates of a selection the user abandoned."""
+    for release in {candidate.release for candidate in candidates if candidate.release is not None}:
+        release()
+
+
+def create_swarm_session(*, http_client: HttpClient | None = None) -> str:
     """Create a SwarmUI API session and return its session id."""
+    http_client = _http(http_client)
     response = http_client.post(f"{SWARM_API_URL}/API/GetNewSession", json={}, headers={"Content-Type": "application/json"})
     response.raise_for_status()
     session_id = response.json().get("session_id")
@@ -151,9 +180,10 @@ def request_text_to_image(
     prompt: str,
     settings: SwarmUIPortraitSettings,
     *,
-    http_client: HttpClient = requests,
+    http_client: HttpClient | None = None,
 ) -> list[str]:
     """Submit a GenerateText2Image request and return generated image paths."""
+    http_client = _http(http_client)
     payload = {
         "session_id": session_id,
         "images": settings.image_count,
@@ -174,8 +204,9 @@ def request_text_to_image(
     return [str(image) for image in images]
 
 
-def download_generated_images(image_paths: list[str], *, http_client: HttpClient = requests) -> list[bytes]:
+def download_generated_images(image_paths: list[str], *, http_client: HttpClient | None = None) -> list[bytes]:
     """Download generated images, skipping individual failed downloads."""
+    http_client = _http(http_client)
     images_bytes: list[bytes] = []
     for rel_path in image_paths:
         try:
@@ -201,12 +232,17 @@ def save_generated_portrait_candidate(
     *,
     copy_portrait,
 ) -> GeneratedPortraitResult:
-    """Persist a selected candidate to portraits and assets/generated."""
+    """Persist a selected candidate to portraits and assets/generated.
+
+    The spooled candidates of its job are deleted once the copy is saved.
+    """
     portrait_path, generated_path = store_generated_portrait_bytes(
         source.name,
         candidate.image_bytes,
         copy_portrait=copy_portrait,
     )
+    if candidate.release is not None:
+        candidate.release()
     return GeneratedPortraitResult([portrait_path], [generated_path] if generated_path else [])
 
 
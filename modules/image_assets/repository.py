@@ -7,7 +7,9 @@ import uuid
 from typing import Any, Iterable
 
 from modules.generic.generic_model_wrapper import GenericModelWrapper
+from modules.helpers.logging_helper import log_warning
 from modules.image_assets.paths import InvalidAssetReference, normalize_asset_reference
+from modules.image_assets.search.persistent_index import ImageSearchIndex
 
 
 class ImageAssetsRepository:
@@ -16,6 +18,28 @@ class ImageAssetsRepository:
     def __init__(self, wrapper: GenericModelWrapper | None = None) -> None:
         """Initialize repository with optional wrapper override."""
         self.wrapper = wrapper or GenericModelWrapper("image_assets")
+        self._search_index: ImageSearchIndex | None = None
+
+    def search_index(self) -> ImageSearchIndex | None:
+        """Return the persistent search index, or ``None`` for non-SQLite wrappers."""
+        if not isinstance(self.wrapper, GenericModelWrapper) or self.wrapper.entity_type != "image_assets":
+            return None
+        if self._search_index is None:
+            self._search_index = ImageSearchIndex(self.wrapper._db_path)
+        return self._search_index
+
+    def _refresh_search_index(self) -> None:
+        """Fold the rows just written into the search index."""
+        index = self.search_index()
+        if index is None:
+            return
+        try:
+            index.refresh()
+        except Exception as exc:
+            log_warning(
+                f"Unable to refresh image search index: {exc}",
+                func_name="ImageAssetsRepository._refresh_search_index",
+            )
 
     def list_all(self) -> list[dict[str, Any]]:
         """Return all persisted image-asset rows."""
@@ -28,22 +52,9 @@ class ImageAssetsRepository:
             hash_value=str(payload.get("Hash") or "").strip(),
             path=str(payload.get("Path") or "").strip(),
         )
-
-        now = self._utc_now_iso()
-        merged = dict(existing or {})
-        merged.update(payload)
-
-        if existing:
-            merged["AssetId"] = existing.get("AssetId")
-            merged["ImportedAt"] = (
-                existing.get("ImportedAt") or payload.get("ImportedAt") or now
-            )
-        else:
-            merged["AssetId"] = str(payload.get("AssetId") or uuid.uuid4())
-            merged["ImportedAt"] = payload.get("ImportedAt") or now
-
-        merged["UpdatedAt"] = payload.get("UpdatedAt") or now
+        merged = self._merge(payload, existing, self._utc_now_iso())
         self.wrapper.save_item(merged, key_field="AssetId")
+        self._refresh_search_index()
         return merged
 
     def replace_by_path(self, payload: dict[str, Any]) -> dict[str, Any]:
@@ -51,8 +62,34 @@ class ImageAssetsRepository:
         payload = self._normalize_payload(payload)
         path = str(payload.get("Path") or "").strip()
         existing = self._find_existing_by_path(path) if path else None
+        merged = self._merge(payload, existing, self._utc_now_iso())
+        self.wrapper.save_item(merged, key_field="AssetId")
+        self._refresh_search_index()
+        return merged
 
+    def bulk_upsert(
+        self, entries: Iterable[tuple[dict[str, Any], dict[str, Any] | None]]
+    ) -> list[dict[str, Any]]:
+        """Write many ``(payload, matched existing row)`` pairs in one transaction.
+
+        Callers resolve the existing row themselves (from maps loaded once), so
+        no per-row table scans happen here.
+        """
         now = self._utc_now_iso()
+        merged = [
+            self._merge(self._normalize_payload(payload), existing, now)
+            for payload, existing in entries
+        ]
+        if merged:
+            self.wrapper.save_items(merged, replace=False)
+            self._refresh_search_index()
+        return merged
+
+    @staticmethod
+    def _merge(
+        payload: dict[str, Any], existing: dict[str, Any] | None, now: str
+    ) -> dict[str, Any]:
+        """Merge a normalized payload into its existing row, keeping identity."""
         merged = dict(existing or {})
         merged.update(payload)
 
@@ -66,7 +103,6 @@ class ImageAssetsRepository:
             merged["ImportedAt"] = payload.get("ImportedAt") or now
 
         merged["UpdatedAt"] = payload.get("UpdatedAt") or now
-        self.wrapper.save_item(merged, key_field="AssetId")
         return merged
 
     def delete_stale_files(self, active_paths: Iterable[str]) -> int:
@@ -86,6 +122,7 @@ class ImageAssetsRepository:
 
         if stale_count:
             self.wrapper.save_items(kept, replace=True)
+            self._refresh_search_index()
         return stale_count
 
     def list_paginated(
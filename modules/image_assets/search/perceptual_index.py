@@ -0,0 +1,268 @@
+"""Perceptual-hash index used to find near-duplicate library images.
+
+Every ``image_assets`` row gets a 64-bit difference hash (dHash) stored in
+``image_perceptual_hashes`` next to the content hash it was computed from, so
+only new or re-imported files are decoded again.  Near-duplicate queries run
+over a :class:`BKTree` keyed by Hamming distance, which keeps lookups well
+below a full pairwise comparison on large libraries.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Generic, Iterator, Optional, TypeVar
+
+from PIL import Image
+
+from db.db import get_connection
+from modules.helpers.logging_helper import log_module_import, log_warning
+from modules.image_assets.paths import resolve_asset_reference
+
+log_module_import(__name__)
+
+SOURCE_TABLE = "image_assets"
+HASH_TABLE = "image_perceptual_hashes"
+HASH_SIZE = 8
+_WRITE_BATCH_ROWS = 200
+
+T = TypeVar("T")
+HashFile = Callable[[Path], int]
+ProgressCallback = Callable[[int, int], None]
+
+
+def _dhash_bits(pixels: list[int], hash_size: int = HASH_SIZE) -> int:
+    """Fold a ``(hash_size + 1) x hash_size`` grayscale grid into a hash."""
+    width = hash_size + 1
+    value = 0
+    for row in range(hash_size):
+        offset = row * width
+        for column in range(hash_size):
+            value = (value << 1) | (pixels[offset + column] > pixels[offset + column + 1])
+    return value
+
+
+def difference_hash(image, hash_size: int = HASH_SIZE) -> int:
+    """Return the dHash of a PIL image.
+
+    The hash compares neighbouring pixels of a tiny grayscale copy, so it is
+    stable across rescaling, recompression and format changes.
+    """
+    resample = getattr(getattr(Image, "Resampling", Image), "LANCZOS", None)
+    size = (hash_size + 1, hash_size)
+    small = image.convert("L").resize(size, resample) if resample else image.convert("L").resize(size)
+    return _dhash_bits(list(small.getdata()), hash_size)
+
+
+def compute_file_dhash(path: Path) -> int:
+    """Decode *path* at reduced size and return its dHash."""
+    with Image.open(path) as image:
+        if hasattr(image, "draft"):
+            # JPEG decoders can skip most of the work for tiny targets.
+            image.draft("L", (HASH_SIZE * 8, HASH_SIZE * 8))
+        return difference_hash(image)
+
+
+def hamming_distance(left: int, right: int) -> int:
+    return (left ^ right).bit_count()
+
+
+def _to_sqlite(value: int) -> int:
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def _from_sqlite(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
+
+
+class BKTree(Generic[T]):
+    """Burkhard-Keller tree over 64-bit hashes with Hamming distance.
+
+    Items sharing the same hash live on one node, so exact perceptual matches
+    never deepen the tree.
+    """
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self) -> None:
+        self._root: Optional[list] = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, value: int, item: T) -> None:
+        self._size += 1
+        if self._root is None:
+            self._root = [value, [item], {}]
+            return
+        node = self._root
+        while True:
+            distance = hamming_distance(value, node[0])
+            if distance == 0:
+                node[1].append(item)
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = [value, [item], {}]
+                return
+            node = child
+
+    def search(self, value: int, max_distance: int) -> list[tuple[int, T]]:
+        """Return ``(distance, item)`` for every item within *max_distance*."""
+        if self._root is None:
+            return []
+        matches: list[tuple[int, T]] = []
+        stack = [self._root]
+        while stack:
+            node_value, items, children = stack.pop()
+            distance = hamming_distance(value, node_value)
+            if distance <= max_distance:
+                matches.extend((distance, item) for item in items)
+            low, high = distance - max_distance, distance + max_distance
+            stack.extend(child for edge, child in children.items() if low <= edge <= high)
+        return matches
+
+
+@dataclass(frozen=True)
+class PerceptualHashUpdate:
+    hashed: int
+    failed: int
+    cancelled: bool = False
+
+
+class PerceptualHashIndex:
+    """Maintain perceptual hashes for the ``image_assets`` rows of one database."""
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        *,
+        hash_file: HashFile = compute_file_dhash,
+        resolve_path: Callable[[str], Path] = resolve_asset_reference,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        self._db_path = db_path
+        self._hash_file = hash_file
+        self._resolve_path = resolve_path
+        self.max_workers = max_workers or min(8, os.cpu_count() or 2)
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        conn = sqlite3.connect(self._db_path) if self._db_path else get_connection()
+        conn.execute("PRAGMA busy_timeout = 5000")
+        columns = {row[1] for row in conn.execute(f"PRAGMA table_info({SOURCE_TABLE})")}
+        if "AssetId" not in columns:
+            conn.close()
+            return None
+        with conn:
+            conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {HASH_TABLE} (
+                    asset_id TEXT PRIMARY KEY,
+                    content_hash TEXT,
+                    dhash INTEGER,
+                    error TEXT
+                )
+                """
+            )
+        return conn
+
+    def update(
+        self,
+        *,
+        progress: Optional[ProgressCallback] = None,
+        cancelled: Optional[Callable[[], bool]] = None,
+    ) -> PerceptualHashUpdate:
+        """Hash assets that are new or whose file content changed.
+
+        Failures are recorded against the content hash so unreadable files are
+        not retried until they change.
+        """
+        conn = self._connect()
+        if conn is None:
+            return PerceptualHashUpdate(0, 0)
+        with closing(conn):
+            with conn:
+                conn.execute(
+                    f"DELETE FROM {HASH_TABLE} WHERE asset_id NOT IN "
+                    f"(SELECT AssetId FROM {SOURCE_TABLE} WHERE AssetId IS NOT NULL)"
+                )
+            stale = conn.execute(
+                f"""
+                SELECT a.AssetId, a.Path, COALESCE(a.Hash, '')
+                FROM {SOURCE_TABLE} a
+                LEFT JOIN {HASH_TABLE} h ON h.asset_id = a.AssetId
+                WHERE COALESCE(a.AssetId, '') != ''
+                  AND (h.asset_id IS NULL OR COALESCE(h.content_hash, '') != COALESCE(a.Hash, ''))
+                """
+            ).fetchall()
+            total = len(stale)
+            hashed = failed = 0
+            if progress:
+                progress(0, total)
+            if not stale:
+                return PerceptualHashUpdate(0, 0)
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for start in range(0, total, _WRITE_BATCH_ROWS):
+                    if cancelled and cancelled():
+                        return PerceptualHashUpdate(hashed, failed, cancelled=True)
+                    batch = stale[start : start + _WRITE_BATCH_ROWS]
+                    rows = list(executor.map(self._hash_row, batch))
+                    with conn:
+                        conn.executemany(
+                            f"INSERT OR REPLACE INTO {HASH_TABLE}"
+                            "(asset_id, content_hash, dhash, error) VALUES (?, ?, ?, ?)",
+                            rows,
+                        )
+                    failed += sum(1 for row in rows if row[3])
+                    hashed += sum(1 for row in rows if not row[3])
+                    if progress:
+                        progress(start + len(batch), total)
+        return PerceptualHashUpdate(hashed, failed)
+
+    def _hash_row(self, row: tuple[str, str, str]) -> tuple[str, str, Optional[int], Optional[str]]:
+        asset_id, path, content_hash = row
+        try:
+            value = self._hash_file(self._resolve_path(path))
+        except Exception as exc:
+            log_warning(
+                f"Unable to compute perceptual hash for {path}: {exc}",
+                func_name="modules.image_assets.search.perceptual_index.PerceptualHashIndex._hash_row",
+            )
+            return asset_id, content_hash, None, str(exc) or type(exc).__name__
+        return asset_id, content_hash, _to_sqlite(int(value)), None
+
+    def hashes(self) -> dict[str, int]:
+        """Return ``{asset_id: dhash}`` for every successfully hashed asset."""
+        conn = self._connect()
+        if conn is None:
+            return {}
+        with closing(conn):
+            return {
+                asset_id: _from_sqlite(value)
+                for asset_id, value in conn.execute(
+                    f"SELECT asset_id, dhash FROM {HASH_TABLE} WHERE dhash IS NOT NULL"
+                )
+            }
+
+    def iter_near_links(self, max_distance: int) -> Iterator[tuple[str, str, int]]:
+        """Yield ``(asset_id, other_id, distance)`` links between near duplicates.
+
+        Assets with an identical hash are chained to the first of them rather
+        than paired exhaustively, which is enough to build connected groups.
+        """
+        by_hash: dict[int, list[str]] = {}
+        for asset_id, value in sorted(self.hashes().items()):
+            by_hash.setdefault(value, []).append(asset_id)
+        tree: BKTree[str] = BKTree()
+        for value, asset_ids in by_hash.items():
+            anchor = asset_ids[0]
+            for other in asset_ids[1:]:
+                yield anchor, other, 0
+            for distance, other in tree.search(value, max_distance):
+                yield other, anchor, distance
+            tree.add(value, anchor)
@@ -0,0 +1,418 @@
+"""Persistent, incrementally maintained search index for the image library.
+
+The index lives next to ``image_assets`` in the campaign database: a row
+table with secondary indexes for the structured filters and sort keys, and an
+FTS5 table over the searchable blob.  Triggers on ``image_assets`` queue
+changed asset ids in ``image_search_pending`` so writes made by any code path
+are picked up; :meth:`ImageSearchIndex.refresh` re-indexes only those ids.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from contextlib import closing
+from typing import Any, Iterable, Optional
+
+from db.db import get_connection
+from modules.generic.json_value_deserializer import deserialize_possible_json
+from modules.helpers.logging_helper import log_module_import, log_warning
+from modules.image_assets.paths import normalize_asset_reference
+from modules.image_assets.search.indexing import (
+    build_searchable_blob,
+    normalize_extension,
+    normalize_query,
+    normalize_tag,
+    tokenize_query,
+)
+
+log_module_import(__name__)
+
+SOURCE_TABLE = "image_assets"
+ROWS_TABLE = "image_search_rows"
+FTS_TABLE = "image_search_fts"
+PENDING_TABLE = "image_search_pending"
+META_TABLE = "image_search_meta"
+INDEX_VERSION = "1"
+
+_SORT_CLAUSES = {
+    "name_asc": "r.name_lower ASC",
+    "name_desc": "r.name_lower DESC",
+    "updated_asc": "r.updated_at ASC",
+    "updated_desc": "r.updated_at DESC",
+    "size_asc": "COALESCE(r.file_size_bytes, 0) ASC",
+    "size_desc": "COALESCE(r.file_size_bytes, 0) DESC",
+}
+
+# Database file -> whether FTS5 is available there, for schemas already ensured
+# by this process; the DDL below then runs once per database, not per query.
+_READY_SCHEMAS: dict[str, bool] = {}
+_READY_SCHEMAS_LOCK = threading.Lock()
+
+
+def _as_optional_int(value: object) -> int | None:
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _database_file(conn: sqlite3.Connection) -> str:
+    """Return the file behind *conn*'s main database ("" for in-memory)."""
+    for _seq, name, filename in conn.execute("PRAGMA database_list"):
+        if name == "main":
+            return filename or ""
+    return ""
+
+
+def build_indexed_row(item: dict[str, Any]) -> dict[str, Any]:
+    """Project one ``image_assets`` record onto the fields search works with."""
+    tags = item.get("Tags") if isinstance(item.get("Tags"), list) else []
+    search_tokens = item.get("SearchTokens") if isinstance(item.get("SearchTokens"), list) else []
+    searchable_blob = str(item.get("SearchableBlob") or "")
+    if not searchable_blob:
+        searchable_blob = build_searchable_blob(
+            name=str(item.get("Name") or ""),
+            path=str(item.get("Path") or ""),
+            relative_path=str(item.get("RelativePath") or ""),
+            source_root=str(item.get("SourceRoot") or ""),
+            extension=str(item.get("Extension") or ""),
+            tags=tags,
+            name_normalized=str(item.get("NameNormalized") or ""),
+            search_tokens=search_tokens,
+            source_folder_name=str(item.get("SourceFolderName") or ""),
+        )
+
+    stored_value = str(item.get("RelativePath") or item.get("Path") or "")
+    try:
+        stored_path = normalize_asset_reference(stored_value)
+    except ValueError:
+        stored_path = stored_value.replace("\\", "/")
+    return {
+        "asset_id": str(item.get("AssetId") or ""),
+        "name": str(item.get("Name") or ""),
+        "path": stored_path,
+        "relative_path": stored_path,
+        "source_root": str(item.get("SourceRoot") or ""),
+        "source_folder_name": str(item.get("SourceFolderName") or ""),
+        "extension": str(item.get("Extension") or ""),
+        "width": _as_optional_int(item.get("Width")),
+        "height": _as_optional_int(item.get("Height")),
+        "file_size_bytes": _as_optional_int(item.get("FileSizeBytes")),
+        "tags": [str(tag) for tag in tags],
+        "name_normalized": str(item.get("NameNormalized") or ""),
+        "searchable_blob": searchable_blob,
+        "updated_at": str(item.get("UpdatedAt") or ""),
+    }
+
+
+class ImageSearchIndex:
+    """Query and maintain the image-library search tables of one database."""
+
+    def __init__(self, db_path: Optional[str] = None) -> None:
+        self._db_path = db_path
+        self._fts_enabled: Optional[bool] = None
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        conn = sqlite3.connect(self._db_path) if self._db_path else get_connection()
+        conn.execute("PRAGMA busy_timeout = 5000")
+        if not self._ensure_schema(conn):
+            conn.close()
+            return None
+        return conn
+
+    def _ensure_schema(self, conn: sqlite3.Connection) -> bool:
+        database = _database_file(conn)
+        with _READY_SCHEMAS_LOCK:
+            ready = _READY_SCHEMAS.get(database) if database else None
+        if ready is not None:
+            self._fts_enabled = ready
+            return True
+        columns = {row[1] for row in conn.execute(f"PRAGMA table_info({SOURCE_TABLE})")}
+        if "AssetId" not in columns:
+            return False
+        self._create_schema(conn)
+        if database:
+            with _READY_SCHEMAS_LOCK:
+                _READY_SCHEMAS[database] = bool(self._fts_enabled)
+        return True
+
+    def _create_schema(self, conn: sqlite3.Connection) -> None:
+        with conn:
+            conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {ROWS_TABLE} (
+                    asset_id TEXT PRIMARY KEY,
+                    name TEXT,
+                    name_lower TEXT,
+                    name_normalized TEXT,
+                    path TEXT,
+                    source_root TEXT,
+                    source_folder_name TEXT,
+                    folder_key TEXT,
+                    extension TEXT,
+                    extension_key TEXT,
+                    width INTEGER,
+                    height INTEGER,
+                    file_size_bytes INTEGER,
+                    tags TEXT,
+                    tag_keys TEXT,
+                    searchable_blob TEXT,
+                    updated_at TEXT
+                )
+                """
+            )
+            for column in ("width", "height", "extension_key", "folder_key", "updated_at", "name_lower"):
+                conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS {ROWS_TABLE}_{column} ON {ROWS_TABLE}({column})"
+                )
+            conn.execute(f"CREATE TABLE IF NOT EXISTS {PENDING_TABLE} (asset_id TEXT PRIMARY KEY)")
+            conn.execute(f"CREATE TABLE IF NOT EXISTS {META_TABLE} (key TEXT PRIMARY KEY, value TEXT)")
+            if self._fts_enabled is None:
+                try:
+                    conn.execute(
+                        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} "
+                        "USING fts5(asset_id UNINDEXED, searchable_blob)"
+                    )
+                    self._fts_enabled = True
+                except sqlite3.OperationalError as exc:
+                    log_warning(
+                        f"SQLite FTS5 unavailable, image search falls back to substring matching: {exc}",
+                        func_name="modules.image_assets.search.persistent_index.ImageSearchIndex._ensure_schema",
+                    )
+                    self._fts_enabled = False
+            for event, refs in (
+                ("INSERT", ("NEW",)),
+                ("UPDATE", ("OLD", "NEW")),
+                ("DELETE", ("OLD",)),
+            ):
+                body = "".join(
+                    f"INSERT OR IGNORE INTO {PENDING_TABLE}(asset_id) "
+                    f"SELECT {ref}.AssetId WHERE {ref}.AssetId IS NOT NULL; "
+                    for ref in refs
+                )
+                conn.execute(
+                    f"CREATE TRIGGER IF NOT EXISTS {PENDING_TABLE}_{event.lower()} "
+                    f"AFTER {event} ON {SOURCE_TABLE} BEGIN {body}END"
+                )
+            version = conn.execute(
+                f"SELECT value FROM {META_TABLE} WHERE key = 'version'"
+            ).fetchone()
+            if version is None or version[0] != INDEX_VERSION:
+                # First use (or a format change): queue every asset once.
+                conn.execute(f"DELETE FROM {ROWS_TABLE}")
+                if self._fts_enabled:
+                    conn.execute(f"DELETE FROM {FTS_TABLE}")
+                conn.execute(
+                    f"INSERT OR IGNORE INTO {PENDING_TABLE}(asset_id) "
+                    f"SELECT AssetId FROM {SOURCE_TABLE} WHERE COALESCE(AssetId, '') != ''"
+                )
+                conn.execute(
+                    f"INSERT OR REPLACE INTO {META_TABLE}(key, value) VALUES ('version', ?)",
+                    (INDEX_VERSION,),
+                )
+
+    def refresh(self) -> int:
+        """Re-index assets changed since the last refresh; return how many."""
+        conn = self._connect()
+        if conn is None:
+            return 0
+        with closing(conn):
+            return self._refresh(conn)
+
+    def _refresh(self, conn: sqlite3.Connection) -> int:
+        pending = [row[0] for row in conn.execute(f"SELECT asset_id FROM {PENDING_TABLE}")]
+        if not pending:
+            return 0
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                for start in range(0, len(pending), 500):
+                    self._reindex(conn, pending[start : start + 500])
+        finally:
+            conn.row_factory = None
+        return len(pending)
+
+    def _reindex(self, conn: sqlite3.Connection, asset_ids: list[str]) -> None:
+        placeholders = ", ".join("?" for _ in asset_ids)
+        conn.execute(f"DELETE FROM {ROWS_TABLE} WHERE asset_id IN ({placeholders})", asset_ids)
+        if self._fts_enabled:
+            conn.execute(f"DELETE FROM {FTS_TABLE} WHERE asset_id IN ({placeholders})", asset_ids)
+        records = conn.execute(
+            f"SELECT * FROM {SOURCE_TABLE} WHERE AssetId IN ({placeholders})", asset_ids
+        ).fetchall()
+        rows = []
+        for record in records:
+            item = {key: deserialize_possible_json(record[key]) for key in record.keys()}
+            row = build_indexed_row(item)
+            if row["asset_id"]:
+                rows.append(row)
+        conn.executemany(
+            f"""
+            INSERT OR REPLACE INTO {ROWS_TABLE} (
+                asset_id, name, name_lower, name_normalized, path, source_root,
+                source_folder_name, folder_key, extension, extension_key, width, height,
+                file_size_bytes, tags, tag_keys, searchable_blob, updated_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    row["asset_id"],
+                    row["name"],
+                    row["name"].lower(),
+                    row["name_normalized"],
+                    row["path"],
+                    row["source_root"],
+                    row["source_folder_name"],
+                    row["source_folder_name"].strip().lower(),
+                    row["extension"],
+                    normalize_extension(row["extension"]),
+                    row["width"],
+                    row["height"],
+                    row["file_size_bytes"],
+                    json.dumps(row["tags"]),
+                    "\n" + "\n".join(normalize_tag(tag) for tag in row["tags"]) + "\n",
+                    row["searchable_blob"],
+                    row["updated_at"],
+                )
+                for row in rows
+            ],
+        )
+        if self._fts_enabled:
+            conn.executemany(
+                f"INSERT INTO {FTS_TABLE}(asset_id, searchable_blob) VALUES (?, ?)",
+                [(row["asset_id"], row["searchable_blob"]) for row in rows],
+            )
+        conn.execute(f"DELETE FROM {PENDING_TABLE} WHERE asset_id IN ({placeholders})", asset_ids)
+
+    def search(
+        self,
+        normalized_query: str,
+        filters: Any,
+        *,
+        sort: str,
+        limit: int,
+        offset: int,
+    ) -> Optional[tuple[list[dict[str, Any]], int]]:
+        """Return ``(rows, total)`` for one page of results, or ``None`` on failure.
+
+        Rows use the same shape as :func:`build_indexed_row`.
+        """
+        try:
+            conn = self._connect()
+            if conn is None:
+                return None
+            with closing(conn):
+                self._refresh(conn)
+                return self._search(conn, normalized_query, filters, sort, limit, offset)
+        except sqlite3.Error as exc:
+            log_warning(
+                f"Persistent image search failed: {exc}",
+                func_name="modules.image_assets.search.persistent_index.ImageSearchIndex.search",
+            )
+            return None
+
+    def _search(self, conn, normalized_query, filters, sort, limit, offset):
+        """Run one page of a search.
+
+        FTS only matches word prefixes, so its hits are unioned with a
+        substring match on every term: "ore" finds "Ore Mine" and "Forest".
+        """
+        terms = tokenize_query(normalized_query)
+        where: list[str] = []
+        params: list[Any] = []
+        if terms:
+            substring = " AND ".join("instr(r.searchable_blob, ?) > 0" for _ in terms)
+            if self._fts_enabled:
+                where.append(
+                    f"(r.asset_id IN (SELECT asset_id FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH ?) "
+                    f"OR ({substring}))"
+                )
+                params.append(" ".join(f'"{term}"*' for term in terms))
+            else:
+                where.append(f"({substring})")
+            params.extend(terms)
+        self._filter_clauses(filters, where, params)
+
+        sql_from = f" FROM {ROWS_TABLE} r"
+        sql_where = f" WHERE {' AND '.join(where)}" if where else ""
+        total = conn.execute(f"SELECT COUNT(*){sql_from}{sql_where}", params).fetchone()[0]
+
+        order_params: list[Any] = []
+        order = _SORT_CLAUSES.get(sort)
+        if order is None:
+            if terms:
+                name_hit = " AND ".join("instr(r.name_normalized, ?) > 0" for _ in terms)
+                token_score = " + ".join("(instr(r.searchable_blob, ?) > 0)" for _ in terms)
+                order = f"({name_hit}) DESC, ({token_score}) DESC, r.updated_at DESC"
+                order_params = [*terms, *terms]
+            else:
+                order = "r.updated_at DESC"
+        rows = conn.execute(
+            f"SELECT r.asset_id, r.name, r.path, r.source_root, r.source_folder_name, r.extension, "
+            f"r.width, r.height, r.file_size_bytes, r.tags, r.name_normalized, r.searchable_blob, "
+            f"r.updated_at{sql_from}{sql_where} ORDER BY {order}, r.rowid LIMIT ? OFFSET ?",
+            [*params, *order_params, int(limit), int(offset)],
+        ).fetchall()
+        return [self._row_dict(row) for row in rows], int(total)
+
+    @staticmethod
+    def _filter_clauses(filters: Any, where: list[str], params: list[Any]) -> None:
+        if filters is None:
+            return
+        if filters.filename:
+            filename_term = normalize_query(filters.filename)
+            if filename_term:
+                where.append("instr(r.name_normalized, ?) > 0")
+                params.append(filename_term)
+        if filters.extension:
+            expected_ext = normalize_extension(filters.extension)
+            if expected_ext:
+                where.append("r.extension_key = ?")
+                params.append(expected_ext)
+        for requested in filters.tags or []:
+            normalized_requested = normalize_tag(requested)
+            if normalized_requested:
+                where.append("instr(r.tag_keys, ?) > 0")
+                params.append(f"\n{normalized_requested}\n")
+        folders = sorted(
+            {str(name).strip().lower() for name in filters.source_folder_names or [] if str(name).strip()}
+        )
+        if folders:
+            where.append(f"r.folder_key IN ({', '.join('?' for _ in folders)})")
+            params.extend(folders)
+        for column, operator, value in (
+            ("width", ">=", filters.min_width),
+            ("width", "<=", filters.max_width),
+            ("height", ">=", filters.min_height),
+            ("height", "<=", filters.max_height),
+        ):
+            if value is not None:
+                where.append(f"r.{column} {operator} ?")
+                params.append(int(value))
+
+    @staticmethod
+    def _row_dict(row: Iterable[Any]) -> dict[str, Any]:
+        (asset_id, name, path, source_root, folder, extension, width, height, size,
+         tags, name_normalized, blob, updated_at) = row
+        try:
+            tag_list = json.loads(tags) if tags else []
+        except ValueError:
+            tag_list = []
+        return {
+            "asset_id": asset_id,
+            "name": name,
+            "path": path,
+            "relative_path": path,
+            "source_root": source_root,
+            "source_folder_name": folder,
+            "extension": extension,
+            "width": width,
+            "height": height,
+            "file_size_bytes": size,
+            "tags": tag_list,
+            "name_normalized": name_normalized,
+            "searchable_blob": blob,
+            "updated_at": updated_at,
+        }
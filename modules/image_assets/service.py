@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable
 
 from modules.image_assets.repository import ImageAssetsRepository
+from modules.image_assets.services.duplicate_service import (
+    DEFAULT_MAX_DISTANCE,
+    DuplicateGroup,
+    DuplicateMergeResult,
+    ImageDuplicateService,
+)
 from modules.image_assets.services.import_service import (
     ImageAssetImportService,
     ImageAssetsImportSummary,
+    ImageImportPlan,
+    ProgressCallback,
 )
 from modules.image_assets.services.search_service import (
     ImageAssetSearchResultDTO,
@@ -25,6 +33,7 @@ class ImageAssetsService:
         self.repository = repository or ImageAssetsRepository()
         self.import_service = ImageAssetImportService(self.repository)
         self.search_service = ImageAssetSearchService(self.repository)
+        self.duplicate_service = ImageDuplicateService(self.repository)
 
     def upsert_asset(self, payload: dict[str, Any]) -> dict[str, Any]:
         """Upsert one image asset by hash/path."""
@@ -69,6 +78,8 @@ class ImageAssetsService:
         recursive: bool,
         reindex_changed_only: bool,
         update_existing_files: bool = True,
+        *,
+        progress: ProgressCallback | None = None,
     ) -> ImageAssetsImportSummary:
         """Import many directories through the dedicated import workflow."""
         return self.import_service.import_directories(
@@ -76,4 +87,27 @@ class ImageAssetsService:
             recursive=recursive,
             reindex_changed_only=reindex_changed_only,
             update_existing_files=update_existing_files,
+            progress=progress,
+        )
+
+    def plan_directory_import(self, paths: list[str], recursive: bool) -> ImageImportPlan:
+        """Dry-run an import and estimate its throughput."""
+        return self.import_service.plan_directories(paths, recursive)
+
+    def find_duplicates(
+        self,
+        max_distance: int = DEFAULT_MAX_DISTANCE,
+        *,
+        progress: ProgressCallback | None = None,
+        cancelled: Callable[[], bool] | None = None,
+    ) -> list[DuplicateGroup]:
+        """Group exact and perceptually similar images."""
+        return self.duplicate_service.find_duplicates(
+            max_distance, progress=progress, cancelled=cancelled
         )
+
+    def merge_duplicates(
+        self, groups: Iterable[DuplicateGroup], *, delete_files: bool = False
+    ) -> list[DuplicateMergeResult]:
+        """Merge duplicate groups into their keepers and reclaim disk space."""
+        return self.duplicate_service.merge_groups(groups, delete_files=delete_files)
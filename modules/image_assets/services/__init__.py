@@ -1,6 +1,15 @@
 """Image-asset services package."""
 
-from modules.image_assets.services.import_service import ImageAssetImportService, ImageAssetsImportSummary
+from modules.image_assets.services.duplicate_service import (
+    DuplicateGroup,
+    DuplicateMergeResult,
+    ImageDuplicateService,
+)
+from modules.image_assets.services.import_service import (
+    ImageAssetImportService,
+    ImageAssetsImportSummary,
+    ImageImportPlan,
+)
 from modules.image_assets.services.search_service import (
     ImageAssetSearchService,
     ImageSearchFilters,
@@ -8,8 +17,12 @@ from modules.image_assets.services.search_service import (
 )
 
 __all__ = [
+    "DuplicateGroup",
+    "DuplicateMergeResult",
+    "ImageDuplicateService",
     "ImageAssetImportService",
     "ImageAssetsImportSummary",
+    "ImageImportPlan",
     "ImageAssetSearchService",
     "ImageSearchFilters",
     "SortOption",
@@ -0,0 +1,410 @@
+"""Find and merge duplicate images in the shared library."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from contextlib import closing
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+from db.db import get_connection
+from modules.helpers.config_helper import ConfigHelper
+from modules.helpers.logging_helper import log_warning
+from modules.image_assets.paths import InvalidAssetReference, resolve_asset_reference
+from modules.image_assets.repository import ImageAssetsRepository
+from modules.image_assets.search.perceptual_index import (
+    HASH_TABLE,
+    PerceptualHashIndex,
+    ProgressCallback,
+)
+
+DEFAULT_MAX_DISTANCE = 6
+_LAYOUT_FILES = ("gm_table_layouts.json",)
+# Tables owned by the image library itself; their rows are dropped, not rewritten.
+_SKIPPED_TABLE_PREFIXES = ("image_assets", "image_search_", HASH_TABLE, "sqlite_")
+
+
+@dataclass(slots=True)
+class DuplicateGroup:
+    """Assets that show the same picture, with the copy worth keeping first."""
+
+    assets: list[dict[str, Any]]
+    exact: bool
+    max_distance: int = 0
+
+    @property
+    def keeper(self) -> dict[str, Any]:
+        return self.assets[0]
+
+    @property
+    def duplicates(self) -> list[dict[str, Any]]:
+        return self.assets[1:]
+
+    @property
+    def reclaimable_bytes(self) -> int:
+        keeper_path = self.keeper.get("Path")
+        seen: set[str] = set()
+        total = 0
+        for asset in self.duplicates:
+            path = str(asset.get("Path") or "")
+            if path and path != keeper_path and path not in seen:
+                seen.add(path)
+                total += int(asset.get("FileSizeBytes") or 0)
+        return total
+
+
+@dataclass(slots=True)
+class DuplicateMergeResult:
+    """Outcome of folding duplicates into a keeper asset."""
+
+    keeper_id: str
+    removed_ids: list[str] = field(default_factory=list)
+    references_updated: int = 0
+    files_deleted: int = 0
+    bytes_reclaimed: int = 0
+    # Files kept on disk because something still names them in a form the rewrite missed.
+    unresolved_references: list[str] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+
+
+def _keeper_rank(asset: dict[str, Any]) -> tuple:
+    """Prefer the largest resolution, then the largest file, then the oldest row."""
+    width = int(asset.get("Width") or 0)
+    height = int(asset.get("Height") or 0)
+    return (
+        -(width * height),
+        -int(asset.get("FileSizeBytes") or 0),
+        str(asset.get("ImportedAt") or "~"),
+        str(asset.get("Path") or ""),
+    )
+
+
+class _DisjointSet:
+    def __init__(self) -> None:
+        self._parent: dict[str, str] = {}
+
+    def find(self, item: str) -> str:
+        parent = self._parent.setdefault(item, item)
+        while parent != self._parent[parent]:
+            self._parent[parent] = self._parent[self._parent[parent]]
+            parent = self._parent[parent]
+        self._parent[item] = parent
+        return parent
+
+    def union(self, left: str, right: str) -> None:
+        left_root, right_root = self.find(left), self.find(right)
+        if left_root != right_root:
+            self._parent[max(left_root, right_root)] = min(left_root, right_root)
+
+    def groups(self) -> dict[str, list[str]]:
+        grouped: dict[str, list[str]] = {}
+        for item in list(self._parent):
+            grouped.setdefault(self.find(item), []).append(item)
+        return grouped
+
+
+class ImageDuplicateService:
+    """Group exact and near-duplicate assets and merge them on request."""
+
+    def __init__(
+        self,
+        repository: ImageAssetsRepository,
+        *,
+        hash_index: PerceptualHashIndex | None = None,
+        campaign_dir: str | Path | None = None,
+    ) -> None:
+        self.repository = repository
+        self._hash_index = hash_index
+        self._campaign_dir = campaign_dir
+
+    @property
+    def hash_index(self) -> PerceptualHashIndex:
+        if self._hash_index is None:
+            self._hash_index = PerceptualHashIndex(self._db_path())
+        return self._hash_index
+
+    def _db_path(self) -> Optional[str]:
+        return getattr(self.repository.wrapper, "_db_path", None)
+
+    def _campaign_root(self) -> Path:
+        return Path(self._campaign_dir or ConfigHelper.get_campaign_dir())
+
+    def find_duplicates(
+        self,
+        max_distance: int = DEFAULT_MAX_DISTANCE,
+        *,
+        progress: ProgressCallback | None = None,
+        cancelled: Callable[[], bool] | None = None,
+    ) -> list[DuplicateGroup]:
+        """Hash pending assets, then group those within *max_distance* bits.
+
+        Assets sharing a content hash always group together, whatever the
+        perceptual distance.  Groups come back largest reclaimable size first.
+        """
+        self.hash_index.update(progress=progress, cancelled=cancelled)
+        assets = {
+            str(asset.get("AssetId")): asset
+            for asset in self.repository.list_all()
+            if asset.get("AssetId")
+        }
+        links = _DisjointSet()
+        by_content: dict[str, str] = {}
+        for asset_id, asset in assets.items():
+            content_hash = str(asset.get("Hash") or "").strip()
+            if content_hash:
+                anchor = by_content.setdefault(content_hash, asset_id)
+                if anchor != asset_id:
+                    links.union(anchor, asset_id)
+        distances: dict[str, int] = {}
+        for left, right, distance in self.hash_index.iter_near_links(max(0, int(max_distance))):
+            if left in assets and right in assets:
+                links.union(left, right)
+                for asset_id in (left, right):
+                    distances[asset_id] = max(distances.get(asset_id, 0), distance)
+
+        groups = []
+        for members in links.groups().values():
+            if len(members) < 2:
+                continue
+            ordered = sorted((assets[asset_id] for asset_id in members), key=_keeper_rank)
+            content_hashes = {str(asset.get("Hash") or "") for asset in ordered}
+            exact = len(content_hashes) == 1 and "" not in content_hashes
+            groups.append(
+                DuplicateGroup(
+                    assets=ordered,
+                    exact=exact,
+                    max_distance=0 if exact else max(distances.get(asset_id, 0) for asset_id in members),
+                )
+            )
+        groups.sort(key=lambda group: (-group.reclaimable_bytes, -len(group.assets)))
+        return groups
+
+    def merge(
+        self,
+        keeper_id: str,
+        duplicate_ids: Iterable[str],
+        *,
+        delete_files: bool = False,
+    ) -> DuplicateMergeResult:
+        """Point every reference at the keeper and drop the duplicate rows.
+
+        References are rewritten in every campaign table and in GM Table
+        layouts; the duplicates' tags are folded into the keeper.  With
+        *delete_files*, a file is deleted only once no asset row points at it
+        and its name no longer appears anywhere in the campaign database or
+        layouts; otherwise it is kept and listed in ``unresolved_references``.
+        """
+        duplicate_ids = [str(asset_id) for asset_id in duplicate_ids if str(asset_id) != str(keeper_id)]
+        result = DuplicateMergeResult(keeper_id=str(keeper_id))
+        if not duplicate_ids:
+            return result
+        assets = {str(asset.get("AssetId")): asset for asset in self.repository.list_all()}
+        keeper = assets.get(str(keeper_id))
+        if keeper is None:
+            raise KeyError(f"Unknown image asset: {keeper_id}")
+        duplicates = [assets[asset_id] for asset_id in duplicate_ids if asset_id in assets]
+        if not duplicates:
+            return result
+        keeper_path = str(keeper.get("Path") or "")
+        replacements = {
+            str(asset.get("Path") or ""): keeper_path
+            for asset in duplicates
+            if asset.get("Path") and asset.get("Path") != keeper_path
+        }
+        tags = list(keeper.get("Tags") or [])
+        for asset in duplicates:
+            tags.extend(tag for tag in asset.get("Tags") or [] if tag not in tags)
+
+        db_path = self._db_path()
+        conn = sqlite3.connect(db_path) if db_path else get_connection()
+        with closing(conn):
+            conn.execute("PRAGMA busy_timeout = 5000")
+            with conn:
+                result.references_updated = self._rewrite_tables(conn, replacements)
+                conn.execute(
+                    "UPDATE image_assets SET Tags = ?, UpdatedAt = ? WHERE AssetId = ?",
+                    (json.dumps(tags), self.repository._utc_now_iso(), keeper.get("AssetId")),
+                )
+                placeholders = ", ".join("?" for _ in duplicates)
+                removed = [str(asset.get("AssetId")) for asset in duplicates]
+                conn.execute(f"DELETE FROM image_assets WHERE AssetId IN ({placeholders})", removed)
+                if conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (HASH_TABLE,)
+                ).fetchone():
+                    conn.execute(f"DELETE FROM {HASH_TABLE} WHERE asset_id IN ({placeholders})", removed)
+                remaining_paths = {
+                    row[0] for row in conn.execute("SELECT Path FROM image_assets WHERE Path IS NOT NULL")
+                }
+                leftovers = {
+                    path: self._leftover_references(conn, path, keeper_path)
+                    for path in replacements
+                    if delete_files and path not in remaining_paths
+                }
+        result.removed_ids = removed
+        self.repository._refresh_search_index()
+        result.references_updated += self._rewrite_layout_files(replacements)
+
+        if delete_files:
+            for path in replacements:
+                if path in remaining_paths:
+                    continue
+                sources = leftovers.get(path, []) + self._leftover_layout_references(path, keeper_path)
+                if sources:
+                    result.unresolved_references.extend(f"{path} ({source})" for source in sources)
+                    continue
+                try:
+                    file_path = resolve_asset_reference(path, self._campaign_dir)
+                    size = file_path.stat().st_size
+                    file_path.unlink()
+                except FileNotFoundError:
+                    continue
+                except (OSError, InvalidAssetReference) as exc:
+                    result.errors.append(f"{path}: {exc}")
+                    continue
+                result.files_deleted += 1
+                result.bytes_reclaimed += size
+        return result
+
+    def merge_groups(
+        self, groups: Iterable[DuplicateGroup], *, delete_files: bool = False
+    ) -> list[DuplicateMergeResult]:
+        """Merge each group into its current keeper."""
+        return [
+            self.merge(
+                str(group.keeper.get("AssetId")),
+                [str(asset.get("AssetId")) for asset in group.duplicates],
+                delete_files=delete_files,
+            )
+            for group in groups
+        ]
+
+    @staticmethod
+    def _text_columns(conn: sqlite3.Connection) -> list[tuple[str, str]]:
+        """Return the campaign's text columns as ``(table, column)`` pairs."""
+        schema = conn.execute("SELECT name, sql FROM sqlite_master WHERE type = 'table'").fetchall()
+        # Virtual tables and their shadow tables are maintained by their owners.
+        virtual = tuple(
+            f"{name}_" for name, sql in schema if str(sql or "").upper().startswith("CREATE VIRTUAL")
+        )
+        tables = [
+            name
+            for name, sql in schema
+            if not str(sql or "").upper().startswith("CREATE VIRTUAL")
+            and not name.startswith(_SKIPPED_TABLE_PREFIXES)
+            and not (virtual and name.startswith(virtual))
+        ]
+        return [
+            (table, row[1])
+            for table in tables
+            for row in conn.execute(f'PRAGMA table_info("{table}")')
+            if str(row[2] or "").upper() in ("", "TEXT")
+        ]
+
+    @classmethod
+    def _rewrite_tables(cls, conn: sqlite3.Connection, replacements: dict[str, str]) -> int:
+        """Replace whole-value and JSON-quoted path references in text columns."""
+        if not replacements:
+            return 0
+        updated = 0
+        for table, column in cls._text_columns(conn):
+            for old, new in replacements.items():
+                quoted_old, quoted_new = json.dumps(old), json.dumps(new)
+                cursor = conn.execute(
+                    f'UPDATE "{table}" SET "{column}" = CASE WHEN "{column}" = ? THEN ? '
+                    f'ELSE replace("{column}", ?, ?) END '
+                    f'WHERE "{column}" = ? OR instr("{column}", ?) > 0',
+                    (old, new, quoted_old, quoted_new, old, quoted_old),
+                )
+                updated += max(cursor.rowcount, 0)
+        return updated
+
+    @classmethod
+    def _leftover_references(cls, conn: sqlite3.Connection, path: str, keeper_path: str) -> list[str]:
+        """List ``table.column`` pairs that still mention the file name of *path*.
+
+        Catches references the rewrite cannot see, such as backslash or
+        absolute paths and names embedded in rich text.  Occurrences of the
+        keeper's own path are ignored so a shared file name does not count.
+        """
+        name = _file_name(path)
+        if not name:
+            return []
+        return [
+            f"{table}.{column}"
+            for table, column in cls._text_columns(conn)
+            if conn.execute(
+                f'SELECT 1 FROM "{table}" WHERE instr(replace("{column}", ?, \'\'), ?) > 0 LIMIT 1',
+                (keeper_path, name),
+            ).fetchone()
+        ]
+
+    def _leftover_layout_references(self, path: str, keeper_path: str) -> list[str]:
+        """List layout files that still mention the file name of *path*."""
+        name = _file_name(path)
+        found = []
+        for layout in _LAYOUT_FILES:
+            layout_path = self._campaign_root() / layout
+            try:
+                text = layout_path.read_text(encoding="utf-8")
+            except FileNotFoundError:
+                continue
+            except OSError:
+                found.append(layout)
+                continue
+            if name and name in text.replace(json.dumps(keeper_path)[1:-1], ""):
+                found.append(layout)
+        return found
+
+    def _rewrite_layout_files(self, replacements: dict[str, str]) -> int:
+        """Rewrite image paths stored in campaign JSON layouts."""
+        if not replacements:
+            return 0
+        updated = 0
+        for name in _LAYOUT_FILES:
+            path = self._campaign_root() / name
+            if not path.exists():
+                continue
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                data, count = _replace_values(data, replacements)
+                if count:
+                    temp_path = path.with_suffix(path.suffix + ".tmp")
+                    temp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+                    os.replace(temp_path, path)
+                    updated += count
+            except (OSError, ValueError) as exc:
+                log_warning(
+                    f"Unable to rewrite image references in {path}: {exc}",
+                    func_name="ImageDuplicateService._rewrite_layout_files",
+                )
+        return updated
+
+
+def _file_name(path: str) -> str:
+    return path.replace("\\", "/").rsplit("/", 1)[-1]
+
+
+def _replace_values(value: Any, replacements: dict[str, str]) -> tuple[Any, int]:
+    if isinstance(value, str):
+        if value in replacements:
+            return replacements[value], 1
+        return value, 0
+    if isinstance(value, list):
+        count = 0
+        items = []
+        for item in value:
+            item, changed = _replace_values(item, replacements)
+            items.append(item)
+            count += changed
+        return items, count
+    if isinstance(value, dict):
+        count = 0
+        mapping = {}
+        for key, item in value.items():
+            mapping[key], changed = _replace_values(item, replacements)
+            count += changed
+        return mapping, count
+    return value, 0
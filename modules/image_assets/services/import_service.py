@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from hashlib import sha256
+import json
+import os
 from pathlib import Path
-from typing import Iterable
-import shutil
+import time
+from typing import Callable, Iterable
 
 from PIL import Image, UnidentifiedImageError
 
+from modules.generic.shared_asset_store import copy_into_campaign
 from modules.image_assets.repository import ImageAssetsRepository
 from modules.image_assets.paths import make_campaign_relative, normalize_asset_reference
 from modules.helpers.config_helper import ConfigHelper
@@ -22,6 +26,8 @@ from modules.image_assets.search.indexing import (
 
 _ALLOWED_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp", ".gif", ".bmp"}
 _BATCH_SIZE = 1024 * 1024
+_WRITE_BATCH_ROWS = 500
+_CHECKPOINT_DIRNAME = os.path.join(".cache", "image_import")
 
 
 @dataclass(slots=True)
@@ -65,11 +71,91 @@ class ImageAssetsImportSummary:
         }
 
 
+@dataclass(slots=True)
+class ImageImportPlan:
+    """Dry-run summary: what an import would touch and how long it should take."""
+
+    roots_total: int
+    roots_missing: list[str]
+    candidates: int
+    total_bytes: int
+    existing_files: int
+    new_files: int
+    external_files: int
+    sampled_files: int
+    sampled_bytes: int
+    sample_seconds: float
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.sampled_bytes / self.sample_seconds if self.sample_seconds > 0 else 0.0
+
+    @property
+    def files_per_second(self) -> float:
+        return self.sampled_files / self.sample_seconds if self.sample_seconds > 0 else 0.0
+
+    @property
+    def estimated_seconds(self) -> float:
+        rate = self.bytes_per_second
+        return self.total_bytes / rate if rate > 0 else 0.0
+
+    def as_dict(self) -> dict[str, object]:
+        """Return a JSON-serializable mapping."""
+        return {
+            "roots_total": self.roots_total,
+            "roots_missing": list(self.roots_missing),
+            "candidates": self.candidates,
+            "total_bytes": self.total_bytes,
+            "existing_files": self.existing_files,
+            "new_files": self.new_files,
+            "external_files": self.external_files,
+            "files_per_second": round(self.files_per_second, 2),
+            "bytes_per_second": round(self.bytes_per_second, 2),
+            "estimated_seconds": round(self.estimated_seconds, 2),
+        }
+
+
+@dataclass(slots=True)
+class _Candidate:
+    """One discovered file with its campaign location and matched row."""
+
+    file_path: Path
+    source_path: Path
+    root_path: Path
+    stored_path: str | None
+    managed_path: Path | None
+    existing: dict | None
+    signature: tuple[int, int] | None = None
+
+
+@dataclass(slots=True)
+class _Probe:
+    """Worker result: size, content hash and (when needed) dimensions."""
+
+    file_size: int = 0
+    content_hash: str = ""
+    unchanged: bool = False
+    dimensions: tuple[int, int] | None = None
+    error: str | None = None
+    metadata_error: str | None = None
+
+
+ProgressCallback = Callable[[int, int], None]
+
+
 class ImageAssetImportService:
     """Filesystem importer that performs dedupe and metadata extraction."""
 
-    def __init__(self, repository: ImageAssetsRepository | None = None) -> None:
+    def __init__(
+        self,
+        repository: ImageAssetsRepository | None = None,
+        *,
+        max_workers: int | None = None,
+        batch_size: int = _WRITE_BATCH_ROWS,
+    ) -> None:
         self.repository = repository or ImageAssetsRepository()
+        self.max_workers = max_workers or min(8, (os.cpu_count() or 2) + 2)
+        self.batch_size = max(1, int(batch_size))
 
     def import_directories(
         self,
@@ -77,15 +163,25 @@ class ImageAssetImportService:
         recursive: bool,
         reindex_changed_only: bool,
         update_existing_files: bool = True,
+        *,
+        progress: ProgressCallback | None = None,
+        resume: bool = True,
     ) -> ImageAssetsImportSummary:
         """Import image assets from one or more roots.
 
+        Existing rows are loaded once, files are hashed and measured in a
+        thread pool, and results are written in batches of ``batch_size``
+        rows per transaction.  Files committed by an interrupted run are
+        skipped when ``resume`` is true.
+
         Args:
             paths: Root directories selected by user.
             recursive: If True, walk subdirectories; otherwise scan direct children only.
             reindex_changed_only: If True, keep unchanged records as-is.
             update_existing_files: If True, replace matching existing rows with
                 metadata read from the import directories.
+            progress: Optional ``callback(done, total)`` called after each batch.
+            resume: Skip files recorded in the checkpoint of an interrupted run.
         """
         options = ImageDirectoryImportOptions(
             recursive=recursive,
@@ -95,17 +191,15 @@ class ImageAssetImportService:
         normalized_roots = self._normalize_roots(paths)
         campaign_root = Path(ConfigHelper.get_campaign_dir()).resolve()
         existing_items = self.repository.list_all()
-        existing_by_path: dict[str, dict] = {}
-        for item in existing_items:
-            raw_path = str(item.get("Path") or "").strip()
-            if not raw_path:
-                continue
-            try:
-                existing_by_path[normalize_asset_reference(raw_path, campaign_root)] = item
-            except ValueError:
-                # Temporary lookup support for an old external absolute value;
-                # the row is rewritten to the managed relative destination.
-                existing_by_path[str(Path(raw_path).expanduser().resolve())] = item
+        existing_by_path = self._index_by_path(existing_items, campaign_root)
+        existing_by_hash = {
+            str(item.get("Hash") or "").strip(): item
+            for item in existing_items
+            if str(item.get("Hash") or "").strip()
+        }
+
+        checkpoint_path = self._checkpoint_path(campaign_root, normalized_roots, options)
+        checkpoint = self._load_checkpoint(checkpoint_path) if resume else {}
 
         roots_missing: list[str] = []
         scanned_files = 0
@@ -123,6 +217,8 @@ class ImageAssetImportService:
             if self._compose_dedupe_key(item.get("Hash"), item.get("FileSizeBytes"))
         }
 
+        to_probe: list[_Candidate] = []
+        seen_sources: set[str] = set()
         for root in normalized_roots:
             root_path = Path(root)
             if not root_path.exists() or not root_path.is_dir():
@@ -134,19 +230,15 @@ class ImageAssetImportService:
             ):
                 scanned_files += 1
                 discovered_candidates += 1
-
                 source_path = file_path.resolve()
-                try:
-                    stored_path = make_campaign_relative(source_path, campaign_root)
-                    managed_path = source_path
-                except ValueError:
-                    managed_path = self._copy_external_asset(source_path, root_path, campaign_root)
-                    stored_path = make_campaign_relative(managed_path, campaign_root)
-                existing = existing_by_path.get(stored_path) or existing_by_path.get(str(source_path))
+                if str(source_path) in seen_sources:
+                    # Nested roots list the same file twice.
+                    skipped_unchanged += 1
+                    continue
+                seen_sources.add(str(source_path))
 
                 try:
-                    file_size = managed_path.stat().st_size
-                    content_hash = self._compute_sha256(managed_path)
+                    signature = self._signature(source_path)
                 except OSError as exc:
                     errors.append(
                         AssetImportError(
@@ -154,93 +246,99 @@ class ImageAssetImportService:
                         )
                     )
                     continue
-
-                dedupe_key = self._compose_dedupe_key(content_hash, file_size)
-                if existing is None and dedupe_key in seen_keys:
-                    skipped_duplicate += 1
+                if checkpoint.get(str(source_path)) == list(signature):
+                    skipped_unchanged += 1
                     continue
 
+                try:
+                    stored_path = make_campaign_relative(source_path, campaign_root)
+                    managed_path = source_path
+                except ValueError:
+                    managed_path = self._copy_external_asset(source_path, root_path, campaign_root)
+                    stored_path = make_campaign_relative(managed_path, campaign_root)
+                existing = existing_by_path.get(stored_path) or existing_by_path.get(str(source_path))
+
                 if existing is not None and not options.update_existing_files:
                     skipped_existing += 1
+                    checkpoint[str(source_path)] = list(signature)
                     continue
 
-                unchanged = bool(
-                    existing
-                    and str(existing.get("Hash") or "") == content_hash
-                    and int(existing.get("FileSizeBytes") or 0) == file_size
+                to_probe.append(
+                    _Candidate(
+                        file_path=file_path,
+                        source_path=source_path,
+                        root_path=root_path,
+                        stored_path=stored_path,
+                        managed_path=managed_path,
+                        existing=existing,
+                        signature=signature,
+                    )
                 )
 
-                if unchanged and options.reindex_changed_only:
+        total = len(to_probe)
+        done = 0
+        batch: list[tuple[_Candidate, dict, dict | None]] = []
+
+        def flush() -> None:
+            nonlocal done
+            if batch:
+                for saved, (candidate, _payload, _target) in zip(self._write_batch(batch), batch):
+                    existing_by_path[candidate.stored_path] = saved
+                    existing_by_hash.setdefault(str(saved.get("Hash") or ""), saved)
+                    checkpoint[str(candidate.source_path)] = list(candidate.signature)
+                done += len(batch)
+                batch.clear()
+            self._save_checkpoint(checkpoint_path, checkpoint)
+            if progress:
+                progress(done, total)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            probes = executor.map(self._probe, to_probe)
+            for candidate, probe in zip(to_probe, probes):
+                existing = candidate.existing
+                if probe.error:
+                    errors.append(AssetImportError(path=str(candidate.source_path), reason=probe.error))
+                    done += 1
+                    continue
+
+                dedupe_key = self._compose_dedupe_key(probe.content_hash, probe.file_size)
+                if existing is None and dedupe_key in seen_keys:
+                    skipped_duplicate += 1
+                    checkpoint[str(candidate.source_path)] = list(candidate.signature)
+                    done += 1
+                    continue
+
+                if probe.unchanged and options.reindex_changed_only:
                     skipped_unchanged += 1
+                    checkpoint[str(candidate.source_path)] = list(candidate.signature)
+                    done += 1
                     continue
 
-                width: int | None = None
-                height: int | None = None
-                if not unchanged:
-                    try:
-                        width, height = self._read_dimensions(managed_path)
-                    except (OSError, UnidentifiedImageError) as exc:
-                        errors.append(
-                            AssetImportError(
-                                path=str(source_path), reason=f"metadata read failed: {exc}"
-                            )
-                        )
-                        continue
-                else:
-                    width = self._as_optional_int(
-                        existing.get("Width") if existing else None
-                    )
-                    height = self._as_optional_int(
-                        existing.get("Height") if existing else None
+                if probe.metadata_error:
+                    errors.append(
+                        AssetImportError(path=str(candidate.source_path), reason=probe.metadata_error)
                     )
+                    done += 1
+                    continue
 
-                stem = file_path.stem
-                tags: list[str] = []
-                name_normalized = normalize_filename(stem)
-                search_tokens = build_search_tokens(
-                    name_normalized=name_normalized, tags=tags
-                )
-                searchable_blob = build_searchable_blob(
-                    name=stem,
-                    path=stored_path,
-                    relative_path=stored_path,
-                    source_root="assets/image_library",
-                    extension=file_path.suffix.lower().lstrip("."),
-                    tags=tags,
-                    name_normalized=name_normalized,
-                    search_tokens=search_tokens,
-                    source_folder_name=file_path.parent.name,
-                )
+                if probe.dimensions is not None:
+                    width, height = probe.dimensions
+                else:
+                    width = self._as_optional_int(existing.get("Width") if existing else None)
+                    height = self._as_optional_int(existing.get("Height") if existing else None)
 
-                payload = {
-                    "Name": stem,
-                    "Path": stored_path,
-                    "RelativePath": stored_path,
-                    "SourceRoot": "assets/image_library",
-                    "SourceFolderName": file_path.parent.name,
-                    "Extension": file_path.suffix.lower().lstrip("."),
-                    "Width": width,
-                    "Height": height,
-                    "FileSizeBytes": file_size,
-                    "Hash": content_hash,
-                    "NameNormalized": name_normalized,
-                    "SearchTokens": search_tokens,
-                    "Tags": tags,
-                    "SearchableBlob": searchable_blob,
-                }
-
-                saved = (
-                    self.repository.replace_by_path(payload)
-                    if existing
-                    else self.repository.upsert_by_hash_or_path(payload)
-                )
-                existing_by_path[stored_path] = saved
+                payload = self._build_payload(candidate, probe, width, height)
+                target = existing if existing is not None else existing_by_hash.get(probe.content_hash)
+                batch.append((candidate, payload, target))
                 seen_keys.add(dedupe_key)
-
                 if existing:
                     updated += 1
                 else:
                     imported_new += 1
+                if len(batch) >= self.batch_size:
+                    flush()
+        flush()
+        self._clear_checkpoint(checkpoint_path)
 
         return ImageAssetsImportSummary(
             roots_total=len(normalized_roots),
@@ -255,6 +353,199 @@ class ImageAssetImportService:
             errors=errors,
         )
 
+    def plan_directories(
+        self,
+        paths: list[str],
+        recursive: bool,
+        *,
+        sample_size: int = 32,
+    ) -> ImageImportPlan:
+        """Scan roots without writing anything and estimate import throughput.
+
+        Up to ``sample_size`` files are hashed and measured through the same
+        worker pool the import uses to derive the expected rate.
+        """
+        normalized_roots = self._normalize_roots(paths)
+        campaign_root = Path(ConfigHelper.get_campaign_dir()).resolve()
+        existing_by_path = self._index_by_path(self.repository.list_all(), campaign_root)
+
+        roots_missing: list[str] = []
+        candidates: list[_Candidate] = []
+        total_bytes = 0
+        existing_files = 0
+        external_files = 0
+        for root in normalized_roots:
+            root_path = Path(root)
+            if not root_path.exists() or not root_path.is_dir():
+                roots_missing.append(str(root_path))
+                continue
+            for file_path in self._iter_image_files(root_path, recursive=recursive):
+                source_path = file_path.resolve()
+                try:
+                    total_bytes += source_path.stat().st_size
+                except OSError:
+                    continue
+                try:
+                    stored_path = make_campaign_relative(source_path, campaign_root)
+                except ValueError:
+                    stored_path = None
+                    external_files += 1
+                existing = existing_by_path.get(stored_path) if stored_path else None
+                existing = existing or existing_by_path.get(str(source_path))
+                if existing is not None:
+                    existing_files += 1
+                candidates.append(
+                    _Candidate(file_path, source_path, root_path, stored_path, source_path, None)
+                )
+
+        sample = candidates[: max(0, int(sample_size))]
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            probes = list(executor.map(self._probe, sample))
+        elapsed = time.perf_counter() - started
+
+        return ImageImportPlan(
+            roots_total=len(normalized_roots),
+            roots_missing=roots_missing,
+            candidates=len(candidates),
+            total_bytes=total_bytes,
+            existing_files=existing_files,
+            new_files=len(candidates) - existing_files,
+            external_files=external_files,
+            sampled_files=len(sample),
+            sampled_bytes=sum(probe.file_size for probe in probes),
+            sample_seconds=elapsed,
+        )
+
+    def _probe(self, candidate: _Candidate) -> _Probe:
+        """Hash one file and read its dimensions unless it is unchanged."""
+        managed_path = candidate.managed_path or candidate.source_path
+        existing = candidate.existing
+        try:
+            file_size = managed_path.stat().st_size
+            content_hash = self._compute_sha256(managed_path)
+        except OSError as exc:
+            return _Probe(error=f"stat/hash failed: {exc}")
+        unchanged = bool(
+            existing
+            and str(existing.get("Hash") or "") == content_hash
+            and int(existing.get("FileSizeBytes") or 0) == file_size
+        )
+        probe = _Probe(file_size=file_size, content_hash=content_hash, unchanged=unchanged)
+        if not unchanged:
+            try:
+                probe.dimensions = self._read_dimensions(managed_path)
+            except (OSError, UnidentifiedImageError) as exc:
+                probe.metadata_error = f"metadata read failed: {exc}"
+        return probe
+
+    @staticmethod
+    def _build_payload(candidate: _Candidate, probe: _Probe, width, height) -> dict:
+        file_path = candidate.file_path
+        stored_path = candidate.stored_path
+        stem = file_path.stem
+        tags: list[str] = []
+        name_normalized = normalize_filename(stem)
+        search_tokens = build_search_tokens(
+            name_normalized=name_normalized, tags=tags
+        )
+        searchable_blob = build_searchable_blob(
+            name=stem,
+            path=stored_path,
+            relative_path=stored_path,
+            source_root="assets/image_library",
+            extension=file_path.suffix.lower().lstrip("."),
+            tags=tags,
+            name_normalized=name_normalized,
+            search_tokens=search_tokens,
+            source_folder_name=file_path.parent.name,
+        )
+        return {
+            "Name": stem,
+            "Path": stored_path,
+            "RelativePath": stored_path,
+            "SourceRoot": "assets/image_library",
+            "SourceFolderName": file_path.parent.name,
+            "Extension": file_path.suffix.lower().lstrip("."),
+            "Width": width,
+            "Height": height,
+            "FileSizeBytes": probe.file_size,
+            "Hash": probe.content_hash,
+            "NameNormalized": name_normalized,
+            "SearchTokens": search_tokens,
+            "Tags": tags,
+            "SearchableBlob": searchable_blob,
+        }
+
+    def _write_batch(self, batch: list[tuple[_Candidate, dict, dict | None]]) -> list[dict]:
+        """Persist one batch, in a single transaction when the repository allows."""
+        bulk_upsert = getattr(self.repository, "bulk_upsert", None)
+        if callable(bulk_upsert):
+            return bulk_upsert([(payload, target) for _candidate, payload, target in batch])
+        return [
+            self.repository.replace_by_path(payload)
+            if candidate.existing
+            else self.repository.upsert_by_hash_or_path(payload)
+            for candidate, payload, _target in batch
+        ]
+
+    @staticmethod
+    def _index_by_path(items: Iterable[dict], campaign_root: Path) -> dict[str, dict]:
+        existing_by_path: dict[str, dict] = {}
+        for item in items:
+            raw_path = str(item.get("Path") or "").strip()
+            if not raw_path:
+                continue
+            try:
+                existing_by_path[normalize_asset_reference(raw_path, campaign_root)] = item
+            except ValueError:
+                # Temporary lookup support for an old external absolute value;
+                # the row is rewritten to the managed relative destination.
+                existing_by_path[str(Path(raw_path).expanduser().resolve())] = item
+        return existing_by_path
+
+    @staticmethod
+    def _signature(path: Path) -> tuple[int, int]:
+        stat = path.stat()
+        return stat.st_size, stat.st_mtime_ns
+
+    @staticmethod
+    def _checkpoint_path(
+        campaign_root: Path, roots: list[str], options: ImageDirectoryImportOptions
+    ) -> Path:
+        key = json.dumps([roots, options.recursive, options.reindex_changed_only, options.update_existing_files])
+        digest = sha256(key.encode("utf-8")).hexdigest()[:16]
+        return campaign_root / _CHECKPOINT_DIRNAME / f"{digest}.json"
+
+    @staticmethod
+    def _load_checkpoint(path: Path) -> dict[str, list[int]]:
+        try:
+            with path.open("r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    @staticmethod
+    def _save_checkpoint(path: Path, checkpoint: dict[str, list[int]]) -> None:
+        if not checkpoint:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(".tmp")
+            with temp_path.open("w", encoding="utf-8") as handle:
+                json.dump(checkpoint, handle)
+            os.replace(temp_path, path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _clear_checkpoint(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
     @staticmethod
     def _normalize_roots(paths: Iterable[str]) -> list[str]:
         deduped: list[str] = []
@@ -330,7 +621,7 @@ class ImageAssetImportService:
                     destination = candidate
                     break
                 counter += 1
-        shutil.copy2(source, destination)
+        copy_into_campaign(source, destination, campaign_dir=campaign_root)
         return destination
 
     @staticmethod
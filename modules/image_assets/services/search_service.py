@@ -1,20 +1,15 @@
-"""Search service for image assets with in-memory and optional SQLite-FTS paths."""
+"""Search service for image assets backed by the persistent SQLite index."""
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-import sqlite3
 from typing import Any, Literal
 
 from modules.image_assets.repository import ImageAssetsRepository
 from modules.image_assets.search.dto import ImageAssetSearchResultDTO
-from modules.image_assets.paths import (
-    InvalidAssetReference,
-    normalize_asset_reference,
-    resolve_asset_reference,
-)
+from modules.image_assets.paths import InvalidAssetReference, resolve_asset_reference
+from modules.image_assets.search.persistent_index import build_indexed_row
 from modules.image_assets.search.indexing import (
-    build_searchable_blob,
     normalize_extension,
     normalize_query,
     normalize_tag,
@@ -31,8 +26,6 @@ SortOption = Literal[
     "size_asc",
 ]
 
-_FTS_THRESHOLD = 750
-
 
 @dataclass(slots=True)
 class ImageSearchFilters:
@@ -106,18 +99,21 @@ class ImageAssetSearchService:
             else ImageSearchFilters.from_mapping(filters if isinstance(filters, dict) else None)
         )
 
+        search_index = getattr(self.repository, "search_index", None)
+        index = search_index() if callable(search_index) else None
+        if index is not None:
+            # Filtering, ordering and paging run inside the campaign database.
+            result = index.search(
+                normalized_query, parsed_filters, sort=sort, limit=limit, offset=offset
+            )
+            if result is not None:
+                rows, total = result
+                return [self._to_dto(row) for row in rows], total
+
         items = self.repository.list_all()
         indexed = [self._build_indexed_row(item) for item in items]
 
-        matched: list[dict[str, Any]]
-        if normalized_query and len(indexed) >= _FTS_THRESHOLD:
-            fts_match = self._search_with_fts(indexed, normalized_query)
-            if fts_match is None:
-                matched = self._search_in_memory(indexed, normalized_query)
-            else:
-                matched = fts_match
-        else:
-            matched = self._search_in_memory(indexed, normalized_query)
+        matched = self._search_in_memory(indexed, normalized_query)
 
         filtered = [row for row in matched if self._matches_filters(row, parsed_filters)]
         ordered = self._sort_rows(filtered, sort=sort, query=normalized_query)
@@ -141,36 +137,6 @@ class ImageAssetSearchService:
                 matched.append(row)
         return matched
 
-    def _search_with_fts(self, rows: list[dict[str, Any]], normalized_query: str) -> list[dict[str, Any]] | None:
-        terms = tokenize_query(normalized_query)
-        if not terms:
-            return list(rows)
-
-        conn: sqlite3.Connection | None = None
-        try:
-            conn = sqlite3.connect(":memory:")
-            conn.execute("CREATE VIRTUAL TABLE image_search USING fts5(asset_id, searchable_blob)")
-            conn.executemany(
-                "INSERT INTO image_search(asset_id, searchable_blob) VALUES (?, ?)",
-                [(str(row.get("asset_id") or ""), str(row.get("searchable_blob") or "")) for row in rows],
-            )
-            statement = " ".join(f'{term}*' for term in terms)
-            cur = conn.execute(
-                "SELECT asset_id FROM image_search WHERE image_search MATCH ?",
-                (statement,),
-            )
-            matched_ids = {str(record[0]) for record in cur.fetchall()}
-        except sqlite3.Error:
-            return None
-        finally:
-            try:
-                if conn is not None:
-                    conn.close()
-            except Exception:
-                pass
-
-        return [row for row in rows if str(row.get("asset_id") or "") in matched_ids]
-
     def _matches_filters(self, row: dict[str, Any], filters: ImageSearchFilters) -> bool:
         if filters.filename:
             filename_term = normalize_query(filters.filename)
@@ -250,47 +216,7 @@ class ImageAssetSearchService:
         return sorted(rows, key=_score, reverse=True)
 
     def _build_indexed_row(self, item: dict[str, Any]) -> dict[str, Any]:
-        tags = item.get("Tags") if isinstance(item.get("Tags"), list) else []
-        search_tokens = item.get("SearchTokens") if isinstance(item.get("SearchTokens"), list) else []
-        searchable_blob = str(item.get("SearchableBlob") or "")
-        if not searchable_blob:
-            searchable_blob = self._compose_searchable_blob(item, tags=tags, search_tokens=search_tokens)
-
-        stored_value = str(item.get("RelativePath") or item.get("Path") or "")
-        try:
-            stored_path = normalize_asset_reference(stored_value)
-        except ValueError:
-            stored_path = stored_value.replace("\\", "/")
-        return {
-            "asset_id": str(item.get("AssetId") or ""),
-            "name": str(item.get("Name") or ""),
-            "path": stored_path,
-            "relative_path": stored_path,
-            "source_root": str(item.get("SourceRoot") or ""),
-            "source_folder_name": str(item.get("SourceFolderName") or ""),
-            "extension": str(item.get("Extension") or ""),
-            "width": self._as_optional_int(item.get("Width")),
-            "height": self._as_optional_int(item.get("Height")),
-            "file_size_bytes": self._as_optional_int(item.get("FileSizeBytes")),
-            "tags": [str(tag) for tag in tags],
-            "name_normalized": str(item.get("NameNormalized") or ""),
-            "searchable_blob": searchable_blob,
-            "updated_at": str(item.get("UpdatedAt") or ""),
-        }
-
-    @staticmethod
-    def _compose_searchable_blob(item: dict[str, Any], *, tags: list[str], search_tokens: list[str]) -> str:
-        return build_searchable_blob(
-            name=str(item.get("Name") or ""),
-            path=str(item.get("Path") or ""),
-            relative_path=str(item.get("RelativePath") or ""),
-            source_root=str(item.get("SourceRoot") or ""),
-            extension=str(item.get("Extension") or ""),
-            tags=tags,
-            name_normalized=str(item.get("NameNormalized") or ""),
-            search_tokens=search_tokens,
-            source_folder_name=str(item.get("SourceFolderName") or ""),
-        )
+        return build_indexed_row(item)
 
     @staticmethod
     def _to_dto(row: dict[str, Any]) -> ImageAssetSearchResultDTO:
@@ -0,0 +1,228 @@
+"""Chunked, resumable AI import of entities from PDF pages.
+
+Pages are grouped into chunks that are sent to the AI a few at a time.  Each
+response is parsed as soon as it arrives and its entities are saved in one
+transaction; :class:`PDFHashTracker` records the chunk so an interrupted
+import resumes with the chunks that are still missing.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Sequence
+
+from modules.generic.generic_model_wrapper import GenericModelWrapper
+from modules.helpers.importing.pdf_hash_tracker import PDFHashTracker
+from modules.helpers.logging_helper import log_info, log_module_import, log_warning
+from modules.importers.pdf_entity_importer import iter_json_records, parse_json_relaxed
+
+log_module_import(__name__)
+
+DEFAULT_PAGES_PER_CHUNK = 6
+DEFAULT_MAX_CHUNK_CHARS = 24_000
+DEFAULT_MAX_CONCURRENCY = 3
+
+
+@dataclass(frozen=True)
+class PageChunk:
+    """A run of consecutive pages sent to the AI in one request."""
+
+    index: int
+    first_page: int
+    last_page: int
+    text: str
+
+    @property
+    def label(self) -> str:
+        if self.first_page == self.last_page:
+            return f"page {self.first_page}"
+        return f"pages {self.first_page}-{self.last_page}"
+
+
+@dataclass(frozen=True)
+class EntityImportSpec:
+    """How one entity type is prompted for, parsed and stored."""
+
+    entity_type: str
+    system_prompt: str
+    build_prompt: Callable[[str, str], str]
+    normalize: Callable[[Any], list]
+    to_record: Callable[[dict], dict]
+
+
+@dataclass
+class BatchImportResult:
+    """Outcome of one :meth:`BatchPDFImporter.run`."""
+
+    chunks_total: int = 0
+    chunks_done: int = 0
+    chunks_skipped: int = 0
+    imported: int = 0
+    items: list = field(default_factory=list)
+    failures: list = field(default_factory=list)
+    cancelled: bool = False
+
+    @property
+    def complete(self) -> bool:
+        return not self.cancelled and self.chunks_done + self.chunks_skipped == self.chunks_total
+
+
+def chunk_pages(
+    pages: Sequence[str],
+    *,
+    pages_per_chunk: int = DEFAULT_PAGES_PER_CHUNK,
+    max_chars: int = DEFAULT_MAX_CHUNK_CHARS,
+) -> list[PageChunk]:
+    """Group consecutive non-blank pages into chunks (1-based page numbers)."""
+    pages_per_chunk = max(1, int(pages_per_chunk))
+    chunks: list[PageChunk] = []
+    current: list[tuple[int, str]] = []
+    size = 0
+
+    def flush() -> None:
+        if current:
+            chunks.append(
+                PageChunk(len(chunks), current[0][0], current[-1][0], "\n\n".join(text for _, text in current))
+            )
+            current.clear()
+
+    for number, page in enumerate(pages, start=1):
+        text = str(page or "").strip()
+        if not text:
+            continue
+        if current and (len(current) >= pages_per_chunk or size + len(text) > max_chars):
+            flush()
+            size = 0
+        current.append((number, text))
+        size += len(text)
+    flush()
+    return chunks
+
+
+def import_key_for(entity_type: str, chunks: Sequence[PageChunk]) -> str:
+    """Identify an import by entity type and the exact chunk contents."""
+    digest = hashlib.sha1()
+    for chunk in chunks:
+        digest.update(chunk.text.encode("utf-8", "replace"))
+        digest.update(b"\0")
+    return f"{entity_type}:{digest.hexdigest()[:16]}"
+
+
+class BatchPDFImporter:
+    """Run the chunk → AI → parse → save pipeline for one entity type."""
+
+    def __init__(
+        self,
+        spec: EntityImportSpec,
+        *,
+        client_factory: Optional[Callable[[], Any]] = None,
+        wrapper: Optional[GenericModelWrapper] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        pages_per_chunk: int = DEFAULT_PAGES_PER_CHUNK,
+        max_chunk_chars: int = DEFAULT_MAX_CHUNK_CHARS,
+    ) -> None:
+        self.spec = spec
+        self._client_factory = client_factory
+        self._wrapper = wrapper or GenericModelWrapper(spec.entity_type)
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.pages_per_chunk = pages_per_chunk
+        self.max_chunk_chars = max_chunk_chars
+
+    def _new_client(self):
+        if self._client_factory is not None:
+            return self._client_factory()
+        from modules.ai.http_pool import PRIORITY_BATCH
+        from modules.ai.local_ai_client import LocalAIClient
+
+        return LocalAIClient(priority=PRIORITY_BATCH)
+
+    def run(
+        self,
+        pages: Sequence[str],
+        *,
+        source_label: str = "",
+        source_path: Optional[str] = None,
+        pdf_hash: Optional[str] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+        cancelled: Optional[Callable[[], bool]] = None,
+    ) -> BatchImportResult:
+        """Import *pages*; chunks already saved for *pdf_hash* are skipped."""
+        chunks = chunk_pages(pages, pages_per_chunk=self.pages_per_chunk, max_chars=self.max_chunk_chars)
+        result = BatchImportResult(chunks_total=len(chunks))
+        import_key = import_key_for(self.spec.entity_type, chunks)
+        done = PDFHashTracker.completed_chunks(pdf_hash, import_key, len(chunks)) if pdf_hash else set()
+        pending = [chunk for chunk in chunks if chunk.index not in done]
+        result.chunks_skipped = len(chunks) - len(pending)
+        if result.chunks_skipped:
+            log_info(
+                f"Resuming {self.spec.entity_type} import of {source_label or 'input'}: "
+                f"{result.chunks_skipped}/{len(chunks)} chunks already saved",
+                func_name="BatchPDFImporter.run",
+            )
+        client = self._new_client()
+        queue = list(reversed(pending))
+        in_flight: dict[Future, PageChunk] = {}
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="pdf-import")
+        try:
+            while queue or in_flight:
+                if cancelled is not None and cancelled():
+                    result.cancelled = True
+                    break
+                # Keep a small backlog queued so workers never idle between chunks.
+                while queue and len(in_flight) < self.max_concurrency * 2:
+                    chunk = queue.pop()
+                    in_flight[executor.submit(self._request, client, chunk, source_label)] = chunk
+                finished, _ = wait(tuple(in_flight), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    chunk = in_flight.pop(future)
+                    if self._store(chunk, future, result) and pdf_hash:
+                        PDFHashTracker.record_chunk(pdf_hash, import_key, chunk.index, len(chunks))
+                    if progress is not None:
+                        progress(result.chunks_done + result.chunks_skipped, len(chunks))
+        finally:
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+        if pdf_hash and result.complete:
+            PDFHashTracker.record_import(pdf_hash, source_path or source_label)
+            PDFHashTracker.clear_chunks(pdf_hash, import_key)
+        return result
+
+    def _request(self, client, chunk: PageChunk, source_label: str) -> str:
+        label = f"{source_label or 'Unknown'} ({chunk.label})"
+        return client.chat([
+            {"role": "system", "content": self.spec.system_prompt},
+            {"role": "user", "content": self.spec.build_prompt(chunk.text, label)},
+        ])
+
+    def _store(self, chunk: PageChunk, future: Future, result: BatchImportResult) -> bool:
+        """Parse one chunk's response and save its entities in one transaction."""
+        try:
+            items = self._parse(future.result())
+            records = [self.spec.to_record(raw) for raw in items if isinstance(raw, dict)]
+            if records:
+                self._wrapper.save_items(records, replace=False)
+        except Exception as exc:
+            log_warning(
+                f"Import of {chunk.label} failed: {exc}",
+                func_name="BatchPDFImporter._store",
+            )
+            result.failures.append((chunk, str(exc)))
+            return False
+        result.chunks_done += 1
+        result.imported += len(records)
+        result.items.extend(raw for raw in items if isinstance(raw, dict))
+        return True
+
+    def _parse(self, response: str) -> list:
+        try:
+            return list(self.spec.normalize(parse_json_relaxed(response)))
+        except (RuntimeError, ValueError):
+            # Salvage the complete entries of a truncated response; ``normalize``
+            # sees them as a bare list, like a top-level array response.
+            salvaged = list(iter_json_records(response))
+            if not salvaged:
+                raise
+            return list(self.spec.normalize(salvaged))
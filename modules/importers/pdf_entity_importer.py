@@ -7,6 +7,8 @@ from modules.helpers.logging_helper import log_function, log_module_import
 
 log_module_import(__name__)
 
+_DECODER = json.JSONDecoder()
+
 
 @log_function
 def parse_json_relaxed(payload: str):
@@ -32,6 +34,11 @@ def parse_json_relaxed(payload: str):
     if start is None:
         raise RuntimeError("Failed to locate JSON in response")
     snippet = text[start:]
+    try:
+        # Decode the first complete value and ignore trailing chatter.
+        return _DECODER.raw_decode(snippet)[0]
+    except ValueError:
+        pass
     for end in range(len(snippet), max(len(snippet) - 2000, 0), -1):
         try:
             return json.loads(snippet[:end])
@@ -40,6 +47,30 @@ def parse_json_relaxed(payload: str):
     raise RuntimeError("Failed to parse JSON from AI response")
 
 
+def iter_json_records(payload: str):
+    """Yield the complete objects of the first JSON array in *payload*.
+
+    Elements are decoded one at a time, so a response cut off mid-array
+    still yields every object that arrived in full.
+    """
+    text = str(payload or "")
+    position = text.find("[")
+    if position < 0:
+        return
+    position += 1
+    length = len(text)
+    while position < length:
+        while position < length and text[position] in " \t\r\n,":
+            position += 1
+        if position >= length or text[position] == "]":
+            return
+        try:
+            value, position = _DECODER.raw_decode(text, position)
+        except ValueError:
+            return
+        yield value
+
+
 def format_longtext_value(value):
     """Return a human-readable plain-text value for longtext fields.
 
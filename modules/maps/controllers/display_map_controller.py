@@ -75,6 +75,7 @@ from modules.maps.utils.token_facing import (
 )
 from PIL import Image, ImageTk, ImageDraw
 from modules.generic.generic_model_wrapper import GenericModelWrapper
+from modules.generic.campaign_search_index import get_campaign_search_index
 from modules.helpers.template_loader import load_template
 
 
@@ -143,6 +144,7 @@ DEFAULT_BRUSH_SIZE = 32  # px
 DEFAULT_SHAPE_WIDTH = 50
 DEFAULT_SHAPE_HEIGHT = 50
 PORTRAIT_MENU_THUMB_SIZE = (48, 48)
+GLOBAL_SEARCH_PAGE_SIZE = 100
 
 try:
     RESAMPLE_MODE = Image.Resampling.LANCZOS
@@ -1107,9 +1109,40 @@ class DisplayMapController:
         listbox = tk.Listbox(popup, activestyle="none")
         listbox.pack(fill="both", expand=True, padx=10, pady=(0,10))
         search_map = []
+        labels_by_table = {wrapper.entity_type: etype for etype, wrapper in self._model_wrappers.items()}
+        search_state = {"query": "", "page": None}
+        def append_page(offset=0):
+            """Append one page of indexed results; return False if unavailable."""
+            try:
+                page = get_campaign_search_index().search(
+                    search_state["query"], entity_types=labels_by_table,
+                    limit=GLOBAL_SEARCH_PAGE_SIZE, offset=offset,
+                )
+            except Exception as exc:
+                log_warning(
+                    f"Indexed search unavailable, scanning tables: {exc}",
+                    func_name="DisplayMapController.open_global_search",
+                )
+                return False
+            search_state["page"] = page
+            for hit in page.hits:
+                etype = labels_by_table.get(hit.entity_type, hit.entity_type)
+                listbox.insert("end", f"{etype}: {hit.name}"); search_map.append((etype, hit.key, None))
+            return True
+        def on_results_scrolled(_first, last):
+            """Fetch the next page once the list is scrolled to its end."""
+            page = search_state["page"]
+            if page is not None and page.has_more and float(last) >= 1.0:
+                search_state["page"] = None
+                append_page(len(search_map))
+        listbox.configure(yscrollcommand=on_results_scrolled)
         def populate(initial=False, query=""):
             """Handle populate."""
             listbox.delete(0, "end"); search_map.clear(); q = query.lower()
+            search_state.update(query="" if initial else query, page=None)
+            if append_page():
+                if listbox.size() > 0: listbox.selection_clear(0, "end"); listbox.selection_set(0); listbox.activate(0)
+                return
             for etype, wrapper in self._model_wrappers.items():
                 for item in wrapper.load_items():
                     # Process each item from wrapper.load_items().
@@ -1124,6 +1157,8 @@ class DisplayMapController:
             """Handle select."""
             if not search_map: return
             idx = listbox.curselection()[0]; etype, name, record = search_map[idx]
+            if record is None:
+                record = self._model_wrappers[etype].load_item_by_key(name) or {}
             portrait = record.get("Portrait", "")
             path = primary_portrait(portrait)
             self.add_token(path, etype, name, record) # This specifically adds a new token
@@ -4,6 +4,7 @@ import json
 
 from modules.generic.generic_model_wrapper import GenericModelWrapper
 from modules.helpers.logging_helper import log_function, log_module_import
+from modules.importers.pdf_batch_importer import EntityImportSpec
 from modules.importers.pdf_entity_importer import parse_json_relaxed, to_list, to_longtext
 
 log_module_import(__name__)
@@ -22,6 +23,29 @@ def normalize_npc_payload(payload):
     raise ValueError("Payload must be a list of NPCs or contain an 'npcs' array")
 
 
+def build_npc_record(raw: dict) -> dict:
+    """Map one AI/JSON NPC entry onto the npcs table columns."""
+    return {
+        "Name": raw.get("Name", "Unnamed"),
+        "Role": raw.get("Role", ""),
+        "Description": to_longtext(raw.get("Description", "")),
+        "Secret": to_longtext(raw.get("Secret", raw.get("Secrets", ""))),
+        "Quote": raw.get("Quote", ""),
+        "RoleplayingCues": to_longtext(raw.get("RoleplayingCues", "")),
+        "Personality": to_longtext(raw.get("Personality", "")),
+        "Motivation": to_longtext(raw.get("Motivation", "")),
+        "Background": to_longtext(raw.get("Background", "")),
+        "Traits": to_longtext(raw.get("Traits", "")),
+        "Notes": to_longtext(raw.get("Notes", "")),
+        "Genre": raw.get("Genre", ""),
+        "Factions": to_list(raw.get("Factions", [])),
+        "Objects": to_list(raw.get("Objects", [])),
+        "Links": raw.get("Links", []) if isinstance(raw.get("Links"), list) else [],
+        "Portrait": raw.get("Portrait", ""),
+        "Audio": raw.get("Audio", ""),
+    }
+
+
 @log_function
 def import_npc_records(payload) -> int:
     """Persist a list (or wrapped dict) of NPC entries into the database."""
@@ -29,37 +53,11 @@ def import_npc_records(payload) -> int:
     if not npcs:
         raise ValueError("No NPCs found in payload")
 
-    wrapper = GenericModelWrapper("npcs")
-    existing = wrapper.load_items()
-    new_items = []
-    for raw in npcs:
-        # Process each raw from npcs.
-        if not isinstance(raw, dict):
-            continue
-        item = {
-            "Name": raw.get("Name", "Unnamed"),
-            "Role": raw.get("Role", ""),
-            "Description": to_longtext(raw.get("Description", "")),
-            "Secret": to_longtext(raw.get("Secret", raw.get("Secrets", ""))),
-            "Quote": raw.get("Quote", ""),
-            "RoleplayingCues": to_longtext(raw.get("RoleplayingCues", "")),
-            "Personality": to_longtext(raw.get("Personality", "")),
-            "Motivation": to_longtext(raw.get("Motivation", "")),
-            "Background": to_longtext(raw.get("Background", "")),
-            "Traits": to_longtext(raw.get("Traits", "")),
-            "Notes": to_longtext(raw.get("Notes", "")),
-            "Genre": raw.get("Genre", ""),
-            "Factions": to_list(raw.get("Factions", [])),
-            "Objects": to_list(raw.get("Objects", [])),
-            "Links": raw.get("Links", []) if isinstance(raw.get("Links"), list) else [],
-            "Portrait": raw.get("Portrait", ""),
-            "Audio": raw.get("Audio", ""),
-        }
-        new_items.append(item)
+    new_items = [build_npc_record(raw) for raw in npcs if isinstance(raw, dict)]
     if not new_items:
         raise ValueError("No valid NPC entries were provided")
 
-    wrapper.save_items(existing + new_items)
+    GenericModelWrapper("npcs").save_items(new_items, replace=False)
     return len(new_items)
 
 
@@ -108,3 +106,12 @@ def build_npc_prompt(raw_text: str, source_label: str) -> str:
         f"Source: {source_label or 'Unknown'}\n"
         "PDF text (may be truncated):\n" + raw_text[:5000000]
     )
+
+
+NPC_IMPORT_SPEC = EntityImportSpec(
+    entity_type="npcs",
+    system_prompt="Extract structured NPC information as strict JSON.",
+    build_prompt=build_npc_prompt,
+    normalize=normalize_npc_payload,
+    to_record=build_npc_record,
+)
@@ -10,6 +10,7 @@ from PIL import Image
 from functools import partial
 from typing import Optional
 from modules.generic.generic_model_wrapper import GenericModelWrapper
+from modules.generic.campaign_search_index import get_campaign_search_index
 from modules.helpers.template_loader import load_template as load_entity_template
 from modules.helpers.text_helpers import format_multiline_text
 from customtkinter import CTkLabel, CTkImage
@@ -66,6 +67,7 @@ log_module_import(__name__)
 PORTRAIT_FOLDER = os.path.join(ConfigHelper.get_campaign_dir(), "assets", "portraits")
 MAX_PORTRAIT_SIZE = (64, 64)  # Thumbnail size for lists
 DEFAULT_MAP_THUMBNAIL_SIZE = (200, 140)
+GLOBAL_SEARCH_PAGE_SIZE = 100
 
 @log_methods
 class GMScreenView(ctk.CTkFrame):
@@ -1006,12 +1008,54 @@ class GMScreenView(ctk.CTkFrame):
 
         # 5) Prepare storage for (type, name)
         search_map = []
+        labels_by_table = {
+            getattr(wrapper, "entity_type", ""): entity_type for entity_type, wrapper in self.wrappers.items()
+        }
+        search_state = {"query": "", "page": None}
+
+        def append_page(offset=0):
+            """Append one page of indexed results; return False if unavailable."""
+            try:
+                page = get_campaign_search_index().search(
+                    search_state["query"],
+                    entity_types=labels_by_table,
+                    limit=GLOBAL_SEARCH_PAGE_SIZE,
+                    offset=offset,
+                )
+            except Exception as exc:
+                log_warning(
+                    f"Indexed search unavailable, scanning tables: {exc}",
+                    func_name="GMScreenView.open_global_search",
+                )
+                return False
+            search_state["page"] = page
+            for hit in page.hits:
+                entity_type = labels_by_table.get(hit.entity_type, hit.entity_type)
+                listbox.insert("end", f"{entity_type[:-1]}: {hit.name}")
+                search_map.append((entity_type, hit.key))
+            return True
+
+        def on_results_scrolled(_first, last):
+            """Fetch the next page once the list is scrolled to its end."""
+            page = search_state["page"]
+            if page is not None and page.has_more and float(last) >= 1.0:
+                search_state["page"] = None
+                append_page(len(search_map))
+
+        listbox.configure(yscrollcommand=on_results_scrolled)
 
         # 6) Populate & auto-select first
         def populate(initial=False, query=""):
             """Handle populate."""
             listbox.delete(0, "end")
             search_map.clear()
+            search_state.update(query="" if initial else query, page=None)
+            if append_page():
+                if listbox.size() > 0:
+                    listbox.selection_clear(0, "end")
+                    listbox.selection_set(0)
+                    listbox.activate(0)
+                return
             for entity_type, wrapper in self.wrappers.items():
                 # Process each (entity_type, wrapper) from wrappers.items().
                 items = wrapper.load_items()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Iterable, List, Tuple
 
@@ -65,50 +66,65 @@ def split_text_into_chunks(raw_text: str, *, max_tokens: int = 800, page_delimit
     return list(_chunk_words(words, 0, "Chunk", max_tokens=max_tokens))
 
 
+def _summarize_chunk(client, chunk: TextChunk, index: int, total: int, source_label: str) -> str:
+    """Summarize one chunk; failures yield an empty summary."""
+    log_info(
+        f"Summarizing chunk {index}/{total} ({chunk.label})",
+        func_name="scenario_chunking.summarize_chunks",
+    )
+    prompt = (
+        "Summarize the following RPG source text chunk.\n"
+        "Return 3-6 sentences focusing on concrete events, NPCs, places, and clues.\n"
+        "Do not invent facts; rely only on this chunk.\n\n"
+        "Keep the original language.\n\n"
+        f"Source: {source_label}\n"
+        f"Chunk label: {chunk.label} (tokens {chunk.start_token}-{chunk.end_token})\n"
+        f"Text:\n{chunk.text}"
+    )
+    try:
+        # Keep summarize chunks resilient if this step fails.
+        summary = client.chat([
+            {"role": "system", "content": "Summarize RPG source text chunks succinctly. "},
+            {"role": "user", "content": prompt},
+        ])
+    except Exception as exc:
+        log_warning(
+            f"Chunk {chunk.label} summary failed: {exc}",
+            func_name="scenario_chunking.summarize_chunks",
+        )
+        summary = ""
+    return _strip_code_fences(summary)
+
+
 def summarize_chunks(
     raw_text: str,
     client,
     source_label: str,
     *,
     max_tokens: int = 800,
+    max_workers: int = 3,
 ) -> Tuple[str, List[dict]]:
-    """Summarize split chunks and stitch them for downstream prompts."""
+    """Summarize split chunks and stitch them for downstream prompts.
+
+    Up to ``max_workers`` chunk summaries are requested at once; the stitched
+    result keeps the source order.
+    """
     chunks = split_text_into_chunks(raw_text, max_tokens=max_tokens)
     if not chunks:
         return "", []
 
-    stitched_parts: List[str] = []
-    metadata: List[dict] = []
-
-    for idx, chunk in enumerate(chunks, start=1):
-        # Process each (idx, chunk) from enumerate(chunks, start=1).
-        log_info(
-            f"Summarizing chunk {idx}/{len(chunks)} ({chunk.label})",
-            func_name="scenario_chunking.summarize_chunks",
-        )
-        prompt = (
-            "Summarize the following RPG source text chunk.\n"
-            "Return 3-6 sentences focusing on concrete events, NPCs, places, and clues.\n"
-            "Do not invent facts; rely only on this chunk.\n\n"
-            "Keep the original language.\n\n"
-            f"Source: {source_label}\n"
-            f"Chunk label: {chunk.label} (tokens {chunk.start_token}-{chunk.end_token})\n"
-            f"Text:\n{chunk.text}"
-        )
-        try:
-            # Keep summarize chunks resilient if this step fails.
-            summary = client.chat([
-                {"role": "system", "content": "Summarize RPG source text chunks succinctly. "},
-                {"role": "user", "content": prompt},
-            ])
-        except Exception as exc:
-            log_warning(
-                f"Chunk {chunk.label} summary failed: {exc}",
-                func_name="scenario_chunking.summarize_chunks",
+    total = len(chunks)
+    with ThreadPoolExecutor(max_workers=max(1, min(int(max_workers), total))) as executor:
+        summaries = list(
+            executor.map(
+                lambda item: _summarize_chunk(client, item[1], item[0], total, source_label),
+                enumerate(chunks, start=1),
             )
-            summary = ""
+        )
 
-        clean_summary = _strip_code_fences(summary)
+    stitched_parts: List[str] = []
+    metadata: List[dict] = []
+    for chunk, clean_summary in zip(chunks, summaries):
         stitched_parts.append(
             f"{chunk.label} [tokens {chunk.start_token}-{chunk.end_token}]: {clean_summary}"
         )
@@ -20,6 +20,7 @@ from modules.generic.generic_list_selection_view import GenericListSelectionView
 from modules.generic.generic_model_wrapper import GenericModelWrapper
 from modules.helpers.config_helper import ConfigHelper
 from modules.helpers.logging_helper import log_module_import, log_info, log_exception
+from modules.helpers.selection_dialog import SelectionDialog
 from modules.helpers.template_loader import load_template, load_entity_definitions
 from modules.helpers.text_helpers import coerce_text
 from modules.campaigns.shared.arc_status import DEFAULT_SCENARIO_STATUS, canonicalize_scenario_status
@@ -2040,14 +2041,21 @@ class ScenarioBuilderWizard(ctk.CTkToplevel):
             arc_objective=context.get("arc_objective", ""),
             arc_thread=context.get("arc_thread", ""),
             existing_scenarios=existing_scenarios,
-            entity_catalog=load_db_entity_catalog(),
+            entity_catalog=load_db_entity_catalog(relevant_to=brief),
         )
 
         self._set_navigation_enabled(False)
 
         def _worker():
             """Internal helper for worker."""
-            result = self.story_forge.run(request)
+            # Drafting of the likeliest option starts while the GM chooses.
+            session = self.story_forge.propose(request)
+            index = self._ask_story_forge_option(session.options) if len(session.options) > 1 else 0
+            if index is None:
+                session.cancel()
+                self.after(0, lambda: self._set_navigation_enabled(True))
+                return
+            result = session.select(index)
             payload = result.to_scenario_payload()
             self.after(0, lambda: _on_success(payload))
 
@@ -2068,6 +2076,25 @@ class ScenarioBuilderWizard(ctk.CTkToplevel):
 
         self._run_in_worker(_worker, on_error=_on_error)
 
+    def _ask_story_forge_option(self, options):  # pragma: no cover - UI interaction
+        """Ask on the Tk thread which rewrite option to draft; block the worker until answered."""
+        labels = [f"{index}. {option['title']}" for index, option in enumerate(options, start=1)]
+        answered = threading.Event()
+        choice = {}
+
+        def _ask():
+            """Internal helper for ask."""
+            try:
+                dialog = SelectionDialog(self, "Story Forge", "Choose the scenario direction to draft:", labels)
+                self.wait_window(dialog)
+                choice["index"] = labels.index(dialog.result) if dialog.result in labels else None
+            finally:
+                answered.set()
+
+        self.after(0, _ask)
+        answered.wait()
+        return choice.get("index")
+
     def _set_navigation_enabled(self, enabled: bool):  # pragma: no cover - UI interaction
         """Set navigation enabled."""
         state = "normal" if enabled else "disabled"
@@ -82,13 +82,17 @@ class ScenarioGeneratorView(ctk.CTkFrame):
         """Discover Ollama models in the background and refresh the selector."""
         config = AIProviderConfig.from_config()
 
+        def apply(models: list[str]) -> None:
+            self.after(0, lambda: self._update_ai_model_options(models))
+
         def worker() -> None:
             try:
-                models = OllamaModelService(config.base_url).list_models()
+                # Cached names arrive at once; a stale catalog refreshes and calls apply again.
+                models = OllamaModelService(config.base_url).list_models(on_refresh=apply)
             except Exception:
                 log_exception("Failed to load Ollama model list")
                 return
-            self.after(0, lambda: self._update_ai_model_options(models))
+            apply(models)
 
         threading.Thread(target=worker, daemon=True).start()
 
@@ -14,6 +14,8 @@ import tkinter as tk
 import customtkinter as ctk
 
 from modules.books.book_importer import extract_text_from_book
+from modules.books.book_text_index import HIGHLIGHT_CLOSE, HIGHLIGHT_OPEN, BookTextIndex, get_book_text_index
+from modules.generic.campaign_search_index import get_campaign_search_index
 from modules.generic.generic_model_wrapper import GenericModelWrapper
 from modules.helpers.config_helper import ConfigHelper
 from modules.helpers.logging_helper import (
@@ -227,6 +229,9 @@ _DEFAULT_WRAPPER_FACTORIES: Sequence[tuple[str, str]] = (
     ("Books", "books"),
 )
 
+# Indexed searches load this many matches at a time as the list is scrolled.
+_SEARCH_PAGE_SIZE = 200
+
 _DEFAULT_NAME_FIELD_OVERRIDES: Mapping[str, str] = {
     "Scenarios": "Title",
     "Informations": "Title",
@@ -827,13 +832,56 @@ def _label_for_excerpt(page: Mapping[str, Any], default_index: int) -> str:
     return f"Page {default_index + 1}"
 
 
-def _collect_book_excerpts(record: Mapping[str, Any], query: str) -> list[tuple[str, RichTextValue]]:
+def _marked_snippet(snippet: str) -> RichTextValue:
+    """Convert an index snippet with highlight markers into bold rich text."""
+    text_parts: list[str] = []
+    matches: list[tuple[int, int]] = []
+    length = 0
+    start = None
+    for char in snippet:
+        if char == HIGHLIGHT_OPEN:
+            start = length
+        elif char == HIGHLIGHT_CLOSE:
+            if start is not None and length > start:
+                matches.append((start, length))
+            start = None
+        else:
+            text_parts.append(char)
+            length += 1
+    value = RichTextValue("".join(text_parts))
+    if matches:
+        value.formatting = {"bold": matches}
+    return value
+
+
+def _indexed_book_excerpts(
+    record: Mapping[str, Any], query: str, text_index: Any
+) -> list[tuple[str, RichTextValue]]:
+    """Return ranked excerpts for *record* from the book text index."""
+    title = str(record.get("Title") or "").strip()
+    if text_index is None or not title:
+        return []
+    try:
+        hits = text_index.search(query, books=[title])
+    except Exception as exc:
+        log_warning(
+            f"Book text index search failed for '{title}': {exc}",
+            func_name="chatbot_dialog._indexed_book_excerpts",
+        )
+        return []
+    return [(f"Page {hit.page}", _marked_snippet(hit.snippet)) for hit in hits]
+
+
+def _collect_book_excerpts(
+    record: Mapping[str, Any], query: str, text_index: Any = None
+) -> list[tuple[str, RichTextValue]]:
     """Collect book excerpts."""
     query_text = (query or "").strip()
     query_lower = query_text.lower()
     if not query_lower:
         return []
 
+    indexed_excerpts = _indexed_book_excerpts(record, query_text, text_index)
     candidates: list[tuple[str, str]] = []
     extracted_cache: dict[str, str] = {}
 
@@ -896,7 +944,7 @@ def _collect_book_excerpts(record: Mapping[str, Any], query: str) -> list[tuple[
                     excerpts.append((normalized_label, _highlight_snippet(snippet, query_text)))
             start = match_index + len(query_lower)
 
-    return excerpts
+    return indexed_excerpts + excerpts
 
 
 # ---------------------------------------------------------------------------
@@ -938,10 +986,12 @@ class ChatbotDialog(ctk.CTkToplevel):
             self._note_fields = _NOTE_FIELD_CANDIDATES
         self._section_overrides = _DEFAULT_SECTION_FIELDS
 
-        self._results: list[tuple[str, str, Mapping[str, Any]]] = []
+        self._results: list[tuple[str, str, Mapping[str, Any] | None]] = []
+        self._index_paging: dict[str, Any] | None = None
         self._notes_widget: tk.Text | None = None
         self._item_cache: dict[str, list[Mapping[str, Any]]] = {}
         self._search_cache: dict[str, list[str]] = {}
+        self._book_text_index: BookTextIndex | None = None
         self._source_filter_vars: dict[str, tk.BooleanVar] = {}
         self._notes_readonly: bool = True
         self._active_query: str = ""
@@ -1079,7 +1129,14 @@ class ChatbotDialog(ctk.CTkToplevel):
 
         scrollbar = ctk.CTkScrollbar(results_frame, command=self.result_list.yview)
         scrollbar.grid(row=1, column=1, sticky="nsw", padx=(6, 6))
-        self.result_list.configure(yscrollcommand=scrollbar.set)
+
+        def on_results_scrolled(first, last):
+            """Move the scrollbar and load the next indexed page at the end."""
+            scrollbar.set(first, last)
+            if float(last) >= 1.0:
+                self._append_index_page()
+
+        self.result_list.configure(yscrollcommand=on_results_scrolled)
 
         self.selection_label = ctk.CTkLabel(
             results_frame,
@@ -1346,6 +1403,7 @@ class ChatbotDialog(ctk.CTkToplevel):
         self._reset_active_record()
         self.result_list.delete(0, tk.END)
         self._results.clear()
+        self._index_paging = None
 
         if not self._wrappers:
             log_warning(
@@ -1375,6 +1433,10 @@ class ChatbotDialog(ctk.CTkToplevel):
                 self.selection_label.configure(text="")
                 return
 
+        if query and not initial and self._populate_from_index(query, active_sources):
+            self._finish_populate(query)
+            return
+
         for entity_type, wrapper in self._wrappers.items():
             # Process each (entity_type, wrapper) from _wrappers.items().
             if active_sources is not None and entity_type not in active_sources:
@@ -1402,6 +1464,9 @@ class ChatbotDialog(ctk.CTkToplevel):
                 search_blobs = [self._build_search_blob(entity_type, record) for record in items]
                 self._search_cache[entity_type] = search_blobs
             name_field = self._name_field_overrides.get(entity_type, "Name")
+            indexed_names: set[str] = set()
+            if entity_type == "Books" and query and not initial:
+                indexed_names = self._indexed_book_titles(query)
             try:
                 # Keep populate resilient if this step fails.
                 count = len(items)  # type: ignore[arg-type]
@@ -1425,7 +1490,9 @@ class ChatbotDialog(ctk.CTkToplevel):
                     )
                     continue
                 blob = search_blobs[idx] if idx < len(search_blobs) else ""
-                if initial or (query and (query in name.lower() or query in blob)):
+                if initial or (
+                    query and (query in name.lower() or query in blob or name in indexed_names)
+                ):
                     display = f"{entity_type.rstrip('s')}: {name}"
                     self.result_list.insert(tk.END, display)
                     self._results.append((entity_type, name, record))
@@ -1434,7 +1501,79 @@ class ChatbotDialog(ctk.CTkToplevel):
                 f"ChatbotDialog._populate - Added {added_for_entity} visible records for {entity_type}",
                 func_name="ChatbotDialog._populate",
             )
+        self._finish_populate(query)
 
+    def _populate_from_index(self, query: str, active_sources: set[str] | None) -> bool:
+        """Fill results from the campaign search index; return False to scan instead."""
+        labels_by_table: dict[str, str] = {}
+        db_paths = set()
+        for entity_type, wrapper in self._wrappers.items():
+            if active_sources is not None and entity_type not in active_sources:
+                continue
+            table = getattr(wrapper, "entity_type", None)
+            if not isinstance(table, str) or not table:
+                return False
+            labels_by_table[table] = entity_type
+            db_paths.add(getattr(wrapper, "_db_path", None))
+        if len(db_paths) != 1:
+            return False
+        self._index_paging = {
+            "index": get_campaign_search_index(db_paths.pop()),
+            "query": query,
+            "labels": labels_by_table,
+            "shown": set(),
+            "offset": 0,
+        }
+        if not self._append_index_page():
+            self._index_paging = None
+            return False
+        return True
+
+    def _append_index_page(self) -> bool:
+        """Append the next page of indexed matches; return False if the search failed.
+
+        Once the last page is shown, book titles matched only through their
+        transcripts are appended and paging stops.
+        """
+        paging = self._index_paging
+        if paging is None:
+            return True
+        query, labels_by_table = paging["query"], paging["labels"]
+        try:
+            page = paging["index"].search(
+                query, entity_types=labels_by_table, limit=_SEARCH_PAGE_SIZE, offset=paging["offset"]
+            )
+        except Exception as exc:
+            log_warning(
+                f"ChatbotDialog._append_index_page - Indexed search failed, scanning tables: {exc}",
+                func_name="ChatbotDialog._append_index_page",
+            )
+            return False
+        log_debug(
+            f"ChatbotDialog._append_index_page - {page.total} indexed matches for {query!r} "
+            f"(offset {page.offset})",
+            func_name="ChatbotDialog._append_index_page",
+        )
+        shown: set[tuple[str, str]] = paging["shown"]
+        for hit in page.hits:
+            entity_type = labels_by_table.get(hit.entity_type, hit.entity_type)
+            self.result_list.insert(tk.END, f"{entity_type.rstrip('s')}: {hit.name}")
+            self._results.append((entity_type, hit.key, None))
+            shown.add((entity_type, hit.key))
+        paging["offset"] += len(page.hits)
+        if page.has_more and page.hits:
+            return True
+        self._index_paging = None
+        if "Books" in labels_by_table.values():
+            # Book transcripts are searched through the book text index.
+            for title in sorted(self._indexed_book_titles(query)):
+                if ("Books", title) not in shown:
+                    self.result_list.insert(tk.END, f"Book: {title}")
+                    self._results.append(("Books", title, None))
+        return True
+
+    def _finish_populate(self, query: str) -> None:
+        """Select the first result or show the empty state."""
         if self.result_list.size() > 0:
             # Handle the branch where result_list.size() > 0.
             self.result_list.selection_clear(0, tk.END)
@@ -1452,6 +1591,46 @@ class ChatbotDialog(ctk.CTkToplevel):
             else:
                 self._render_text(RichTextValue("No records available to display."))
 
+    def _load_result_record(self, entity_type: str, name: str) -> Mapping[str, Any]:
+        """Load the full row behind an indexed search hit."""
+        wrapper = self._wrappers.get(entity_type)
+        if wrapper is None:
+            return {}
+        try:
+            record = wrapper.load_item_by_key(
+                name, key_field=self._name_field_overrides.get(entity_type, "Name")
+            )
+        except Exception:
+            log_exception(
+                f"ChatbotDialog._load_result_record - Failed to load {entity_type} '{name}'",
+                func_name="ChatbotDialog._load_result_record",
+            )
+            return {}
+        return record or {}
+
+    def _get_book_text_index(self) -> BookTextIndex | None:
+        """Return the full-text index backing the Books source."""
+        if self._book_text_index is None:
+            wrapper = self._wrappers.get("Books")
+            if wrapper is None:
+                return None
+            self._book_text_index = get_book_text_index(getattr(wrapper, "_db_path", None))
+        return self._book_text_index
+
+    def _indexed_book_titles(self, query: str) -> set[str]:
+        """Return titles of books whose indexed text matches *query*."""
+        text_index = self._get_book_text_index()
+        if text_index is None:
+            return set()
+        try:
+            return text_index.matching_books(query)
+        except Exception as exc:
+            log_warning(
+                f"ChatbotDialog._indexed_book_titles - Book text search failed: {exc}",
+                func_name="ChatbotDialog._indexed_book_titles",
+            )
+            return set()
+
     def _build_search_blob(self, entity_type: str, record: Mapping[str, Any]) -> str:
         """Build search blob."""
         parts: list[str] = []
@@ -1569,6 +1748,9 @@ class ChatbotDialog(ctk.CTkToplevel):
         if idx >= len(self._results):
             return
         entity_type, name, record = self._results[idx]
+        if record is None:
+            record = self._load_result_record(entity_type, name)
+            self._results[idx] = (entity_type, name, record)
         self._reset_active_record()
         self._active_entity = (entity_type, name)
         self._active_record = record
@@ -1592,7 +1774,9 @@ class ChatbotDialog(ctk.CTkToplevel):
             self._base_sections = [(title, list(entries)) for title, entries in sections]
             raw_query = self.query_entry.get() if hasattr(self, "query_entry") else ""
             query_for_excerpts = raw_query if raw_query.strip() else self._active_query
-            self._book_excerpts = _collect_book_excerpts(record, query_for_excerpts)
+            self._book_excerpts = _collect_book_excerpts(
+                record, query_for_excerpts, self._get_book_text_index()
+            )
             log_info(
                 f"ChatbotDialog._display_selected_note - Prepared {len(self._book_excerpts)} excerpts for focused navigation",
                 func_name="ChatbotDialog._display_selected_note",
@@ -15,6 +15,13 @@ import customtkinter as ctk
 from modules.ui.image_library.result_card import ImageResult, ImageResultCard
 from modules.image_assets.paths import resolve_asset_reference
 from modules.ui.image_library.thumbnail_cache import ThumbnailCache, ThumbnailPlaceholderFactory
+from modules.ui.image_library.thumbnail_service import (
+    PRIORITY_NEAR,
+    PRIORITY_VISIBLE,
+    ThumbnailService,
+    TkThumbnailDelivery,
+    get_thumbnail_service,
+)
 from modules.ui.image_library.toolbar import ImageLibraryToolbar, SORT_OPTIONS, ToolbarState
 from modules.ui.image_library.editor.image_editor_dialog import ImageEditorDialog
 from modules.ui.image_viewer import show_portrait
@@ -63,10 +70,16 @@ class ImageBrowserPanel(ctk.CTkFrame):
         self._filtered_records: list[ImageResult] = []
         self._active_cards: list[ImageResultCard] = []
         self._ctk_images: list[ctk.CTkImage] = []
+        self._placeholder_images: dict[tuple[int, int], ctk.CTkImage] = {}
+        self._render_generation = 0
 
         self._open_callback = on_open or self._default_open
         self._view_callback = on_view or self._default_view
-        self._thumbnail_cache = thumbnail_cache or ThumbnailCache(max_items=512)
+        self._thumbnail_service: ThumbnailService = (
+            ThumbnailService(thumbnail_cache) if thumbnail_cache else get_thumbnail_service()
+        )
+        self._thumbnail_cache = self._thumbnail_service.cache
+        self._thumbnail_delivery = TkThumbnailDelivery(self, self._thumbnail_service)
         self._attach_callback = on_attach_to_entity
         self._toolbar_state_changed_callback = on_toolbar_state_changed
 
@@ -342,6 +355,7 @@ class ImageBrowserPanel(ctk.CTkFrame):
         canvas = getattr(self.scrollable, "_parent_canvas", None)
         if not canvas:
             window = VirtualWindow(0, total_rows)
+            visible_rows = range(0, total_rows)
         else:
             y_top_fraction, _y_bottom_fraction = canvas.yview()
             canvas_height = max(1, canvas.winfo_height())
@@ -352,6 +366,7 @@ class ImageBrowserPanel(ctk.CTkFrame):
             start_row = max(0, first_visible_row - self._row_overscan)
             end_row = min(total_rows, first_visible_row + visible_row_count + self._row_overscan)
             window = VirtualWindow(start_row, end_row)
+            visible_rows = range(first_visible_row, first_visible_row + visible_row_count)
 
         render_signature = (display_mode, columns, item_height, total_items)
         should_rerender = not (
@@ -379,10 +394,12 @@ class ImageBrowserPanel(ctk.CTkFrame):
             item = self._filtered_records[index]
             row = offset // columns
             col = offset % columns
+            thumb_path = item.resolved_path or item.path
+            image, pending = self._card_thumbnail(thumb_path, thumb_size)
             card = ImageResultCard(
                 self._items_frame,
                 item=item,
-                image=self._load_ctk_thumb(item.resolved_path or item.path, thumb_size),
+                image=image,
                 display_mode=display_mode,
                 on_open=self._open_callback,
                 on_view=self._view_callback,
@@ -393,6 +410,10 @@ class ImageBrowserPanel(ctk.CTkFrame):
             pady = 8 if display_mode == "Grid" else 4
             card.grid(row=row, column=col, padx=padx, pady=pady, sticky="ew")
             self._active_cards.append(card)
+            if pending:
+                # Cards in the viewport load before the overscan rows.
+                priority = PRIORITY_VISIBLE if window.start_row + row in visible_rows else PRIORITY_NEAR
+                self._request_card_thumbnail(card, thumb_path, thumb_size, priority)
 
     def _load_ctk_thumb(self, path: str, size: tuple[int, int]) -> ctk.CTkImage:
         """Fetch thumbnail from cache and wrap as CTk image."""
@@ -406,6 +427,43 @@ class ImageBrowserPanel(ctk.CTkFrame):
         self._ctk_images.append(ctk_img)
         return ctk_img
 
+    def _card_thumbnail(self, path: str, size: tuple[int, int]) -> tuple[ctk.CTkImage, bool]:
+        """Return ``(image, pending)``: a cached thumbnail, or a placeholder to replace."""
+        cached = self._thumbnail_service.peek(self._resolve_thumbnail_path(path), size)
+        if cached is not None:
+            ctk_img = ctk.CTkImage(light_image=cached, dark_image=cached, size=size)
+            self._ctk_images.append(ctk_img)
+            return ctk_img, False
+        return self._placeholder_image(size), True
+
+    def _placeholder_image(self, size: tuple[int, int]) -> ctk.CTkImage:
+        placeholder = self._placeholder_images.get(size)
+        if placeholder is None:
+            image = ThumbnailPlaceholderFactory.build(size)
+            placeholder = ctk.CTkImage(light_image=image, dark_image=image, size=size)
+            self._placeholder_images[size] = placeholder
+        return placeholder
+
+    def _request_card_thumbnail(
+        self, card: ImageResultCard, path: str, size: tuple[int, int], priority: int
+    ) -> None:
+        """Load a card thumbnail off the Tk thread and swap it in when ready."""
+        generation = self._render_generation
+        self._thumbnail_delivery.request(
+            self._resolve_thumbnail_path(path),
+            size,
+            lambda image, _error: self._apply_card_thumbnail(card, generation, image, size),
+            priority=priority,
+            owner=self,
+        )
+
+    def _apply_card_thumbnail(self, card, generation: int, image, size: tuple[int, int]) -> None:
+        if generation != self._render_generation or image is None or not card.winfo_exists():
+            return
+        ctk_img = ctk.CTkImage(light_image=image, dark_image=image, size=size)
+        self._ctk_images.append(ctk_img)
+        card.set_image(ctk_img)
+
     @staticmethod
     def _resolve_thumbnail_path(path: str) -> str:
         """Resolve image-library thumbnails the same way preview resolves portraits."""
@@ -417,12 +475,19 @@ class ImageBrowserPanel(ctk.CTkFrame):
 
     def _clear_rendered_cards(self) -> None:
         """Remove currently rendered widgets and image references."""
+        # Thumbnails still queued for the old cards are no longer needed.
+        self._render_generation += 1
+        self._thumbnail_service.cancel_owner(self)
         for card in self._active_cards:
             if card.winfo_exists():
                 card.destroy()
         self._active_cards.clear()
         self._ctk_images.clear()
 
+    def destroy(self) -> None:
+        self._thumbnail_service.cancel_owner(self)
+        super().destroy()
+
     def _show_context_menu(self, item: ImageResult, x_root: int, y_root: int) -> None:
         """Open right-click context menu for one item."""
         self._context_item = item
@@ -447,7 +512,8 @@ class ImageBrowserPanel(ctk.CTkFrame):
         if not self._context_item:
             return
 
-        def _refresh_after_save(_saved_path: str) -> None:
+        def _refresh_after_save(saved_path: str) -> None:
+            self._thumbnail_service.invalidate(self._resolve_thumbnail_path(saved_path) or saved_path)
             self._apply_filters_and_render()
 
         ImageEditorDialog(
@@ -1,6 +1,7 @@
 """Dialogs for image library workflows."""
 
+from modules.ui.image_library.dialogs.duplicate_review_dialog import ImageDuplicateReviewDialog
 from modules.ui.image_library.dialogs.import_directories_dialog import ImageDirectoryImportDialog
 from modules.ui.image_library.dialogs.library_browser_dialog import ImageLibraryBrowserDialog
 
-__all__ = ["ImageDirectoryImportDialog", "ImageLibraryBrowserDialog"]
+__all__ = ["ImageDirectoryImportDialog", "ImageDuplicateReviewDialog", "ImageLibraryBrowserDialog"]
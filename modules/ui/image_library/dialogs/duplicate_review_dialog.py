@@ -0,0 +1,258 @@
+"""Dialog to review and merge duplicate images in the shared library."""
+
+from __future__ import annotations
+
+import threading
+import tkinter as tk
+from tkinter import messagebox, ttk
+
+import customtkinter as ctk
+
+from modules.helpers.logging_helper import log_exception
+from modules.image_assets import ImageAssetsService
+from modules.image_assets.services.duplicate_service import DuplicateGroup, DuplicateMergeResult
+
+# Maximum Hamming distance between 64-bit dHashes for each strictness level.
+STRICTNESS_DISTANCES = {"Identical": 0, "Very similar": 4, "Similar": 8}
+
+
+def format_bytes(size: int) -> str:
+    """Return a short human-readable size."""
+    value = float(size)
+    for unit in ("B", "KB", "MB", "GB"):
+        if value < 1024 or unit == "GB":
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GB"
+
+
+class ImageDuplicateReviewDialog(ctk.CTkToplevel):
+    """Scan the library for duplicates and merge the groups the GM confirms."""
+
+    def __init__(self, master: tk.Misc | None = None, *, service: ImageAssetsService | None = None) -> None:
+        super().__init__(master)
+        self.title("Image Library Duplicates")
+        self.geometry("980x640")
+        self.minsize(760, 480)
+        self.transient(master)
+
+        self._service = service or ImageAssetsService()
+        self._groups: dict[str, DuplicateGroup] = {}
+        self._scan_cancel = threading.Event()
+        self._busy = False
+
+        self.strictness_var = ctk.StringVar(value="Very similar")
+        self.delete_files_var = ctk.BooleanVar(value=False)
+        self.status_var = ctk.StringVar(value="Scan the library to look for duplicates.")
+
+        self._build_ui()
+        self.bind("<Escape>", lambda _event: self.destroy())
+        self.lift()
+        self.focus_force()
+
+    def _build_ui(self) -> None:
+        """Build UI."""
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
+
+        top = ctk.CTkFrame(self)
+        top.grid(row=0, column=0, sticky="ew", padx=12, pady=(12, 8))
+        top.grid_columnconfigure(3, weight=1)
+        ctk.CTkLabel(top, text="Match").grid(row=0, column=0, padx=(8, 4), pady=8)
+        ctk.CTkOptionMenu(
+            top, values=list(STRICTNESS_DISTANCES), variable=self.strictness_var
+        ).grid(row=0, column=1, padx=4, pady=8)
+        self.scan_button = ctk.CTkButton(top, text="Scan", command=self._start_scan)
+        self.scan_button.grid(row=0, column=2, padx=4, pady=8)
+        ctk.CTkLabel(top, textvariable=self.status_var, anchor="w").grid(
+            row=0, column=3, sticky="ew", padx=8, pady=8
+        )
+
+        tree_frame = ctk.CTkFrame(self)
+        tree_frame.grid(row=1, column=0, sticky="nsew", padx=12, pady=8)
+        tree_frame.grid_columnconfigure(0, weight=1)
+        tree_frame.grid_rowconfigure(0, weight=1)
+        self.tree = ttk.Treeview(
+            tree_frame, columns=("resolution", "size", "path"), selectmode="extended"
+        )
+        self.tree.heading("#0", text="Image")
+        self.tree.heading("resolution", text="Resolution")
+        self.tree.heading("size", text="Size")
+        self.tree.heading("path", text="Path")
+        self.tree.column("#0", width=260)
+        self.tree.column("resolution", width=110, anchor="center")
+        self.tree.column("size", width=90, anchor="e")
+        self.tree.column("path", width=420)
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
+        scrollbar.grid(row=0, column=1, sticky="ns")
+        self.tree.configure(yscrollcommand=scrollbar.set)
+
+        actions = ctk.CTkFrame(self)
+        actions.grid(row=2, column=0, sticky="ew", padx=12, pady=(0, 12))
+        actions.grid_columnconfigure(1, weight=1)
+        ctk.CTkCheckBox(
+            actions, text="Delete duplicate files from disk", variable=self.delete_files_var
+        ).grid(row=0, column=0, padx=8, pady=8, sticky="w")
+        ctk.CTkButton(actions, text="Keep selected image", command=self._keep_selected).grid(
+            row=0, column=2, padx=4, pady=8
+        )
+        ctk.CTkButton(actions, text="Merge selected groups", command=self._merge_selected).grid(
+            row=0, column=3, padx=4, pady=8
+        )
+        ctk.CTkButton(actions, text="Merge all", command=self._merge_all).grid(
+            row=0, column=4, padx=(4, 8), pady=8
+        )
+
+    def _start_scan(self) -> None:
+        """Hash new assets and group duplicates on a worker thread."""
+        if self._busy:
+            return
+        self._busy = True
+        self.scan_button.configure(state="disabled")
+        self.status_var.set("Hashing images…")
+        max_distance = STRICTNESS_DISTANCES.get(self.strictness_var.get(), 4)
+
+        def report(done: int, total: int) -> None:
+            self.after(0, lambda: self.status_var.set(f"Hashing images… {done}/{total}"))
+
+        def worker() -> None:
+            try:
+                groups = self._service.find_duplicates(
+                    max_distance, progress=report, cancelled=self._scan_cancel.is_set
+                )
+                error = None
+            except Exception as exc:
+                groups, error = [], exc
+            if not self._scan_cancel.is_set():
+                self.after(0, lambda: self._on_scan_complete(groups, error))
+
+        threading.Thread(target=worker, name="image-duplicate-scan", daemon=True).start()
+
+    def _on_scan_complete(self, groups: list[DuplicateGroup], error: Exception | None) -> None:
+        self._busy = False
+        self.scan_button.configure(state="normal")
+        if error is not None:
+            log_exception(
+                f"Duplicate scan failed: {error}",
+                func_name="ImageDuplicateReviewDialog._on_scan_complete",
+            )
+            self.status_var.set("Duplicate scan failed.")
+            return
+        self._show_groups(groups)
+
+    def _show_groups(self, groups: list[DuplicateGroup]) -> None:
+        self.tree.delete(*self.tree.get_children())
+        self._groups.clear()
+        for index, group in enumerate(groups):
+            group_id = f"group-{index}"
+            self._groups[group_id] = group
+            kind = "identical" if group.exact else "similar"
+            self.tree.insert(
+                "",
+                "end",
+                iid=group_id,
+                text=f"{len(group.assets)} {kind} images",
+                values=("", format_bytes(group.reclaimable_bytes), ""),
+                open=True,
+            )
+            self._insert_members(group_id, group)
+        reclaimable = sum(group.reclaimable_bytes for group in groups)
+        self.status_var.set(
+            f"{len(groups)} duplicate groups, {format_bytes(reclaimable)} reclaimable."
+            if groups
+            else "No duplicates found."
+        )
+
+    def _insert_members(self, group_id: str, group: DuplicateGroup) -> None:
+        for position, asset in enumerate(group.assets):
+            width, height = asset.get("Width"), asset.get("Height")
+            self.tree.insert(
+                group_id,
+                "end",
+                iid=f"{group_id}:{asset.get('AssetId')}",
+                text=("★ " if position == 0 else "") + str(asset.get("Name") or ""),
+                values=(
+                    f"{width}×{height}" if width and height else "",
+                    format_bytes(int(asset.get("FileSizeBytes") or 0)),
+                    str(asset.get("Path") or ""),
+                ),
+            )
+
+    def _keep_selected(self) -> None:
+        """Make the selected image the keeper of its group."""
+        for item in self.tree.selection():
+            group_id, _sep, asset_id = item.partition(":")
+            group = self._groups.get(group_id)
+            if group is None or not asset_id:
+                continue
+            group.assets.sort(key=lambda asset: str(asset.get("AssetId")) != asset_id)
+            self.tree.delete(*self.tree.get_children(group_id))
+            self._insert_members(group_id, group)
+
+    def _selected_groups(self) -> list[str]:
+        selected = []
+        for item in self.tree.selection():
+            group_id = item.partition(":")[0]
+            if group_id in self._groups and group_id not in selected:
+                selected.append(group_id)
+        return selected
+
+    def _merge_selected(self) -> None:
+        self._merge(self._selected_groups())
+
+    def _merge_all(self) -> None:
+        self._merge(list(self._groups))
+
+    def _merge(self, group_ids: list[str]) -> None:
+        """Merge groups after confirmation and drop them from the list."""
+        if self._busy or not group_ids:
+            return
+        groups = [self._groups[group_id] for group_id in group_ids]
+        delete_files = bool(self.delete_files_var.get())
+        duplicates = sum(len(group.duplicates) for group in groups)
+        detail = "and deleted from disk" if delete_files else "from the library (files are kept)"
+        if not messagebox.askyesno(
+            "Merge duplicates",
+            f"{duplicates} duplicate images will be removed {detail}. "
+            "References will point at the starred image. Continue?",
+            parent=self,
+        ):
+            return
+        try:
+            results = self._service.merge_duplicates(groups, delete_files=delete_files)
+        except Exception as exc:
+            log_exception(
+                f"Duplicate merge failed: {exc}",
+                func_name="ImageDuplicateReviewDialog._merge",
+            )
+            messagebox.showerror("Merge duplicates", f"Merge failed:\n{exc}", parent=self)
+            return
+        for group_id in group_ids:
+            self._groups.pop(group_id, None)
+            self.tree.delete(group_id)
+        messagebox.showinfo("Merge duplicates", self._format_results(results), parent=self)
+        self.status_var.set(f"{len(self._groups)} duplicate groups left.")
+
+    @staticmethod
+    def _format_results(results: list[DuplicateMergeResult]) -> str:
+        lines = [
+            f"Removed images: {sum(len(result.removed_ids) for result in results)}",
+            f"References updated: {sum(result.references_updated for result in results)}",
+            f"Files deleted: {sum(result.files_deleted for result in results)}",
+            f"Space reclaimed: {format_bytes(sum(result.bytes_reclaimed for result in results))}",
+        ]
+        unresolved = [reference for result in results for reference in result.unresolved_references]
+        if unresolved:
+            lines.append(f"Files kept because they are still referenced: {len(unresolved)}")
+            lines.extend(f"  {reference}" for reference in unresolved[:10])
+            if len(unresolved) > 10:
+                lines.append(f"  ... and {len(unresolved) - 10} more")
+        errors = sum(len(result.errors) for result in results)
+        if errors:
+            lines.append(f"Errors: {errors}")
+        return "\n".join(lines)
+
+    def destroy(self) -> None:
+        self._scan_cancel.set()
+        super().destroy()
@@ -46,6 +46,7 @@ class ImageResultCard(ctk.CTkFrame):
         self._on_view = on_view
         self._on_context_menu = on_context_menu
         self._on_attach = on_attach
+        self._thumb_label: ctk.CTkLabel | None = None
 
         self.grid_columnconfigure(1, weight=1)
 
@@ -56,7 +57,7 @@ class ImageResultCard(ctk.CTkFrame):
 
     def _build_list_layout(self, image: ctk.CTkImage) -> None:
         """Build row-oriented layout."""
-        thumb = ctk.CTkLabel(self, text="", image=image)
+        thumb = self._thumb_label = ctk.CTkLabel(self, text="", image=image)
         thumb.grid(row=0, column=0, padx=(8, 12), pady=8, sticky="w")
 
         title = ctk.CTkLabel(self, text=self.item.name, anchor="w")
@@ -74,7 +75,7 @@ class ImageResultCard(ctk.CTkFrame):
 
     def _build_grid_layout(self, image: ctk.CTkImage) -> None:
         """Build card-style layout."""
-        thumb = ctk.CTkLabel(self, text="", image=image)
+        thumb = self._thumb_label = ctk.CTkLabel(self, text="", image=image)
         thumb.grid(row=0, column=0, padx=8, pady=(8, 4), sticky="n")
 
         title = ctk.CTkLabel(self, text=self.item.name, justify="center", wraplength=180)
@@ -82,6 +83,11 @@ class ImageResultCard(ctk.CTkFrame):
 
         self._bind_interactions(thumb, title, self)
 
+    def set_image(self, image: ctk.CTkImage) -> None:
+        """Replace the thumbnail once it has loaded."""
+        if self._thumb_label is not None:
+            self._thumb_label.configure(image=image)
+
     def _bind_interactions(self, *widgets) -> None:
         """Wire all interaction shortcuts consistently."""
         for widget in widgets:
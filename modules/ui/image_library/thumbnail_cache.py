@@ -2,114 +2,128 @@
 
 from __future__ import annotations
 
-import hashlib
 import io
 import os
 from collections import OrderedDict
 from pathlib import Path
 from threading import RLock
+from typing import Callable
 
 from PIL import Image, ImageOps
 
+from modules.ui.image_library.thumbnail_store import ThumbnailStore
+
 
 class ThumbnailCache:
-    """Hybrid thumbnail cache with in-memory LRU and optional disk backing."""
+    """Thumbnail cache with an in-memory LRU and an optional SQLite blob store.
+
+    Returned images are shared with the cache and must not be mutated.
+    """
 
     def __init__(
         self,
         *,
         max_items: int = 512,
         disk_cache_dir: str | os.PathLike[str] | None = None,
-        image_format: str = "PNG",
+        store: ThumbnailStore | None = None,
+        builder: Callable[[str, tuple[int, int]], Image.Image] | None = None,
+        namespace: str = "library",
     ) -> None:
         self.max_items = max(1, int(max_items))
-        self.image_format = image_format.upper()
-        self._memory: OrderedDict[str, Image.Image] = OrderedDict()
+        self.namespace = namespace
+        self._memory: OrderedDict[tuple[str, int | None, tuple[int, int]], Image.Image] = OrderedDict()
         self._lock = RLock()
-        self._disk_cache_dir = Path(disk_cache_dir).expanduser() if disk_cache_dir else None
-        if self._disk_cache_dir:
-            self._disk_cache_dir.mkdir(parents=True, exist_ok=True)
+        if store is None and disk_cache_dir:
+            store = ThumbnailStore(Path(disk_cache_dir).expanduser() / "thumbnails.sqlite3")
+        self._store = store
+        self._builder = builder or (lambda path, size: self._build_thumbnail(source_path=path, size=size))
 
     def clear(self) -> None:
         """Clear in-memory cache only."""
         with self._lock:
             self._memory.clear()
 
-    def get_thumbnail(self, source_path: str, size: tuple[int, int]) -> Image.Image:
-        """Return a thumbnail image for the source path and requested size."""
-        cache_key = self._make_cache_key(source_path=source_path, size=size)
+    def peek(self, source_path: str, size: tuple[int, int]) -> Image.Image | None:
+        """Return a thumbnail held in memory for the file as it is now."""
+        return self._lookup(self._memory_key(source_path, size, self._stat(source_path)))
 
+    def _lookup(self, key: tuple[str, int | None, tuple[int, int]]) -> Image.Image | None:
         with self._lock:
-            cached = self._memory.get(cache_key)
+            cached = self._memory.get(key)
             if cached is not None:
-                self._memory.move_to_end(cache_key)
-                return cached.copy()
-
-        if self._disk_cache_dir:
-            disk_image = self._load_from_disk(cache_key)
-            if disk_image is not None:
-                self._remember(cache_key, disk_image)
-                return disk_image.copy()
-
-        image = self._build_thumbnail(source_path=source_path, size=size)
-        self._remember(cache_key, image)
-        if self._disk_cache_dir:
-            self._store_to_disk(cache_key, image)
-        return image.copy()
-
-    def _remember(self, cache_key: str, image: Image.Image) -> None:
+                self._memory.move_to_end(key)
+            return cached
+
+    def invalidate(self, source_path: str) -> None:
+        """Forget in-memory thumbnails of *source_path* after it was edited."""
+        source_path = str(source_path)
+        with self._lock:
+            for key in [key for key in self._memory if key[0] == source_path]:
+                del self._memory[key]
+
+    def get_thumbnail(self, source_path: str, size: tuple[int, int]) -> Image.Image:
+        """Return a thumbnail image for the source path and requested size."""
+        size = tuple(size)
+        stat = self._stat(source_path)
+        key = self._memory_key(source_path, size, stat)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        store_key = None
+        if self._store is not None and stat is not None:
+            store_key = self._store_key(source_path=source_path, size=size, stat=stat)
+        if store_key:
+            stored = self._store.get(store_key)
+            if stored is not None:
+                self._remember(key, stored)
+                return stored
+
+        image = self._builder(source_path, size)
+        self._remember(key, image)
+        if store_key:
+            try:
+                self._store.put(store_key, image)
+            except Exception:
+                pass
+        return image
+
+    def _remember(self, key: tuple[str, int | None, tuple[int, int]], image: Image.Image) -> None:
         """Store one entry in LRU memory cache."""
         with self._lock:
-            self._memory[cache_key] = image.copy()
-            self._memory.move_to_end(cache_key)
+            self._memory[key] = image
+            self._memory.move_to_end(key)
             while len(self._memory) > self.max_items:
                 self._memory.popitem(last=False)
 
-    def _load_from_disk(self, cache_key: str) -> Image.Image | None:
-        """Load a thumbnail from disk cache if available."""
-        path = self._disk_path(cache_key)
-        if not path or not path.exists():
-            return None
+    @staticmethod
+    def _stat(source_path: str) -> os.stat_result | None:
         try:
-            with Image.open(path) as img:
-                return img.copy()
-        except Exception:
+            return os.stat(source_path)
+        except OSError:
             return None
 
-    def _store_to_disk(self, cache_key: str, image: Image.Image) -> None:
-        """Write a thumbnail to disk cache."""
-        path = self._disk_path(cache_key)
-        if not path:
-            return
-        try:
-            image.save(path, format=self.image_format)
-        except Exception:
-            return
-
-    def _disk_path(self, cache_key: str) -> Path | None:
-        """Return the disk path for a cache key."""
-        if not self._disk_cache_dir:
-            return None
-        extension = self.image_format.lower()
-        return self._disk_cache_dir / f"{cache_key}.{extension}"
+    @staticmethod
+    def _memory_key(
+        source_path: str, size: tuple[int, int], stat: os.stat_result | None
+    ) -> tuple[str, int | None, tuple[int, int]]:
+        """Key memory entries by path and mtime so an overwritten file misses."""
+        return (str(source_path), stat.st_mtime_ns if stat is not None else None, tuple(size))
 
-    def _make_cache_key(self, *, source_path: str, size: tuple[int, int]) -> str:
-        """Create deterministic cache key from path, mtime and size."""
-        source = Path(source_path)
-        try:
-            stat = source.stat()
-            marker = f"{source.resolve()}::{stat.st_mtime_ns}::{stat.st_size}::{size[0]}x{size[1]}"
-        except OSError:
-            marker = f"{source_path}::missing::{size[0]}x{size[1]}"
-        return hashlib.sha256(marker.encode("utf-8")).hexdigest()
+    def _store_key(self, *, source_path: str, size: tuple[int, int], stat: os.stat_result) -> str:
+        """Key persisted thumbnails by path, mtime and file size."""
+        return f"{self.namespace}:{source_path}:{stat.st_mtime_ns}:{stat.st_size}:{size[0]}x{size[1]}"
 
     @staticmethod
     def _build_thumbnail(*, source_path: str, size: tuple[int, int]) -> Image.Image:
         """Generate thumbnail from source path."""
         with Image.open(source_path) as original:
+            if hasattr(original, "draft"):
+                # JPEG sources decode at a reduced scale close to the target.
+                original.draft("RGB", (size[0] * 2, size[1] * 2))
             transformed = ImageOps.exif_transpose(original)
             rendered = transformed.convert("RGBA")
-            rendered.thumbnail(size, Image.Resampling.LANCZOS)
+            rendered.thumbnail(size, Image.Resampling.LANCZOS, reducing_gap=2.0)
             output = Image.new("RGBA", size, (32, 32, 32, 255))
             paste_x = (size[0] - rendered.width) // 2
             paste_y = (size[1] - rendered.height) // 2
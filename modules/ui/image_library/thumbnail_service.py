@@ -0,0 +1,277 @@
+"""Asynchronous, prioritized thumbnail loading.
+
+Widgets ask :class:`ThumbnailService` for thumbnails instead of decoding on
+the Tk thread.  Requests are served by a small thread pool in priority order
+(visible cards first) and can be cancelled when cards scroll out of view.
+Callbacks run on a worker thread; widgets go through :class:`TkThumbnailDelivery`,
+which queues results and applies them from a poll on the Tk thread.
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+import queue
+import threading
+import tkinter as tk
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Hashable, Optional
+
+from PIL import Image
+
+from modules.helpers.config_helper import ConfigHelper
+from modules.helpers.logging_helper import log_module_import, log_warning
+from modules.ui.image_library.thumbnail_cache import ThumbnailCache
+from modules.ui.image_library.thumbnail_store import ThumbnailStore
+
+log_module_import(__name__)
+
+PRIORITY_VISIBLE = 0
+PRIORITY_NEAR = 1
+PRIORITY_BACKGROUND = 2
+STORE_RELATIVE_PATH = os.path.join(".cache", "thumbnails.sqlite3")
+
+ThumbnailCallback = Callable[[Optional[Image.Image], Optional[BaseException]], None]
+
+
+@dataclass(eq=False)
+class ThumbnailTicket:
+    """Handle of one queued request; cancelling it drops the pending work."""
+
+    source_path: str
+    size: tuple[int, int]
+    callback: ThumbnailCallback
+    owner: Hashable = None
+    cancelled: bool = field(default=False)
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class ThumbnailService:
+    """Serve thumbnails from a :class:`ThumbnailCache` on a worker pool."""
+
+    def __init__(self, cache: ThumbnailCache | None = None, *, max_workers: int | None = None) -> None:
+        self.cache = cache or ThumbnailCache()
+        self.max_workers = max(1, int(max_workers or min(4, os.cpu_count() or 2)))
+        self._jobs: queue.PriorityQueue = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._owners: dict[Hashable, set[ThumbnailTicket]] = {}
+        self._lock = threading.Lock()
+        self._threads: list[threading.Thread] = []
+        self._closed = False
+
+    def peek(self, source_path: str, size: tuple[int, int]) -> Image.Image | None:
+        """Return an in-memory thumbnail immediately, or ``None``."""
+        return self.cache.peek(source_path, size)
+
+    def request(
+        self,
+        source_path: str,
+        size: tuple[int, int],
+        callback: ThumbnailCallback,
+        *,
+        priority: int = PRIORITY_VISIBLE,
+        owner: Hashable = None,
+    ) -> ThumbnailTicket:
+        """Queue a thumbnail; lower *priority* values are served first.
+
+        *owner* groups requests so a view can drop all of its outstanding
+        work with :meth:`cancel_owner` when it re-renders.
+        """
+        ticket = ThumbnailTicket(str(source_path), tuple(size), callback, owner)
+        if self._closed:
+            ticket.cancel()
+            return ticket
+        with self._lock:
+            if owner is not None:
+                self._owners.setdefault(owner, set()).add(ticket)
+            self._ensure_workers()
+        self._jobs.put((int(priority), next(self._sequence), ticket))
+        return ticket
+
+    def cancel_owner(self, owner: Hashable) -> None:
+        """Cancel every pending request made on behalf of *owner*."""
+        with self._lock:
+            tickets = self._owners.pop(owner, set())
+        for ticket in tickets:
+            ticket.cancel()
+
+    def invalidate(self, source_path: str) -> None:
+        self.cache.invalidate(source_path)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        for _thread in self._threads:
+            self._jobs.put((-1, next(self._sequence), None))
+
+    def _ensure_workers(self) -> None:
+        """Start workers lazily (lock held by caller)."""
+        while len(self._threads) < self.max_workers:
+            thread = threading.Thread(target=self._run, name="thumbnail-worker", daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _run(self) -> None:
+        while True:
+            _priority, _sequence, ticket = self._jobs.get()
+            if ticket is None:
+                return
+            if ticket.cancelled:
+                continue
+            image, error = None, None
+            try:
+                image = self.cache.get_thumbnail(ticket.source_path, ticket.size)
+            except Exception as exc:
+                error = exc
+            self._forget(ticket)
+            if not ticket.cancelled:
+                try:
+                    ticket.callback(image, error)
+                except Exception:
+                    pass
+
+    def _forget(self, ticket: ThumbnailTicket) -> None:
+        if ticket.owner is None:
+            return
+        with self._lock:
+            tickets = self._owners.get(ticket.owner)
+            if tickets is not None:
+                tickets.discard(ticket)
+                if not tickets:
+                    self._owners.pop(ticket.owner, None)
+
+
+class TkThumbnailDelivery:
+    """Request thumbnails for a Tk widget and run handlers on the Tk thread.
+
+    Worker threads only put results on a queue; the widget polls it with
+    ``after`` while requests are outstanding. Create and use it from the Tk
+    thread.
+    """
+
+    def __init__(self, widget, service: ThumbnailService, *, poll_ms: int = 30) -> None:
+        self.widget = widget
+        self.service = service
+        self.poll_ms = max(1, int(poll_ms))
+        self._results: queue.SimpleQueue = queue.SimpleQueue()
+        self._pending: set[ThumbnailTicket] = set()
+        self._polling = False
+
+    def request(
+        self,
+        source_path: str,
+        size: tuple[int, int],
+        handler: ThumbnailCallback,
+        *,
+        priority: int = PRIORITY_VISIBLE,
+        owner: Hashable = None,
+    ) -> ThumbnailTicket:
+        """Like :meth:`ThumbnailService.request`, but *handler* runs on the Tk thread."""
+        holder: list[ThumbnailTicket] = []
+        ticket = self.service.request(
+            source_path,
+            size,
+            lambda image, error: self._results.put((holder, handler, image, error)),
+            priority=priority,
+            owner=owner,
+        )
+        holder.append(ticket)
+        if not ticket.cancelled:
+            self._pending.add(ticket)
+            self._schedule()
+        return ticket
+
+    def _schedule(self) -> None:
+        if self._polling:
+            return
+        try:
+            self.widget.after(self.poll_ms, self._poll)
+        except (RuntimeError, tk.TclError):
+            return
+        self._polling = True
+
+    def _poll(self) -> None:
+        self._polling = False
+        try:
+            alive = bool(self.widget.winfo_exists())
+        except (RuntimeError, tk.TclError):
+            alive = False
+        if not alive:
+            self._pending.clear()
+            return
+        while True:
+            try:
+                holder, handler, image, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            ticket = holder[0] if holder else None
+            self._pending.discard(ticket)
+            if ticket is not None and ticket.cancelled:
+                continue
+            try:
+                handler(image, error)
+            except tk.TclError:
+                pass
+        # Cancelled tickets never report back, so stop waiting for them.
+        self._pending = {ticket for ticket in self._pending if not ticket.cancelled}
+        if self._pending:
+            self._schedule()
+
+
+_SERVICES: dict[str, tuple[str, ThumbnailService]] = {}
+_STORES: dict[str, ThumbnailStore] = {}
+_SERVICES_LOCK = threading.Lock()
+
+
+def _shared_store(campaign_dir: str) -> ThumbnailStore | None:
+    """Return the thumbnail store of *campaign_dir* (lock held by caller)."""
+    path = str(Path(campaign_dir) / STORE_RELATIVE_PATH)
+    if path not in _STORES:
+        try:
+            _STORES[path] = ThumbnailStore(path)
+        except Exception as exc:
+            log_warning(
+                f"Thumbnail store unavailable, using memory only: {exc}",
+                func_name="modules.ui.image_library.thumbnail_service._shared_store",
+            )
+            return None
+    return _STORES[path]
+
+
+def _media_thumbnail(source_path: str, size: tuple[int, int]) -> Image.Image:
+    from modules.ui.entity_media.thumbnail import load_media_thumbnail
+
+    return load_media_thumbnail(source_path, size)
+
+
+def _campaign_service(kind: str, build: Callable[[ThumbnailStore | None], ThumbnailCache]) -> ThumbnailService:
+    """Return the *kind* service of the current campaign, replacing it after a switch."""
+    campaign_dir = str(ConfigHelper.get_campaign_dir())
+    with _SERVICES_LOCK:
+        current = _SERVICES.get(kind)
+        if current is not None and current[0] == campaign_dir:
+            return current[1]
+        if current is not None:
+            current[1].close()
+        service = ThumbnailService(build(_shared_store(campaign_dir)))
+        _SERVICES[kind] = (campaign_dir, service)
+        return service
+
+
+def get_thumbnail_service() -> ThumbnailService:
+    """Return the current campaign's service for image-library thumbnails."""
+    return _campaign_service("library", lambda store: ThumbnailCache(max_items=1024, store=store))
+
+
+def get_media_thumbnail_service() -> ThumbnailService:
+    """Return the current campaign's service for entity portraits and media previews."""
+    return _campaign_service(
+        "media",
+        lambda store: ThumbnailCache(
+            max_items=1024, store=store, builder=_media_thumbnail, namespace="media"
+        ),
+    )
@@ -0,0 +1,114 @@
+"""Single-file SQLite blob store for rendered thumbnails.
+
+All thumbnails live in one memory-mapped database instead of one PNG per
+image.  Rows hold zlib-compressed raw pixels, so a hit is a primary-key
+lookup plus ``Image.frombytes`` with no image codec involved.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+
+from PIL import Image
+
+from modules.helpers.logging_helper import log_warning
+
+DEFAULT_MAX_ENTRIES = 50_000
+_MMAP_BYTES = 256 * 1024 * 1024
+
+
+class ThumbnailStore:
+    """Persist thumbnails keyed by an opaque string."""
+
+    def __init__(self, path: str | Path, *, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.path = Path(path)
+        self.max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute(f"PRAGMA mmap_size = {_MMAP_BYTES}")
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS thumbnails (
+                    key TEXT PRIMARY KEY,
+                    mode TEXT NOT NULL,
+                    width INTEGER NOT NULL,
+                    height INTEGER NOT NULL,
+                    data BLOB NOT NULL,
+                    stored_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS thumbnails_stored_at ON thumbnails(stored_at)")
+        self._writes = 0
+
+    def get(self, key: str) -> Image.Image | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT mode, width, height, data FROM thumbnails WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        mode, width, height, data = row
+        try:
+            return Image.frombytes(mode, (width, height), zlib.decompress(data))
+        except Exception as exc:
+            log_warning(
+                f"Discarding unreadable thumbnail {key}: {exc}",
+                func_name="modules.ui.image_library.thumbnail_store.ThumbnailStore.get",
+            )
+            self.discard(key)
+            return None
+
+    def put(self, key: str, image: Image.Image) -> None:
+        data = zlib.compress(image.tobytes(), 1)
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO thumbnails(key, mode, width, height, data, stored_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, image.mode, image.width, image.height, data, time.time()),
+                )
+            self._writes += 1
+            if self._writes % 500 == 0:
+                self._prune()
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM thumbnails WHERE key = ?", (key,))
+
+    def discard_prefix(self, prefix: str) -> None:
+        """Drop every entry whose key starts with *prefix*."""
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "DELETE FROM thumbnails WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+                )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM thumbnails").fetchone()[0])
+
+    def _prune(self) -> None:
+        """Keep the newest ``max_entries`` thumbnails (lock held by caller)."""
+        count = self._conn.execute("SELECT COUNT(*) FROM thumbnails").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            with self._conn:
+                self._conn.execute(
+                    "DELETE FROM thumbnails WHERE key IN "
+                    "(SELECT key FROM thumbnails ORDER BY stored_at ASC LIMIT ?)",
+                    (excess,),
+                )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
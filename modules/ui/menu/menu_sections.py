@@ -149,6 +149,7 @@ def build_menu_specs(app) -> list[TopLevelMenuSpec]:
                         _command("Import Portraits from Folder", app.import_portraits_from_directory, icon_key="import_portraits"),
                         _command("Import Image Directories…", app.open_image_directory_importer),
                         _command("Open Image Library", app.open_image_library_browser),
+                        _command("Find Duplicate Images…", app.open_image_duplicate_review),
                     ],
                 ),
                 MenuGroupSpec(
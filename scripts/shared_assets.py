@@ -0,0 +1,50 @@
+"""Maintenance entry point for the cross-campaign shared asset store."""
+
+import argparse
+import sys
+from pathlib import Path
+
+from modules.generic.shared_asset_store import get_shared_asset_store
+from modules.helpers.logging_helper import log_module_import
+
+log_module_import(__name__)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse args."""
+    parser = argparse.ArgumentParser(
+        description="Report on or deduplicate campaign assets through the [SharedAssets] store.",
+    )
+    parser.add_argument("--campaign-dir", default=None, help="Campaign folder used to locate the store")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("report", help="Print stored versus referenced bytes")
+    adopt = commands.add_parser("adopt", help="Replace existing asset copies with reflinks to the store")
+    adopt.add_argument("directories", nargs="+", help="Asset folders to deduplicate (e.g. Campaigns/Foo/assets)")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Run the module entry point."""
+    args = parse_args()
+    campaign_dir = Path(args.campaign_dir) if args.campaign_dir else None
+    store = get_shared_asset_store(campaign_dir)
+    if store is None:
+        print("The shared asset store is disabled; set [SharedAssets] enabled = true first.")
+        return 1
+
+    if args.command == "adopt":
+        for directory in args.directories:
+            adopted = store.adopt_tree(Path(directory))
+            print(f"{directory}: {adopted} file(s) now share storage.")
+
+    report = store.report()
+    print(
+        f"{report.objects} object(s), {report.links} campaign file(s): "
+        f"{report.stored_bytes} bytes stored, {report.referenced_bytes} referenced, "
+        f"{report.copied_bytes} copied, {report.saved_bytes} saved."
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""Tests for batched entity generation."""
+
+import json
+import sqlite3
+
+import pytest
+
+from modules.ai.automation import entity_generator
+from modules.ai.automation.entity_generator import EntityAutoGenerator
+from modules.generic.generic_model_wrapper import GenericModelWrapper
+
+TEMPLATE = {"fields": [{"name": "Name", "type": "text"}, {"name": "Description", "type": "text"}]}
+
+
+class _FakeAIClient:
+    """Answer each prompt with the next scripted batch of names."""
+
+    def __init__(self, batches):
+        self.batches = list(batches)
+        self.prompts = []
+
+    def chat(self, messages):
+        self.prompts.append(messages[-1]["content"])
+        names = self.batches.pop(0)
+        return json.dumps([{"Name": name, "Description": f"About {name}"} for name in names])
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    path = tmp_path / "campaign.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE npcs (Name TEXT PRIMARY KEY, Description TEXT)")
+    conn.execute("INSERT INTO npcs VALUES ('Old Tom', 'Already here')")
+    conn.commit()
+    conn.close()
+    monkeypatch.setattr(entity_generator, "load_template", lambda slug: TEMPLATE)
+    monkeypatch.setattr(entity_generator, "load_schema_from_json", lambda slug: [])
+    monkeypatch.setattr(
+        entity_generator,
+        "build_entity_prompt",
+        lambda slug, count, user_prompt, db_path=None, avoid_names=None: (
+            f"count={count} avoid={','.join(avoid_names or [])}"
+        ),
+    )
+    return str(path)
+
+
+def test_batch_packs_requests_and_drops_duplicates(db_path):
+    ai = _FakeAIClient([["Ana", "ana", "old TOM", "Bram"], ["Cleo", "Dax"]])
+    generator = EntityAutoGenerator(db_path=db_path, ai_client=ai)
+
+    items = generator.generate_batch("npcs", 4, "harbour folk", context_window=1000)
+
+    assert [item["Name"] for item in items] == ["Ana", "Bram", "Cleo", "Dax"]
+    assert ai.prompts == ["count=4 avoid=", "count=2 avoid=Ana,Bram"]
+
+
+def test_batch_request_size_follows_the_context_window(db_path):
+    ai = _FakeAIClient([["A1", "A2"], ["B1", "B2"], ["C1"]])
+    generator = EntityAutoGenerator(db_path=db_path, ai_client=ai)
+
+    items = generator.generate_batch("npcs", 5, "guards", context_window=260)
+
+    assert len(items) == 5
+    assert [prompt.split()[0] for prompt in ai.prompts] == ["count=2", "count=2", "count=1"]
+
+
+def test_save_writes_the_batch_in_one_transaction(db_path):
+    events = []
+    listener = lambda path, event: events.append(event)
+    GenericModelWrapper.add_save_listener(listener)
+    try:
+        generator = EntityAutoGenerator(db_path=db_path, ai_client=_FakeAIClient([]))
+        generator.save("npcs", [{"Name": f"Npc {idx}", "Description": ""} for idx in range(30)])
+    finally:
+        GenericModelWrapper.remove_save_listener(listener)
+
+    assert len(events) == 1 and events[0].item_count == 30
+    wrapper = GenericModelWrapper("npcs", db_path=db_path)
+    assert len(wrapper.load_items()) == 31
@@ -0,0 +1,93 @@
+"""Shared fixtures for AI client tests."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class _StubGenerateServer(ThreadingHTTPServer):
+    """Local ``/api/generate`` endpoint that counts the requests it serves.
+
+    Streaming requests receive ``stream_chunks`` one at a time, as NDJSON on
+    ``/api/generate`` and as server-sent events on any other path.
+    """
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _StubGenerateHandler)
+        self.requests: list[dict] = []
+        self.stream_chunks = ["Once ", "upon ", "a ", "time."]
+        self.stream_delay = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def request_count(self) -> int:
+        with self._lock:
+            return len(self.requests)
+
+    def record(self, payload: dict) -> int:
+        with self._lock:
+            self.requests.append(payload)
+            return len(self.requests)
+
+
+class _StubGenerateHandler(BaseHTTPRequestHandler):
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        count = self.server.record(payload)
+        if payload.get("stream"):
+            self._stream(sse=self.path != "/api/generate")
+            return
+        body = json.dumps({"response": f"reply {count}"}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream(self, *, sse: bool) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream" if sse else "application/x-ndjson")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        try:
+            for chunk in self.server.stream_chunks:
+                if sse:
+                    line = "data: " + json.dumps({"choices": [{"delta": {"content": chunk}}]}) + "\n\n"
+                else:
+                    line = json.dumps({"response": chunk, "done": False}) + "\n"
+                self.wfile.write(line.encode("utf-8"))
+                self.wfile.flush()
+                time.sleep(self.server.stream_delay)
+            closing = "data: [DONE]\n\n" if sse else json.dumps({"response": "", "done": True}) + "\n"
+            self.wfile.write(closing.encode("utf-8"))
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, *_args) -> None:
+        pass
+
+
+@pytest.fixture
+def ai_stub_server():
+    """Serve ``/api/generate`` on localhost and expose the request log."""
+    server = _StubGenerateServer()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
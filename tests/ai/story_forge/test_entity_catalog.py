@@ -0,0 +1,88 @@
+"""Tests for the cached Story Forge entity catalog."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import time
+
+import pytest
+
+from modules.ai.story_forge.entity_catalog import EntityCatalog, load_db_entity_catalog
+from modules.generic.generic_model_wrapper import GenericModelWrapper
+
+
+@pytest.fixture
+def database(tmp_path):
+    path = tmp_path / "campaign.db"
+    with sqlite3.connect(path) as connection:
+        connection.execute("CREATE TABLE npcs (Name TEXT PRIMARY KEY, Description TEXT)")
+        connection.execute("CREATE TABLE scenarios (Title TEXT PRIMARY KEY, Summary TEXT)")
+    GenericModelWrapper("npcs", db_path=str(path)).save_items(
+        [
+            {"Name": "Rika Vale", "Description": "Broker"},
+            {"Name": "Marshal Vey", "Description": "Villain"},
+            {"Name": "Dockmaster Neral", "Description": "Mole"},
+        ]
+    )
+    return str(path)
+
+
+def test_names_are_cached_until_a_save(database, monkeypatch):
+    catalog = EntityCatalog(database)
+    assert catalog.names("npcs") == ["Rika Vale", "Marshal Vey", "Dockmaster Neral"]
+
+    loads = []
+    original = EntityCatalog._load_names
+    monkeypatch.setattr(EntityCatalog, "_load_names", lambda self, t: loads.append(t) or original(self, t))
+    catalog.names("npcs", limit=2)
+    assert loads == []
+
+    GenericModelWrapper.add_save_listener(catalog.on_saved)
+    try:
+        GenericModelWrapper("npcs", db_path=database).save_item({"Name": "Ash Warden", "Description": ""})
+    finally:
+        GenericModelWrapper.remove_save_listener(catalog.on_saved)
+
+    assert catalog.names("npcs")[-1] == "Ash Warden"
+    assert loads == ["npcs"]
+
+
+def test_related_names_rank_by_shared_keywords(database):
+    catalog = EntityCatalog(database)
+
+    assert catalog.related_names("npcs", "The Marshal waits at the dock; Vey is armed") == ["Marshal Vey"]
+    assert catalog.related_names("npcs", "nothing relevant") == []
+
+
+def test_load_catalog_puts_related_names_inside_the_limit(database):
+    catalog = load_db_entity_catalog(("npcs", "scenarios"), limit=2, relevant_to="Neral", db_path=database)
+
+    assert catalog == {"NPCs": ["Dockmaster Neral", "Rika Vale"]}
+
+
+@pytest.mark.skipif(not os.environ.get("GMCD_BENCHMARKS"), reason="set GMCD_BENCHMARKS=1 to run benchmarks")
+def test_benchmark_catalog_with_10k_entities(tmp_path):
+    path = str(tmp_path / "large.db")
+    with sqlite3.connect(path) as connection:
+        connection.execute("CREATE TABLE npcs (Name TEXT PRIMARY KEY, Description TEXT, Traits TEXT)")
+    GenericModelWrapper("npcs", db_path=path).save_items(
+        [
+            {"Name": f"Npc {index}", "Description": {"text": "x" * 400, "formatting": {}}, "Traits": ["a", "b"]}
+            for index in range(10_000)
+        ]
+    )
+
+    started = time.perf_counter()
+    for _ in range(5):
+        [item["Name"] for item in GenericModelWrapper("npcs", db_path=path).load_items()]
+    full_loads = time.perf_counter() - started
+
+    catalog = EntityCatalog(path)
+    started = time.perf_counter()
+    for _ in range(5):
+        catalog.names("npcs")
+    cached = time.perf_counter() - started
+
+    print(f"\nentity catalog x5: load_items {full_loads:.3f}s, cached catalog {cached:.3f}s")
+    assert cached * 5 < full_loads
@@ -0,0 +1,88 @@
+"""Tests for Story Forge scene entity assignment."""
+
+from __future__ import annotations
+
+import os
+import random
+import re
+import time
+
+import pytest
+
+from modules.ai.story_forge.scene_entity_assignment import SceneKeywordIndex, assign_unused_entities_to_scenes
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_WORDS = ["dock", "market", "ash", "vale", "vey", "marshal", "neral", "harbor", "ledger", "rain", "crypt", "café"]
+
+
+def _reference_score(scene, entity_name):
+    """Scan-everything scoring used before the keyword index."""
+    scene_text = " ".join(str(scene.get(key) or "").casefold() for key in ("Title", "Summary", "Text"))
+    entity_cf = entity_name.casefold()
+    if not scene_text.strip():
+        return 0
+    score = 100 if entity_cf in scene_text else 0
+    keywords = dict.fromkeys(token for token in _TOKEN_RE.findall(entity_cf) if len(token) >= 3)
+    return score + sum(10 for keyword in keywords if keyword in scene_text)
+
+
+def _reference_best(scenes, entity_name, fallback):
+    best_index, best_score = fallback, -1
+    for index, scene in enumerate(scenes):
+        score = _reference_score(scene, entity_name)
+        if score > best_score:
+            best_index, best_score = index, score
+    return (fallback, 0) if best_score <= 0 else (best_index, best_score)
+
+
+def _scenes(rng, count):
+    return [
+        {
+            "Title": f"Scene {index} " + " ".join(rng.sample(_WORDS, 2)),
+            "Summary": " ".join(rng.choice(_WORDS) + rng.choice(["", "s", "-side"]) for _ in range(12)),
+        }
+        for index in range(count)
+    ]
+
+
+def _entities(rng, count):
+    return {"NPCs": [f"{rng.choice(_WORDS).title()} {rng.choice(_WORDS)}{index % 7 or ''}" for index in range(count)]}
+
+
+def test_index_matches_keywords_inside_words_and_full_names():
+    index = SceneKeywordIndex([{"Title": "Dockside ambush"}, {"Summary": "Meet Rika Vale at the Dock"}, {}])
+
+    assert index.scores("Dock") == {0: 110, 1: 110}
+    assert index.scores("Rika Vale") == {1: 120}
+    assert index.scores("Ox") == {}
+
+
+def test_assignment_agrees_with_a_full_scan():
+    rng = random.Random(7)
+    scenes = _scenes(rng, 40)
+    entities = _entities(rng, 300)
+
+    _, diagnostics = assign_unused_entities_to_scenes(scenes, entities)
+
+    for assignment in diagnostics["assignments"]:
+        expected = _reference_best(scenes, assignment["entity"], 0)
+        assert (assignment["scene_index"], assignment["score"]) == expected
+
+
+@pytest.mark.skipif(not os.environ.get("GMCD_BENCHMARKS"), reason="set GMCD_BENCHMARKS=1 to run benchmarks")
+def test_benchmark_assignment_with_10k_entities_and_200_scenes():
+    rng = random.Random(11)
+    scenes = _scenes(rng, 200)
+    names = _entities(rng, 10_000)["NPCs"]
+
+    started = time.perf_counter()
+    _, diagnostics = assign_unused_entities_to_scenes(scenes, {"NPCs": names})
+    indexed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    reference = [_reference_best(scenes, name, 0) for name in dict.fromkeys(names)]
+    scanned = time.perf_counter() - started
+
+    print(f"\nscene assignment: indexed {indexed:.3f}s, full scan {scanned:.3f}s")
+    assert [(item["scene_index"], item["score"]) for item in diagnostics["assignments"]] == reference
+    assert indexed * 5 < scanned
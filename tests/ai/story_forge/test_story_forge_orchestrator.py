@@ -1,5 +1,9 @@
 """Regression tests for story forge orchestrator."""
 
+import json
+import threading
+import time
+
 from modules.ai.story_forge.contracts import StoryForgeRequest
 from modules.ai.story_forge.orchestrator import StoryForgeOrchestrator
 from modules.core.ai import (
@@ -102,3 +106,84 @@ def test_story_forge_orchestrator_emits_failed_event_on_error(monkeypatch):
     assert events[0].event_type == EVENT_AI_PIPELINE_STARTED
     assert events[-1].event_type == EVENT_AI_PIPELINE_FAILED
     assert events[-1].request_id == "req-story-forge-fail"
+
+
+
+class _SleepingAIClient:
+    """Answer every call after a fixed delay and record the prompts."""
+
+    def __init__(self, delay, delays=None):
+        """Initialize the _SleepingAIClient instance."""
+        self.delay = delay
+        self.delays = dict(delays or {})
+        self.prompts = []
+        self._lock = threading.Lock()
+
+    def chat(self, messages):
+        """Handle chat."""
+        prompt = messages[-1]["content"]
+        with self._lock:
+            self.prompts.append(prompt)
+        time.sleep(self.delays.get(prompt, self.delay))
+        if prompt == "rewrite":
+            return json.dumps({"options": [{"title": "Witness"}, {"title": "Heist"}]})
+        return json.dumps({"title": prompt, "entities": {"NPCs": ["Eloi"]}})
+
+
+def _patch_prompts(monkeypatch):
+    """Replace prompt builders with short tags that identify each call."""
+    from modules.ai.story_forge import orchestrator as orchestrator_module
+
+    monkeypatch.setattr(orchestrator_module, "build_rewrite_options_prompt", lambda _r: "rewrite")
+    monkeypatch.setattr(orchestrator_module, "build_entity_options_prompt", lambda _r, o: f"entities:{o['title']}")
+    monkeypatch.setattr(orchestrator_module, "build_full_draft_prompt", lambda _r, o, _e: f"draft:{o['title']}")
+
+
+def test_story_forge_drafts_the_likeliest_option_while_the_user_chooses(monkeypatch):
+    """Verify that a speculative draft makes selecting its option nearly instant."""
+    _patch_prompts(monkeypatch)
+    client = _SleepingAIClient(delay=0.1)
+    session = StoryForgeOrchestrator(ai_client=client).propose(_request())
+    time.sleep(0.3)  # the user reads the options
+
+    started = time.perf_counter()
+    response = session.select(0)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.1
+    assert response.title == "draft:Witness"
+    assert client.prompts == ["rewrite", "entities:Witness", "draft:Witness"]
+
+
+def test_story_forge_cancels_speculation_for_unselected_options(monkeypatch):
+    """Verify that choosing another option stops the speculative draft."""
+    _patch_prompts(monkeypatch)
+    client = _SleepingAIClient(delay=0.1)
+    session = StoryForgeOrchestrator(ai_client=client).propose(_request())
+
+    started = time.perf_counter()
+    response = session.select(1)
+    elapsed = time.perf_counter() - started
+    time.sleep(0.15)  # let the abandoned request finish
+
+    assert 0.2 <= elapsed < 0.35
+    assert response.title == "draft:Heist"
+    assert "draft:Witness" not in client.prompts
+    assert client.prompts.count("entities:Heist") == 1
+
+
+def test_story_forge_events_report_the_selected_draft_only(monkeypatch):
+    """Verify that a later speculative draft does not leak into the selected run's events."""
+    _patch_prompts(monkeypatch)
+    client = _SleepingAIClient(delay=0.02, delays={"draft:Heist": 0.15})
+    events = []
+    unsubscribe = ai_pipeline_events.subscribe("*", events.append)
+    try:
+        session = StoryForgeOrchestrator(ai_client=client).propose(_request(), speculate=2)
+        time.sleep(0.3)  # both drafts finish, the unselected one last
+        session.select(0)
+    finally:
+        unsubscribe()
+
+    terminal = [event for event in events if event.phase in ("normalization", "completed")]
+    assert [event.metadata["prompt_text"].rsplit(":", 1)[-1] for event in terminal] == ["Witness", "Witness"]
@@ -0,0 +1,146 @@
+"""Tests for the shared AI backend connection pool and limiter."""
+
+from __future__ import annotations
+
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from modules.ai.http_pool import PRIORITY_BATCH, PRIORITY_INTERACTIVE, BackendPool, PriorityLimiter
+
+
+class _SlowServer(ThreadingHTTPServer):
+    """Threaded endpoint that records how many requests overlap."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _SlowHandler)
+        self.active = 0
+        self.peak = 0
+        self.served = 0
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/work"
+
+
+class _SlowHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        with self.server._lock:
+            self.server.active += 1
+            self.server.peak = max(self.server.peak, self.server.active)
+        time.sleep(0.05)
+        with self.server._lock:
+            self.server.active -= 1
+            self.server.served += 1
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *_args) -> None:
+        pass
+
+
+class _UrllibSession:
+    """Session-shaped adapter so the limiter can be driven without requests."""
+
+    def request(self, method, url, **_kwargs):
+        with urllib.request.urlopen(urllib.request.Request(url, method=method), timeout=5) as response:
+            response.read()
+            return _Response(response.status)
+
+    def close(self):
+        pass
+
+
+class _Response:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class _ScriptedSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def request(self, method, url, **_kwargs):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def slow_server():
+    server = _SlowServer()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_pool_caps_concurrent_connections(slow_server):
+    pool = BackendPool("test", max_concurrent=2, session_factory=_UrllibSession)
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        statuses = list(executor.map(lambda _: pool.get(slow_server.url).status_code, range(6)))
+
+    assert statuses == [200] * 6
+    assert slow_server.served == 6 and slow_server.peak == 2
+    assert pool.stats() == {"in_flight": 0, "queue_depth": 0, "max_concurrent": 2}
+
+
+def test_interactive_requests_overtake_queued_batch_work():
+    limiter = PriorityLimiter(1)
+    order = []
+    limiter.acquire()
+
+    def waiter(label, priority):
+        with limiter.slot(priority):
+            order.append(label)
+
+    threads = []
+    for label, priority in (("batch-1", PRIORITY_BATCH), ("batch-2", PRIORITY_BATCH), ("chat", PRIORITY_INTERACTIVE)):
+        threads.append(threading.Thread(target=waiter, args=(label, priority)))
+        threads[-1].start()
+        while limiter.queue_depth < len(threads):
+            time.sleep(0.001)
+    assert limiter.in_flight == 1
+    limiter.release()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert order == ["chat", "batch-1", "batch-2"]
+
+
+def test_retries_throttled_answers_with_backoff():
+    delays = []
+    session = _ScriptedSession([_Response(503, {"Retry-After": "2"}), _Response(429), _Response(200)])
+    pool = BackendPool("test", backoff_base=1.0, session_factory=lambda: session, sleep=delays.append)
+
+    response = pool.post("http://backend.invalid/api")
+
+    assert response.status_code == 200 and session.calls == 3
+    assert delays[0] == 2.0 and 0 <= delays[1] <= 2.0
+
+
+def test_gives_up_after_the_retry_budget():
+    session = _ScriptedSession([_Response(503) for _ in range(3)])
+    pool = BackendPool("test", retries=2, session_factory=lambda: session, sleep=lambda _delay: None)
+
+    assert pool.get("http://backend.invalid/api").status_code == 503
+    assert session.calls == 3
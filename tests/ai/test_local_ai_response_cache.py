@@ -0,0 +1,111 @@
+"""Tests for the persistent LocalAIClient response cache."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from modules.ai import http_pool
+from modules.ai.local_ai_client import LocalAIClient
+from modules.ai.response_cache import AIResponseCache, make_cache_key
+
+MESSAGES = [
+    {"role": "system", "content": "Return JSON."},
+    {"role": "user", "content": "Describe a goblin."},
+]
+
+
+def _client(cache: AIResponseCache, base_url: str = "http://ai.invalid", temperature: float = 0.0) -> LocalAIClient:
+    client = LocalAIClient(response_cache=cache)
+    client.base_url = base_url
+    client.temperature = temperature
+    client.use_powershell = False
+    return client
+
+
+@pytest.fixture
+def cache(tmp_path):
+    store = AIResponseCache(tmp_path / "ai_cache.sqlite3")
+    yield store
+    store.close()
+
+
+def test_cache_key_ignores_cosmetic_whitespace_but_not_sampling():
+    base = dict(endpoint="u", model="m", temperature=0.0, max_tokens=0)
+
+    assert make_cache_key(prompt="a  \r\nb\n", **base) == make_cache_key(prompt="a\nb", **base)
+    assert make_cache_key(prompt="a", **base) != make_cache_key(prompt="a", **{**base, "temperature": 0.2})
+    assert make_cache_key(prompt="a", **base) != make_cache_key(prompt="a", **{**base, "model": "other"})
+
+
+def test_cache_expires_and_evicts_least_recently_used(tmp_path):
+    store = AIResponseCache(tmp_path / "c.sqlite3", max_bytes=10, max_age_seconds=60)
+    store.put("old", "12345")
+    store.put("new", "67890")
+    assert store.get("old") == "12345"
+
+    store._prune(time.time())
+    store.put("third", "abcde")
+    store._prune(time.time())
+
+    assert store.get("new") is None
+    assert store.get("old") == "12345" and store.get("third") == "abcde"
+    assert AIResponseCache(tmp_path / "c.sqlite3", max_age_seconds=-1).get("old") is None
+    store.close()
+
+
+def test_deterministic_requests_hit_the_cache(cache, monkeypatch):
+    calls = []
+    monkeypatch.setattr(LocalAIClient, "_post", lambda self, url, payload, timeout: calls.append(payload) or {"response": "ok"})
+    client = _client(cache)
+
+    assert client.chat(MESSAGES) == "ok"
+    assert client.chat(MESSAGES) == "ok"
+    assert _client(cache).chat(MESSAGES) == "ok"
+    assert len(calls) == 1
+
+    client.chat(MESSAGES, cache=False)
+    assert len(calls) == 2
+
+
+def test_sampled_requests_bypass_the_cache_unless_opted_in(cache, monkeypatch):
+    calls = []
+    monkeypatch.setattr(LocalAIClient, "_post", lambda self, url, payload, timeout: calls.append(payload) or {"response": "ok"})
+    client = _client(cache, temperature=0.7)
+
+    client.chat(MESSAGES)
+    client.chat(MESSAGES)
+    assert len(calls) == 2
+
+    client.chat(MESSAGES, cache=True)
+    client.chat(MESSAGES, cache=True)
+    assert len(calls) == 3
+
+
+def test_stub_server_counts_hits_and_misses(cache, ai_stub_server):
+    if not hasattr(http_pool.requests, "adapters"):
+        pytest.skip("requests is not installed")
+    client = _client(cache, base_url=ai_stub_server.url)
+
+    first = client.chat(MESSAGES)
+    second = client.chat(MESSAGES)
+    other = client.chat([{"role": "user", "content": "Describe an orc."}])
+
+    assert first == second == "reply 1"
+    assert other == "reply 2"
+    assert ai_stub_server.request_count == 2
+
+
+def test_sampling_options_reach_the_server_and_rejected_answers_can_be_forgotten(cache, monkeypatch):
+    calls = []
+    monkeypatch.setattr(LocalAIClient, "_post", lambda self, url, payload, timeout: calls.append(payload) or {"response": "ok"})
+    client = _client(cache)
+    client.max_tokens = 512
+
+    client.chat(MESSAGES)
+    client.forget(MESSAGES)
+    client.chat(MESSAGES)
+
+    assert calls[0]["options"] == {"temperature": 0.0, "num_predict": 512}
+    assert len(calls) == 2
@@ -0,0 +1,119 @@
+"""Tests for streamed LocalAIClient completions."""
+
+from __future__ import annotations
+
+import json
+import threading
+import urllib.request
+
+import pytest
+
+from modules.ai import http_pool
+from modules.ai.local_ai_client import LocalAIClient
+from modules.ai.runtime import AIPipelineRunner
+from modules.ai.streaming import TkChunkPump, iter_stream_text
+
+MESSAGES = [{"role": "user", "content": "Tell a story."}]
+
+
+def _open_stream(server, path: str):
+    body = json.dumps({"model": "m", "prompt": "p", "stream": True}).encode("utf-8")
+    request = urllib.request.Request(server.url + path, data=body, headers={"Content-Type": "application/json"})
+    return urllib.request.urlopen(request, timeout=5)
+
+
+@pytest.mark.parametrize("path", ["/api/generate", "/v1/chat/completions"])
+def test_ndjson_and_sse_streams_yield_chunks_in_order(ai_stub_server, path):
+    with _open_stream(ai_stub_server, path) as response:
+        chunks = list(iter_stream_text(response))
+
+    assert chunks == ["Once ", "upon ", "a ", "time."]
+
+
+def test_stop_event_cancels_the_stream(ai_stub_server):
+    ai_stub_server.stream_delay = 0.05
+    stop = threading.Event()
+    received = []
+    with _open_stream(ai_stub_server, "/api/generate") as response:
+        for chunk in iter_stream_text(response, stop):
+            received.append(chunk)
+            if len(received) == 2:
+                stop.set()
+
+    assert received == ["Once ", "upon "]
+
+
+def test_stream_error_events_raise():
+    with pytest.raises(RuntimeError, match="model not found"):
+        list(iter_stream_text([b'{"error": "model not found"}']))
+
+
+class _StreamingClient:
+    model = "stub"
+
+    def chat_stream(self, messages, stop_event=None):
+        yield from ["Hello", ", ", "world "]
+
+
+def test_run_chat_forwards_chunks_and_returns_the_full_text():
+    received = []
+
+    text = AIPipelineRunner(_StreamingClient(), pipeline_name="test").run_chat(MESSAGES, on_chunk=received.append)
+
+    assert received == ["Hello", ", ", "world "]
+    assert text == "Hello, world"
+
+
+class _FakeWidget:
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, _delay, callback):
+        self.scheduled.append(callback)
+
+    def run_pending(self):
+        pending, self.scheduled = self.scheduled, []
+        for callback in pending:
+            callback()
+
+
+def test_tk_pump_batches_chunks_and_reports_completion():
+    widget = _FakeWidget()
+    delivered, done = [], []
+    pump = TkChunkPump(widget, delivered.append, on_done=lambda: done.append(True)).start()
+
+    pump.put("a")
+    pump.put("b")
+    widget.run_pending()
+    pump.put("c")
+    pump.close()
+    widget.run_pending()
+
+    assert delivered == ["ab", "c"]
+    assert done == [True] and widget.scheduled == []
+
+
+def test_chat_stream_against_stub_server(ai_stub_server):
+    if not hasattr(http_pool.requests, "adapters"):
+        pytest.skip("requests is not installed")
+    client = LocalAIClient(response_cache=False)
+    client.base_url = ai_stub_server.url
+    client.use_powershell = False
+
+    chunks = list(client.chat_stream(MESSAGES))
+
+    assert chunks == ["Once ", "upon ", "a ", "time."]
+    assert ai_stub_server.requests[-1]["stream"] is True
+
+
+def test_chat_stream_ignores_the_powershell_transport(ai_stub_server, monkeypatch):
+    if not hasattr(http_pool.requests, "adapters"):
+        pytest.skip("requests is not installed")
+    monkeypatch.setattr("modules.ai.local_ai_client.platform.system", lambda: "Windows")
+    client = LocalAIClient(response_cache=False)
+    client.base_url = ai_stub_server.url
+    client.use_powershell = True
+
+    chunks = list(client.chat_stream(MESSAGES))
+
+    assert chunks == ["Once ", "upon ", "a ", "time."]
@@ -1,6 +1,15 @@
 """Tests for Ollama model discovery."""
 
-from modules.ai.ollama_model_service import OllamaModelService
+import json
+import subprocess
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from modules.ai.ollama_model_service import OLLAMA_DEFAULT_NUM_CTX, ModelCatalog, ModelInfo, OllamaModelService
 
 
 def test_list_models_from_cli_parses_ollama_table(monkeypatch):
@@ -32,7 +41,7 @@ def test_list_models_from_cli_parses_ollama_table(monkeypatch):
     }
 
 
-def test_list_models_falls_back_to_tags_api(monkeypatch):
+def test_list_models_falls_back_to_tags_api(monkeypatch, tmp_path):
     """Verify that model discovery falls back to Ollama's tags endpoint."""
 
     class Response:
@@ -45,4 +54,142 @@ def test_list_models_falls_back_to_tags_api(monkeypatch):
     monkeypatch.setattr(OllamaModelService, "_list_models_from_cli", staticmethod(lambda: []))
     monkeypatch.setattr("modules.ai.ollama_model_service.requests.get", lambda *args, **kwargs: Response())
 
-    assert OllamaModelService("http://localhost:11434").list_models() == ["qwen2.5:7b", "phi4:latest"]
+    service = OllamaModelService("http://localhost:11434", catalog=ModelCatalog(tmp_path / "models.json"))
+    assert service.list_models() == ["qwen2.5:7b", "phi4:latest"]
+
+
+class _OllamaStub(ThreadingHTTPServer):
+    """Local ``/api/tags`` and ``/api/show`` endpoints with an optional delay."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _OllamaStubHandler)
+        self.delay = 0.0
+        self.hits = 0
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+class _OllamaStubHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        self._reply({"models": [{"name": "llama3.1:8b"}, {"name": "qwen2.5:7b"}]})
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)))
+        if payload["model"] == "llama3.1:8b":
+            self._reply({"parameters": "num_ctx 16384\ntemperature 0.7", "model_info": {"llama.context_length": 131072}})
+        else:
+            self._reply({"model_info": {"qwen2.context_length": 32768}})
+
+    def _reply(self, payload) -> None:
+        self.server.hits += 1
+        time.sleep(self.server.delay)
+        body = json.dumps(payload).encode("utf-8")
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except OSError:
+            pass
+
+    def log_message(self, *_args) -> None:
+        pass
+
+
+class _Response:
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def json(self):
+        return json.loads(self._body)
+
+
+class _UrllibClient:
+    """``requests``-shaped client so the stub is reachable without requests."""
+
+    def get(self, url, timeout=None):
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return _Response(response.read())
+
+    def post(self, url, **kwargs):
+        data = json.dumps(kwargs["json"]).encode("utf-8")
+        request = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=kwargs.get("timeout")) as response:
+            return _Response(response.read())
+
+
+@pytest.fixture
+def ollama_stub(monkeypatch):
+    def cli_times_out(command, **kwargs):
+        raise subprocess.TimeoutExpired(command, kwargs.get("timeout"))
+
+    monkeypatch.setattr("modules.ai.ollama_model_service.subprocess.run", cli_times_out)
+    server = _OllamaStub()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_refresh_records_context_lengths_after_cli_timeout(ollama_stub, tmp_path):
+    catalog = ModelCatalog(tmp_path / "models.json")
+    service = OllamaModelService(ollama_stub.url, catalog=catalog, http_client=_UrllibClient())
+
+    assert service.list_models() == ["llama3.1:8b", "qwen2.5:7b"]
+
+    reloaded = ModelCatalog(tmp_path / "models.json")
+    assert reloaded.info(ollama_stub.url, "llama3.1:8b").context_length == 16384
+    # No num_ctx in the Modelfile: Ollama serves its default, not the architecture maximum.
+    assert reloaded.info(ollama_stub.url, "qwen2.5:7b").context_length == OLLAMA_DEFAULT_NUM_CTX
+    assert not reloaded.is_stale(ollama_stub.url)
+
+
+def test_stale_catalog_answers_at_once_while_a_slow_server_times_out(ollama_stub, tmp_path):
+    catalog = ModelCatalog(tmp_path / "models.json", ttl_seconds=0)
+    catalog.replace(ollama_stub.url, [ModelInfo("cached:latest", context_length=4096)])
+    ollama_stub.delay = 1.0
+    service = OllamaModelService(ollama_stub.url, catalog=catalog, http_client=_UrllibClient(), timeout=0.2)
+    refreshed = []
+
+    started = time.perf_counter()
+    names = service.list_models(on_refresh=refreshed.append)
+    elapsed = time.perf_counter() - started
+    deadline = time.time() + 5
+    while not refreshed and time.time() < deadline:
+        time.sleep(0.01)
+
+    assert names == ["cached:latest"] and elapsed < 0.2
+    assert refreshed == [["cached:latest"]]
+    assert catalog.info(ollama_stub.url, "cached:latest").context_length == 4096
+
+
+def test_throughput_is_smoothed_and_survives_a_refresh(tmp_path):
+    catalog = ModelCatalog(tmp_path / "models.json")
+    catalog.record_throughput("http://ai", "llama3.1:8b", tokens=400, seconds=10)
+    catalog.record_throughput("http://ai", "llama3.1:8b", tokens=600, seconds=10)
+    assert not (tmp_path / "models.json").exists()
+    catalog.replace("http://ai", [ModelInfo("llama3.1:8b", context_length=8192)])
+
+    info = ModelCatalog(tmp_path / "models.json").info("http://ai", "llama3.1:8b")
+    assert info.tokens_per_second == 50.0 and info.context_length == 8192
+
+
+def test_flush_writes_pending_throughput(tmp_path):
+    catalog = ModelCatalog(tmp_path / "models.json")
+    catalog.record_throughput("http://ai", "llama3.1:8b", tokens=300, seconds=10)
+
+    catalog.flush()
+
+    assert ModelCatalog(tmp_path / "models.json").info("http://ai", "llama3.1:8b").tokens_per_second == 30.0
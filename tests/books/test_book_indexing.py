@@ -0,0 +1,65 @@
+"""Tests for parallel, resumable book indexing."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from modules.books.book_indexing import BookIndexingEngine, _page_ranges
+from modules.books.book_text_index import BookTextIndex
+
+PAGES = {1: "Goblin caves.", 2: "", 3: "Dragon hoards.", 4: "Owlbear dens.", 5: "Troll bridges."}
+
+
+def _engine(index, calls, **kwargs):
+    def extract(_pdf_path, first, last):
+        calls.append((first, last))
+        return [(page, PAGES[page]) for page in range(first, last + 1)]
+
+    return BookIndexingEngine(
+        index,
+        max_workers=2,
+        pages_per_task=2,
+        executor_factory=lambda workers: ThreadPoolExecutor(max_workers=workers),
+        extract_range=extract,
+        page_counter=lambda _pdf_path: len(PAGES),
+        **kwargs,
+    )
+
+
+def test_page_ranges_group_contiguous_pages():
+    assert _page_ranges([5, 1, 2, 3, 7], 2) == [(1, 2), (3, 3), (5, 5), (7, 7)]
+
+
+def test_pages_stream_into_index_with_progress(tmp_path):
+    index = BookTextIndex(str(tmp_path / "campaign.db"))
+    calls, progress = [], []
+
+    with _engine(index, calls) as engine:
+        result = engine.index_book("Bestiary", "book.pdf", progress=progress.append)
+
+    assert result.complete and result.page_count == 5 and result.pages_indexed == 5
+    assert sorted(calls) == [(1, 2), (3, 4), (5, 5)]
+    assert progress[0].pages_done == 0 and progress[-1].pages_done == 5
+    assert index.indexed_pages("Bestiary") == {1, 2, 3, 4, 5}
+    assert index.matching_books("owlbear") == {"Bestiary"}
+
+
+def test_resume_skips_pages_already_indexed(tmp_path):
+    index = BookTextIndex(str(tmp_path / "campaign.db"))
+    index.index_pages("Bestiary", {1: PAGES[1], 2: PAGES[2], 3: PAGES[3]})
+    calls = []
+
+    with _engine(index, calls) as engine:
+        result = engine.index_book("Bestiary", "book.pdf")
+
+    assert calls == [(4, 5)]
+    assert result.pages_indexed == 2
+    assert index.page_texts("Bestiary")[3] == "Owlbear dens."
+
+
+def test_cancel_stops_before_remaining_ranges(tmp_path):
+    index = BookTextIndex(str(tmp_path / "campaign.db"))
+
+    with _engine(index, []) as engine:
+        result = engine.index_book("Bestiary", "book.pdf", cancelled=lambda: True)
+
+    assert result.cancelled and not result.complete
+    assert index.indexed_pages("Bestiary") != {1, 2, 3, 4, 5}
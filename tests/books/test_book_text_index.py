@@ -0,0 +1,121 @@
+"""Tests for the book full-text index."""
+
+import json
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
+from db.migrations.book_text_index import migrate_inline_book_text
+from modules.generic.generic_model_wrapper import GenericModelWrapper
+from modules.books.book_text_index import (
+    HIGHLIGHT_CLOSE,
+    HIGHLIGHT_OPEN,
+    BookTextIndex,
+    get_book_text_index,
+    strip_book_text,
+)
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_search_ranks_paragraphs_and_highlights_matches(tmp_path):
+    index = BookTextIndex(str(tmp_path / "campaign.db"))
+    index.index_book(
+        "Bestiary",
+        [
+            "Goblins lurk in caves.\n\nDragons hoard gold and hate goblins.",
+            "The dragon sleeps. A dragon wakes. Dragons everywhere.",
+        ],
+    )
+    index.index_book("Atlas", ["Maps of the dragon coast."])
+
+    hits = index.search("dragon", books=["Bestiary"])
+
+    assert [(hit.page, hit.paragraph) for hit in hits] == [(2, 1), (1, 2)]
+    assert f"{HIGHLIGHT_OPEN}dragon{HIGHLIGHT_CLOSE}" in hits[0].snippet
+    assert index.matching_books("gob") == {"Bestiary"}
+    assert index.matching_books("dragon coast") == {"Atlas"}
+
+
+def test_reindexing_replaces_pages_and_page_texts_round_trip(tmp_path):
+    index = BookTextIndex(str(tmp_path / "campaign.db"))
+    index.index_book("Rules", ["old text"])
+    index.index_book("Rules", ["Page one.\n\nSecond paragraph.", "", "Page three."])
+    index.index_pages("Rules", {2: "Late page two."})
+
+    assert index.page_texts("Rules") == [
+        "Page one.\n\nSecond paragraph.",
+        "Late page two.",
+        "Page three.",
+    ]
+    assert index.search("old") == []
+    index.remove_book("Rules")
+    assert index.indexed_books() == set()
+
+
+def test_renaming_a_book_moves_its_indexed_text(tmp_path):
+    database = str(tmp_path / "campaign.db")
+    with sqlite3.connect(database) as connection:
+        connection.execute("CREATE TABLE books (Title TEXT PRIMARY KEY, Notes TEXT)")
+        connection.execute("INSERT INTO books VALUES ('Bestiary', '')")
+    index = get_book_text_index(database)
+    assert get_book_text_index(database) is index
+    index.index_book("Bestiary", ["Goblins lurk in caves."])
+
+    try:
+        GenericModelWrapper("books", db_path=database).save_item(
+            {"Title": "Monster Manual", "Notes": ""}, original_key_value="Bestiary"
+        )
+    finally:
+        GenericModelWrapper.remove_save_listener(index.on_saved)
+
+    assert index.indexed_books() == {"Monster Manual"}
+    assert index.page_texts("Monster Manual") == ["Goblins lurk in caves."]
+
+
+def test_importing_the_index_does_not_subscribe_to_saves():
+    script = (
+        "import modules.books.book_text_index\n"
+        "from modules.generic.generic_model_wrapper import GenericModelWrapper\n"
+        "print(len(GenericModelWrapper._save_listeners))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+
+    assert completed.stdout.strip() == "0"
+
+
+def test_migration_moves_inline_transcripts_out_of_book_rows(tmp_path):
+    database = tmp_path / "campaign.db"
+    excerpt = {"Path": "assets/books/excerpt.pdf", "Label": "Intro"}
+    with sqlite3.connect(database) as connection:
+        connection.execute(
+            "CREATE TABLE books (Title TEXT PRIMARY KEY, ExtractedText TEXT, ExtractedPages TEXT)"
+        )
+        connection.execute(
+            "INSERT INTO books VALUES (?, ?, ?)",
+            ("Rules", "Page one\n\nPage two", json.dumps(["Page one", "Page two", excerpt])),
+        )
+        connection.execute("INSERT INTO books VALUES ('Empty', '', '[]')")
+
+    assert migrate_inline_book_text(database) == 1
+    assert migrate_inline_book_text(database) == 0
+
+    with sqlite3.connect(database) as connection:
+        row = connection.execute(
+            "SELECT ExtractedText, ExtractedPages FROM books WHERE Title = 'Rules'"
+        ).fetchone()
+    assert row == ("", json.dumps([excerpt]))
+    assert BookTextIndex(str(database)).page_texts("Rules") == ["Page one", "Page two"]
+
+
+def test_strip_book_text_keeps_excerpt_descriptors():
+    record = {"Title": "Rules", "ExtractedText": "x" * 100, "ExtractedPages": ["x", {"Path": "a.pdf"}]}
+
+    assert strip_book_text(record) == {
+        "Title": "Rules",
+        "ExtractedText": "",
+        "ExtractedPages": [{"Path": "a.pdf"}],
+    }
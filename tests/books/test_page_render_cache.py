@@ -0,0 +1,95 @@
+"""Tests for the rendered PDF page cache and prefetching renderer."""
+
+import time
+
+from modules.books.page_render_cache import PageRenderCache, PageRenderer, zoom_bucket
+
+
+class _FakeImage:
+    def __init__(self, width, height, zoom=None):
+        self.width = width
+        self.height = height
+        self.zoom = zoom
+
+    def getbands(self):
+        return ("R", "G", "B")
+
+    def resize(self, size):
+        return _FakeImage(size[0], size[1], self.zoom)
+
+
+def _render(calls):
+    def render(page, zoom):
+        calls.append((page, zoom))
+        return _FakeImage(round(100 * zoom), round(100 * zoom), zoom)
+
+    return render
+
+
+def test_cache_evicts_least_recently_used_within_budget():
+    cache = PageRenderCache(max_bytes=3 * 100 * 100 * 2)
+    cache.put("a.pdf", 1, 1.0, _FakeImage(100, 100))
+    cache.put("a.pdf", 2, 1.0, _FakeImage(100, 100))
+    assert cache.get("a.pdf", 1, 1.01) is not None
+    cache.put("a.pdf", 3, 1.0, _FakeImage(100, 100))
+
+    assert cache.get("a.pdf", 2, 1.0) is None
+    assert cache.get("a.pdf", 1, 1.0) is not None
+    assert cache.size_bytes == 2 * 3 * 100 * 100
+    assert zoom_bucket(1.26) == 1.25
+
+
+def test_lookup_scales_nearest_cached_raster():
+    cache = PageRenderCache()
+    cache.put("a.pdf", 1, 1.0, _FakeImage(100, 100, 1.0))
+    cache.put("a.pdf", 1, 2.0, _FakeImage(200, 200, 2.0))
+    renderer = PageRenderer("a.pdf", _render([]), cache=cache)
+    try:
+        image, exact = renderer.lookup(1, 1.75)
+        assert not exact
+        assert (image.width, image.zoom) == (175, 2.0)
+        assert renderer.lookup(1, 1.0)[1]
+        assert renderer.lookup(2, 1.0) == (None, False)
+    finally:
+        renderer.close()
+
+
+def test_request_shows_preview_then_exact_render_and_prefetches_neighbours():
+    calls, delivered = [], []
+    cache = PageRenderCache()
+    renderer = PageRenderer("a.pdf", _render(calls), cache=cache, page_count=3, prefetch_radius=1)
+
+    def callback(page, zoom, image, exact, error):
+        delivered.append((page, zoom, image.width, exact, error))
+
+    try:
+        renderer.request(2, 1.5, callback)
+        deadline = time.monotonic() + 5
+        while len(calls) < 4 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        renderer.close()
+
+    assert delivered == [(2, 1.5, 150, False, None), (2, 1.5, 150, True, None)]
+    assert calls == [(2, 0.35), (2, 1.5), (3, 1.5), (1, 1.5)]
+    assert cache.get("a.pdf", 3, 1.5) is not None
+
+
+def test_flipping_through_cached_pages_keeps_reading_ahead():
+    calls = []
+    cache = PageRenderCache()
+    for page in range(1, 6):
+        cache.put("a.pdf", page, 1.0, _FakeImage(100, 100, 1.0))
+    renderer = PageRenderer("a.pdf", _render(calls), cache=cache, page_count=10, prefetch_radius=1)
+
+    try:
+        # Exact cache hits only prefetch, as the viewers do.
+        for page in range(2, 6):
+            renderer.prefetch(page, 1.0)
+        deadline = time.monotonic() + 5
+        while not calls and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        renderer.close()
+
+    assert calls == [(6, 1.0)]
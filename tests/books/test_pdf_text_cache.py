@@ -0,0 +1,60 @@
+"""Tests for the positional PDF text cache."""
+
+from modules.books import pdf_text_cache
+from modules.books.pdf_text_cache import PDFTextCache, load_text_cache
+
+PAGES = [
+    [(0, 0, 10, 5, "Goblin"), (12, 0, 30, 5, "King"), (0, 10, 10, 15, "rules")],
+    [(0, 0, 10, 5, "nothing")],
+    [(0, 0, 10, 5, "goblin"), (12, 0, 30, 5, "king's"), (0, 10, 10, 15, "goblin")],
+]
+
+
+class _FakePage:
+    def __init__(self, words):
+        self._words = words
+
+    def get_text(self, mode):
+        assert mode == "words"
+        return [word + (0, 0, index) for index, word in enumerate(self._words)]
+
+
+class _FakeDocument:
+    opened = 0
+
+    def __init__(self):
+        type(self).opened += 1
+        self.page_count = len(PAGES)
+
+    def load_page(self, index):
+        return _FakePage(PAGES[index])
+
+    def close(self):
+        pass
+
+
+def test_search_returns_pages_and_word_rects():
+    cache = PDFTextCache(PAGES)
+
+    hits = cache.search("goblin  KING")
+
+    assert [hit.page for hit in hits] == [1, 3]
+    assert hits[0].rects == ((0, 0, 10, 5), (12, 0, 30, 5))
+    assert cache.page_rects(3, "goblin") == ((0, 0, 10, 5), (0, 10, 10, 15))
+    assert cache.matching_pages("rules") == [1]
+    assert cache.page_contains(2, "nothing") and not cache.page_contains(9, "nothing")
+
+
+def test_cache_is_built_once_and_persisted_per_hash(tmp_path, monkeypatch):
+    monkeypatch.setattr(pdf_text_cache, "_MEMORY", {})
+    pdf = tmp_path / "rules.pdf"
+    pdf.write_bytes(b"%PDF-1.4 fake")
+    _FakeDocument.opened = 0
+
+    first = load_text_cache(pdf, open_document=lambda _path: _FakeDocument(), campaign_dir=str(tmp_path))
+    monkeypatch.setattr(pdf_text_cache, "_MEMORY", {})
+    second = load_text_cache(pdf, open_document=lambda _path: _FakeDocument(), campaign_dir=str(tmp_path))
+
+    assert _FakeDocument.opened == 1
+    assert list((tmp_path / pdf_text_cache.CACHE_DIRNAME).glob("*.json.gz"))
+    assert second.matching_pages("goblin") == first.matching_pages("goblin") == [1, 3]
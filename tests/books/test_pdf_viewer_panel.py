@@ -118,3 +118,14 @@ def test_pdf_viewer_find_next_reports_no_matches() -> None:
 
     assert viewer.current_page == 1
     assert viewer.search_status_label.text == "No matches"
+
+
+def test_pdf_viewer_search_uses_text_cache_when_ready() -> None:
+    from modules.books.pdf_text_cache import PDFTextCache
+
+    viewer = _search_viewer()
+    viewer._document = _FakeDocument(["", "", ""])
+    viewer._text_cache = PDFTextCache([[(0, 0, 1, 1, "alpha")], [], [(0, 0, 1, 1, "Alpha")]])
+
+    assert PDFViewerFrame._build_search_matches(viewer, "alpha") == [1, 3]
+    assert PDFViewerFrame._page_contains_query(viewer, 2, "alpha")
@@ -26,12 +26,17 @@ class _RetryingFakeAIClient:
         """Initialize the _RetryingFakeAIClient instance."""
         self.responses = list(responses)
         self.calls: list[list[dict[str, str]]] = []
+        self.forgotten: list[list[dict[str, str]]] = []
 
     def chat(self, messages):
         """Handle chat."""
         self.calls.append(list(messages))
         return self.responses.pop(0)
 
+    def forget(self, messages):
+        """Record which cached answer was dropped."""
+        self.forgotten.append(list(messages))
+
 
 class _FakeScenarioWrapper:
     def __init__(self, items):
@@ -262,3 +267,4 @@ def test_arc_generation_service_retries_when_first_payload_has_single_scenario_a
     assert result["arcs"][0]["scenarios"] == ["Cold Open", "Hidden Ledger", "Broken Oath"]
     assert len(ai_client.calls) == 2
     assert "did not satisfy the campaign-arc constraints" in ai_client.calls[1][-1]["content"]
+    assert ai_client.forgotten == [ai_client.calls[0]]
@@ -1,5 +1,8 @@
 """Regression tests for arc scenario expansion service."""
 
+import json
+import threading
+
 import pytest
 
 from modules.campaigns.services.ai import (
@@ -864,3 +867,55 @@ def test_arc_scenario_expansion_replaces_scene_notes_in_created_entity_descripti
         assert "Purpose:" not in description
         assert "Atouts:" not in description
         assert len(description) > 250
+
+
+class _PerArcFakeAIClient:
+    """Answer each arc request on its own and fail one arc's first attempt."""
+
+    def __init__(self, failing_arc):
+        """Initialize the _PerArcFakeAIClient instance."""
+        self.failing_arc = failing_arc
+        self.requested_arcs: list[str] = []
+        self._lock = threading.Lock()
+
+    def chat(self, messages):
+        """Handle chat."""
+        arc_name = "Dock Strike" if "Dock Strike" in messages[1]["content"] else "Guild War"
+        with self._lock:
+            self.requested_arcs.append(arc_name)
+            first_attempt = self.requested_arcs.count(arc_name) == 1
+        count = 1 if arc_name == self.failing_arc and first_attempt else 2
+        scenarios = [
+            {
+                "Title": f"{arc_name} Part {number}",
+                "Summary": f"Chapter {number} of {arc_name}.",
+                "Secrets": "The patron is closer than expected.",
+                "Scenes": ["Open the case", "Apply pressure", "Close the trap"],
+                "Places": ["Rainmarket"],
+                "NPCs": ["Rika Vale"],
+                "Villains": ["Marshal Vey"],
+                "Creatures": [],
+                "Factions": ["Rainmarket Compact"],
+                "Objects": [],
+            }
+            for number in range(1, count + 1)
+        ]
+        return json.dumps({"arcs": [{"arc_name": arc_name, "scenarios": scenarios}]})
+
+
+def test_arc_scenario_expansion_retries_only_the_failing_arc():
+    """Verify that one invalid arc response is re-requested without redoing the others."""
+    ai_client = _PerArcFakeAIClient(failing_arc="Dock Strike")
+    service = ArcScenarioExpansionService(ai_client, max_concurrency=2)
+
+    result = service.generate_scenarios(
+        {"name": "Stormfront", "tone": "Noir"},
+        [
+            {"name": "Guild War", "summary": "Street-level pressure.", "scenarios": ["Cold Open"]},
+            {"name": "Dock Strike", "summary": "The docks shut down.", "scenarios": ["Cold Open"]},
+        ],
+    )
+
+    assert sorted(ai_client.requested_arcs) == ["Dock Strike", "Dock Strike", "Guild War"]
+    assert [group["arc_name"] for group in result["arcs"]] == ["Guild War", "Dock Strike"]
+    assert [len(group["scenarios"]) for group in result["arcs"]] == [2, 2]
@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import json
+import os
 import sqlite3
+import time
 
+import pytest
+
+from db.db import ensure_nocase_key_index
 from modules.campaigns.services.campaign_forge_persistence import (
     CampaignForgePersistence,
+    CampaignForgePersistenceError,
     SAVE_MODE_MERGE_KEEP_EXISTING,
     SAVE_MODE_REPLACE_GENERATED_ONLY,
 )
+from modules.generic.generic_model_wrapper import GenericModelWrapper
 from tests.campaigns.fixtures.campaign_forge_payloads import generated_scenario_payload
 
 
@@ -99,6 +107,7 @@ def _create_campaign_forge_tables(db_path):
         cursor.execute("CREATE TABLE scenarios (Title TEXT PRIMARY KEY, Summary TEXT)")
         cursor.execute("CREATE TABLE npcs (Name TEXT PRIMARY KEY, Role TEXT)")
         cursor.execute("CREATE TABLE places (Name TEXT PRIMARY KEY, Description TEXT)")
+        ensure_nocase_key_index(cursor, "scenarios", "Title")
         conn.commit()
     finally:
         conn.close()
@@ -117,8 +126,6 @@ def _load_names(db_path, table):
 
 def test_save_from_dry_run_persists_fallback_entities_to_scenario_db(tmp_path):
     """Verify fallback entity wrappers use the scenario wrapper database path."""
-    from modules.generic.generic_model_wrapper import GenericModelWrapper
-
     db_path = tmp_path / "campaign.sqlite"
     _create_campaign_forge_tables(db_path)
     scenario_wrapper = GenericModelWrapper("scenarios", db_path=str(db_path))
@@ -154,3 +161,138 @@ def test_save_from_dry_run_persists_fallback_entities_to_scenario_db(tmp_path):
     assert _load_names(db_path, "places") == ["Rainmarket"]
     assert persistence.entity_wrappers["npcs"]._db_path == str(db_path)
     assert persistence.entity_wrappers["places"]._db_path == str(db_path)
+
+
+def _forge_payload(arc_count: int, scenarios_per_arc: int) -> tuple[dict, list[dict]]:
+    """Build a generated payload whose scenarios each create one NPC."""
+    groups = []
+    for arc_index in range(arc_count):
+        scenarios = [
+            {
+                "Title": f"Arc {arc_index} Scenario {index}",
+                "Summary": "Generated summary.",
+                "EntityCreations": {"npcs": [{"Name": f"Npc {arc_index}-{index}", "Role": "Contact"}]},
+            }
+            for index in range(scenarios_per_arc)
+        ]
+        groups.append({"arc_name": f"Arc {arc_index}", "scenarios": scenarios})
+    arcs = [{"name": f"Arc {index}", "scenarios": []} for index in range(arc_count)]
+    return {"arcs": groups}, arcs
+
+
+def _campaign_persistence(db_path) -> CampaignForgePersistence:
+    """Create persistence backed by real wrappers, including a campaigns table."""
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE IF NOT EXISTS campaigns (Name TEXT PRIMARY KEY, Arcs TEXT, LinkedScenarios TEXT)")
+    conn.commit()
+    conn.close()
+    return CampaignForgePersistence(
+        GenericModelWrapper("scenarios", db_path=str(db_path)),
+        campaign_wrapper=GenericModelWrapper("campaigns", db_path=str(db_path)),
+    )
+
+
+def test_dry_run_collisions_use_the_indexed_title_lookup(tmp_path):
+    """Verify collisions are found without loading every scenario."""
+    db_path = tmp_path / "campaign.sqlite"
+    _create_campaign_forge_tables(db_path)
+    wrapper = GenericModelWrapper("scenarios", db_path=str(db_path))
+    wrapper.save_items([{"Title": "Rainmarket Ultimatum"}, {"Title": "rainmarket ultimatum (2)"}, {"Title": "Other"}])
+    wrapper.load_items = lambda: pytest.fail("collision check should not load every scenario")
+    persistence = CampaignForgePersistence(scenario_wrapper=wrapper)
+    payload = {"arcs": [{"arc_name": "Arc Alpha", "scenarios": [{"Title": "RAINMARKET ULTIMATUM"}]}]}
+
+    report = persistence.build_dry_run_report(payload, [], save_mode=SAVE_MODE_MERGE_KEEP_EXISTING)
+
+    assert report["scenarios"]["items"][0]["final_title"] == "RAINMARKET ULTIMATUM (3)"
+    assert wrapper.existing_keys(["OTHER"], "Title", nocase=True) == {"Other"}
+    conn = sqlite3.connect(db_path)
+    plan = conn.execute("EXPLAIN QUERY PLAN SELECT Title FROM scenarios WHERE Title LIKE 'rain%' ESCAPE '\\'").fetchall()
+    conn.close()
+    assert "idx_scenarios_Title_nocase" in str(plan)
+
+
+def test_save_writes_scenarios_entities_and_arc_links_in_one_transaction(tmp_path):
+    """Verify one commit covers metadata, created entities and scenarios."""
+    db_path = tmp_path / "campaign.sqlite"
+    _create_campaign_forge_tables(db_path)
+    persistence = _campaign_persistence(db_path)
+    payload, arcs = _forge_payload(2, 3)
+    dry_run = persistence.build_dry_run_report(payload, arcs, save_mode=SAVE_MODE_MERGE_KEEP_EXISTING)
+    metadata = {"Name": "Stormfront", "Arcs": [dict(arc) for arc in arcs], "LinkedScenarios": []}
+    events = []
+    listener = lambda path, event: events.append((event.entity_type, event.item_count))
+    GenericModelWrapper.add_save_listener(listener)
+    try:
+        result = persistence.save_from_dry_run(payload, arcs, dry_run, campaign_metadata=metadata)
+    finally:
+        GenericModelWrapper.remove_save_listener(listener)
+
+    assert events == [("campaigns", 1), ("npcs", 6), ("scenarios", 6)]
+    assert [len(group["scenarios"]) for group in result["saved_groups"]] == [3, 3]
+    assert arcs[0]["scenarios"] == ["Arc 0 Scenario 0", "Arc 0 Scenario 1", "Arc 0 Scenario 2"]
+    conn = sqlite3.connect(db_path)
+    stored_arcs, linked = conn.execute("SELECT Arcs, LinkedScenarios FROM campaigns").fetchone()
+    conn.close()
+    assert json.loads(stored_arcs)[1]["scenarios"] == ["Arc 1 Scenario 0", "Arc 1 Scenario 1", "Arc 1 Scenario 2"]
+    assert len(json.loads(linked)) == 6
+
+
+def test_per_item_save_links_arcs_in_campaign_metadata(tmp_path, monkeypatch):
+    """Verify the fallback path stores the planned arc links too."""
+    db_path = tmp_path / "campaign.sqlite"
+    _create_campaign_forge_tables(db_path)
+    persistence = _campaign_persistence(db_path)
+    monkeypatch.setattr(persistence, "_supports_single_transaction", lambda: False)
+    payload, arcs = _forge_payload(2, 2)
+    dry_run = persistence.build_dry_run_report(payload, arcs, save_mode=SAVE_MODE_MERGE_KEEP_EXISTING)
+    metadata = {"Name": "Stormfront", "Arcs": [dict(arc) for arc in arcs], "LinkedScenarios": []}
+
+    persistence.save_from_dry_run(payload, arcs, dry_run, campaign_metadata=metadata)
+
+    conn = sqlite3.connect(db_path)
+    stored_arcs, linked = conn.execute("SELECT Arcs, LinkedScenarios FROM campaigns").fetchone()
+    conn.close()
+    assert json.loads(stored_arcs)[1]["scenarios"] == ["Arc 1 Scenario 0", "Arc 1 Scenario 1"]
+    assert len(json.loads(linked)) == 4
+
+
+def test_failed_save_rolls_back_every_write(tmp_path, monkeypatch):
+    """Verify a failing scenario write leaves no campaign or entity rows behind."""
+    db_path = tmp_path / "campaign.sqlite"
+    _create_campaign_forge_tables(db_path)
+    persistence = _campaign_persistence(db_path)
+    payload, arcs = _forge_payload(1, 2)
+    dry_run = persistence.build_dry_run_report(payload, arcs, save_mode=SAVE_MODE_MERGE_KEEP_EXISTING)
+
+    def broken_write(cursor, items, replace):
+        raise sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setattr(persistence.scenario_wrapper, "_write_items", broken_write)
+    with pytest.raises(CampaignForgePersistenceError, match="phase=scenario"):
+        persistence.save_from_dry_run(payload, arcs, dry_run, campaign_metadata={"Name": "Stormfront"})
+
+    assert persistence.unsaved_generated_payload is payload
+    assert arcs[0]["scenarios"] == []
+    assert _load_names(db_path, "npcs") == []
+    assert _load_names(db_path, "campaigns") == []
+
+
+@pytest.mark.skipif(not os.environ.get("GMCD_BENCHMARKS"), reason="set GMCD_BENCHMARKS=1 to run benchmarks")
+def test_benchmark_persisting_50_arcs_of_10_scenarios(tmp_path, monkeypatch):
+    timings = {}
+    for label, single_transaction in (("per-item", False), ("one transaction", True)):
+        db_path = tmp_path / f"{label}.sqlite"
+        _create_campaign_forge_tables(db_path)
+        persistence = _campaign_persistence(db_path)
+        monkeypatch.setattr(persistence, "_supports_single_transaction", lambda flag=single_transaction: flag)
+        payload, arcs = _forge_payload(50, 10)
+
+        started = time.perf_counter()
+        dry_run = persistence.build_dry_run_report(payload, arcs, save_mode=SAVE_MODE_MERGE_KEEP_EXISTING)
+        persistence.save_from_dry_run(payload, arcs, dry_run, campaign_metadata={"Name": "Stormfront"})
+        timings[label] = time.perf_counter() - started
+        assert len(_load_names(db_path, "npcs")) == 500
+
+    print(f"\ncampaign forge save 50x10: {timings}")
+    assert timings["one transaction"] * 5 < timings["per-item"]
@@ -83,3 +83,86 @@ def test_clean_campaign_can_still_dispatch_requested_full_checkpoint():
 
     assert len(jobs) == 1
     assert jobs[0].force_full_checkpoint is True
+
+
+def test_adaptive_scheduler_stretches_quiet_period_during_bursts():
+    from modules.generic.campaign_sync.auto_publish.scheduler import (
+        AdaptivePublicationScheduler, ChangeVolume,
+    )
+
+    scheduler = AdaptivePublicationScheduler(
+        idle_delay=30, maximum_interval=300, burst_saves_per_minute=20, maximum_stretch=4,
+    )
+    calm = ChangeVolume(saves=2)
+    burst = ChangeVolume(saves=200)
+
+    assert scheduler.due_at(0.0, 60.0, calm) == 60.0 + 30 * (1 + 2 / 20)
+    assert scheduler.due_at(0.0, 60.0, burst) == 60.0 + 120.0
+    assert scheduler.due_at(0.0, 250.0, burst) == 300.0
+
+
+def test_adaptive_scheduler_stretches_for_bulk_saves():
+    from modules.generic.campaign_sync.auto_publish.scheduler import (
+        AdaptivePublicationScheduler, ChangeVolume,
+    )
+
+    scheduler = AdaptivePublicationScheduler(
+        idle_delay=30, maximum_interval=300, burst_saves_per_minute=20,
+        burst_items_per_minute=100, burst_bytes_per_minute=1_000_000, maximum_stretch=4,
+    )
+
+    assert scheduler.due_at(0.0, 60.0, ChangeVolume(saves=2, items=2)) == 60.0 + 30 * (1 + 2 / 20)
+    assert scheduler.due_at(0.0, 60.0, ChangeVolume(saves=2, items=100)) == 60.0 + 60.0
+    assert scheduler.due_at(0.0, 60.0, ChangeVolume(saves=2, bytes=5_000_000)) == 60.0 + 120.0
+    assert scheduler.due_at(0.0, 60.0, ChangeVolume(saves=1, items=1000)) == 60.0 + 30.0
+
+
+def test_burst_of_saves_coalesces_into_one_publication_with_metrics(tmp_path):
+    from modules.generic.campaign_sync.auto_publish.models import EventKind, SyncState, WorkerEvent
+    from modules.generic.campaign_sync.auto_publish.outbox import DurableOutbox
+
+    now = [1000.0]
+    dispatched = []
+
+    class Executor:
+        def submit(self, function, *args):
+            dispatched.append(args[0])
+
+        def shutdown(self, **_kwargs):
+            return None
+
+    outbox = DurableOutbox(tmp_path / "outbox.json")
+    coordinator = AutoPublishCoordinator(
+        outbox, IdleWorker(), clock=lambda: now[0], executor=Executor(),
+    )
+    writes = []
+    original_persist = outbox._persist
+    outbox._persist = lambda: (writes.append(1), original_persist())
+
+    for second in range(100):
+        now[0] = 1000.0 + second * 0.5
+        coordinator.mark_dirty(
+            campaign_id="c1", campaign_name="Campaign", campaign_root=tmp_path,
+            database_path=tmp_path / "campaign.db", expected_parent_revision=3,
+            changed_items=1, changed_bytes=250,
+        )
+        coordinator.tick()
+
+    assert dispatched == []
+    assert len(writes) == 1
+    now[0] += 600
+    coordinator.tick()
+    assert len(dispatched) == 1
+
+    result = type("Result", (), {"archive_size": 4096})()
+    coordinator.handle_event(WorkerEvent(
+        "job", "c1", 2, EventKind.SUCCESS, SyncState.SYNCHRONIZED, result=result, terminal=True,
+    ))
+    metrics = coordinator.metrics()
+    assert metrics.saves_recorded == 100
+    assert metrics.changed_bytes == 25000
+    assert metrics.publishes_started == 1
+    assert metrics.publishes_avoided == 99
+    assert metrics.average_bundle_size == 4096
+    assert metrics.average_time_to_publish == 600 + 99 * 0.5
+    assert outbox.get("c1") is None
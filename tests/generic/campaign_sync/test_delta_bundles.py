@@ -9,8 +9,15 @@ from pathlib import Path
 
 import pytest
 
-from modules.generic.campaign_sync.change_detector import calculate_campaign_fingerprint
-from modules.generic.campaign_sync.delta_applier import apply_delta, clone_campaign
+from modules.generic.campaign_sync.change_detector import (
+    calculate_campaign_fingerprint,
+    fingerprint_from_inventory,
+)
+from modules.generic.campaign_sync.delta_applier import (
+    apply_delta,
+    clone_campaign,
+    delta_clone_skips,
+)
 from modules.generic.campaign_sync.delta_builder import (
     build_inventory,
     compare_inventories,
@@ -126,6 +133,52 @@ def test_delta_reconstruction_matches_inventory_and_canonical_fingerprint(tmp_pa
     assert (active / "assets" / "changed.bin").read_bytes() == b"old"
 
 
+def test_delta_clone_shares_unchanged_files_and_skips_rewritten_ones(tmp_path):
+    active = tmp_path / "active"
+    _campaign(active)
+    (active / "campaign.db-wal").write_bytes(b"wal")
+    changed = InventoryEntry("assets/changed.bin", "d" * 64, 3, "asset")
+    delta = DeltaManifest(1, "a" * 64, (changed,), ("assets/deleted.bin",), (changed,))
+    staging = tmp_path / "staging"
+
+    report = clone_campaign(active, staging, skip=delta_clone_skips(delta, "campaign.db"))
+
+    assert os.path.samefile(
+        staging / "world_maps" / "renamed-old.png", active / "world_maps" / "renamed-old.png"
+    )
+    for skipped in ("campaign.db", "campaign.db-wal", "assets/changed.bin", "assets/deleted.bin"):
+        assert not (staging / skipped).exists()
+    assert report.skipped == 4
+    assert report.linked + report.reflinked + report.copied == 1
+
+
+def test_inventory_stat_cache_reuses_digests_of_untouched_files(tmp_path, monkeypatch):
+    root = tmp_path / "campaign"
+    database = _campaign(root)
+    stat_cache: dict = {}
+    first = build_inventory(root, database, database_snapshot_path=database, stat_cache=stat_cache)
+    assert set(stat_cache) == {"assets/changed.bin", "assets/deleted.bin", "world_maps/renamed-old.png"}
+
+    (root / "assets" / "changed.bin").unlink()
+    (root / "assets" / "changed.bin").write_bytes(b"new")
+    hashed: list[str] = []
+    from modules.generic.campaign_sync import delta_builder
+
+    def counting_sha256(path):
+        hashed.append(Path(path).name)
+        return sha256_file(path)
+
+    monkeypatch.setattr(delta_builder, "sha256_file", counting_sha256)
+    second = build_inventory(root, database, database_snapshot_path=database, stat_cache=stat_cache)
+
+    assert sorted(hashed) == ["campaign.db", "changed.bin"]
+    assert second != first
+    assert second == build_inventory(root, database, database_snapshot_path=database)
+    assert fingerprint_from_inventory(second) == calculate_campaign_fingerprint(
+        root, database_path=database, database_snapshot_path=database
+    )
+
+
 def test_delta_rejects_corrupted_payload_and_traversal(tmp_path):
     payload = tmp_path / "payload.bin"
     payload.write_bytes(b"expected")
@@ -223,3 +223,17 @@ def test_unrelated_releases_do_not_affect_revision(campaign, tmp_path):
     publisher.enable(root, database_path=database)
 
     assert publisher.publish(root, database_path=database).revision == 1
+
+
+def test_delta_touching_most_files_is_promoted_to_full_checkpoint(campaign, tmp_path):
+    root, database = campaign
+    gallery = MockGallery()
+    publisher = _publisher(tmp_path, gallery, full_checkpoint_ratio=0.5)
+    publisher.enable(root, database_path=database)
+    publisher.publish(root, database_path=database)
+    (root / "assets" / "image_library" / "scene.png").write_bytes(b"redrawn image")
+
+    result = publisher.publish(root, database_path=database)
+
+    assert result.snapshot_mode == "full_campaign"
+    assert result.archive_size == len(result.release.archive_bytes)
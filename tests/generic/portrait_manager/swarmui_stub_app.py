@@ -0,0 +1,63 @@
+"""Flask stub of the SwarmUI endpoints used by the portrait queue tests.
+
+Run as a script in its own interpreter (the test suite replaces ``flask`` with
+a stub); it prints the bound port and serves until terminated.
+"""
+from __future__ import annotations
+
+import base64
+import threading
+import time
+
+from flask import Flask, Response, jsonify, request
+from werkzeug.serving import make_server
+
+PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAIAAAD8GO2jAAAAKklEQVR4nO3OQQ0AIBDAsAP/nuGNAvZoFSzZOjNnyNi/AwAAAAAAAAAAXgOShgHBiIFQyQAAAABJRU5ErkJggg=="
+)
+
+app = Flask("swarmui_stub")
+stats = {"sessions": 0, "generations": 0, "downloads": 0, "active": 0, "peak": 0}
+lock = threading.Lock()
+
+
+@app.post("/API/GetNewSession")
+def new_session():
+    with lock:
+        stats["sessions"] += 1
+    return jsonify(session_id="session-1")
+
+
+@app.post("/API/GenerateText2Image")
+def generate():
+    payload = request.get_json()
+    if payload.get("session_id") != "session-1":
+        return jsonify(error="invalid session"), 400
+    with lock:
+        stats["generations"] += 1
+        number = stats["generations"]
+        stats["active"] += 1
+        stats["peak"] = max(stats["peak"], stats["active"])
+    time.sleep(0.1)
+    with lock:
+        stats["active"] -= 1
+    return jsonify(images=[f"View/local/{number}_{idx}.png" for idx in range(payload["images"])])
+
+
+@app.get("/View/<path:name>")
+def view(name):
+    with lock:
+        stats["downloads"] += 1
+    return Response(PNG, mimetype="image/png")
+
+
+@app.get("/stats")
+def get_stats():
+    with lock:
+        return jsonify(stats)
+
+
+if __name__ == "__main__":
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    print(server.server_port, flush=True)
+    server.serve_forever()
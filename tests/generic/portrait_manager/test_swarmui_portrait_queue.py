@@ -0,0 +1,197 @@
+"""Tests for the persistent SwarmUI portrait job queue."""
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from modules.helpers import swarmui_portrait_queue, swarmui_portrait_service
+from modules.helpers.swarmui_portrait_queue import (
+    DOWNLOADED,
+    FAILED,
+    READY,
+    SUBMITTED,
+    PortraitJobQueue,
+    resume_pending_portrait_jobs,
+)
+from modules.helpers.swarmui_portrait_service import PortraitGenerationSource, SwarmUIPortraitSettings
+
+STUB_APP = Path(__file__).with_name("swarmui_stub_app.py")
+SETTINGS = SwarmUIPortraitSettings(model="test-model", image_count=2, cfgscale=7.0)
+
+
+class _Response:
+    def __init__(self, status: int, body: bytes) -> None:
+        self.status_code = status
+        self.content = body
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class _UrllibClient:
+    """HttpClient that talks to the stub without requests."""
+
+    def __init__(self, base_url: str) -> None:
+        self.base_url = base_url
+
+    def _send(self, url: str, data: bytes | None = None) -> _Response:
+        url = url.replace(swarmui_portrait_service.SWARM_API_URL, self.base_url)
+        request = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+        try:
+            with urllib.request.urlopen(request, timeout=5) as response:
+                return _Response(response.status, response.read())
+        except urllib.error.HTTPError as exc:
+            return _Response(exc.code, exc.read())
+
+    def post(self, url: str, **kwargs) -> _Response:
+        return self._send(url, json.dumps(kwargs.get("json", {})).encode("utf-8"))
+
+    def get(self, url: str, **kwargs) -> _Response:
+        return self._send(url)
+
+    def stats(self) -> dict:
+        return self._send(f"{self.base_url}/stats").json()
+
+
+@pytest.fixture
+def swarm_stub():
+    """Run the Flask stub in its own interpreter, where the real flask is importable."""
+    if subprocess.run([sys.executable, "-c", "import flask"], capture_output=True).returncode != 0:
+        pytest.skip("flask is not installed")
+    process = subprocess.Popen([sys.executable, str(STUB_APP)], stdout=subprocess.PIPE, text=True)
+    try:
+        port = int(process.stdout.readline())
+        yield _UrllibClient(f"http://127.0.0.1:{port}")
+    finally:
+        process.terminate()
+        process.wait(timeout=5)
+
+
+@pytest.fixture
+def campaign_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(swarmui_portrait_queue.ConfigHelper, "get_campaign_dir", lambda: str(tmp_path))
+    monkeypatch.setattr(swarmui_portrait_queue, "make_thumbnail", lambda content: ("thumbnail", len(content)))
+    return tmp_path
+
+
+def _source(name: str) -> PortraitGenerationSource:
+    return PortraitGenerationSource(name=name, record={"Name": name, "Description": "A weathered sailor"})
+
+
+def test_queue_generates_and_downloads_in_parallel(swarm_stub, campaign_dir):
+    queue = PortraitJobQueue(http_client=swarm_stub, max_submissions=2, max_downloads=3)
+    for name in ("Ana", "Bram", "Cleo"):
+        queue.enqueue(_source(name), SETTINGS)
+
+    done = queue.run()
+
+    assert sorted(job.entity_name for job in done) == ["Ana", "Bram", "Cleo"]
+    assert all(job.state == READY and len(job.files) == 2 for job in done)
+    assert all(len(job.thumbnails) == 2 for job in done)
+    stats = swarm_stub.stats()
+    assert stats["sessions"] == 1 and stats["generations"] == 3 and stats["downloads"] == 6
+    assert stats["peak"] == 2
+    for job in done:
+        for path in job.files:
+            assert Path(path).parent == queue.queue_dir
+            assert Path(path).read_bytes()[:4] == b"\x89PNG"
+    assert queue.pending_jobs() == []
+    queue.close()
+
+
+def test_queue_resumes_after_a_restart(swarm_stub, campaign_dir):
+    queue = PortraitJobQueue(http_client=swarm_stub)
+    submitted = queue.enqueue(_source("Ana"), SETTINGS)
+    downloaded = queue.enqueue(_source("Bram"), SETTINGS)
+    queue._submit(submitted)
+    queue._submit(downloaded)
+    queue._download(downloaded)
+    queue.close()
+    before = swarm_stub.stats()
+
+    restarted = PortraitJobQueue(http_client=swarm_stub)
+    assert [job.state for job in restarted.pending_jobs()] == [SUBMITTED, DOWNLOADED]
+    done = restarted.run()
+
+    assert [job.state for job in done] == [READY, READY]
+    after = swarm_stub.stats()
+    assert after["generations"] == before["generations"] == 2
+    assert after["downloads"] == before["downloads"] + 2
+    restarted.close()
+
+
+def _spooled_job(queue: PortraitJobQueue, name: str, count: int = 2):
+    """Queue a job whose images are already downloaded into the spool folder."""
+    job = queue.enqueue(_source(name), SETTINGS)
+    for index in range(count):
+        path = queue.queue_dir / f"job{job.id}_{index}.png"
+        path.write_bytes(f"{name} {index}".encode())
+        job.files.append(str(path))
+    job.state = DOWNLOADED
+    queue._save(job)
+    return job
+
+
+def test_discarding_a_job_deletes_its_spooled_candidates(campaign_dir):
+    queue = PortraitJobQueue()
+    kept = _spooled_job(queue, "Ana")
+    chosen = _spooled_job(queue, "Bram")
+    queue.run()
+
+    queue.discard(chosen.id)
+
+    assert [job.id for job in queue.jobs()] == [kept.id]
+    assert sorted(path.name for path in queue.queue_dir.glob("job*_*")) == [f"job{kept.id}_0.png", f"job{kept.id}_1.png"]
+    queue.close()
+
+
+def test_unpicked_candidates_are_pruned_after_the_retention_period(campaign_dir):
+    queue = PortraitJobQueue()
+    stale = _spooled_job(queue, "Ana")
+    fresh = _spooled_job(queue, "Bram")
+    queue.run()
+    with queue._conn:
+        queue._conn.execute("UPDATE portrait_jobs SET updated_at = 0 WHERE id = ?", (stale.id,))
+
+    resume_pending_portrait_jobs(queue)
+
+    assert [job.id for job in queue.jobs()] == [fresh.id]
+    assert not list(queue.queue_dir.glob(f"job{stale.id}_*"))
+    queue.close()
+
+
+def test_pending_jobs_resume_in_the_background(campaign_dir):
+    queue = PortraitJobQueue()
+    _spooled_job(queue, "Bram")
+
+    resume_pending_portrait_jobs(queue).join(timeout=5)
+
+    assert [job.state for job in queue.jobs()] == [READY]
+    assert resume_pending_portrait_jobs(queue) is None
+    queue.close()
+
+
+def test_generate_waits_for_a_job_claimed_by_another_run(campaign_dir, monkeypatch):
+    queue = PortraitJobQueue()
+    spooled = _spooled_job(queue, "Cleo", 1)
+    monkeypatch.setattr(queue, "enqueue", lambda *args, **kwargs: spooled)
+    # Another run, such as the startup resume, picks the job up first.
+    [claimed] = queue._claim(None)
+    threading.Timer(0.1, queue._finish, (claimed,)).start()
+
+    job = queue.generate(_source("Cleo"), SETTINGS)
+
+    assert job.id == spooled.id and job.state == READY
+    assert len(job.files) == 1
+    queue.close()
@@ -3,7 +3,8 @@ from __future__ import annotations
 
 import base64
 
-from modules.helpers import swarmui_portrait_service
+from modules.helpers import swarmui_portrait_queue
+from modules.helpers.swarmui_portrait_queue import PortraitJobQueue
 from modules.helpers.swarmui_portrait_service import (
     SWARM_API_URL,
     PortraitGenerationSource,
@@ -11,6 +12,7 @@ from modules.helpers.swarmui_portrait_service import (
     build_portrait_prompt,
     create_generated_portrait_filename,
     generate_portrait_candidates,
+    save_generated_portrait_candidate,
 )
 
 
@@ -51,20 +53,23 @@ def _png_bytes() -> bytes:
     )
 
 
-def test_generate_portrait_candidates_uses_mocked_swarmui_http_client(monkeypatch) -> None:
+def test_generate_portrait_candidates_uses_mocked_swarmui_http_client(tmp_path, monkeypatch) -> None:
     http_client = FakeHttpClient(_png_bytes())
     source = PortraitGenerationSource(
         name="Captain Test",
         record={"Name": "Captain Test", "Description": "A brave pilot", "Role": "Ace"},
     )
     settings = SwarmUIPortraitSettings(model="test-model", image_count=2, cfgscale=7.5)
-    monkeypatch.setattr(swarmui_portrait_service, "make_thumbnail", lambda content: "thumbnail")
+    monkeypatch.setattr(swarmui_portrait_queue.ConfigHelper, "get_campaign_dir", lambda: str(tmp_path))
+    monkeypatch.setattr(swarmui_portrait_queue, "make_thumbnail", lambda content: "thumbnail")
+    queue = PortraitJobQueue(tmp_path / "queue", http_client=http_client)
 
-    candidates = generate_portrait_candidates(source, settings, http_client=http_client)
+    candidates = generate_portrait_candidates(source, settings, queue=queue)
 
     assert len(candidates) == 1
     assert candidates[0].image_bytes == http_client.image_bytes
     assert candidates[0].thumbnail == "thumbnail"
+    assert queue.pending_jobs() == []
     assert http_client.posts[0][0] == f"{SWARM_API_URL}/API/GetNewSession"
     generate_url, generate_kwargs = http_client.posts[1]
     assert generate_url == f"{SWARM_API_URL}/API/GenerateText2Image"
@@ -73,6 +78,28 @@ def test_generate_portrait_candidates_uses_mocked_swarmui_http_client(monkeypatc
     assert generate_kwargs["json"]["images"] == 2
     assert generate_kwargs["json"]["model"] == "test-model"
     assert http_client.gets[0][0] == f"{SWARM_API_URL}/View/local/image.png"
+    queue.close()
+
+
+def test_saving_a_candidate_deletes_the_spooled_job(tmp_path, monkeypatch) -> None:
+    http_client = FakeHttpClient(_png_bytes())
+    source = PortraitGenerationSource(name="Captain Test", record={"Name": "Captain Test"})
+    settings = SwarmUIPortraitSettings(model="test-model", image_count=1, cfgscale=7.5)
+    monkeypatch.setattr(swarmui_portrait_queue.ConfigHelper, "get_campaign_dir", lambda: str(tmp_path))
+    monkeypatch.setattr(swarmui_portrait_queue, "make_thumbnail", lambda content: "thumbnail")
+    queue = PortraitJobQueue(tmp_path / "queue", http_client=http_client)
+    [candidate] = generate_portrait_candidates(source, settings, queue=queue)
+    assert list((tmp_path / "queue").glob("job*_*"))
+
+    result = save_generated_portrait_candidate(
+        source, candidate, copy_portrait=lambda _path, name: f"assets/portraits/{name}.png"
+    )
+
+    assert result.portrait_paths == ["assets/portraits/Captain Test.png"]
+    assert (tmp_path / result.generated_asset_paths[0]).read_bytes() == http_client.image_bytes
+    assert list((tmp_path / "queue").glob("job*_*")) == []
+    assert queue.jobs() == []
+    queue.close()
 
 
 def test_prompt_and_filename_helpers_are_safe_and_reusable() -> None:
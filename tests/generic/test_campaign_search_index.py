@@ -0,0 +1,131 @@
+"""Tests for the campaign-wide entity search index."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+
+import pytest
+
+from modules.generic.campaign_search_index import CampaignSearchIndex, entity_text, split_highlights
+from modules.generic.generic_model_wrapper import GenericModelWrapper
+
+
+@pytest.fixture
+def database(tmp_path):
+    path = tmp_path / "campaign.db"
+    with sqlite3.connect(path) as connection:
+        connection.execute("CREATE TABLE npcs (Name TEXT PRIMARY KEY, Description TEXT, Portrait TEXT)")
+        connection.execute("CREATE TABLE scenarios (Title TEXT PRIMARY KEY, Summary TEXT)")
+    GenericModelWrapper("npcs", db_path=str(path)).save_items(
+        [
+            {
+                "Name": "Éowyn",
+                "Description": {"text": "Shieldmaiden who slays the witch-king", "formatting": {}},
+                "Portrait": "assets/portraits/witch.png",
+            },
+            {"Name": "Grima", "Description": "Advisor whispering to the king"},
+        ]
+    )
+    GenericModelWrapper("scenarios", db_path=str(path)).save_items(
+        [{"Title": "The Witch Hunt", "Summary": "Track the coven"}]
+    )
+    return str(path)
+
+
+def test_entity_text_flattens_rich_text_and_skips_media():
+    record = {
+        "Name": "Grima",
+        "Notes": json.dumps({"text": "Wormtongue", "formatting": {"bold": []}}),
+        "Traits": ["sly", {"text": "craven"}],
+        "Portrait": "grima.png",
+    }
+
+    assert entity_text(record, "Name").split("\n") == ["Wormtongue", "sly", "craven"]
+
+
+def test_split_highlights_returns_offsets():
+    assert split_highlights("the \u0002witch\u0003-king") == ("the witch-king", ((4, 9),))
+
+
+def test_search_ranks_names_first_and_folds_accents(database):
+    index = CampaignSearchIndex(database)
+
+    page = index.search("witch", entity_types=["npcs", "scenarios"])
+
+    assert page.total == 2
+    assert [(hit.entity_type, hit.key) for hit in page.hits] == [
+        ("scenarios", "The Witch Hunt"),
+        ("npcs", "Éowyn"),
+    ]
+    assert page.hits[0].name_highlights == ((4, 9),)
+    assert "witch" in page.hits[1].snippet and page.hits[1].snippet_highlights
+    assert [hit.key for hit in index.search("eowyn", entity_types=["npcs"]).hits] == ["Éowyn"]
+    assert index.search("witch.png", entity_types=["npcs"]).total == 0
+
+
+def test_search_paginates_and_lists_without_query(database):
+    index = CampaignSearchIndex(database)
+
+    first = index.search("", entity_types=["npcs"], limit=1)
+    second = index.search("", entity_types=["npcs"], limit=1, offset=1)
+
+    assert first.total == 2 and first.has_more
+    assert [hit.key for hit in first.hits + second.hits] == ["Grima", "Éowyn"]
+    assert not second.has_more
+
+
+def test_saves_update_the_index_incrementally(database):
+    index = CampaignSearchIndex(database)
+    index.search("king", entity_types=["npcs"])
+    GenericModelWrapper.add_save_listener(index.on_saved)
+    try:
+        wrapper = GenericModelWrapper("npcs", db_path=database)
+        wrapper.save_item({"Name": "Grima", "Description": "Exiled to Orthanc"})
+        wrapper.save_items([{"Name": "Grima", "Description": "Exiled to Orthanc"}])
+    finally:
+        GenericModelWrapper.remove_save_listener(index.on_saved)
+
+    assert [hit.key for hit in index.search("orthanc", entity_types=["npcs"]).hits] == ["Grima"]
+    assert index.search("whispering", entity_types=["npcs"]).total == 0
+    assert index.search("", entity_types=["npcs"]).total == 1
+
+
+def test_reopened_index_skips_unchanged_tables(database):
+    assert CampaignSearchIndex(database).refresh(["npcs", "scenarios"]) == 3
+    assert CampaignSearchIndex(database).refresh(["npcs", "scenarios"]) == 0
+
+
+def test_search_falls_back_to_substrings_when_fts_finds_nothing(database):
+    index = CampaignSearchIndex(database)
+
+    assert [hit.key for hit in index.search("owyn", entity_types=["npcs"]).hits] == ["Éowyn"]
+    page = index.search("hieldmaid", entity_types=["npcs"])
+    assert [hit.key for hit in page.hits] == ["Éowyn"]
+    assert page.hits[0].snippet_highlights == ((1, 10),)
+    assert index.search("witch", entity_types=["npcs"]).total == 1
+
+
+def test_search_appends_substring_hits_after_ranked_hits(database):
+    GenericModelWrapper("npcs", db_path=database).save_items(
+        [{"Name": "Switchblade", "Description": "Cutpurse"}], replace=False
+    )
+    index = CampaignSearchIndex(database)
+
+    page = index.search("witch", entity_types=["npcs"])
+    second = index.search("witch", entity_types=["npcs"], limit=1, offset=1)
+
+    assert page.total == 2
+    assert [hit.key for hit in page.hits] == ["Éowyn", "Switchblade"]
+    assert second.total == 2 and [hit.key for hit in second.hits] == ["Switchblade"]
+
+
+def test_refresh_notices_updates_made_outside_the_wrappers(database):
+    index = CampaignSearchIndex(database)
+    assert index.search("orthanc", entity_types=["npcs"]).total == 0
+
+    with sqlite3.connect(database) as connection:
+        connection.execute("UPDATE npcs SET Description = 'Exiled to Orthanc' WHERE Name = 'Grima'")
+
+    assert [hit.key for hit in index.search("orthanc", entity_types=["npcs"]).hits] == ["Grima"]
+    assert CampaignSearchIndex(database).refresh(["npcs"]) == 0
@@ -0,0 +1,125 @@
+"""Tests for the opt-in cross-campaign shared asset store."""
+
+import shutil
+
+from modules.generic import shared_asset_store
+from modules.generic.shared_asset_store import SharedAssetStore, copy_into_campaign
+
+
+def _fake_reflink(source, destination):
+    """Stand in for FICLONE on filesystems without copy-on-write clones."""
+    shutil.copy2(source, destination)
+    return True
+
+
+def test_materialize_clones_identical_assets_and_reports_savings(tmp_path, monkeypatch):
+    monkeypatch.setattr(shared_asset_store, "try_reflink", _fake_reflink)
+    store = SharedAssetStore(tmp_path / "store")
+    source = tmp_path / "pack" / "goblin.png"
+    source.parent.mkdir()
+    source.write_bytes(b"g" * 1024)
+
+    first = tmp_path / "campaign_a" / "assets" / "portraits" / "goblin.png"
+    second = tmp_path / "campaign_b" / "assets" / "portraits" / "goblin.png"
+    assert store.materialize(source, first) == "reflink"
+    assert store.materialize(source, second) == "reflink"
+
+    report = store.report()
+    assert report.objects == 1
+    assert report.links == 2
+    assert report.stored_bytes == 1024
+    assert report.saved_bytes == 1024
+
+
+def test_in_place_writes_never_reach_the_stored_object(tmp_path, monkeypatch):
+    monkeypatch.setattr(shared_asset_store, "try_reflink", _fake_reflink)
+    store = SharedAssetStore(tmp_path / "store")
+    source = tmp_path / "goblin.png"
+    source.write_bytes(b"original")
+    first = tmp_path / "campaign_a" / "goblin.png"
+    second = tmp_path / "campaign_b" / "goblin.png"
+    store.materialize(source, first)
+    store.materialize(source, second)
+
+    with first.open("wb") as handle:
+        handle.write(b"edited")
+
+    assert second.read_bytes() == b"original"
+    assert store.object_path(shared_asset_store._hash_file(source)).read_bytes() == b"original"
+
+
+def test_adopt_tree_deduplicates_existing_campaign_copies(tmp_path, monkeypatch):
+    monkeypatch.setattr(shared_asset_store, "try_reflink", _fake_reflink)
+    store = SharedAssetStore(tmp_path / "store")
+    for campaign in ("a", "b", "c"):
+        path = tmp_path / campaign / "assets" / "maps" / "keep.png"
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"map-bytes")
+
+    adopted = sum(
+        store.adopt_tree(tmp_path / campaign / "assets") for campaign in ("a", "b", "c")
+    )
+
+    assert adopted == 3
+    assert (tmp_path / "c" / "assets" / "maps" / "keep.png").read_bytes() == b"map-bytes"
+    assert store.report().saved_bytes == len(b"map-bytes") * 2
+
+
+def test_adopt_leaves_files_alone_without_reflink_support(tmp_path, monkeypatch):
+    monkeypatch.setattr(shared_asset_store, "try_reflink", lambda *_: False)
+    store = SharedAssetStore(tmp_path / "store")
+    path = tmp_path / "campaign" / "assets" / "keep.png"
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"map-bytes")
+    inode = path.stat().st_ino
+
+    assert store.adopt_tree(tmp_path / "campaign" / "assets") == 0
+
+    assert path.stat().st_ino == inode
+    assert store.report().objects == 0
+
+
+def test_materialize_copies_once_without_reflink_support(tmp_path, monkeypatch):
+    monkeypatch.setattr(shared_asset_store, "try_reflink", lambda *_: False)
+    store = SharedAssetStore(tmp_path / "store")
+    source = tmp_path / "goblin.png"
+    source.write_bytes(b"goblin")
+    destination = tmp_path / "campaign" / "goblin.png"
+
+    assert store.materialize(source, destination) == "copy"
+
+    assert destination.read_bytes() == b"goblin"
+    assert not any(path.is_file() for path in store.objects_dir.rglob("*"))
+    assert store.report().objects == 0
+
+
+def test_unknown_link_modes_fall_back_to_auto(tmp_path):
+    assert SharedAssetStore(tmp_path / "store", link_mode="hardlink").link_mode == "auto"
+    assert SharedAssetStore(tmp_path / "store", link_mode="copy").link_mode == "copy"
+
+
+def test_report_prunes_links_that_no_longer_exist(tmp_path, monkeypatch):
+    monkeypatch.setattr(shared_asset_store, "try_reflink", _fake_reflink)
+    store = SharedAssetStore(tmp_path / "store")
+    source = tmp_path / "source.bin"
+    source.write_bytes(b"abc")
+    destination = tmp_path / "campaign" / "source.bin"
+    assert store.materialize(source, destination) == "reflink"
+    destination.unlink()
+
+    report = store.report()
+
+    assert report.links == 0
+    assert report.saved_bytes == 0
+
+
+def test_copy_into_campaign_plain_copies_when_store_disabled(tmp_path, monkeypatch):
+    monkeypatch.setattr(shared_asset_store, "get_shared_asset_store", lambda *_: None)
+    source = tmp_path / "token.png"
+    source.write_bytes(b"token")
+    destination = tmp_path / "campaign" / "assets" / "tokens" / "token.png"
+
+    copy_into_campaign(source, destination)
+
+    assert destination.read_bytes() == b"token"
+    assert not (tmp_path / shared_asset_store.DEFAULT_STORE_DIRNAME).exists()
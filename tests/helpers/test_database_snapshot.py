@@ -0,0 +1,59 @@
+import hashlib
+import sqlite3
+
+from modules.helpers.database_snapshot import DatabaseSnapshotService
+
+
+def _database(path):
+    with sqlite3.connect(path) as connection:
+        connection.execute("CREATE TABLE notes (body TEXT)")
+        connection.executemany("INSERT INTO notes VALUES (?)", [("x" * 500,)] * 200)
+    return path
+
+
+def test_overlapping_leases_share_one_snapshot_and_clean_up(tmp_path):
+    database = _database(tmp_path / "campaign.db")
+    service = DatabaseSnapshotService(pages=4, sleep=0)
+
+    with service.acquire(database) as first:
+        with service.acquire(database) as second, service.acquire(first.path) as alias:
+            assert first is second is alias
+        assert first.path.exists()
+        assert first.sha256 == hashlib.sha256(first.path.read_bytes()).hexdigest()
+        with sqlite3.connect(first.path) as connection:
+            assert connection.execute("SELECT COUNT(*) FROM notes").fetchone() == (200,)
+        snapshot_path = first.path
+
+    assert not snapshot_path.exists()
+    assert service.active_count() == 0
+
+
+def test_new_operation_takes_a_fresh_snapshot(tmp_path):
+    database = _database(tmp_path / "campaign.db")
+    service = DatabaseSnapshotService()
+
+    with service.acquire(database) as before:
+        digest = before.sha256
+    with sqlite3.connect(database) as connection:
+        connection.execute("INSERT INTO notes VALUES ('later')")
+    with service.acquire(database) as after:
+        assert after is not before
+        assert after.sha256 != digest
+
+
+def test_overlapping_lease_after_a_commit_gets_a_fresh_snapshot(tmp_path):
+    database = _database(tmp_path / "campaign.db")
+    service = DatabaseSnapshotService()
+
+    with service.acquire(database) as first:
+        with sqlite3.connect(database) as connection:
+            connection.execute("UPDATE notes SET body = 'edited' WHERE rowid = 1")
+        with service.acquire(database) as second, service.acquire(first.path) as handle:
+            assert second is not first
+            assert handle is first
+            with sqlite3.connect(second.path) as connection:
+                assert connection.execute("SELECT body FROM notes WHERE rowid = 1").fetchone() == ("edited",)
+        assert first.path.exists()
+        assert not second.path.exists()
+
+    assert service.active_count() == 0
@@ -0,0 +1,118 @@
+"""Tests for batched, resumable image directory imports."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from modules.generic.generic_model_wrapper import GenericModelWrapper
+from modules.image_assets.repository import ImageAssetsRepository
+from modules.image_assets.services.import_service import ImageAssetImportService
+
+
+@pytest.fixture
+def campaign(tmp_path: Path, monkeypatch) -> Path:
+    root = tmp_path / "campaign"
+    library = root / "assets" / "image_library" / "maps"
+    library.mkdir(parents=True)
+    for index in range(10):
+        (library / f"map_{index}.png").write_bytes(f"map-{index}".encode())
+    monkeypatch.setattr(
+        "modules.image_assets.services.import_service.ConfigHelper.get_campaign_dir", lambda: str(root)
+    )
+    monkeypatch.setattr("modules.image_assets.paths.ConfigHelper.get_campaign_dir", lambda: str(root))
+    return root
+
+
+def _repository(tmp_path: Path) -> ImageAssetsRepository:
+    database = tmp_path / "campaign.db"
+    with sqlite3.connect(database) as connection:
+        connection.execute(
+            "CREATE TABLE image_assets (AssetId TEXT PRIMARY KEY, Name TEXT, Path TEXT, Hash TEXT)"
+        )
+    return ImageAssetsRepository(GenericModelWrapper("image_assets", db_path=str(database)))
+
+
+def _service(repository, monkeypatch, hashed: list[Path]) -> ImageAssetImportService:
+    service = ImageAssetImportService(repository, max_workers=4, batch_size=4)
+    original = ImageAssetImportService._compute_sha256
+
+    def counting_hash(path):
+        hashed.append(path)
+        return original(path)
+
+    monkeypatch.setattr(service, "_compute_sha256", counting_hash)
+    monkeypatch.setattr(service, "_read_dimensions", lambda _path: (64, 32))
+    return service
+
+
+def test_import_writes_batches_without_per_file_scans(campaign, tmp_path, monkeypatch):
+    repository = _repository(tmp_path)
+    monkeypatch.setattr(repository, "list_all", _count_calls(repository.list_all, calls := []))
+    progress: list[tuple[int, int]] = []
+    service = _service(repository, monkeypatch, [])
+
+    summary = service.import_directories(
+        [str(campaign / "assets")], recursive=True, reindex_changed_only=True,
+        progress=lambda done, total: progress.append((done, total)),
+    )
+
+    assert summary.imported_new == 10
+    assert len(calls) == 1
+    assert progress[-1] == (10, 10) and len(progress) == 3
+    rows = repository.wrapper.load_items()
+    assert sorted(row["Name"] for row in rows) == [f"map_{index}" for index in range(10)]
+    assert {row["Width"] for row in rows} == {64}
+
+
+def test_interrupted_import_resumes_after_committed_batches(campaign, tmp_path, monkeypatch):
+    repository = _repository(tmp_path)
+    original_bulk = repository.bulk_upsert
+    writes = []
+
+    def failing_bulk(entries):
+        writes.append(entries)
+        if len(writes) == 2:
+            raise RuntimeError("disk full")
+        return original_bulk(entries)
+
+    monkeypatch.setattr(repository, "bulk_upsert", failing_bulk)
+    with pytest.raises(RuntimeError):
+        _service(repository, monkeypatch, []).import_directories(
+            [str(campaign / "assets")], recursive=True, reindex_changed_only=True
+        )
+    monkeypatch.setattr(repository, "bulk_upsert", original_bulk)
+
+    hashed: list[Path] = []
+    summary = _service(repository, monkeypatch, hashed).import_directories(
+        [str(campaign / "assets")], recursive=True, reindex_changed_only=True
+    )
+
+    assert summary.skipped_unchanged == 4
+    assert summary.imported_new == 6
+    assert len(hashed) == 6
+    assert len(repository.wrapper.load_items()) == 10
+    assert not list((campaign / ".cache" / "image_import").glob("*.json"))
+
+
+def test_plan_reports_counts_without_writing(campaign, tmp_path, monkeypatch):
+    repository = _repository(tmp_path)
+    service = _service(repository, monkeypatch, [])
+
+    plan = service.plan_directories([str(campaign / "assets"), str(tmp_path / "missing")], recursive=True)
+
+    assert (plan.candidates, plan.new_files, plan.existing_files, plan.external_files) == (10, 10, 0, 0)
+    assert plan.total_bytes == sum(len(f"map-{index}") for index in range(10))
+    assert plan.roots_missing == [str((tmp_path / "missing").resolve())]
+    assert plan.sampled_files == 10 and plan.as_dict()["estimated_seconds"] >= 0
+    assert repository.wrapper.load_items() == []
+
+
+def _count_calls(function, calls):
+    def wrapper(*args, **kwargs):
+        calls.append(args)
+        return function(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,164 @@
+"""Tests for perceptual-hash duplicate detection and merging."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from modules.generic.generic_model_wrapper import GenericModelWrapper
+from modules.image_assets.repository import ImageAssetsRepository
+from modules.image_assets.search.perceptual_index import (
+    BKTree,
+    PerceptualHashIndex,
+    _dhash_bits,
+    hamming_distance,
+)
+from modules.image_assets.services.duplicate_service import ImageDuplicateService
+
+# Perceptual hashes per file: the two goblins differ by two bits, the dragon is unrelated.
+HASHES = {
+    "goblin.png": 0xF0F0F0F0F0F0F0F0,
+    "goblin_small.jpg": 0xF0F0F0F0F0F0F0F3,
+    "goblin_copy.png": 0xF0F0F0F0F0F0F0F0,
+    "dragon.png": 0x0123456789ABCDEF,
+}
+
+
+@pytest.fixture
+def campaign(tmp_path: Path, monkeypatch) -> Path:
+    root = tmp_path / "campaign"
+    library = root / "assets" / "image_library"
+    library.mkdir(parents=True)
+    for name in HASHES:
+        (library / name).write_bytes(name.encode())
+    monkeypatch.setattr("modules.image_assets.paths.ConfigHelper.get_campaign_dir", lambda: str(root))
+    database = root / "campaign.db"
+    with sqlite3.connect(database) as connection:
+        connection.execute(
+            "CREATE TABLE image_assets (AssetId TEXT PRIMARY KEY, Name TEXT, Path TEXT, Hash TEXT, "
+            "Width INTEGER, Height INTEGER, FileSizeBytes INTEGER, Tags TEXT, ImportedAt TEXT, UpdatedAt TEXT)"
+        )
+        connection.execute("CREATE TABLE npcs (Name TEXT PRIMARY KEY, Portrait TEXT, Notes TEXT)")
+        connection.execute(
+            "INSERT INTO npcs VALUES ('Grik', 'assets/image_library/goblin_small.jpg', ?)",
+            (json.dumps({"gallery": ["assets/image_library/goblin_copy.png"]}),),
+        )
+    rows = [
+        ("a1", "goblin.png", "sha-goblin", 512, 512, 4000, ["goblin"]),
+        ("a2", "goblin_small.jpg", "sha-small", 128, 128, 900, ["token"]),
+        ("a3", "goblin_copy.png", "sha-goblin", 512, 512, 4000, []),
+        ("a4", "dragon.png", "sha-dragon", 512, 512, 5000, []),
+    ]
+    GenericModelWrapper("image_assets", db_path=str(database)).save_items(
+        [
+            {
+                "AssetId": asset_id,
+                "Name": name,
+                "Path": f"assets/image_library/{name}",
+                "Hash": sha,
+                "Width": width,
+                "Height": height,
+                "FileSizeBytes": size,
+                "Tags": tags,
+                "ImportedAt": f"2024-01-0{asset_id[1]}",
+            }
+            for asset_id, name, sha, width, height, size, tags in rows
+        ]
+    )
+    return root
+
+
+def _service(campaign: Path, hashed: list[str]) -> ImageDuplicateService:
+    database = str(campaign / "campaign.db")
+
+    def hash_file(path: Path) -> int:
+        hashed.append(path.name)
+        return HASHES[path.name]
+
+    index = PerceptualHashIndex(database, hash_file=hash_file, max_workers=2)
+    repository = ImageAssetsRepository(GenericModelWrapper("image_assets", db_path=database))
+    return ImageDuplicateService(repository, hash_index=index, campaign_dir=campaign)
+
+
+def test_dhash_bits_compare_neighbouring_pixels():
+    pixels = [3, 2, 1] + [1, 2, 3]
+    assert _dhash_bits(pixels, hash_size=2) == 0b1100
+
+
+def test_bk_tree_returns_items_within_distance():
+    tree = BKTree()
+    for value in (0b0000, 0b0001, 0b0111, 0b1111, 0b0000):
+        tree.add(value, value)
+
+    matches = sorted(tree.search(0b0000, 1))
+
+    assert matches == [(0, 0), (0, 0), (1, 1)]
+    assert hamming_distance(0b1010, 0b0101) == 4
+
+
+def test_find_duplicates_groups_near_and_exact_copies(campaign):
+    hashed: list[str] = []
+    service = _service(campaign, hashed)
+
+    groups = service.find_duplicates(max_distance=4)
+
+    assert len(groups) == 1
+    group = groups[0]
+    assert [asset["AssetId"] for asset in group.assets] == ["a1", "a3", "a2"]
+    assert not group.exact and group.max_distance == 2
+    assert group.reclaimable_bytes == 4900
+    assert sorted(hashed) == sorted(HASHES)
+
+    hashed.clear()
+    service.find_duplicates(max_distance=4)
+    assert hashed == []
+
+
+def test_merge_rewrites_references_and_reclaims_files(campaign):
+    service = _service(campaign, [])
+    group = service.find_duplicates(max_distance=4)[0]
+
+    (result,) = service.merge_groups([group], delete_files=True)
+
+    assert sorted(result.removed_ids) == ["a2", "a3"]
+    assert result.files_deleted == 2 and result.bytes_reclaimed == len(b"goblin_small.jpg") + len(b"goblin_copy.png")
+    assert not (campaign / "assets" / "image_library" / "goblin_copy.png").exists()
+    with sqlite3.connect(campaign / "campaign.db") as connection:
+        portrait, notes = connection.execute("SELECT Portrait, Notes FROM npcs").fetchone()
+        remaining = connection.execute("SELECT AssetId, Tags FROM image_assets ORDER BY AssetId").fetchall()
+    assert portrait == "assets/image_library/goblin.png"
+    assert json.loads(notes) == {"gallery": ["assets/image_library/goblin.png"]}
+    assert [row[0] for row in remaining] == ["a1", "a4"]
+    assert json.loads(remaining[0][1]) == ["goblin", "token"]
+    assert service.find_duplicates(max_distance=4) == []
+
+
+def test_merge_keeps_files_by_default(campaign):
+    service = _service(campaign, [])
+    group = service.find_duplicates(max_distance=4)[0]
+
+    (result,) = service.merge_groups([group])
+
+    assert result.files_deleted == 0
+    assert (campaign / "assets" / "image_library" / "goblin_copy.png").exists()
+    assert (campaign / "assets" / "image_library" / "goblin_small.jpg").exists()
+
+
+def test_merge_keeps_files_still_referenced_in_unrewritten_forms(campaign):
+    with sqlite3.connect(campaign / "campaign.db") as connection:
+        connection.execute(
+            "INSERT INTO npcs VALUES ('Snag', NULL, ?)",
+            ("<p>See assets\\image_library\\goblin_copy.png and assets/image_library/goblin.png</p>",),
+        )
+    service = _service(campaign, [])
+    group = service.find_duplicates(max_distance=4)[0]
+
+    (result,) = service.merge_groups([group], delete_files=True)
+
+    assert result.files_deleted == 1
+    assert result.unresolved_references == ["assets/image_library/goblin_copy.png (npcs.Notes)"]
+    assert (campaign / "assets" / "image_library" / "goblin_copy.png").exists()
+    assert not (campaign / "assets" / "image_library" / "goblin_small.jpg").exists()
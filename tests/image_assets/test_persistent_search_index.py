@@ -0,0 +1,113 @@
+"""Tests for the persistent image-library search index."""
+
+from __future__ import annotations
+
+import sqlite3
+
+from modules.generic.generic_model_wrapper import GenericModelWrapper
+from modules.image_assets.repository import ImageAssetsRepository
+from modules.image_assets.search.persistent_index import ImageSearchIndex
+from modules.image_assets.services.search_service import ImageAssetSearchService, ImageSearchFilters
+
+_COLUMNS = (
+    "AssetId", "Name", "Path", "RelativePath", "SourceRoot", "SourceFolderName", "Extension",
+    "Width", "Height", "FileSizeBytes", "Hash", "NameNormalized", "SearchTokens", "Tags",
+    "ImportedAt", "UpdatedAt",
+)
+
+
+def _repository(tmp_path, monkeypatch) -> ImageAssetsRepository:
+    campaign = tmp_path / "campaign"
+    campaign.mkdir()
+    monkeypatch.setattr("modules.image_assets.paths.ConfigHelper.get_campaign_dir", lambda: str(campaign))
+    database = tmp_path / "campaign.db"
+    with sqlite3.connect(database) as connection:
+        columns = ", ".join(f"{name} TEXT" for name in _COLUMNS)
+        connection.execute(f"CREATE TABLE image_assets ({columns}, PRIMARY KEY(AssetId))")
+    return ImageAssetsRepository(GenericModelWrapper("image_assets", db_path=str(database)))
+
+
+def _asset(name, folder, *, width, extension="png", tags=(), updated="2026-01-01T00:00:00+00:00"):
+    slug = name.lower().replace(" ", "-")
+    return {
+        "Name": name,
+        "Path": f"assets/image_library/{folder}/{slug}.{extension}",
+        "SourceFolderName": folder,
+        "Extension": extension,
+        "Width": width,
+        "Height": width // 2,
+        "FileSizeBytes": width * 10,
+        "Hash": slug,
+        "NameNormalized": name.lower(),
+        "Tags": list(tags),
+        "UpdatedAt": updated,
+    }
+
+
+def test_index_tracks_repository_writes_and_pushes_filters_into_sql(tmp_path, monkeypatch):
+    repository = _repository(tmp_path, monkeypatch)
+    service = ImageAssetSearchService(repository)
+    repository.upsert_by_hash_or_path(_asset("Forest Shrine", "Forests", width=1920, tags=["forest"]))
+    repository.upsert_by_hash_or_path(_asset("Forest Road", "forests", width=800, extension="jpg"))
+    repository.upsert_by_hash_or_path(_asset("Dungeon Map", "dungeons", width=1024))
+
+    rows, total = service.search_images(
+        "fore", ImageSearchFilters(extension=".PNG", min_width=1200, tags=["Forest"])
+    )
+    assert total == 1 and [row.name for row in rows] == ["Forest Shrine"]
+
+    rows, total = service.search_images(
+        filters={"source_folder_names": ["FORESTS"]}, sort="size_desc", limit=1, offset=1
+    )
+    assert total == 2 and [row.name for row in rows] == ["Forest Road"]
+
+    repository.upsert_by_hash_or_path(_asset("Forest Shrine Ruined", "forests", width=1920, tags=["forest"]) | {"Hash": "forest-shrine"})
+    repository.delete_stale_files(["assets/image_library/forests/forest-shrine-ruined.png"])
+
+    rows, total = service.search_images("shrine")
+    assert total == 1 and rows[0].name == "Forest Shrine Ruined"
+    assert service.search_images("dungeon") == ([], 0)
+
+
+def test_index_picks_up_rows_written_outside_the_repository(tmp_path, monkeypatch):
+    repository = _repository(tmp_path, monkeypatch)
+    service = ImageAssetSearchService(repository)
+    assert service.search_images("anything") == ([], 0)
+
+    GenericModelWrapper("image_assets", db_path=repository.wrapper._db_path).save_items(
+        [dict(_asset("Castle Gate", "castles", width=640), AssetId="external")], replace=False
+    )
+
+    rows, total = service.search_images("castle gate", sort="name_asc")
+    assert total == 1 and rows[0].asset_id == "external"
+    with sqlite3.connect(repository.wrapper._db_path) as connection:
+        assert connection.execute("SELECT asset_id FROM image_search_rows").fetchall() == [("external",)]
+        assert connection.execute("SELECT COUNT(*) FROM image_search_pending").fetchone() == (0,)
+
+
+def test_search_falls_back_to_substrings_and_creates_the_schema_once(tmp_path, monkeypatch):
+    repository = _repository(tmp_path, monkeypatch)
+    service = ImageAssetSearchService(repository)
+    created = []
+    original = ImageSearchIndex._create_schema
+    monkeypatch.setattr(
+        ImageSearchIndex, "_create_schema", lambda self, conn: created.append(1) or original(self, conn)
+    )
+    repository.upsert_by_hash_or_path(_asset("Goblin Camp", "camps", width=640))
+
+    rows, total = service.search_images("oblin")
+    assert total == 1 and rows[0].name == "Goblin Camp"
+    assert service.search_images("gob")[1] == 1
+    assert service.search_images("orc") == ([], 0)
+    assert len(created) == 1
+
+
+def test_search_unions_prefix_and_substring_hits(tmp_path, monkeypatch):
+    repository = _repository(tmp_path, monkeypatch)
+    service = ImageAssetSearchService(repository)
+    repository.upsert_by_hash_or_path(_asset("Ore Mine", "mines", width=640))
+    repository.upsert_by_hash_or_path(_asset("Forest Road", "roads", width=640))
+
+    rows, total = service.search_images("ore")
+
+    assert total == 2 and [row.name for row in rows] == ["Ore Mine", "Forest Road"]
@@ -0,0 +1,115 @@
+"""Tests for the chunked, resumable PDF entity import pipeline."""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import sqlite3
+
+import pytest
+
+from modules.generic.generic_model_wrapper import GenericModelWrapper
+from modules.helpers.importing.pdf_hash_tracker import PDFHashTracker
+from modules.importers.pdf_batch_importer import BatchPDFImporter, EntityImportSpec, chunk_pages
+from modules.importers.pdf_entity_importer import iter_json_records, parse_json_relaxed
+
+def _normalize(payload):
+    return payload if isinstance(payload, list) else payload["creatures"]
+
+
+SPEC = EntityImportSpec(
+    entity_type="creatures",
+    system_prompt="Extract creatures.",
+    build_prompt=lambda text, label: text,
+    normalize=_normalize,
+    to_record=lambda raw: {"Name": raw["Name"], "Stats": raw.get("Stats", "")},
+)
+
+
+class _FakeClient:
+    """Answer each chunk with one creature per page line; fail on request."""
+
+    def __init__(self, fail_on: str | None = None) -> None:
+        self.prompts: list[str] = []
+        self.fail_on = fail_on
+
+    def chat(self, messages):
+        text = messages[-1]["content"]
+        self.prompts.append(text)
+        if self.fail_on and self.fail_on in text:
+            raise RuntimeError("model unavailable")
+        names = [line for line in text.split("\n\n") if line]
+        return "Here you go:\n" + json.dumps({"creatures": [{"Name": name} for name in names]})
+
+
+@pytest.fixture
+def campaign(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "modules.helpers.importing.pdf_hash_tracker.ConfigHelper.get_campaign_dir", lambda: str(tmp_path)
+    )
+    database = tmp_path / "campaign.db"
+    with sqlite3.connect(database) as connection:
+        connection.execute("CREATE TABLE creatures (Name TEXT PRIMARY KEY, Stats TEXT)")
+    return GenericModelWrapper("creatures", db_path=str(database))
+
+
+def test_chunk_pages_groups_pages_and_skips_blanks():
+    chunks = chunk_pages(["a", "", "b", "c", "dddd"], pages_per_chunk=2, max_chars=4)
+
+    assert [(chunk.first_page, chunk.last_page, chunk.text) for chunk in chunks] == [
+        (1, 3, "a\n\nb"),
+        (4, 4, "c"),
+        (5, 5, "dddd"),
+    ]
+
+
+def test_relaxed_parsing_ignores_chatter_and_salvages_truncated_arrays():
+    assert parse_json_relaxed('Sure! {"creatures": []} Anything else?') == {"creatures": []}
+    truncated = '{"creatures": [{"Name": "Orc"}, {"Name": "Troll"}, {"Name": "Og'
+    assert list(iter_json_records(truncated)) == [{"Name": "Orc"}, {"Name": "Troll"}]
+
+
+def test_salvaged_records_are_normalized(campaign):
+    spec = dataclasses.replace(
+        SPEC, normalize=lambda payload: [item for item in _normalize(payload) if item.get("Name") != "Troll"]
+    )
+    importer = BatchPDFImporter(spec, client_factory=_FakeClient, wrapper=campaign)
+
+    truncated = '{"creatures": [{"Name": "Orc"}, {"Name": "Troll"}, {"Name": "Og'
+    assert importer._parse(truncated) == [{"Name": "Orc"}]
+
+
+def test_import_saves_every_chunk(campaign):
+    pages = [f"Beast {index}" for index in range(10)]
+    client = _FakeClient()
+
+    result = BatchPDFImporter(
+        SPEC, client_factory=lambda: client, wrapper=campaign, max_concurrency=3, pages_per_chunk=3
+    ).run(pages, source_label="bestiary.pdf", pdf_hash="abc")
+
+    assert result.complete and result.chunks_total == 4
+    assert result.imported == 10
+    assert sorted(item["Name"] for item in campaign.load_items()) == sorted(pages)
+    assert PDFHashTracker.is_already_imported("abc")
+
+
+def test_interrupted_import_resumes_missing_chunks(campaign):
+    pages = [f"Beast {index}" for index in range(6)]
+    importer_args = dict(wrapper=campaign, max_concurrency=2, pages_per_chunk=2)
+
+    first = BatchPDFImporter(
+        SPEC, client_factory=lambda: _FakeClient(fail_on="Beast 2"), **importer_args
+    ).run(pages, pdf_hash="abc")
+    assert not first.complete and len(first.failures) == 1
+    assert not PDFHashTracker.is_already_imported("abc")
+
+    retry_client = _FakeClient()
+    second = BatchPDFImporter(SPEC, client_factory=lambda: retry_client, **importer_args).run(
+        pages, pdf_hash="abc"
+    )
+
+    assert second.complete and second.chunks_skipped == 2
+    assert retry_client.prompts == ["Beast 2\n\nBeast 3"]
+    assert len(campaign.load_items()) == 6
+    assert PDFHashTracker.is_already_imported("abc")
+    assert PDFHashTracker.completed_chunks("abc", "anything", 3) == set()
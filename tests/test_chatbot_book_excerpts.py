@@ -77,3 +77,55 @@ def test_collect_book_excerpts_uses_path(monkeypatch: pytest.MonkeyPatch, record
     matching = [value for label, value in excerpts if label == expected_label]
     assert matching and matching[0].text
     assert "wizard" in matching[0].text.lower()
+
+
+def test_collect_book_excerpts_prefers_ranked_index_hits(tmp_path) -> None:
+    """Verify that indexed page hits come first with bold query matches."""
+    from modules.books.book_text_index import BookTextIndex
+
+    index = BookTextIndex(str(tmp_path / "campaign.db"))
+    index.index_book("Grimoire", ["Nothing here.", "The wizard casts a spell."])
+
+    excerpts = chatbot_dialog._collect_book_excerpts({"Title": "Grimoire"}, "wizard", index)
+
+    assert [label for label, _ in excerpts] == ["Page 2"]
+    value = excerpts[0][1]
+    assert value.text == "The wizard casts a spell."
+    assert value.formatting == {"bold": [(4, 10)]}
+
+
+def test_indexed_results_load_page_by_page(tmp_path, monkeypatch) -> None:
+    """Verify that indexed matches are paged instead of capped."""
+    import sqlite3
+
+    from modules.generic.campaign_search_index import CampaignSearchIndex
+    from modules.generic.generic_model_wrapper import GenericModelWrapper
+
+    database = str(tmp_path / "campaign.db")
+    with sqlite3.connect(database) as connection:
+        connection.execute("CREATE TABLE npcs (Name TEXT PRIMARY KEY, Description TEXT)")
+    GenericModelWrapper("npcs", db_path=database).save_items(
+        [{"Name": f"Goblin {number:02d}", "Description": ""} for number in range(5)]
+    )
+    index = CampaignSearchIndex(database)
+    monkeypatch.setattr(chatbot_dialog, "get_campaign_search_index", lambda _path: index)
+    monkeypatch.setattr(chatbot_dialog, "_SEARCH_PAGE_SIZE", 2)
+
+    class _Listbox:
+        def __init__(self) -> None:
+            self.rows: list[str] = []
+
+        def insert(self, _index, text) -> None:
+            self.rows.append(text)
+
+    dialog = chatbot_dialog.ChatbotDialog.__new__(chatbot_dialog.ChatbotDialog)
+    dialog._wrappers = {"NPCs": GenericModelWrapper("npcs", db_path=database)}
+    dialog._results = []
+    dialog.result_list = _Listbox()
+
+    assert dialog._populate_from_index("oblin", None)
+    assert len(dialog.result_list.rows) == 2
+    while dialog._index_paging is not None:
+        dialog._append_index_page()
+
+    assert [key for _type, key, _record in dialog._results] == [f"Goblin {n:02d}" for n in range(5)]
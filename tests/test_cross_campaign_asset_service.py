@@ -89,6 +89,65 @@ def test_analyze_bundle_ignores_unsafe_or_malformed_ambiance_wallpaper_entries(
         shutil.rmtree(analysis.temp_dir, ignore_errors=True)
 
 
+def _create_npc_table(db_path, rows=()):
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE npcs (Name TEXT PRIMARY KEY, Portrait TEXT)")
+    conn.executemany("INSERT INTO npcs (Name, Portrait) VALUES (?, ?)", rows)
+    conn.commit()
+    conn.close()
+
+
+def test_streaming_import_keeps_assets_in_archive_and_reuses_identical_files(
+    tmp_path,
+):
+    """Analysis should not unpack assets and import should reuse matching files."""
+    source_root = tmp_path / "source"
+    (source_root / "portraits").mkdir(parents=True)
+    (source_root / "portraits" / "bob.png").write_bytes(b"same-bytes")
+    (source_root / "portraits" / "alice.png").write_bytes(b"alice-bytes")
+    source_db = source_root / "campaign.db"
+    _create_npc_table(source_db)
+    records = [
+        {"Name": "Alice", "Portrait": "portraits/alice.png"},
+        {"Name": "Bob", "Portrait": "portraits/bob.png"},
+    ]
+    bundle_path = tmp_path / "npcs.zip"
+    export_bundle(
+        bundle_path,
+        CampaignDatabase("Source", source_root, source_db),
+        {"npcs": records},
+        include_systems=False,
+    )
+
+    target_root = tmp_path / "target"
+    existing_portrait = target_root / "assets" / "portraits" / "bob_existing.png"
+    existing_portrait.parent.mkdir(parents=True)
+    existing_portrait.write_bytes(b"same-bytes")
+    target_db = target_root / "campaign.db"
+    _create_npc_table(target_db, [("Alice", "")])
+
+    analysis = analyze_bundle(bundle_path, target_db)
+    assert analysis.duplicates == {"npcs": ["Alice"]}
+    assert not (analysis.temp_dir / "assets").exists()
+    assert not (analysis.temp_dir / "data" / "npcs.json").exists()
+
+    summary = apply_import(
+        analysis,
+        CampaignDatabase("Target", target_root, target_db),
+        overwrite=False,
+    )
+
+    assert summary["imported"] == 1
+    assert summary["skipped"] == 1
+    assert summary["assets_reused"] == 1
+    assert not (target_root / "assets" / "portraits" / "bob.png").exists()
+    conn = sqlite3.connect(target_db)
+    rows = dict(conn.execute("SELECT Name, Portrait FROM npcs").fetchall())
+    conn.close()
+    assert rows == {"Alice": "", "Bob": "assets/portraits/bob_existing.png"}
+    assert not analysis.temp_dir.exists()
+
+
 def test_export_bundle_raises_when_database_missing(tmp_path):
     """Verify that export bundle raises when database missing."""
     destination = tmp_path / "export.zip"
@@ -83,6 +83,24 @@ def test_main_window_forces_campaign_update_check_on_launch() -> None:
     raise AssertionError("MainWindow.__init__ no longer forces an update check at launch")
 
 
+def test_main_window_resumes_portrait_jobs_on_launch() -> None:
+    """Portrait jobs interrupted by the last session are resumed at startup."""
+    init_method = _get_method("__init__")
+    scheduled = [
+        node.args[1].attr
+        for node in ast.walk(init_method)
+        if isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == "after"
+        and len(node.args) == 2
+        and isinstance(node.args[1], ast.Attribute)
+    ]
+
+    assert "_resume_portrait_jobs" in scheduled
+    calls = [node for node in ast.walk(_get_method("_resume_portrait_jobs")) if isinstance(node, ast.Call)]
+    assert any(isinstance(call.func, ast.Name) and call.func.id == "resume_pending_portrait_jobs" for call in calls)
+
+
 def test_gm_screen_auto_open_alias_points_to_campaign_overview() -> None:
     """Verify that GM screen auto open alias points to campaign overview."""
     alias_method = _get_method("_auto_open_gm_screen_if_available")
@@ -95,3 +113,34 @@ def test_gm_screen_auto_open_alias_points_to_campaign_overview() -> None:
         and call.func.attr == "_auto_open_campaign_overview"
         for call in calls
     )
+
+
+def test_frozen_build_supports_process_pool_workers() -> None:
+    """Verify that freeze_support runs before anything else in the entry point."""
+    main_guard = next(
+        node
+        for node in MODULE_AST.body
+        if isinstance(node, ast.If) and "__main__" in ast.unparse(node.test)
+    )
+
+    assert ast.unparse(main_guard.body[0]) == "multiprocessing.freeze_support()"
+
+
+def test_main_window_flushes_the_model_catalog_on_destroy() -> None:
+    """Throughput kept in memory must reach the catalog file at shutdown."""
+    # The class body defines destroy twice; the last definition is the one in effect.
+    destroy_method = [
+        node for node in MAIN_WINDOW_CLASS.body if isinstance(node, ast.FunctionDef) and node.name == "destroy"
+    ][-1]
+
+    for node in ast.walk(destroy_method):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr == "flush"
+            and isinstance(node.func.value, ast.Call)
+            and getattr(node.func.value.func, "id", None) == "get_model_catalog"
+        ):
+            return
+
+    raise AssertionError("MainWindow.destroy no longer flushes the model catalog")
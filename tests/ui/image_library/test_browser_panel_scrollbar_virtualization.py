@@ -6,6 +6,8 @@ from dataclasses import dataclass
 
 from modules.ui.image_library.browser_panel import ImageBrowserPanel
 from modules.ui.image_library.result_card import ImageResult
+from modules.ui.image_library.thumbnail_cache import ThumbnailCache
+from modules.ui.image_library.thumbnail_service import ThumbnailService
 
 
 @dataclass
@@ -105,7 +107,9 @@ def test_scrollbar_yview_movement_rerenders_new_cards(monkeypatch) -> None:
     panel._view_callback = lambda _item: None
     panel._attach_callback = None
     panel._show_context_menu = lambda _item, _x, _y: None
-    panel._load_ctk_thumb = lambda _path, _size: object()
+    panel._card_thumbnail = lambda _path, _size: (object(), False)
+    panel._render_generation = 0
+    panel._thumbnail_service = ThumbnailService(ThumbnailCache())
     panel._schedule_virtualized_render = lambda force=False: panel._render_visible_subset()
     panel._scroll_events_bound = False
     panel._scroll_bind_job = None
@@ -6,6 +6,8 @@ from dataclasses import dataclass
 
 from modules.ui.image_library.browser_panel import ImageBrowserPanel
 from modules.ui.image_library.result_card import ImageResult
+from modules.ui.image_library.thumbnail_cache import ThumbnailCache
+from modules.ui.image_library.thumbnail_service import ThumbnailService
 
 
 @dataclass
@@ -83,7 +85,9 @@ def test_render_visible_subset_skips_clearing_when_window_is_unchanged(monkeypat
     panel._view_callback = lambda _item: None
     panel._attach_callback = None
     panel._show_context_menu = lambda _item, _x, _y: None
-    panel._load_ctk_thumb = lambda _path, _size: object()
+    panel._card_thumbnail = lambda _path, _size: (object(), False)
+    panel._render_generation = 0
+    panel._thumbnail_service = ThumbnailService(ThumbnailCache())
 
     panel._render_visible_subset()
 
@@ -0,0 +1,178 @@
+"""Tests for the thumbnail blob store and the prioritized thumbnail service."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+from modules.ui.image_library import thumbnail_service as service_module
+from modules.ui.image_library import thumbnail_store
+from modules.ui.image_library.thumbnail_cache import ThumbnailCache
+from modules.ui.image_library.thumbnail_service import (
+    PRIORITY_NEAR,
+    PRIORITY_VISIBLE,
+    ThumbnailService,
+    TkThumbnailDelivery,
+)
+from modules.ui.image_library.thumbnail_store import ThumbnailStore
+
+
+class _Pixels:
+    def __init__(self, data: bytes, width: int = 2, height: int = 1, mode: str = "RGBA") -> None:
+        self.data, self.width, self.height, self.mode = data, width, height, mode
+
+    def tobytes(self) -> bytes:
+        return self.data
+
+
+def _fake_pil(monkeypatch) -> None:
+    monkeypatch.setattr(
+        thumbnail_store,
+        "Image",
+        SimpleNamespace(frombytes=lambda mode, size, data: _Pixels(data, size[0], size[1], mode)),
+    )
+
+
+def test_store_round_trips_pixels(tmp_path, monkeypatch):
+    _fake_pil(monkeypatch)
+    store = ThumbnailStore(tmp_path / "thumbs.sqlite3", max_entries=10)
+
+    store.put("library:a.png", _Pixels(b"\x01\x02\x03\x04" * 2))
+
+    restored = store.get("library:a.png")
+    assert (restored.mode, restored.width, restored.height) == ("RGBA", 2, 1)
+    assert restored.tobytes() == b"\x01\x02\x03\x04" * 2
+    assert store.get("library:missing.png") is None
+    store.close()
+
+
+def test_cache_serves_memory_then_store_without_rebuilding(tmp_path, monkeypatch):
+    _fake_pil(monkeypatch)
+    source = tmp_path / "token.png"
+    source.write_bytes(b"png")
+    built = []
+
+    def builder(path, size):
+        built.append(path)
+        return _Pixels(b"\x00" * 8)
+
+    store = ThumbnailStore(tmp_path / "thumbs.sqlite3")
+    cache = ThumbnailCache(store=store, builder=builder)
+
+    first = cache.get_thumbnail(str(source), (2, 1))
+    assert cache.get_thumbnail(str(source), (2, 1)) is first
+    assert cache.peek(str(source), (2, 1)) is first
+
+    cache.invalidate(str(source))
+    assert cache.peek(str(source), (2, 1)) is None
+    assert cache.get_thumbnail(str(source), (2, 1)).tobytes() == b"\x00" * 8
+    assert built == [str(source)]
+    store.close()
+
+
+class _BlockingCache:
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.order: list[str] = []
+
+    def peek(self, _path, _size):
+        return None
+
+    def get_thumbnail(self, path, _size):
+        if path == "blocker":
+            self.started.set()
+            self.release.wait(5)
+        self.order.append(path)
+        return path
+
+
+def test_service_serves_visible_first_and_drops_cancelled_work():
+    cache = _BlockingCache()
+    service = ThumbnailService(cache, max_workers=1)
+    delivered: list[str] = []
+    done = threading.Event()
+
+    def collect(image, _error):
+        delivered.append(image)
+        if image == "visible":
+            done.set()
+
+    service.request("blocker", (8, 8), lambda *_args: None)
+    assert cache.started.wait(5)
+    service.request("offscreen", (8, 8), collect, priority=PRIORITY_NEAR, owner="panel")
+    service.request("near", (8, 8), collect, priority=PRIORITY_NEAR)
+    service.request("visible", (8, 8), collect, priority=PRIORITY_VISIBLE)
+    service.cancel_owner("panel")
+    cache.release.set()
+
+    assert done.wait(5)
+    service.close()
+    assert cache.order[:2] == ["blocker", "visible"]
+    assert "offscreen" not in cache.order
+    assert delivered[0] == "visible"
+
+
+def test_memory_tier_misses_after_the_file_is_overwritten(tmp_path):
+    source = tmp_path / "token.png"
+    source.write_bytes(b"png")
+    built = []
+    cache = ThumbnailCache(builder=lambda path, size: built.append(path) or _Pixels(bytes([len(built)]) * 8))
+
+    first = cache.get_thumbnail(str(source), (2, 1))
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert cache.peek(str(source), (2, 1)) is None
+    assert cache.get_thumbnail(str(source), (2, 1)) is not first
+    assert len(built) == 2
+
+
+def test_shared_services_follow_the_current_campaign(tmp_path, monkeypatch):
+    monkeypatch.setattr(service_module, "_SERVICES", {})
+    monkeypatch.setattr(service_module, "_STORES", {})
+    campaign = {"dir": str(tmp_path / "first")}
+    monkeypatch.setattr(service_module.ConfigHelper, "get_campaign_dir", lambda: campaign["dir"])
+
+    first = service_module.get_thumbnail_service()
+    assert service_module.get_thumbnail_service() is first
+    campaign["dir"] = str(tmp_path / "second")
+    second = service_module.get_thumbnail_service()
+
+    assert second is not first and first._closed
+    assert (tmp_path / "second" / service_module.STORE_RELATIVE_PATH).exists()
+    for store in service_module._STORES.values():
+        store.close()
+
+
+class _FakeWidget:
+    def __init__(self) -> None:
+        self.scheduled = []
+
+    def after(self, _delay, callback):
+        self.scheduled.append(callback)
+
+    def winfo_exists(self):
+        return True
+
+
+def test_delivery_runs_handlers_from_the_polling_thread():
+    cache = _BlockingCache()
+    cache.release.set()
+    service = ThumbnailService(cache, max_workers=1)
+    widget = _FakeWidget()
+    delivery = TkThumbnailDelivery(widget, service)
+    handled = []
+
+    delivery.request("portrait", (8, 8), lambda image, _error: handled.append((image, threading.current_thread())))
+    deadline = time.monotonic() + 5
+    while delivery._results.empty() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    service.close()
+
+    assert handled == [] and len(widget.scheduled) == 1
+    widget.scheduled.pop()()
+    assert handled == [("portrait", threading.current_thread())]
+    assert widget.scheduled == []
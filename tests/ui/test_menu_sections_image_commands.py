@@ -46,6 +46,7 @@ def test_menu_sections_expose_image_library_commands() -> None:
         import_portraits_from_directory=lambda: None,
         open_image_directory_importer=lambda: None,
         open_image_library_browser=lambda: None,
+        open_image_duplicate_review=lambda: None,
         map_tool=lambda: None,
         open_whiteboard=lambda: None,
         open_dice_roller=lambda: None,
@@ -74,6 +75,7 @@ def test_menu_sections_expose_image_library_commands() -> None:
     assert sync_labels == ["Campaign Update Settings", "Cross-campaign Asset Library"]
     assert "Import Image Directories…" in labels
     assert "Open Image Library" in labels
+    assert "Find Duplicate Images…" in labels
     assert "Ambiance Control" in live_labels
     assert "Ambiance Screen" not in live_labels
     assert "Import Ambiance Wallpapers" in live_labels